@@ -13,13 +13,22 @@ from dfdatetime import fat_date_time
 from dfdatetime import filetime
 from dfdatetime import hfs_time
 from dfdatetime import golang_time
+from dfdatetime import gps_time
 from dfdatetime import java_time
+from dfdatetime import ksuid_time
+from dfdatetime import ntp_time
+from dfdatetime import object_id_time
 from dfdatetime import ole_automation_date
+from dfdatetime import pcap_time
 from dfdatetime import posix_time
+from dfdatetime import ptp_time
 from dfdatetime import rfc2579_date_time
 from dfdatetime import semantic_time
+from dfdatetime import snowflake_time
 from dfdatetime import systemtime
+from dfdatetime import tai_time
 from dfdatetime import time_elements
+from dfdatetime import ulid_time
 from dfdatetime import uuid_time
 from dfdatetime import webkit_time
 
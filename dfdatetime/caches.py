@@ -0,0 +1,223 @@
+"""Optional caches of parsed date and time strings."""
+
+import collections
+import os
+import threading
+
+
+class LRUCache:
+    """Size-bounded least recently used (LRU) cache.
+
+    Attributes:
+      evictions (int): number of values that were evicted from the cache.
+      hits (int): number of lookups that were served from the cache.
+      maximum_size (int): maximum number of values in the cache.
+      misses (int): number of lookups that were not served from the cache.
+    """
+
+    def __init__(self, maximum_size):
+        """Initializes a LRU cache.
+
+        Args:
+          maximum_size (int): maximum number of values in the cache.
+
+        Raises:
+          ValueError: if the maximum size is out of bounds.
+        """
+        if maximum_size < 1:
+            raise ValueError(f"Maximum size value: {maximum_size:d} out of bounds.")
+
+        super().__init__()
+        self._lock = threading.Lock()
+        self._values = collections.OrderedDict()
+        self.evictions = 0
+        self.hits = 0
+        self.maximum_size = maximum_size
+        self.misses = 0
+
+    def __len__(self):
+        """Retrieves the number of values in the cache.
+
+        Returns:
+          int: number of values in the cache.
+        """
+        return len(self._values)
+
+    def _ResetAfterFork(self):
+        """Resets the cache in a child process after a fork.
+
+        The lock can be held by another thread of the parent process at the time
+        of the fork, hence it is replaced.
+        """
+        self._lock = threading.Lock()
+        self._values = collections.OrderedDict()
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def Clear(self):
+        """Removes all values and resets the statistics."""
+        with self._lock:
+            self._values.clear()
+            self.evictions = 0
+            self.hits = 0
+            self.misses = 0
+
+    def Get(self, key):
+        """Retrieves a value from the cache.
+
+        Args:
+          key (Hashable): key of the value.
+
+        Returns:
+          object: value or None if not in the cache.
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._values.move_to_end(key)
+
+        return value
+
+    def GetStatistics(self):
+        """Retrieves the statistics of the cache.
+
+        Returns:
+          dict[str, object]: statistics of the cache.
+        """
+        with self._lock:
+            number_of_lookups = self.hits + self.misses
+            return {
+                "evictions": self.evictions,
+                "hit_rate": self.hits / number_of_lookups if number_of_lookups else 0.0,
+                "hits": self.hits,
+                "maximum_size": self.maximum_size,
+                "misses": self.misses,
+                "size": len(self._values),
+            }
+
+    def Put(self, key, value):
+        """Stores a value in the cache.
+
+        The least recently used value is evicted if the cache is full.
+
+        Args:
+          key (Hashable): key of the value.
+          value (object): value, which cannot be None.
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+
+            if len(self._values) > self.maximum_size:
+                self._values.popitem(last=False)
+                self.evictions += 1
+
+
+class ParseCaches:
+    """Optional caches of parsed date and time strings per parser.
+
+    When enabled the date and time tuples parsed by CopyFromDateTimeString,
+    CopyFromStringISO8601, CopyFromStringRFC822, CopyFromStringRFC1123 and
+    CopyFromStringRFC2822 are cached per parser, keyed by the time string, which
+    makes repeated time strings, such as in text logs, considerably cheaper to
+    parse. Invalid time strings are not cached. When disabled, which is the
+    default, the parsers are not cached.
+
+    The caches are cleared in a child process after a fork.
+    """
+
+    DEFAULT_MAXIMUM_SIZE = 4096
+
+    PARSER_NAMES = frozenset(["date_time", "iso8601", "rfc822", "rfc1123", "rfc2822"])
+
+    _caches = {}
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def _ResetAfterFork(cls):
+        """Resets the caches in a child process after a fork."""
+        cls._lock = threading.Lock()
+
+        for cache in cls._caches.values():
+            cache._ResetAfterFork()  # pylint: disable=protected-access
+
+    @classmethod
+    def Disable(cls):
+        """Disables the caches."""
+        with cls._lock:
+            cls._caches = {}
+
+    @classmethod
+    def Enable(cls, maximum_size=None, parser_names=None):
+        """Enables the caches.
+
+        Args:
+          maximum_size (Optional[int]): maximum number of date and time tuples
+              per parser, where None represents DEFAULT_MAXIMUM_SIZE.
+          parser_names (Optional[set[str]]): names of the parsers to cache, where
+              None represents all PARSER_NAMES.
+
+        Raises:
+          ValueError: if the maximum size is out of bounds or a parser name is
+              not supported.
+        """
+        parser_names = parser_names or cls.PARSER_NAMES
+
+        unsupported_parser_names = set(parser_names).difference(cls.PARSER_NAMES)
+        if unsupported_parser_names:
+            names = ", ".join(sorted(unsupported_parser_names))
+            raise ValueError(f"Unsupported parser names: {names:s}.")
+
+        if maximum_size is None:
+            maximum_size = cls.DEFAULT_MAXIMUM_SIZE
+
+        parse_caches = {
+            parser_name: LRUCache(maximum_size) for parser_name in parser_names
+        }
+
+        with cls._lock:
+            cls._caches = parse_caches
+
+    @classmethod
+    def GetCache(cls, parser_name):
+        """Retrieves the cache of a specific parser.
+
+        Args:
+          parser_name (str): name of the parser, such as "iso8601".
+
+        Returns:
+          LRUCache: cache of the parser or None if not enabled.
+        """
+        return cls._caches.get(parser_name)
+
+    @classmethod
+    def GetStatistics(cls):
+        """Retrieves the statistics of the caches.
+
+        Returns:
+          dict[str, dict[str, object]]: statistics per parser name.
+        """
+        return {
+            parser_name: cache.GetStatistics()
+            for parser_name, cache in sorted(cls._caches.items())
+        }
+
+    @classmethod
+    def IsEnabled(cls):
+        """Determines if the caches are enabled.
+
+        Returns:
+          bool: True if one or more caches are enabled.
+        """
+        return bool(cls._caches)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=ParseCaches._ResetAfterFork  # pylint: disable=protected-access
+    )
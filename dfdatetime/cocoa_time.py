@@ -1,7 +1,5 @@
 """Cocoa timestamp implementation."""
 
-import decimal
-
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -63,13 +61,13 @@ class CocoaTime(interface.DateTimeValues):
         """
         if self._normalized_timestamp is None:
             if self._timestamp is not None:
-                self._normalized_timestamp = (
-                    decimal.Decimal(self._timestamp) - self._COCOA_TO_POSIX_BASE
+                self._normalized_timestamp = self._GetNormalizedTimestampFromFloat(
+                    self._timestamp,
+                    self._COCOA_TO_POSIX_BASE,
+                    1,
+                    self._time_zone_offset,
                 )
 
-                if self._time_zone_offset:
-                    self._normalized_timestamp -= self._time_zone_offset * 60
-
         return self._normalized_timestamp
 
     def CopyFromDateTimeString(self, time_string):
@@ -87,16 +85,16 @@ class CocoaTime(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         timestamp = self._GetNumberOfSecondsFromElements(
             year, month, day_of_month, hours, minutes, seconds
@@ -123,14 +121,12 @@ class CocoaTime(interface.DateTimeValues):
         number_of_days, hours, minutes, seconds = self._GetTimeValues(
             int(self._timestamp)
         )
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
         microseconds = int((self._timestamp % 1) * definitions.MICROSECONDS_PER_SECOND)
 
         return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}.{microseconds:06d}"
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{microseconds:06d}"
         )
 
     def CopyToSerializableDict(self):
@@ -145,5 +141,29 @@ class CocoaTime(interface.DateTimeValues):
 
         return serializable_dict
 
+    @classmethod
+    def DecodeToPosixTimestampsInMicroseconds(cls, timestamps, time_zone_offset=None):
+        """Decodes Cocoa timestamps to POSIX timestamps in bulk.
+
+        This is considerably faster than creating a Cocoa timestamp object per
+        value, for example to decode the date values of a property list. The
+        POSIX timestamps are identical to those of GetPlasoTimestamp.
+
+        Args:
+          timestamps (Iterable[float]): Cocoa timestamps, such as an array of
+              64-bit floating-point values.
+          time_zone_offset (Optional[int]): time zone offset in number of minutes
+              from UTC or None if not set.
+
+        Returns:
+          tuple[array.array, bytearray]: POSIX timestamps in microseconds, where
+              invalid Cocoa timestamps are represented by 0, and validity mask,
+              where 1 represents a valid and 0 an invalid Cocoa timestamp, such as
+              infinity or NaN.
+        """
+        return cls._GetPosixTimestampsInMicrosecondsFromFloats(
+            timestamps, cls._COCOA_TO_POSIX_BASE, 1, time_zone_offset
+        )
+
 
 factory.Factory.RegisterDateTimeValues(CocoaTime)
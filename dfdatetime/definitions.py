@@ -8,6 +8,9 @@ Also see:
 
 DAYS_PER_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
+# Number of days preceding the first day of a month in a non-leap year.
+DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
 SECONDS_PER_DAY = 86400
 
 DECISECONDS_PER_SECOND = 10
@@ -65,6 +68,21 @@ PRECISION_VALUES = frozenset(
     ]
 )
 
+# Policies to resolve a local time that is ambiguous, since it occurs twice
+# when the clock is set back, or that does not exist, since it is skipped when
+# the clock is set forward.
+TIME_ZONE_AMBIGUITY_EARLIEST = "earliest"
+TIME_ZONE_AMBIGUITY_LATEST = "latest"
+TIME_ZONE_AMBIGUITY_RAISE = "raise"
+
+TIME_ZONE_AMBIGUITY_POLICIES = frozenset(
+    [
+        TIME_ZONE_AMBIGUITY_EARLIEST,
+        TIME_ZONE_AMBIGUITY_LATEST,
+        TIME_ZONE_AMBIGUITY_RAISE,
+    ]
+)
+
 # Create a days per century lookup table.
 DAYS_PER_CENTURY = {}
 for year in range(-10000, 10000, 100):
@@ -111,13 +111,8 @@ class FakeTime(interface.DateTimeValues):
         number_of_days, hours, minutes, seconds = self._GetTimeValues(
             self._number_of_seconds
         )
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
-        date_time_string = (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+        date_time_string = f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
         if self._microseconds is not None:
             date_time_string = ".".join([date_time_string, f"{self._microseconds:06d}"])
 
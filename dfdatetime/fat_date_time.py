@@ -1,5 +1,7 @@
 """FAT date time implementation."""
 
+import array
+import calendar
 import decimal
 
 from dfdatetime import definitions
@@ -33,6 +35,9 @@ class FATDateTime(interface.DateTimeValues):
     The FAT date time has no time zone information and is typically stored
     in the local time of the computer.
 
+    Since the date and the time of day are 16-bit values they are decoded with
+    lookup tables of 65536 entries each, which are built on first use.
+
     Attributes:
       is_local_time (bool): True if the date and time value is in local time.
     """
@@ -42,6 +47,11 @@ class FATDateTime(interface.DateTimeValues):
     # The difference between January 1, 1980 and January 1, 1970 in seconds.
     _FAT_DATE_TO_POSIX_BASE = 315532800
 
+    # Lookup tables of the number of days since January 1, 1980 per date value
+    # and the number of seconds since 00:00:00 per time of day value, where -1
+    # represents an invalid value.
+    _lookup_tables = None
+
     def __init__(self, fat_date_time=None, precision=None, time_zone_offset=None):
         """Initializes a FAT date time.
 
@@ -67,6 +77,42 @@ class FATDateTime(interface.DateTimeValues):
         """int: FAT date time or None if not set."""
         return self._fat_date_time
 
+    @classmethod
+    def _GetLookupTables(cls):
+        """Retrieves the lookup tables, which are built on first use.
+
+        Returns:
+          tuple[array.array, array.array]: number of days since January 1, 1980
+              per date value and number of seconds since 00:00:00 per time of day
+              value, where -1 represents an invalid value.
+        """
+        lookup_tables = cls._lookup_tables
+        if lookup_tables is None:
+            days_per_date = array.array("l", [-1]) * 0x10000
+            seconds_per_time_of_day = array.array("l", [-1]) * 0x10000
+
+            number_of_days = 0
+            for year in range(0, 0x80):
+                for month in range(1, 13):
+                    _, days_per_month = calendar.monthrange(1980 + year, month)
+                    for day_of_month in range(1, days_per_month + 1):
+                        date = (year << 9) | (month << 5) | day_of_month
+                        days_per_date[date] = number_of_days
+                        number_of_days += 1
+
+            for hours in range(0, 24):
+                for minutes in range(0, 60):
+                    for seconds in range(0, 60, 2):
+                        time_of_day = (hours << 11) | (minutes << 5) | (seconds // 2)
+                        seconds_per_time_of_day[time_of_day] = (
+                            (hours * 60) + minutes
+                        ) * 60 + seconds
+
+            lookup_tables = (days_per_date, seconds_per_time_of_day)
+            cls._lookup_tables = lookup_tables
+
+        return lookup_tables
+
     def _GetNormalizedTimestamp(self):
         """Retrieves the normalized timestamp.
 
@@ -100,35 +146,28 @@ class FATDateTime(interface.DateTimeValues):
           ValueError: if the month, day of month, hours, minutes or seconds
               value is out of bounds.
         """
-        day_of_month = fat_date_time & 0x1F
-        month = (fat_date_time >> 5) & 0x0F
-        year = (fat_date_time >> 9) & 0x7F
-
-        days_per_month = self._GetDaysPerMonth(year, month)
-        if day_of_month < 1 or day_of_month > days_per_month:
-            raise ValueError("Day of month value out of bounds.")
-
-        number_of_days = self._GetDayOfYear(1980 + year, month, day_of_month)
-        number_of_days -= 1
-        for past_year in range(0, year):
-            number_of_days += self._GetNumberOfDaysInYear(past_year)
+        days_per_date, seconds_per_time_of_day = self._GetLookupTables()
 
-        fat_date_time >>= 16
+        number_of_days = days_per_date[fat_date_time & 0xFFFF]
+        if number_of_days == -1:
+            month = (fat_date_time >> 5) & 0x0F
+            if month < 1 or month > 12:
+                raise ValueError("Month value out of bounds.")
 
-        seconds = (fat_date_time & 0x1F) * 2
-        minutes = (fat_date_time >> 5) & 0x3F
-        hours = (fat_date_time >> 11) & 0x1F
+            raise ValueError("Day of month value out of bounds.")
 
-        if hours not in range(0, 24):
-            raise ValueError("Hours value out of bounds.")
+        number_of_seconds = seconds_per_time_of_day[(fat_date_time >> 16) & 0xFFFF]
+        if number_of_seconds == -1:
+            hours = (fat_date_time >> 27) & 0x1F
+            if hours >= 24:
+                raise ValueError("Hours value out of bounds.")
 
-        if minutes not in range(0, 60):
-            raise ValueError("Minutes value out of bounds.")
+            minutes = (fat_date_time >> 21) & 0x3F
+            if minutes >= 60:
+                raise ValueError("Minutes value out of bounds.")
 
-        if seconds not in range(0, 60):
             raise ValueError("Seconds value out of bounds.")
 
-        number_of_seconds = (((hours * 60) + minutes) * 60) + seconds
         number_of_seconds += number_of_days * definitions.SECONDS_PER_DAY
         return number_of_seconds
 
@@ -147,15 +186,16 @@ class FATDateTime(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            _,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         if year < 1980 or year > (1980 + 0x7F):
             raise ValueError(f"Year value not supported: {year!s}.")
@@ -180,13 +220,8 @@ class FATDateTime(interface.DateTimeValues):
         number_of_days, hours, minutes, seconds = self._GetTimeValues(
             self._number_of_seconds
         )
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
-        return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+        return f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def CopyToSerializableDict(self):
         """Copies the date time value to a serializable dictionary.
@@ -200,6 +235,39 @@ class FATDateTime(interface.DateTimeValues):
 
         return serializable_dict
 
+    @classmethod
+    def DecodeToPosixTimestamps(cls, fat_date_times):
+        """Decodes FAT date times to POSIX timestamps in bulk.
+
+        This is considerably faster than creating a FAT date time object per
+        value, for example to decode the date and time values of all the
+        directory entries of a FAT volume.
+
+        Args:
+          fat_date_times (Iterable[int]): FAT date times, such as an array of
+              32-bit values.
+
+        Returns:
+          array.array: POSIX timestamps in seconds, where -1 represents an invalid
+              FAT date time.
+        """
+        days_per_date, seconds_per_time_of_day = cls._GetLookupTables()
+
+        posix_timestamps = array.array("q")
+        for fat_date_time in fat_date_times:
+            number_of_days = days_per_date[fat_date_time & 0xFFFF]
+            number_of_seconds = seconds_per_time_of_day[(fat_date_time >> 16) & 0xFFFF]
+            if number_of_days == -1 or number_of_seconds == -1:
+                posix_timestamps.append(-1)
+            else:
+                posix_timestamps.append(
+                    cls._FAT_DATE_TO_POSIX_BASE
+                    + number_of_days * definitions.SECONDS_PER_DAY
+                    + number_of_seconds
+                )
+
+        return posix_timestamps
+
 
 class FATTimestamp(interface.DateTimeValues):
     """FAT timestamp.
@@ -273,16 +341,16 @@ class FATTimestamp(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         if year < 1980 or year > (1980 + 0x7F):
             raise ValueError(f"Year value not supported: {year!s}.")
@@ -312,12 +380,10 @@ class FATTimestamp(interface.DateTimeValues):
         timestamp, milliseconds = divmod(self._timestamp, 100)
         number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
 
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
         return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:02d}"
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{milliseconds:02d}"
         )
 
     def CopyToSerializableDict(self):
@@ -332,6 +398,22 @@ class FATTimestamp(interface.DateTimeValues):
 
         return serializable_dict
 
+    @classmethod
+    def DecodeToPosixTimestampsInMilliseconds(cls, timestamps):
+        """Decodes FAT timestamps to POSIX timestamps in bulk.
+
+        Args:
+          timestamps (Iterable[int]): FAT timestamps.
+
+        Returns:
+          array.array: POSIX timestamps in milliseconds.
+        """
+        posix_base = cls._FAT_DATE_TO_POSIX_BASE * definitions.MILLISECONDS_PER_SECOND
+
+        return array.array(
+            "q", [posix_base + (timestamp * 10) for timestamp in timestamps]
+        )
+
 
 factory.Factory.RegisterDateTimeValues(FATDateTime)
 factory.Factory.RegisterDateTimeValues(FATTimestamp)
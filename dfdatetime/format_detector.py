@@ -0,0 +1,226 @@
+"""Detectors of the format of date and time strings."""
+
+from dfdatetime import strptime_parser
+from dfdatetime import validators
+
+
+class DateTimeStringParser:
+    """Parser of date and time strings in a detected format.
+
+    Date and time strings are parsed in the detected format and only a string
+    that does not match the detected format is parsed in the fallback formats.
+
+    Attributes:
+      confidence (float): fraction of the sampled date and time strings that
+          matched the detected format.
+      format_name (str): name of the detected format, which is either a string
+          format, such as "iso8601", or a strptime-style format string.
+      number_of_fallbacks (int): number of date and time strings that did not
+          match the detected format.
+    """
+
+    def __init__(self, format_name, confidence, try_parse_functions):
+        """Initializes a parser.
+
+        Args:
+          format_name (str): name of the detected format.
+          confidence (float): fraction of the sampled date and time strings that
+              matched the detected format.
+          try_parse_functions (list[function]): functions that try to parse
+              a date and time string and return None if the string does not
+              match, where the first function corresponds to the detected
+              format and the other functions to the fallback formats.
+        """
+        super().__init__()
+        self._fallback_try_parse_functions = try_parse_functions[1:]
+        self._try_parse_function = try_parse_functions[0]
+        self.confidence = confidence
+        self.format_name = format_name
+        self.number_of_fallbacks = 0
+
+    def Parse(self, time_string):
+        """Parses a date and time string.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          TimeElements: time elements or None if the date and time string does
+              not match the detected format or any of the fallback formats.
+        """
+        date_time_values = self._try_parse_function(time_string)
+        if date_time_values is None:
+            self.number_of_fallbacks += 1
+
+            for try_parse_function in self._fallback_try_parse_functions:
+                date_time_values = try_parse_function(time_string)
+                if date_time_values is not None:
+                    break
+
+        return date_time_values
+
+    def ParseValues(self, time_strings):
+        """Parses a sequence of date and time strings.
+
+        Args:
+          time_strings (Iterable[str]): date and time strings.
+
+        Returns:
+          list[TimeElements]: time elements of the date and time strings, where
+              None represents a date and time string that does not match the
+              detected format or any of the fallback formats.
+        """
+        return [self.Parse(time_string) for time_string in time_strings]
+
+
+class DateTimeStringFormatDetector:
+    """Detector of the format of date and time strings.
+
+    The format is detected once on a sample of the date and time strings, which
+    are expected to share the same format, such as a column of a log file or
+    database table. The candidate formats are tried in order, where the first
+    format that matches the most sampled strings is selected, hence more
+    specific formats should precede less specific formats.
+    """
+
+    DEFAULT_MAXIMUM_SAMPLE_SIZE = 100
+
+    # String formats supported by the date time values, in order of preference.
+    STRING_FORMATS = ["date_time", "iso8601", "rfc1123", "rfc822", "rfc2822"]
+
+    DEFAULT_STRPTIME_FORMATS = [
+        "%d/%b/%Y:%H:%M:%S %z",
+        "%Y/%m/%d %H:%M:%S",
+        "%m/%d/%Y %H:%M:%S",
+        "%m/%d/%Y %I:%M:%S %p",
+        "%d.%m.%Y %H:%M:%S",
+        "%a %b %d %H:%M:%S %Y",
+        "%Y%m%d%H%M%S",
+    ]
+
+    def __init__(
+        self, maximum_sample_size=None, minimum_confidence=0.0, strptime_formats=None
+    ):
+        """Initializes a detector.
+
+        Args:
+          maximum_sample_size (Optional[int]): maximum number of date and time
+              strings to sample, where None represents
+              DEFAULT_MAXIMUM_SAMPLE_SIZE.
+          minimum_confidence (Optional[float]): minimum fraction of the sampled
+              date and time strings that must match the detected format.
+          strptime_formats (Optional[list[str]]): strptime-style format strings
+              to try after the string formats, where None represents
+              DEFAULT_STRPTIME_FORMATS.
+
+        Raises:
+          ValueError: if the maximum sample size or minimum confidence is out of
+              bounds or a strptime-style format string is not supported.
+        """
+        if maximum_sample_size is None:
+            maximum_sample_size = self.DEFAULT_MAXIMUM_SAMPLE_SIZE
+
+        if maximum_sample_size < 1:
+            raise ValueError(
+                f"Maximum sample size value: {maximum_sample_size:d} out of bounds."
+            )
+
+        if minimum_confidence < 0.0 or minimum_confidence > 1.0:
+            raise ValueError(
+                f"Minimum confidence value: {minimum_confidence:f} out of bounds."
+            )
+
+        if strptime_formats is None:
+            strptime_formats = self.DEFAULT_STRPTIME_FORMATS
+
+        candidates = []
+        for string_format in self.STRING_FORMATS:
+            validator = validators.DateTimeStringValidator(string_format)
+            candidates.append((string_format, validator.TryParse))
+
+        for format_string in strptime_formats:
+            parser = strptime_parser.StrptimeParserFactory.GetParser(format_string)
+            candidates.append((format_string, parser.TryParse))
+
+        super().__init__()
+        self._candidates = candidates
+        self._maximum_sample_size = maximum_sample_size
+        self._minimum_confidence = minimum_confidence
+
+    def _GetSample(self, time_strings):
+        """Retrieves a sample of date and time strings.
+
+        The sample is spread evenly over the date and time strings and does not
+        contain empty strings.
+
+        Args:
+          time_strings (Sequence[str]): date and time strings.
+
+        Returns:
+          list[str]: sampled date and time strings.
+        """
+        number_of_time_strings = len(time_strings)
+        step = max(1, number_of_time_strings // self._maximum_sample_size)
+
+        sample = []
+        for index in range(0, number_of_time_strings, step):
+            time_string = time_strings[index]
+            if time_string:
+                sample.append(time_string)
+                if len(sample) >= self._maximum_sample_size:
+                    break
+
+        return sample
+
+    def Detect(self, time_strings):
+        """Detects the format of date and time strings.
+
+        Args:
+          time_strings (Sequence[str]): date and time strings.
+
+        Returns:
+          DateTimeStringParser: parser of the date and time strings in the
+              detected format or None if no format was detected with the minimum
+              confidence.
+        """
+        sample = self._GetSample(time_strings)
+        if not sample:
+            return None
+
+        number_of_matches_per_candidate = []
+        for candidate_index, (_, try_parse_function) in enumerate(self._candidates):
+            number_of_matches = 0
+            for time_string in sample:
+                if try_parse_function(time_string) is not None:
+                    number_of_matches += 1
+
+            number_of_matches_per_candidate.append((number_of_matches, candidate_index))
+
+            # A format that matches all sampled strings cannot be improved upon.
+            if number_of_matches == len(sample):
+                break
+
+        # Sort by descending number of matches and preserve the order of
+        # preference of candidates with the same number of matches.
+        number_of_matches_per_candidate.sort(key=lambda values: (-values[0], values[1]))
+
+        number_of_matches, candidate_index = number_of_matches_per_candidate[0]
+        confidence = number_of_matches / len(sample)
+        if not number_of_matches or confidence < self._minimum_confidence:
+            return None
+
+        tried_candidate_indexes = {
+            index for _, index in number_of_matches_per_candidate
+        }
+        candidate_indexes = [index for _, index in number_of_matches_per_candidate]
+        candidate_indexes.extend(
+            index
+            for index in range(len(self._candidates))
+            if index not in tried_candidate_indexes
+        )
+
+        format_name = self._candidates[candidate_index][0]
+        try_parse_functions = [
+            self._candidates[index][1] for index in candidate_indexes
+        ]
+        return DateTimeStringParser(format_name, confidence, try_parse_functions)
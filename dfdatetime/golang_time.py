@@ -1,5 +1,6 @@
 """Golang time.Time timestamp implementation."""
 
+import array
 import decimal
 import struct
 
@@ -58,6 +59,13 @@ class GolangTime(interface.DateTimeValues):
 
     _EPOCH = GolangTimeEpoch()
 
+    # Number of seconds, nanoseconds and time zone offset in minutes.
+    _FIELDS_STRUCT = struct.Struct(">qih")
+
+    _RECORD_FORMATS = {1: ">Bqih", 2: ">Bqihb"}
+
+    _RECORD_SIZES = {1: 15, 2: 16}
+
     def __init__(self, golang_timestamp=None, precision=None):
         """Initializes a Golang time.Time timestamp.
 
@@ -85,6 +93,63 @@ class GolangTime(interface.DateTimeValues):
         """bytes: Golang time.Time timestamp or None if not set."""
         return self._golang_timestamp
 
+    @classmethod
+    def _DecodeRecords(cls, buffer):
+        """Decodes concatenated serialized Golang time.Time timestamps.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated serialized version 1
+              and version 2 Golang time.Time timestamps.
+
+        Yields:
+          tuple[int, int, int, int, int]: offset and size of the serialized
+              timestamp, number of seconds since January 1, 1 00:00:00, fraction
+              of second in nanoseconds and time zone offset in minutes, where -1
+              represents UTC.
+
+        Raises:
+          ValueError: if a serialized timestamp is not supported or truncated.
+        """
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+
+        # A buffer that only contains timestamps of the same version is unpacked
+        # in a single pass.
+        for version, record_size in cls._RECORD_SIZES.items():
+            number_of_records, remainder = divmod(buffer_size, record_size)
+            if number_of_records and not remainder:
+                versions = view[::record_size].tobytes()
+                if versions.count(version) == number_of_records:
+                    records = struct.iter_unpack(cls._RECORD_FORMATS[version], view)
+                    for offset, values in zip(
+                        range(0, buffer_size, record_size), records
+                    ):
+                        yield (offset, record_size, *values[1:4])
+
+                    return
+
+        offset = 0
+        while offset < buffer_size:
+            version = view[offset]
+            record_size = cls._RECORD_SIZES.get(version)
+            if not record_size:
+                raise ValueError(
+                    f"Unsupported Golang time.Time timestamp version: {version:d} "
+                    f"at offset: {offset:d}."
+                )
+
+            if offset + record_size > buffer_size:
+                raise ValueError(
+                    f"Truncated Golang time.Time timestamp at offset: {offset:d}."
+                )
+
+            number_of_seconds, nanoseconds, time_zone_offset = (
+                cls._FIELDS_STRUCT.unpack_from(view, offset + 1)
+            )
+            yield offset, record_size, number_of_seconds, nanoseconds, time_zone_offset
+
+            offset += record_size
+
     def _GetNormalizedTimestamp(self):
         """Retrieves the normalized timestamp.
 
@@ -142,8 +207,8 @@ class GolangTime(interface.DateTimeValues):
             raise ValueError("Unsupported Golang time.Time timestamp.")
 
         try:
-            number_of_seconds, nanoseconds, time_zone_offset = struct.unpack(
-                ">qih", golang_timestamp[1:15]
+            number_of_seconds, nanoseconds, time_zone_offset = (
+                self._FIELDS_STRUCT.unpack_from(golang_timestamp, 1)
             )
             # TODO: add support for version 2 time zone offset in seconds
 
@@ -174,15 +239,16 @@ class GolangTime(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         if year < 0:
             raise ValueError(f"Year value not supported: {year!s}.")
@@ -210,12 +276,10 @@ class GolangTime(interface.DateTimeValues):
         number_of_days, hours, minutes, seconds = self._GetTimeValues(
             self._number_of_seconds
         )
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
         return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}.{self._nanoseconds:09d}"
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{self._nanoseconds:09d}"
         )
 
     def CopyToSerializableDict(self):
@@ -230,5 +294,88 @@ class GolangTime(interface.DateTimeValues):
             "golang_timestamp": self._golang_timestamp,
         }
 
+    @classmethod
+    def DecodeBuffer(cls, buffer):
+        """Decodes concatenated serialized Golang time.Time timestamps in bulk.
+
+        The serialized timestamps are decoded directly from the buffer, without
+        copying the individual timestamps, for example to decode the timestamps
+        of BoltDB or Docker metadata.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated serialized version 1
+              and version 2 Golang time.Time timestamps.
+
+        Returns:
+          tuple[array.array, array.array, array.array]: number of seconds since
+              January 1, 1 00:00:00, fraction of second in nanoseconds and time
+              zone offset in minutes per timestamp.
+
+        Raises:
+          ValueError: if a serialized timestamp is not supported or truncated.
+        """
+        numbers_of_seconds = array.array("q")
+        nanoseconds_values = array.array("l")
+        time_zone_offsets = array.array("h")
+
+        for (
+            _,
+            _,
+            number_of_seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) in cls._DecodeRecords(buffer):
+            # A time zone offset of -1 minute is a special representation for UTC.
+            if time_zone_offset == -1:
+                time_zone_offset = 0
+
+            numbers_of_seconds.append(number_of_seconds)
+            nanoseconds_values.append(nanoseconds)
+            time_zone_offsets.append(time_zone_offset)
+
+        return numbers_of_seconds, nanoseconds_values, time_zone_offsets
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, precision=None):
+        """Creates Golang time.Time timestamps from a buffer.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated serialized version 1
+              and version 2 Golang time.Time timestamps.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[GolangTime]: Golang time.Time timestamps.
+
+        Raises:
+          ValueError: if a serialized timestamp is not supported or truncated.
+        """
+        # pylint: disable=protected-access
+        view = memoryview(buffer).cast("B")
+
+        golang_times = []
+        for (
+            offset,
+            record_size,
+            number_of_seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) in cls._DecodeRecords(view):
+            # A time zone offset of -1 minute is a special representation for UTC.
+            if time_zone_offset == -1:
+                time_zone_offset = 0
+
+            golang_time = cls(precision=precision)
+            golang_time._golang_timestamp = view[
+                offset : offset + record_size
+            ].tobytes()
+            golang_time._nanoseconds = nanoseconds
+            golang_time._number_of_seconds = number_of_seconds
+            golang_time._time_zone_offset = time_zone_offset
+            golang_times.append(golang_time)
+
+        return golang_times
+
 
 factory.Factory.RegisterDateTimeValues(GolangTime)
@@ -0,0 +1,89 @@
+"""GPS timestamp implementation."""
+
+import decimal
+
+from dfdatetime import factory
+from dfdatetime import interface
+from dfdatetime import tai_time
+
+
+class GPSTimeEpoch(interface.DateTimeEpoch):
+    """GPS time epoch."""
+
+    def __init__(self):
+        """Initializes a GPS time epoch."""
+        super().__init__(1980, 1, 6)
+
+
+class GPSTime(tai_time.TAITime):
+    """GPS timestamp.
+
+    The GPS timestamp is a signed 64-bit integer that contains the number of
+    nanoseconds since 1980-01-06 00:00:00 in the GPS timescale. GPS time does
+    not have leap seconds and is 19 seconds behind TAI, hence it is ahead of UTC
+    by the TAI - UTC offset minus 19 seconds, such as 18 seconds since 2017.
+
+    GPS time is commonly stored as a week number and the number of seconds in
+    the week, such as in GPS receiver and flight logs.
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _EPOCH = GPSTimeEpoch()
+
+    # The difference between January 6, 1980 and January 1, 1970 in seconds.
+    _POSIX_BASE = -315964800
+
+    _SECONDS_PER_WEEK = 7 * 24 * 60 * 60
+
+    # The number of seconds between January 1, 1970 00:00:00 TAI and the epoch,
+    # which is 19 seconds after January 6, 1980 00:00:00 TAI.
+    _TAI_BASE = 315964819
+
+    @classmethod
+    def NewFromWeekAndSeconds(
+        cls, week, seconds, leap_second_table=None, precision=None
+    ):
+        """Creates a GPS timestamp from a week number and seconds in the week.
+
+        Args:
+          week (int): number of weeks since the epoch, which is the full week
+              number and not the 10-bit week number that rolls over every 1024
+              weeks.
+          seconds (int|float|decimal.Decimal): number of seconds since the start
+              of the week, where a fraction of second smaller than nanoseconds
+              is truncated.
+          leap_second_table (Optional[LeapSecondTable]): leap second table, where
+              None represents the leap second table with the leap seconds up to
+              and including 2017-01-01.
+          precision (Optional[str]): precision of the date and time value, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          GPSTime: GPS timestamp.
+
+        Raises:
+          ValueError: if the week number or seconds are out of bounds.
+        """
+        if week < 0:
+            raise ValueError(f"Week value: {week!s} out of bounds.")
+
+        if seconds < 0 or seconds >= cls._SECONDS_PER_WEEK:
+            raise ValueError(f"Seconds value: {seconds!s} out of bounds.")
+
+        units_per_second = cls._UNITS_PER_SECOND
+
+        # The seconds are converted by their string representation, so that
+        # the fraction of second of a floating-point value is preserved.
+        timestamp = week * cls._SECONDS_PER_WEEK * units_per_second
+        timestamp += int(decimal.Decimal(str(seconds)) * units_per_second)
+
+        return cls(
+            leap_second_table=leap_second_table,
+            precision=precision,
+            timestamp=timestamp,
+        )
+
+
+factory.Factory.RegisterDateTimeValues(GPSTime)
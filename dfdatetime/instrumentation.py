@@ -0,0 +1,422 @@
+"""Opt-in instrumentation of date and time values hot paths.
+
+When enabled the methods of the date and time values types registered with
+the factory are wrapped to count calls, normalized timestamp and date with time
+of day cache hits and misses, and exceptions per type and method, and to record
+sampled latency histograms. When disabled the original methods are restored,
+hence instrumentation has no overhead when it is not used.
+"""
+
+import threading
+import time
+import types
+
+from dfdatetime import factory
+from dfdatetime import interface
+
+
+class MethodStatistics:
+    """Statistics of an instrumented method.
+
+    Attributes:
+      cache_hits (int): number of calls that were served from a cache.
+      cache_misses (int): number of calls that were not served from a cache.
+      calls (int): number of calls.
+      exceptions (int): number of calls that raised an exception.
+      latency_histogram (dict[int, int]): number of sampled calls per latency
+          bucket, where the key is the upper bound of the bucket in nanoseconds.
+      sampled_calls (int): number of calls of which the latency was sampled.
+      sampled_latency (int): total latency of the sampled calls in nanoseconds.
+    """
+
+    def __init__(self):
+        """Initializes method statistics."""
+        super().__init__()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.calls = 0
+        self.exceptions = 0
+        self.latency_histogram = {}
+        self.sampled_calls = 0
+        self.sampled_latency = 0
+
+    def AddLatency(self, latency):
+        """Adds a sampled latency.
+
+        Args:
+          latency (int): latency in nanoseconds.
+        """
+        # Buckets are powers of 2 nanoseconds.
+        bucket = 1 << latency.bit_length()
+
+        self.latency_histogram[bucket] = self.latency_histogram.get(bucket, 0) + 1
+        self.sampled_calls += 1
+        self.sampled_latency += latency
+
+    def CopyToDict(self):
+        """Copies the method statistics to a dictionary.
+
+        Returns:
+          dict[str, object]: method statistics.
+        """
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "calls": self.calls,
+            "exceptions": self.exceptions,
+            "latency_histogram": dict(sorted(self.latency_histogram.items())),
+            "sampled_calls": self.sampled_calls,
+            "sampled_latency": self.sampled_latency,
+        }
+
+
+class InstrumentationScope:
+    """Scope of instrumentation measurements, such as a pipeline stage.
+
+    Attributes:
+      name (str): name of the scope.
+      statistics (dict[str, dict[str, object]]): statistics per "type.method"
+          recorded during the scope, which is set when the scope is exited.
+    """
+
+    def __init__(self, name=None, sample_rate=None):
+        """Initializes an instrumentation scope.
+
+        Args:
+          name (Optional[str]): name of the scope.
+          sample_rate (Optional[int]): sample the latency of every Nth call, used
+              when the scope has to enable instrumentation.
+        """
+        super().__init__()
+        self._enabled_instrumentation = False
+        self._sample_rate = sample_rate
+        self._start_snapshot = None
+        self.name = name
+        self.statistics = None
+
+    def __enter__(self):
+        """Enters a with statement."""
+        if not Instrumentation.IsEnabled():
+            Instrumentation.Enable(sample_rate=self._sample_rate)
+            self._enabled_instrumentation = True
+
+        self._start_snapshot = Instrumentation.GetSnapshot()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        """Exits a with statement."""
+        end_snapshot = Instrumentation.GetSnapshot()
+
+        if self._enabled_instrumentation:
+            Instrumentation.Disable()
+            self._enabled_instrumentation = False
+
+        self.statistics = Instrumentation.GetSnapshotDifference(
+            self._start_snapshot, end_snapshot
+        )
+
+
+class Instrumentation:
+    """Instrumentation of date and time values hot paths."""
+
+    DEFAULT_METHOD_NAMES = frozenset(
+        [
+            "_CopyDateTimeFromString",
+            "_CopyDateTimeTupleFromString",
+            "_GetDateWithTimeOfDay",
+            "_GetNormalizedTimestamp",
+            "CopyFromDateTimeString",
+            "CopyFromStringISO8601",
+            "CopyFromStringRFC1123",
+            "CopyFromStringRFC2822",
+            "CopyFromStringRFC822",
+            "CopyToDateTimeString",
+            "CopyToDateTimeStringISO8601",
+            "CopyToPosixTimestamp",
+            "CopyToPosixTimestampWithFractionOfSecond",
+            "GetPlasoTimestamp",
+        ]
+    )
+
+    DEFAULT_SAMPLE_RATE = 100
+
+    # pylint: disable=protected-access
+
+    # Functions to determine if a call of a method can be served from a cache.
+    _CACHE_CHECKS = {
+        "_GetNormalizedTimestamp": (
+            lambda date_time_values: date_time_values._normalized_timestamp is not None
+        ),
+        "_GetDateWithTimeOfDay": (
+            lambda date_time_values: date_time_values._normalized_timestamp is not None
+            and date_time_values._cached_date_time_values is not None
+            and date_time_values._cached_date_time_values[0]
+            == date_time_values._normalized_timestamp
+        ),
+    }
+
+    _lock = threading.Lock()
+
+    # Methods that were replaced, as (type, method name, original method).
+    _original_methods = []
+
+    _sample_counter = 0
+    _sample_rate = DEFAULT_SAMPLE_RATE
+
+    _statistics = {}
+
+    _thread_local = threading.local()
+
+    @classmethod
+    def _GetMethodStatistics(cls, type_name, method_name):
+        """Retrieves the statistics of a method.
+
+        Args:
+          type_name (str): name of the date and time values type.
+          method_name (str): name of the method.
+
+        Returns:
+          MethodStatistics: method statistics.
+        """
+        key = f"{type_name:s}.{method_name:s}"
+        method_statistics = cls._statistics.get(key)
+        if method_statistics is None:
+            with cls._lock:
+                method_statistics = cls._statistics.setdefault(key, MethodStatistics())
+
+        return method_statistics
+
+    @classmethod
+    def _GetTypesToInstrument(cls):
+        """Retrieves the date and time values types to instrument.
+
+        Returns:
+          list[type]: date and time values types, including their date and time
+              values base types.
+        """
+        date_time_values_types = []
+        for date_time_values_type in factory.Factory._date_time_values_types.values():
+            for base_type in date_time_values_type.__mro__:
+                if (
+                    issubclass(base_type, interface.DateTimeValues)
+                    and base_type not in date_time_values_types
+                ):
+                    date_time_values_types.append(base_type)
+
+        return date_time_values_types
+
+    @classmethod
+    def _WrapMethod(cls, method_name, method):
+        """Wraps a method to record statistics.
+
+        Args:
+          method_name (str): name of the method.
+          method (function): method to wrap.
+
+        Returns:
+          function: wrapped method.
+        """
+        cache_check = cls._CACHE_CHECKS.get(method_name)
+        thread_local = cls._thread_local
+
+        def _InstrumentedMethod(self, *args, **kwargs):
+            """Records statistics of a call to an instrumented method."""
+            active_calls = getattr(thread_local, "active_calls", None)
+            if active_calls is None:
+                active_calls = set()
+                thread_local.active_calls = active_calls
+
+            # Calls to overridden implementations of the same method, such as
+            # via super(), are recorded only once.
+            call_key = (id(self), method_name)
+            if call_key in active_calls:
+                return method(self, *args, **kwargs)
+
+            method_statistics = cls._GetMethodStatistics(
+                type(self).__name__, method_name
+            )
+            method_statistics.calls += 1
+
+            if cache_check:
+                if cache_check(self):
+                    method_statistics.cache_hits += 1
+                else:
+                    method_statistics.cache_misses += 1
+
+            cls._sample_counter += 1
+            is_sampled = cls._sample_counter % cls._sample_rate == 0
+
+            active_calls.add(call_key)
+            try:
+                if not is_sampled:
+                    return method(self, *args, **kwargs)
+
+                start_time = time.perf_counter_ns()
+                try:
+                    return method(self, *args, **kwargs)
+                finally:
+                    method_statistics.AddLatency(time.perf_counter_ns() - start_time)
+
+            except Exception:
+                method_statistics.exceptions += 1
+                raise
+
+            finally:
+                active_calls.discard(call_key)
+
+        _InstrumentedMethod.__doc__ = method.__doc__
+        _InstrumentedMethod.__name__ = method.__name__
+        _InstrumentedMethod.__wrapped__ = method
+        return _InstrumentedMethod
+
+    @classmethod
+    def Disable(cls):
+        """Disables instrumentation and restores the original methods."""
+        with cls._lock:
+            for date_time_values_type, method_name, method in reversed(
+                cls._original_methods
+            ):
+                setattr(date_time_values_type, method_name, method)
+
+            cls._original_methods = []
+
+    @classmethod
+    def Enable(cls, method_names=None, sample_rate=None):
+        """Enables instrumentation.
+
+        Only date and time values types registered with the factory at the time
+        instrumentation is enabled are instrumented.
+
+        Args:
+          method_names (Optional[set[str]]): names of the methods to instrument,
+              where None represents DEFAULT_METHOD_NAMES.
+          sample_rate (Optional[int]): sample the latency of every Nth call, where
+              None represents DEFAULT_SAMPLE_RATE.
+
+        Raises:
+          ValueError: if instrumentation is already enabled or the sample rate is
+              out of bounds.
+        """
+        if sample_rate is None:
+            sample_rate = cls.DEFAULT_SAMPLE_RATE
+
+        if sample_rate < 1:
+            raise ValueError(f"Sample rate value: {sample_rate:d} out of bounds.")
+
+        if cls._original_methods:
+            raise ValueError("Instrumentation already enabled.")
+
+        method_names = method_names or cls.DEFAULT_METHOD_NAMES
+
+        with cls._lock:
+            cls._sample_counter = 0
+            cls._sample_rate = sample_rate
+
+            for date_time_values_type in cls._GetTypesToInstrument():
+                for method_name in sorted(method_names):
+                    # Only methods defined by the type itself are wrapped, since
+                    # inherited methods are wrapped on the type that defines them.
+                    method = date_time_values_type.__dict__.get(method_name)
+                    if not isinstance(method, types.FunctionType):
+                        continue
+
+                    setattr(
+                        date_time_values_type,
+                        method_name,
+                        cls._WrapMethod(method_name, method),
+                    )
+                    cls._original_methods.append(
+                        (date_time_values_type, method_name, method)
+                    )
+
+    @classmethod
+    def GetSnapshot(cls):
+        """Retrieves a snapshot of the statistics.
+
+        Returns:
+          dict[str, dict[str, object]]: statistics per "type.method".
+        """
+        with cls._lock:
+            items = list(cls._statistics.items())
+
+        return {
+            key: method_statistics.CopyToDict()
+            for key, method_statistics in sorted(items)
+        }
+
+    @classmethod
+    def GetSnapshotDifference(cls, start_snapshot, end_snapshot):
+        """Determines the difference between two statistics snapshots.
+
+        Args:
+          start_snapshot (dict[str, dict[str, object]]): statistics per
+              "type.method" at the start.
+          end_snapshot (dict[str, dict[str, object]]): statistics per
+              "type.method" at the end.
+
+        Returns:
+          dict[str, dict[str, object]]: statistics per "type.method" recorded
+              between both snapshots, without methods that were not called.
+        """
+        difference = {}
+        for key, end_values in end_snapshot.items():
+            start_values = start_snapshot.get(key, {})
+
+            values = {}
+            for name, end_value in end_values.items():
+                start_value = start_values.get(name)
+                if name == "latency_histogram":
+                    start_value = start_value or {}
+                    histogram = {
+                        bucket: count - start_value.get(bucket, 0)
+                        for bucket, count in end_value.items()
+                    }
+                    values[name] = {
+                        bucket: count for bucket, count in histogram.items() if count
+                    }
+                else:
+                    values[name] = end_value - (start_value or 0)
+
+            if values["calls"]:
+                difference[key] = values
+
+        return difference
+
+    @classmethod
+    def IsEnabled(cls):
+        """Determines if instrumentation is enabled.
+
+        Returns:
+          bool: True if instrumentation is enabled.
+        """
+        return bool(cls._original_methods)
+
+    @classmethod
+    def Reset(cls):
+        """Resets the statistics."""
+        with cls._lock:
+            cls._sample_counter = 0
+            cls._statistics = {}
+
+    @classmethod
+    def Scope(cls, name=None, sample_rate=None):
+        """Creates a scope for instrumentation measurements.
+
+        The scope enables instrumentation, if not already enabled, for the
+        duration of a with statement and records the statistics of the calls
+        made in the scope, for example:
+
+          with Instrumentation.Scope(name="parse") as scope:
+            ...
+
+          print(scope.statistics)
+
+        Args:
+          name (Optional[str]): name of the scope, such as a pipeline stage.
+          sample_rate (Optional[int]): sample the latency of every Nth call, used
+              when the scope has to enable instrumentation.
+
+        Returns:
+          InstrumentationScope: instrumentation scope.
+        """
+        return InstrumentationScope(name=name, sample_rate=sample_rate)
@@ -1,8 +1,12 @@
 """Date and time interfaces."""
 
 import abc
+import array
 import decimal
+import re
+import struct
 
+from dfdatetime import caches
 from dfdatetime import definitions
 
 
@@ -77,6 +81,23 @@ class DateTimeValues:
     _UINT60_MAX = (1 << 60) - 1
     _UINT64_MAX = (1 << 64) - 1
 
+    # Canonical shapes of a date and time string: "YYYY-MM-DD" optionally
+    # followed by " hh:mm:ss", a 3, 6 or 9 digit seconds fraction and a
+    # "[+-]##:##" time zone offset.
+    _DATE_TIME_STRING_RE = re.compile(
+        r"([0-9]{4})-([0-9]{2})-([0-9]{2})"
+        r"(?: ([0-9]{2}):([0-9]{2}):([0-9]{2})"
+        r"(?:\.([0-9]{9}|[0-9]{6}|[0-9]{3}))?"
+        r"(?:([+-])([0-9]{2}):([0-9]{2}))?)?"
+    )
+
+    # Decimal integer as supported by int(), which allows surrounding white
+    # space, except for the information separators 0x1c - 0x1f, a sign and
+    # underscores between digits.
+    _INTEGER_STRING_RE = re.compile(r"[^\S\x1c-\x1f]*[+-]?\d+(?:_\d+)*[^\S\x1c-\x1f]*")
+
+    _FRACTION_OF_SECOND_MULTIPLIERS = {3: 1000000, 6: 1000, 9: 1}
+
     _REMAINDER_MULTIPLIER = {
         definitions.PRECISION_1_MILLISECOND: _1_MILLISECOND_PER_SECOND,
         definitions.PRECISION_10_MILLISECONDS: _10_MILLISECONDS_PER_SECOND,
@@ -89,6 +110,16 @@ class DateTimeValues:
         definitions.PRECISION_100_NANOSECONDS: _100_NANOSECONDS_PER_SECOND,
     }
 
+    # Maximum number of strings per string cache.
+    _MAXIMUM_NUMBER_OF_CACHED_STRINGS = 4096
+
+    # Date strings per epoch date and number of days since the epoch and time zone
+    # offset strings per time zone offset, shared by all date and time values
+    # types, since consecutive date and time values often share the same date
+    # and time zone offset.
+    _date_strings = {}
+    _time_zone_offset_strings = {}
+
     def __init__(self, is_delta=False, precision=None, time_zone_offset=None):
         """Initializes date time values.
 
@@ -310,35 +341,11 @@ class DateTimeValues:
         Raises:
           ValueError: if the date string is invalid or not supported.
         """
-        date_string_length = len(date_string)
+        date_tuple, error_message = self._ParseDateFromString(date_string)
+        if error_message:
+            raise ValueError(error_message)
 
-        # The date string should at least contain 'YYYY-MM-DD'.
-        if date_string_length < 10:
-            raise ValueError("Date string too short.")
-
-        if date_string[4] != "-" or date_string[7] != "-":
-            raise ValueError("Invalid date string.")
-
-        try:
-            year = int(date_string[0:4], 10)
-        except ValueError:
-            raise ValueError("Unable to parse year.")
-
-        try:
-            month = int(date_string[5:7], 10)
-        except ValueError:
-            raise ValueError("Unable to parse month.")
-
-        try:
-            day_of_month = int(date_string[8:10], 10)
-        except ValueError:
-            raise ValueError("Unable to parse day of month.")
-
-        days_per_month = self._GetDaysPerMonth(year, month)
-        if day_of_month < 1 or day_of_month > days_per_month:
-            raise ValueError("Day of month value out of bounds.")
-
-        return year, month, day_of_month
+        return date_tuple
 
     def _CopyDateTimeFromString(self, time_string):
         """Copies a date and time from a string.
@@ -359,42 +366,61 @@ class DateTimeValues:
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        if not time_string:
-            raise ValueError("Invalid time string.")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
+
+        date_time_values = {"year": year, "month": month, "day_of_month": day_of_month}
+
+        if len(time_string) > 10:
+            date_time_values["hours"] = hours
+            date_time_values["minutes"] = minutes
+            date_time_values["seconds"] = seconds
+
+            if len(time_string) > 19 and time_string[19] == ".":
+                date_time_values["nanoseconds"] = nanoseconds
 
-        time_string_length = len(time_string)
+        if time_zone_offset is not None:
+            date_time_values["time_zone_offset"] = time_zone_offset
 
-        year, month, day_of_month = self._CopyDateFromString(time_string)
+        return date_time_values
 
-        if time_string_length <= 10:
-            return {"year": year, "month": month, "day_of_month": day_of_month}
+    def _CopyDateTimeTupleFromString(self, time_string):
+        """Copies a date and time from a string.
 
-        # If a time of day is specified the time string it should at least
-        # contain 'YYYY-MM-DD hh:mm:ss'.
-        if time_string[10] != " ":
-            raise ValueError(
-                "Invalid time string - space missing as date and time separator."
-            )
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
 
-        hours, minutes, seconds, nanoseconds, time_zone_offset = (
-            self._CopyTimeFromString(time_string[11:])
-        )
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
 
-        date_time_values = {
-            "year": year,
-            "month": month,
-            "day_of_month": day_of_month,
-            "hours": hours,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the hours, minutes, seconds and nanoseconds are 0 and the time
+              zone offset is None if not defined.
 
-        if nanoseconds is not None:
-            date_time_values["nanoseconds"] = nanoseconds
-        if time_zone_offset is not None:
-            date_time_values["time_zone_offset"] = time_zone_offset
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        date_time_tuple = self._GetDateTimeTupleFromString(time_string)
+        if not date_time_tuple:
+            # Parse the time string again to determine why it is invalid, which
+            # is not cached.
+            _, error_message = self._ParseDateTimeTupleFromString(time_string)
+            raise ValueError(error_message)
 
-        return date_time_values
+        return date_time_tuple
 
     def _CopyTimeFromString(self, time_string):
         """Copies a time from a string.
@@ -414,126 +440,139 @@ class DateTimeValues:
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        time_string_length = len(time_string)
+        time_tuple, error_message = self._ParseTimeFromString(time_string)
+        if error_message:
+            raise ValueError(error_message)
 
-        # The time string should at least contain 'hh:mm:ss'.
-        if time_string_length < 8:
-            raise ValueError("Time string too short.")
+        return time_tuple
 
-        if time_string[2] != ":" or time_string[5] != ":":
-            raise ValueError("Invalid time string.")
-
-        try:
-            hours = int(time_string[0:2], 10)
-        except ValueError:
-            raise ValueError("Unable to parse hours.")
-
-        if hours not in range(0, 24):
-            raise ValueError(f"Hours value: {hours:d} out of bounds.")
-
-        try:
-            minutes = int(time_string[3:5], 10)
-        except ValueError:
-            raise ValueError("Unable to parse minutes.")
-
-        if minutes not in range(0, 60):
-            raise ValueError(f"Minutes value: {minutes:d} out of bounds.")
-
-        try:
-            seconds = int(time_string[6:8], 10)
-        except ValueError:
-            raise ValueError("Unable to parse day of seconds.")
+    def _CreateSerializableDict(self):
+        """Creates a serializable dictionary.
 
-        # TODO: support a leap second?
-        if seconds not in range(0, 60):
-            raise ValueError(f"Seconds value: {seconds:d} out of bounds.")
+        Returns:
+          dict[str, object]: serializable dictionary.
+        """
+        serializable_dict = {
+            "__class_name__": type(self).__name__,
+            "__type__": "DateTimeValues",
+        }
+        if self.is_local_time:
+            serializable_dict["is_local_time"] = True
+        if self._time_zone_offset:
+            serializable_dict["time_zone_offset"] = self._time_zone_offset
+        if self.time_zone_hint:
+            serializable_dict["time_zone_hint"] = self.time_zone_hint
 
-        nanoseconds = None
-        time_zone_offset = None
+        return serializable_dict
 
-        time_zone_string_index = 8
-        while time_zone_string_index < time_string_length:
-            if time_string[time_zone_string_index] in ("+", "-"):
-                break
+    def _GetDateTimeTupleFromMatch(self, match):
+        """Retrieves a date and time tuple from a date and time string match.
 
-            time_zone_string_index += 1
+        Args:
+          match (re.Match): match of the canonical date and time string regular
+              expression.
 
-        # The calculations that follow rely on the time zone string index
-        # to point beyond the string in case no time zone offset was defined.
-        if time_zone_string_index == time_string_length - 1:
-            time_zone_string_index += 1
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes
+              or None if a value is out of bounds.
+        """
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            fraction_of_second,
+            time_zone_sign,
+            time_zone_hours,
+            time_zone_minutes,
+        ) = match.groups()
+
+        year = int(year, 10)
+        month = int(month, 10)
+        day_of_month = int(day_of_month, 10)
+
+        if month < 1 or month > 12 or day_of_month < 1:
+            return None
 
-        if time_string_length > 8 and time_string[8] == ".":
-            time_fraction_length = time_zone_string_index - 9
-            if time_fraction_length not in (3, 6, 9):
-                raise ValueError("Invalid time string.")
+        if day_of_month > self._GetDaysPerMonth(year, month):
+            return None
 
-            try:
-                time_fraction = time_string[9:time_zone_string_index]
-                time_fraction = int(time_fraction, 10)
-            except ValueError:
-                raise ValueError("Unable to parse time fraction.")
+        if hours is None:
+            return year, month, day_of_month, 0, 0, 0, 0, None
 
-            if time_fraction_length == 3:
-                time_fraction *= 1000000
-            elif time_fraction_length == 6:
-                time_fraction *= 1000
+        hours = int(hours, 10)
+        minutes = int(minutes, 10)
+        seconds = int(seconds, 10)
 
-            nanoseconds = time_fraction
+        if hours > 23 or minutes > 59 or seconds > 59:
+            return None
 
-        if time_zone_string_index < time_string_length:
-            if (
-                time_string_length - time_zone_string_index != 6
-                or time_string[time_zone_string_index + 3] != ":"
-            ):
-                raise ValueError("Invalid time string.")
+        nanoseconds = 0
+        if fraction_of_second:
+            nanoseconds = int(fraction_of_second, 10) * (
+                self._FRACTION_OF_SECOND_MULTIPLIERS[len(fraction_of_second)]
+            )
 
-            try:
-                hours_from_utc = int(
-                    time_string[time_zone_string_index + 1 : time_zone_string_index + 3]
-                )
-            except ValueError:
-                raise ValueError("Unable to parse time zone hours offset.")
+        time_zone_offset = None
+        if time_zone_sign:
+            time_zone_hours = int(time_zone_hours, 10)
+            time_zone_minutes = int(time_zone_minutes, 10)
 
-            if hours_from_utc not in range(0, 15):
-                raise ValueError("Time zone hours offset value out of bounds.")
+            if time_zone_hours > 14 or time_zone_minutes > 59:
+                return None
 
-            try:
-                minutes_from_utc = int(
-                    time_string[time_zone_string_index + 4 : time_zone_string_index + 6]
-                )
-            except ValueError:
-                raise ValueError("Unable to parse time zone minutes offset.")
+            time_zone_offset = (time_zone_hours * 60) + time_zone_minutes
+            if time_zone_sign == "-":
+                time_zone_offset = -time_zone_offset
 
-            if minutes_from_utc not in range(0, 60):
-                raise ValueError("Time zone minutes offset value out of bounds.")
+        return (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        )
 
-            # pylint: disable=invalid-unary-operand-type
-            time_zone_offset = (hours_from_utc * 60) + minutes_from_utc
+    def _GetDateTimeTupleFromString(self, time_string):
+        """Retrieves a date and time tuple from a string.
 
-            if time_string[time_zone_string_index] == "-":
-                time_zone_offset = -time_zone_offset
+        The date and time tuple is retrieved from the "date_time" parse cache
+        when enabled.
 
-        return hours, minutes, seconds, nanoseconds, time_zone_offset
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
 
-    def _CreateSerializableDict(self):
-        """Creates a serializable dictionary.
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
 
         Returns:
-          dict[str, object]: serializable dictionary.
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the hours, minutes, seconds and nanoseconds are 0 and the time
+              zone offset is None if not defined, or None if the time string is
+              invalid or not supported.
         """
-        serializable_dict = {
-            "__class_name__": type(self).__name__,
-            "__type__": "DateTimeValues",
-        }
-        if self.is_local_time:
-            serializable_dict["is_local_time"] = True
-        if self._time_zone_offset:
-            serializable_dict["time_zone_offset"] = self._time_zone_offset
-        if self.time_zone_hint:
-            serializable_dict["time_zone_hint"] = self.time_zone_hint
+        cache = caches.ParseCaches.GetCache("date_time")
+        if cache is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromString(time_string)
+            return date_time_tuple
 
-        return serializable_dict
+        date_time_tuple = cache.Get(time_string)
+        if date_time_tuple is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromString(time_string)
+            if date_time_tuple:
+                cache.Put(time_string, date_time_tuple)
+
+        return date_time_tuple
 
     def _GetDateValues(
         self, number_of_days, epoch_year, epoch_month, epoch_day_of_month
@@ -660,6 +699,38 @@ class DateTimeValues:
 
         return year, month, number_of_days
 
+    def _GetDateStringWithEpoch(self, number_of_days, date_time_epoch):
+        """Retrieves a date string.
+
+        Args:
+          number_of_days (int): number of days since epoch.
+          date_time_epoch (DateTimeEpoch): date and time of the epoch.
+
+        Returns:
+           str: date formatted as: "YYYY-MM-DD".
+        """
+        date_strings = DateTimeValues._date_strings
+
+        lookup_key = (
+            date_time_epoch.year,
+            date_time_epoch.month,
+            date_time_epoch.day_of_month,
+            number_of_days,
+        )
+        date_string = date_strings.get(lookup_key)
+        if date_string is None:
+            year, month, day_of_month = self._GetDateValuesWithEpoch(
+                number_of_days, date_time_epoch
+            )
+            date_string = f"{year:04d}-{month:02d}-{day_of_month:02d}"
+
+            if len(date_strings) >= self._MAXIMUM_NUMBER_OF_CACHED_STRINGS:
+                date_strings.clear()
+
+            date_strings[lookup_key] = date_string
+
+        return date_string
+
     def _GetDateValuesWithEpoch(self, number_of_days, date_time_epoch):
         """Determines date values.
 
@@ -768,6 +839,21 @@ class DateTimeValues:
 
         return days_per_month
 
+    def _GetIntegerFromString(self, string):
+        """Retrieves a decimal integer from a string.
+
+        Args:
+          string (str): string of a decimal integer, which can be surrounded by
+              white space and prefixed with a sign, as supported by int().
+
+        Returns:
+          int: integer or None if the string does not represent a decimal integer.
+        """
+        if not self._INTEGER_STRING_RE.fullmatch(string):
+            return None
+
+        return int(string, 10)
+
     @abc.abstractmethod
     def _GetNormalizedTimestamp(self):
         """Retrieves the normalized timestamp.
@@ -779,6 +865,48 @@ class DateTimeValues:
               determined.
         """
 
+    @classmethod
+    def _GetNormalizedTimestampFromFloat(
+        cls, timestamp, posix_base, seconds_per_unit, time_zone_offset
+    ):
+        """Retrieves the normalized timestamp of a floating-point timestamp.
+
+        The timestamp is converted by means of its integer ratio, which is exact,
+        and is rounded like decimal.Decimal(timestamp) - posix_base multiplied
+        by the number of seconds per unit.
+
+        Args:
+          timestamp (float): floating-point timestamp, which contains the number
+              of units, such as days, since its epoch.
+          posix_base (int): number of units between the epoch of the timestamp
+              and January 1, 1970 00:00:00.
+          seconds_per_unit (int): number of seconds per unit.
+          time_zone_offset (int): time zone offset in number of minutes from UTC
+              or None if not set.
+
+        Returns:
+          decimal.Decimal: normalized timestamp, which contains the number of
+              seconds since January 1, 1970 00:00:00 and a fraction of second used
+              for increased precision.
+        """
+        try:
+            numerator, denominator = timestamp.as_integer_ratio()
+        except (OverflowError, ValueError):
+            # Infinity and NaN do not have an integer ratio.
+            normalized_timestamp = decimal.Decimal(timestamp) - posix_base
+        else:
+            normalized_timestamp = (
+                decimal.Decimal(numerator - (posix_base * denominator)) / denominator
+            )
+
+        if seconds_per_unit != 1:
+            normalized_timestamp *= seconds_per_unit
+
+        if time_zone_offset:
+            normalized_timestamp -= time_zone_offset * 60
+
+        return normalized_timestamp
+
     def _GetNumberOfDaysInCentury(self, year):
         """Retrieves the number of days in a century.
 
@@ -882,6 +1010,96 @@ class DateTimeValues:
 
         return number_of_seconds
 
+    @classmethod
+    def _GetPosixTimestampsInMicrosecondsFromFloats(
+        cls, timestamps, posix_base, seconds_per_unit, time_zone_offset
+    ):
+        """Retrieves POSIX timestamps in microseconds of floating-point timestamps.
+
+        The timestamps are converted in integer arithmetic by means of their
+        integer ratio and rounded half up like GetPlasoTimestamp. A timestamp
+        that is so close to halfway between two microseconds that the rounding
+        of the decimal arithmetic of GetPlasoTimestamp could affect the result is
+        converted with the decimal arithmetic instead, hence the results are
+        identical to those of GetPlasoTimestamp.
+
+        Args:
+          timestamps (Iterable[float]): floating-point timestamps, which contain
+              the number of units, such as days, since their epoch.
+          posix_base (int): number of units between the epoch of the timestamps
+              and January 1, 1970 00:00:00.
+          seconds_per_unit (int): number of seconds per unit.
+          time_zone_offset (int): time zone offset in number of minutes from UTC
+              or None if not set.
+
+        Returns:
+          tuple[array.array, bytearray]: POSIX timestamps in microseconds, where
+              invalid timestamps are represented by 0, and validity mask, where 1
+              represents a valid and 0 an invalid timestamp, such as infinity,
+              NaN or a timestamp that exceeds 64-bit.
+        """
+        microseconds_per_unit = seconds_per_unit * definitions.MICROSECONDS_PER_SECOND
+        posix_base_in_microseconds = posix_base * microseconds_per_unit
+        time_zone_offset_in_microseconds = (
+            (time_zone_offset or 0) * 60 * definitions.MICROSECONDS_PER_SECOND
+        )
+        maximum_rounding_error_base = abs(time_zone_offset_in_microseconds) + 1
+        minimum_posix_timestamp = -(1 << 63)
+        maximum_posix_timestamp = (1 << 63) - 1
+
+        posix_timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for timestamp in timestamps:
+            try:
+                numerator, denominator = timestamp.as_integer_ratio()
+            except (OverflowError, ValueError):
+                posix_timestamps.append(0)
+                validity_mask.append(0)
+                continue
+
+            numerator = (numerator * microseconds_per_unit) - (
+                (posix_base_in_microseconds + time_zone_offset_in_microseconds)
+                * denominator
+            )
+            posix_timestamp, remainder = divmod(numerator, denominator)
+
+            # The decimal arithmetic rounds its intermediate results to 28
+            # significant digits, which is an error of less than 2^-80 times
+            # the magnitude of the result and time zone offset.
+            distance_to_halfway = abs((2 * remainder) - denominator)
+            if (distance_to_halfway << 80) <= denominator * (
+                abs(posix_timestamp) + maximum_rounding_error_base
+            ):
+                normalized_timestamp = cls._GetNormalizedTimestampFromFloat(
+                    timestamp, posix_base, seconds_per_unit, time_zone_offset
+                )
+                normalized_timestamp *= definitions.MICROSECONDS_PER_SECOND
+                try:
+                    posix_timestamp = int(
+                        normalized_timestamp.quantize(1, rounding=decimal.ROUND_HALF_UP)
+                    )
+                except decimal.InvalidOperation:
+                    posix_timestamp = None
+
+            elif 2 * remainder > denominator or (
+                2 * remainder == denominator and posix_timestamp >= 0
+            ):
+                posix_timestamp += 1
+
+            if (
+                posix_timestamp is None
+                or posix_timestamp < minimum_posix_timestamp
+                or posix_timestamp > maximum_posix_timestamp
+            ):
+                posix_timestamps.append(0)
+                validity_mask.append(0)
+            else:
+                posix_timestamps.append(posix_timestamp)
+                validity_mask.append(1)
+
+        return posix_timestamps, validity_mask
+
     def _GetTimeValues(self, number_of_seconds):
         """Determines time values.
 
@@ -897,6 +1115,59 @@ class DateTimeValues:
         number_of_days, hours = divmod(number_of_hours, 24)
         return number_of_days, hours, minutes, seconds
 
+    def _GetTimeZoneOffsetString(self, time_zone_offset):
+        """Retrieves a time zone offset string.
+
+        Args:
+          time_zone_offset (int): time zone offset in number of minutes from UTC.
+
+        Returns:
+          str: time zone offset formatted as: "[+-]hh:mm".
+        """
+        time_zone_offset_strings = DateTimeValues._time_zone_offset_strings
+
+        time_zone_string = time_zone_offset_strings.get(time_zone_offset)
+        if time_zone_string is None:
+            if time_zone_offset >= 0:
+                time_zone_offset_sign = "+"
+            else:
+                time_zone_offset_sign = "-"
+
+            time_zone_offset_hours, time_zone_offset_minutes = divmod(
+                abs(time_zone_offset), 60
+            )
+            time_zone_string = (
+                f"{time_zone_offset_sign:s}{time_zone_offset_hours:02d}:"
+                f"{time_zone_offset_minutes:02d}"
+            )
+
+            if len(time_zone_offset_strings) >= self._MAXIMUM_NUMBER_OF_CACHED_STRINGS:
+                time_zone_offset_strings.clear()
+
+            time_zone_offset_strings[time_zone_offset] = time_zone_string
+
+        return time_zone_string
+
+    def _IsDateTimeStringCandidate(self, time_string):
+        """Determines if a string can be a date and time string.
+
+        This is a cheap check that does not parse the string, which is used to
+        reject strings that CopyFromDateTimeString certainly does not support.
+
+        Args:
+          time_string (str): string.
+
+        Returns:
+          bool: True if the string can be a date and time string formatted as:
+              "YYYY-MM-DD" optionally followed by a time of day.
+        """
+        return bool(
+            time_string
+            and len(time_string) >= 10
+            and time_string[4] == "-"
+            and time_string[7] == "-"
+        )
+
     def _IsLeapYear(self, year):
         """Determines if a year is a leap year.
 
@@ -909,6 +1180,273 @@ class DateTimeValues:
         # pylint: disable=consider-using-ternary
         return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
 
+    def _ParseDateFromString(self, date_string):
+        """Parses a date from a string.
+
+        An invalid date string is signaled by the return value, hence rejecting
+        a string does not raise an exception.
+
+        Args:
+          date_string (str): date value formatted as: YYYY-MM-DD
+
+        Returns:
+          tuple[tuple[int, int, int], str]: year, month and day of month and None,
+              or None and the reason the date string is invalid or not supported.
+        """
+        # The date string should at least contain 'YYYY-MM-DD'.
+        if len(date_string) < 10:
+            return None, "Date string too short."
+
+        if date_string[4] != "-" or date_string[7] != "-":
+            return None, "Invalid date string."
+
+        year = self._GetIntegerFromString(date_string[0:4])
+        if year is None:
+            return None, "Unable to parse year."
+
+        month = self._GetIntegerFromString(date_string[5:7])
+        if month is None:
+            return None, "Unable to parse month."
+
+        day_of_month = self._GetIntegerFromString(date_string[8:10])
+        if day_of_month is None:
+            return None, "Unable to parse day of month."
+
+        if month not in range(1, 13):
+            return None, "Month value out of bounds."
+
+        days_per_month = self._GetDaysPerMonth(year, month)
+        if day_of_month < 1 or day_of_month > days_per_month:
+            return None, "Day of month value out of bounds."
+
+        return (year, month, day_of_month), None
+
+    def _ParseDateTimeTupleFromString(self, time_string):
+        """Parses a date and time from a string.
+
+        Strings in one of the canonical shapes are parsed in a single pass, other
+        strings are parsed field by field, which also determines the reason an
+        invalid string is rejected. An invalid string is signaled by the return
+        value, hence rejecting a string does not raise an exception.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
+
+        Returns:
+          tuple[tuple[int, int, int, int, int, int, int, int], str]: year, month,
+              day of month, hours, minutes, seconds, nanoseconds and time zone
+              offset in minutes, where the hours, minutes, seconds and nanoseconds
+              are 0 and the time zone offset is None if not defined, and None, or
+              None and the reason the time string is invalid or not supported.
+        """
+        if not time_string:
+            return None, "Invalid time string."
+
+        match = self._DATE_TIME_STRING_RE.fullmatch(time_string)
+        if match:
+            date_time_tuple = self._GetDateTimeTupleFromMatch(match)
+            if date_time_tuple:
+                return date_time_tuple, None
+
+        date_tuple, error_message = self._ParseDateFromString(time_string)
+        if error_message:
+            return None, error_message
+
+        if len(time_string) <= 10:
+            return date_tuple + (0, 0, 0, 0, None), None
+
+        # If a time of day is specified the time string it should at least
+        # contain 'YYYY-MM-DD hh:mm:ss'.
+        if time_string[10] != " ":
+            return None, (
+                "Invalid time string - space missing as date and time separator."
+            )
+
+        time_tuple, error_message = self._ParseTimeFromString(time_string[11:])
+        if error_message:
+            return None, error_message
+
+        hours, minutes, seconds, nanoseconds, time_zone_offset = time_tuple
+
+        date_time_tuple = date_tuple + (
+            hours,
+            minutes,
+            seconds,
+            nanoseconds or 0,
+            time_zone_offset,
+        )
+        return date_time_tuple, None
+
+    def _ParseTimeFromString(self, time_string):
+        """Parses a time from a string.
+
+        An invalid time string is signaled by the return value, hence rejecting
+        a string does not raise an exception.
+
+        Args:
+          time_string (str): time value formatted as:
+              hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The seconds fraction and
+              time zone offset are optional.
+
+        Returns:
+          tuple[tuple[int, int, int, int, int], str]: hours, minutes, seconds,
+              nanoseconds and time zone offset in minutes and None, or None and
+              the reason the time string is invalid or not supported.
+        """
+        time_string_length = len(time_string)
+
+        # The time string should at least contain 'hh:mm:ss'.
+        if time_string_length < 8:
+            return None, "Time string too short."
+
+        if time_string[2] != ":" or time_string[5] != ":":
+            return None, "Invalid time string."
+
+        hours = self._GetIntegerFromString(time_string[0:2])
+        if hours is None:
+            return None, "Unable to parse hours."
+
+        if hours not in range(0, 24):
+            return None, f"Hours value: {hours:d} out of bounds."
+
+        minutes = self._GetIntegerFromString(time_string[3:5])
+        if minutes is None:
+            return None, "Unable to parse minutes."
+
+        if minutes not in range(0, 60):
+            return None, f"Minutes value: {minutes:d} out of bounds."
+
+        seconds = self._GetIntegerFromString(time_string[6:8])
+        if seconds is None:
+            return None, "Unable to parse day of seconds."
+
+        # TODO: support a leap second?
+        if seconds not in range(0, 60):
+            return None, f"Seconds value: {seconds:d} out of bounds."
+
+        nanoseconds = None
+        time_zone_offset = None
+
+        time_zone_string_index = 8
+        while time_zone_string_index < time_string_length:
+            if time_string[time_zone_string_index] in ("+", "-"):
+                break
+
+            time_zone_string_index += 1
+
+        # The calculations that follow rely on the time zone string index
+        # to point beyond the string in case no time zone offset was defined.
+        if time_zone_string_index == time_string_length - 1:
+            time_zone_string_index += 1
+
+        if time_string_length > 8 and time_string[8] == ".":
+            time_fraction_length = time_zone_string_index - 9
+            if time_fraction_length not in self._FRACTION_OF_SECOND_MULTIPLIERS:
+                return None, "Invalid time string."
+
+            time_fraction = self._GetIntegerFromString(
+                time_string[9:time_zone_string_index]
+            )
+            if time_fraction is None:
+                return None, "Unable to parse time fraction."
+
+            nanoseconds = time_fraction * (
+                self._FRACTION_OF_SECOND_MULTIPLIERS[time_fraction_length]
+            )
+
+        if time_zone_string_index < time_string_length:
+            if (
+                time_string_length - time_zone_string_index != 6
+                or time_string[time_zone_string_index + 3] != ":"
+            ):
+                return None, "Invalid time string."
+
+            hours_from_utc = self._GetIntegerFromString(
+                time_string[time_zone_string_index + 1 : time_zone_string_index + 3]
+            )
+            if hours_from_utc is None:
+                return None, "Unable to parse time zone hours offset."
+
+            if hours_from_utc not in range(0, 15):
+                return None, "Time zone hours offset value out of bounds."
+
+            minutes_from_utc = self._GetIntegerFromString(
+                time_string[time_zone_string_index + 4 : time_zone_string_index + 6]
+            )
+            if minutes_from_utc is None:
+                return None, "Unable to parse time zone minutes offset."
+
+            if minutes_from_utc not in range(0, 60):
+                return None, "Time zone minutes offset value out of bounds."
+
+            time_zone_offset = (hours_from_utc * 60) + minutes_from_utc
+
+            if time_string[time_zone_string_index] == "-":
+                time_zone_offset = -time_zone_offset
+
+        return (hours, minutes, seconds, nanoseconds, time_zone_offset), None
+
+    @classmethod
+    def _UnpackBufferAtStride(cls, buffer, value_struct, offset, stride):
+        """Unpacks values stored at a fixed stride in a buffer.
+
+        The values are unpacked in a single pass, without copying the buffer,
+        for example to read the timestamps of equally sized records of a network
+        capture or memory-mapped file.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): buffer.
+          value_struct (struct.Struct): structure of the values.
+          offset (int): offset of the first value relative to the start of the
+              buffer.
+          stride (int): number of bytes between the start of consecutive values,
+              or None if the values are consecutive.
+
+        Returns:
+          list[tuple[object, ...]]: unpacked values, where values that extend
+              beyond the end of the buffer are ignored.
+
+        Raises:
+          ValueError: if the offset or stride is out of bounds.
+        """
+        value_size = value_struct.size
+        if stride is None:
+            stride = value_size
+
+        if offset < 0:
+            raise ValueError(f"Offset value: {offset:d} out of bounds.")
+
+        if stride < value_size:
+            raise ValueError(f"Stride value: {stride:d} out of bounds.")
+
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+        if offset + value_size > buffer_size:
+            return []
+
+        last_offset = offset + (
+            ((buffer_size - offset - value_size) // stride) * stride
+        )
+
+        record_struct = value_struct
+        if stride > value_size:
+            record_struct = struct.Struct(
+                f"{value_struct.format:s}{stride - value_size:d}x"
+            )
+
+        values = list(record_struct.iter_unpack(view[offset:last_offset]))
+        values.append(value_struct.unpack_from(view, last_offset))
+        return values
+
     @abc.abstractmethod
     def CopyFromDateTimeString(self, time_string):
         """Copies a date time value from a date and time string.
@@ -980,21 +1518,10 @@ class DateTimeValues:
             date_time_string = date_time_string.replace(" ", "T")
 
             if self._time_zone_offset is not None or not self.is_local_time:
-                time_zone_offset_hours, time_zone_offset_minutes = divmod(
-                    self._time_zone_offset or 0, 60
-                )
-                if time_zone_offset_hours >= 0:
-                    time_zone_offset_sign = "+"
-                else:
-                    time_zone_offset_sign = "-"
-                    time_zone_offset_hours *= -1
-
-                time_zone_string = (
-                    f"{time_zone_offset_hours:02d}:{time_zone_offset_minutes:02d}"
-                )
-                date_time_string = time_zone_offset_sign.join(
-                    [date_time_string, time_zone_string]
+                time_zone_string = self._GetTimeZoneOffsetString(
+                    self._time_zone_offset or 0
                 )
+                date_time_string = "".join([date_time_string, time_zone_string])
 
         return date_time_string
 
@@ -1069,3 +1596,38 @@ class DateTimeValues:
         """
         _, _, _, hours, minutes, seconds = self._GetDateWithTimeOfDay()
         return hours, minutes, seconds
+
+    def TryCopyFromDateTimeString(self, time_string):
+        """Tries to copy a date time value from a date and time string.
+
+        Unlike CopyFromDateTimeString an invalid or unsupported time string is
+        signaled by the return value instead of an exception. The time string
+        is parsed without raising an exception, only a valid time string of
+        which the date and time is not supported by the date time value, such
+        as a date before its epoch, is rejected by CopyFromDateTimeString.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
+
+        Returns:
+          bool: True if the date time value was copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        if not self._IsDateTimeStringCandidate(time_string):
+            return False
+
+        if not self._GetDateTimeTupleFromString(time_string):
+            return False
+
+        try:
+            self.CopyFromDateTimeString(time_string)
+        except ValueError:
+            return False
+
+        return True
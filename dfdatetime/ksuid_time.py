@@ -0,0 +1,220 @@
+"""KSUID timestamp implementation."""
+
+import array
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import interface
+from dfdatetime import linear_time
+
+
+class KSUIDTimeEpoch(interface.DateTimeEpoch):
+    """KSUID time epoch."""
+
+    def __init__(self):
+        """Initializes a KSUID time epoch."""
+        super().__init__(2014, 5, 13)
+
+
+class KSUIDTime(linear_time.LinearTime):
+    """KSUID timestamp.
+
+    The K-Sortable Unique IDentifier (KSUID) is a 20-byte value of which the
+    first 4 bytes contain an unsigned 32-bit big-endian integer with the number
+    of seconds since 2014-05-13 16:53:20. The KSUID string consists of 27
+    characters of base62, which represent the KSUID as a 160-bit big-endian
+    integer.
+
+    Also see:
+      https://github.com/segmentio/ksuid
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _BASE62_CHARACTERS = (
+        "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    )
+
+    _BASE62_VALUES = dict(zip(_BASE62_CHARACTERS, range(62)))
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_SECOND
+
+    _EPOCH = KSUIDTimeEpoch()
+
+    # The difference between May 13, 2014 16:53:20 and January 1, 1970 in
+    # seconds.
+    _KSUID_TO_POSIX_BASE = -1400000000
+
+    # Largest KSUID string, which represents 2^160 - 1. Since the characters of
+    # base62 are in ASCII order, KSUID strings compare like the KSUIDs.
+    _MAXIMUM_KSUID_STRING = "aWgEPTl1tmebfsQzFP4bxwgy80V"
+
+    _MAXIMUM_TIMESTAMP = (1 << 32) - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    _POSIX_BASE = _KSUID_TO_POSIX_BASE
+
+    _RECORD_STRUCT = struct.Struct(">I16x")
+
+    # The timestamp is the upper 32 bits of the 160-bit KSUID, which in most
+    # cases is determined by the first 7 characters of the KSUID string, since
+    # the remaining 20 characters represent a value less than 62^20, which is
+    # a small fraction of 2^128.
+    _TRAILING_CHARACTERS_BASE = 62**20
+
+    @classmethod
+    def _GetTimestampFromString(cls, ksuid_string):
+        """Retrieves the timestamp from a KSUID string.
+
+        Args:
+          ksuid_string (str): KSUID string of 27 base62 characters, that has been
+              validated to be in range.
+
+        Returns:
+          int: KSUID timestamp.
+        """
+        base62_values = cls._BASE62_VALUES
+
+        value = 0
+        for character in ksuid_string[:7]:
+            value = (value * 62) + base62_values[character]
+
+        trailing_characters_base = cls._TRAILING_CHARACTERS_BASE
+
+        timestamp = (value * trailing_characters_base) >> 128
+        if timestamp == (((value + 1) * trailing_characters_base) - 1) >> 128:
+            return timestamp
+
+        for character in ksuid_string[7:]:
+            value = (value * 62) + base62_values[character]
+
+        return value >> 128
+
+    @classmethod
+    def DecodeBuffer(cls, buffer):
+        """Decodes the timestamps of concatenated KSUIDs in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 20-byte KSUIDs.
+
+        Returns:
+          tuple[array.array, bytearray]: number of seconds since January 1, 1970
+              00:00:00 per KSUID and validity mask, where 1 represents a valid
+              KSUID, which is every KSUID in the buffer.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 20.
+        """
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+        if buffer_size % cls._RECORD_STRUCT.size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{cls._RECORD_STRUCT.size:d}."
+            )
+
+        ksuid_to_posix_base = cls._KSUID_TO_POSIX_BASE
+
+        timestamps = array.array(
+            "q",
+            [
+                timestamp - ksuid_to_posix_base
+                for (timestamp,) in cls._RECORD_STRUCT.iter_unpack(view)
+            ],
+        )
+        return timestamps, bytearray(b"\x01" * len(timestamps))
+
+    @classmethod
+    def DecodeStrings(cls, ksuid_strings):
+        """Decodes the timestamps of KSUID strings in bulk.
+
+        Args:
+          ksuid_strings (Sequence[str]): KSUID strings of 27 base62 characters.
+
+        Returns:
+          tuple[array.array, bytearray]: number of seconds since January 1, 1970
+              00:00:00 per KSUID string, where invalid KSUID strings are
+              represented by 0, and validity mask, where 1 represents a valid and
+              0 an invalid KSUID string.
+        """
+        ksuid_to_posix_base = cls._KSUID_TO_POSIX_BASE
+        maximum_ksuid_string = cls._MAXIMUM_KSUID_STRING
+
+        # The characters of base62 are the ASCII letters and digits, which are
+        # checked for all strings in a single pass.
+        joined_string = "".join(ksuid_strings)
+        are_characters_valid = joined_string.isascii() and joined_string.isalnum()
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for ksuid_string in ksuid_strings:
+            if (
+                len(ksuid_string) == 27
+                and ksuid_string <= maximum_ksuid_string
+                and (
+                    are_characters_valid
+                    or (ksuid_string.isascii() and ksuid_string.isalnum())
+                )
+            ):
+                timestamp = cls._GetTimestampFromString(ksuid_string)
+                timestamps.append(timestamp - ksuid_to_posix_base)
+                validity_mask.append(1)
+            else:
+                timestamps.append(0)
+                validity_mask.append(0)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, precision=None):
+        """Creates KSUID timestamps from concatenated KSUIDs.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 20-byte KSUIDs.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[KSUIDTime]: KSUID timestamps.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 20.
+        """
+        ksuid_to_posix_base = cls._KSUID_TO_POSIX_BASE
+
+        timestamps, _ = cls.DecodeBuffer(buffer)
+        return [
+            cls(precision=precision, timestamp=timestamp + ksuid_to_posix_base)
+            for timestamp in timestamps
+        ]
+
+    @classmethod
+    def NewFromStrings(cls, ksuid_strings, precision=None):
+        """Creates KSUID timestamps from KSUID strings.
+
+        Args:
+          ksuid_strings (Sequence[str]): KSUID strings of 27 base62 characters.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[KSUIDTime]: KSUID timestamps, where invalid KSUID strings are
+              represented by None.
+        """
+        ksuid_to_posix_base = cls._KSUID_TO_POSIX_BASE
+
+        timestamps, validity_mask = cls.DecodeStrings(ksuid_strings)
+        return [
+            (
+                cls(precision=precision, timestamp=timestamp + ksuid_to_posix_base)
+                if is_valid
+                else None
+            )
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+
+factory.Factory.RegisterDateTimeValues(KSUIDTime)
@@ -0,0 +1,230 @@
+"""Leap second table."""
+
+import bisect
+
+
+class LeapSecondTable:
+    """Leap second table.
+
+    The leap second table maps between POSIX time, which is the number of
+    seconds since 1970-01-01 00:00:00 UTC without leap seconds, and TAI time,
+    which is the number of seconds since 1970-01-01 00:00:00 TAI, by the
+    difference between TAI and UTC (TAI - UTC offset) at that time. TAI time is
+    POSIX time plus the TAI - UTC offset, such as the Linux CLOCK_TAI clock.
+
+    Before the first entry of the table the offset of the first entry applies,
+    which approximates the fractional offsets of UTC before 1972.
+
+    The offset is determined with a binary search of the table.
+    """
+
+    # The TAI - UTC offset and the POSIX timestamp from which it applies, per
+    # leap second up to and including 2017-01-01.
+    _LEAP_SECONDS = (
+        (63072000, 10),  # 1972-01-01
+        (78796800, 11),  # 1972-07-01
+        (94694400, 12),  # 1973-01-01
+        (126230400, 13),  # 1974-01-01
+        (157766400, 14),  # 1975-01-01
+        (189302400, 15),  # 1976-01-01
+        (220924800, 16),  # 1977-01-01
+        (252460800, 17),  # 1978-01-01
+        (283996800, 18),  # 1979-01-01
+        (315532800, 19),  # 1980-01-01
+        (362793600, 20),  # 1981-07-01
+        (394329600, 21),  # 1982-07-01
+        (425865600, 22),  # 1983-07-01
+        (489024000, 23),  # 1985-07-01
+        (567993600, 24),  # 1988-01-01
+        (631152000, 25),  # 1990-01-01
+        (662688000, 26),  # 1991-01-01
+        (709948800, 27),  # 1992-07-01
+        (741484800, 28),  # 1993-07-01
+        (773020800, 29),  # 1994-07-01
+        (820454400, 30),  # 1996-01-01
+        (867715200, 31),  # 1997-07-01
+        (915148800, 32),  # 1999-01-01
+        (1136073600, 33),  # 2006-01-01
+        (1230768000, 34),  # 2009-01-01
+        (1341100800, 35),  # 2012-07-01
+        (1435708800, 36),  # 2015-07-01
+        (1483228800, 37),  # 2017-01-01
+    )
+
+    # Number of seconds between January 1, 1900 and January 1, 1970.
+    _NTP_TO_POSIX_BASE = 2208988800
+
+    def __init__(self, leap_seconds=None):
+        """Initializes a leap second table.
+
+        Args:
+          leap_seconds (Optional[Iterable[tuple[int, int]]]): POSIX timestamp
+              in seconds and the TAI - UTC offset in seconds that applies from
+              that time, per leap second, or None to use the leap seconds up to
+              and including 2017-01-01.
+
+        Raises:
+          ValueError: if the leap seconds are missing.
+        """
+        if leap_seconds is None:
+            leap_seconds = self._LEAP_SECONDS
+
+        leap_seconds = sorted(leap_seconds)
+        if not leap_seconds:
+            raise ValueError("Missing leap seconds.")
+
+        super().__init__()
+        self._offsets = [offset for _, offset in leap_seconds]
+        self._posix_timestamps = [timestamp for timestamp, _ in leap_seconds]
+        self._tai_timestamps = [
+            timestamp + offset for timestamp, offset in leap_seconds
+        ]
+
+    def __len__(self):
+        """Retrieves the number of leap seconds in the table.
+
+        Returns:
+          int: number of leap seconds in the table.
+        """
+        return len(self._offsets)
+
+    def _GetOffsetInterval(self, tai_timestamp):
+        """Retrieves the TAI - UTC offset and the interval in which it applies.
+
+        Args:
+          tai_timestamp (int): number of seconds since January 1, 1970 00:00:00
+              TAI.
+
+        Returns:
+          tuple[int, int|float, int|float]: TAI - UTC offset in seconds, and the
+              inclusive lower and exclusive upper bound in seconds of the TAI
+              timestamps to which the offset applies, where a leap second is
+              an interval by itself and infinity represents no bound.
+        """
+        index = bisect.bisect_right(self._tai_timestamps, tai_timestamp)
+        if index == 0:
+            return self._offsets[0], float("-inf"), self._tai_timestamps[0]
+
+        offset = self._offsets[index - 1]
+        lower_bound = self._tai_timestamps[index - 1]
+
+        if index == len(self._tai_timestamps):
+            return offset, lower_bound, float("inf")
+
+        # The interval ends at the leap second that precedes the next offset, if
+        # any.
+        upper_bound = self._tai_timestamps[index]
+        leap_second_timestamp = self._posix_timestamps[index] + offset
+        if tai_timestamp >= leap_second_timestamp:
+            return offset, leap_second_timestamp, upper_bound
+
+        return offset, lower_bound, min(upper_bound, leap_second_timestamp)
+
+    def CopyTAIToPOSIXTimestamps(self, tai_timestamps, units_per_second=1):
+        """Copies TAI timestamps to POSIX timestamps in bulk.
+
+        The offset is only looked up for a TAI timestamp that is outside the
+        interval between leap seconds of the previous TAI timestamp, hence
+        timestamps that are sorted, such as those of a log, are converted at
+        the cost of a comparison per timestamp.
+
+        Args:
+          tai_timestamps (Iterable[int]): number of units since January 1, 1970
+              00:00:00 TAI.
+          units_per_second (Optional[int]): number of units per second.
+
+        Returns:
+          list[int]: number of units since January 1, 1970 00:00:00 UTC per TAI
+              timestamp, where a leap second is represented by the second that
+              follows it, like in POSIX time.
+        """
+        posix_timestamps = []
+
+        lower_bound = 0
+        upper_bound = 0
+        offset = 0
+        for tai_timestamp in tai_timestamps:
+            if tai_timestamp < lower_bound or tai_timestamp >= upper_bound:
+                number_of_seconds = tai_timestamp // units_per_second
+                offset, lower_bound, upper_bound = self._GetOffsetInterval(
+                    number_of_seconds
+                )
+                offset *= units_per_second
+                lower_bound *= units_per_second
+                upper_bound *= units_per_second
+
+            posix_timestamps.append(tai_timestamp - offset)
+
+        return posix_timestamps
+
+    def GetOffsetFromPOSIXTimestamp(self, posix_timestamp):
+        """Retrieves the TAI - UTC offset of a POSIX timestamp.
+
+        Args:
+          posix_timestamp (int): number of seconds since January 1, 1970
+              00:00:00 UTC.
+
+        Returns:
+          int: TAI - UTC offset in seconds.
+        """
+        index = bisect.bisect_right(self._posix_timestamps, posix_timestamp)
+        return self._offsets[max(index - 1, 0)]
+
+    def GetOffsetFromTAITimestamp(self, tai_timestamp):
+        """Retrieves the TAI - UTC offset of a TAI timestamp.
+
+        Args:
+          tai_timestamp (int): number of seconds since January 1, 1970 00:00:00
+              TAI.
+
+        Returns:
+          tuple[int, bool]: TAI - UTC offset in seconds and True if the TAI
+              timestamp is a leap second, for which the offset is that of the
+              preceding second.
+        """
+        index = bisect.bisect_right(self._tai_timestamps, tai_timestamp)
+        if index == 0:
+            return self._offsets[0], False
+
+        offset = self._offsets[index - 1]
+        is_leap_second = (
+            index < len(self._posix_timestamps)
+            and tai_timestamp - offset >= self._posix_timestamps[index]
+        )
+        return offset, is_leap_second
+
+    @classmethod
+    def NewFromLeapSecondsList(cls, file_object):
+        """Creates a leap second table from a leap-seconds.list file.
+
+        The leap-seconds.list file, such as distributed by the IERS and with the
+        time zone database, contains a line per leap second with the NTP
+        timestamp in seconds since 1900-01-01 00:00:00 from which the TAI - UTC
+        offset applies and the offset, where lines that start with "#" are
+        comments.
+
+        Args:
+          file_object (Iterable[str]): lines of a leap-seconds.list file, such as
+              a file opened in text mode.
+
+        Returns:
+          LeapSecondTable: leap second table.
+
+        Raises:
+          ValueError: if the leap-seconds.list file is invalid.
+        """
+        leap_seconds = []
+        for line_number, line in enumerate(file_object, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            try:
+                ntp_timestamp, offset = line.split()[:2]
+                leap_seconds.append(
+                    (int(ntp_timestamp, 10) - cls._NTP_TO_POSIX_BASE, int(offset, 10))
+                )
+            except ValueError:
+                raise ValueError(f"Invalid leap second on line: {line_number:d}.")
+
+        return cls(leap_seconds=leap_seconds)
@@ -0,0 +1,307 @@
+"""Linear timestamp implementation."""
+
+import decimal
+
+from dfdatetime import definitions
+from dfdatetime import interface
+
+
+class LinearTime(interface.DateTimeValues):
+    """Linear timestamp.
+
+    A linear timestamp is an integer that contains the number of units, such as
+    seconds or 100th nano seconds, since an epoch. The timestamp types are
+    declared by subclasses with the class attributes:
+
+    * _DEFAULT_PRECISION: precision of the timestamp, which should be one of
+      the PRECISION_VALUES in definitions;
+    * _EPOCH: date of the epoch of the timestamp;
+    * _MINIMUM_TIMESTAMP and _MAXIMUM_TIMESTAMP: range of supported timestamps,
+      such as 0 and _UINT64_MAX for an unsigned 64-bit timestamp, where None
+      represents no bound;
+    * _MINIMUM_YEAR and _MAXIMUM_YEAR: range of years supported by
+      CopyFromDateTimeString, where None represents no bound;
+    * _UNSUPPORTED_YEAR_ERROR: error message of a year outside the range of
+      supported years, which is formatted with the year;
+    * _POSIX_BASE: number of seconds between the epoch and January 1, 1970
+      00:00:00, where _GetPosixBaseInUnits can be overridden for an epoch that
+      is not at a whole second;
+    * _UNITS_PER_SECOND: number of units per second, which should be a power
+      of 10 that is a divisor of the number of nanoseconds per second.
+
+    Timestamps outside the range of supported timestamps are preserved but do
+    not represent a date and time value.
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_SECOND
+
+    _EPOCH = None
+
+    # Number of digits of the fraction of second per number of units per second.
+    _FRACTION_OF_SECOND_DIGITS = {
+        10**number_of_digits: number_of_digits for number_of_digits in range(1, 10)
+    }
+
+    _MAXIMUM_TIMESTAMP = None
+    _MINIMUM_TIMESTAMP = None
+
+    _MAXIMUM_YEAR = None
+    _MINIMUM_YEAR = None
+
+    _POSIX_BASE = 0
+
+    _UNITS_PER_SECOND = 1
+
+    _UNSUPPORTED_YEAR_ERROR = "Year value: {0:d} not supported."
+
+    def __init__(self, precision=None, time_zone_offset=None, timestamp=None):
+        """Initializes a linear timestamp.
+
+        Args:
+          precision (Optional[str]): precision of the date and time value, which
+              should be one of the PRECISION_VALUES in definitions.
+          time_zone_offset (Optional[int]): time zone offset in number of minutes
+              from UTC or None if not set.
+          timestamp (Optional[int]): timestamp.
+        """
+        super().__init__(
+            precision=precision or self._DEFAULT_PRECISION,
+            time_zone_offset=time_zone_offset,
+        )
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self):
+        """int: timestamp or None if not set."""
+        return self._timestamp
+
+    def _GetNormalizedTimestamp(self):
+        """Retrieves the normalized timestamp.
+
+        Returns:
+          decimal.Decimal: normalized timestamp, which contains the number of
+              seconds since January 1, 1970 00:00:00 and a fraction of second used
+              for increased precision, or None if the normalized timestamp cannot be
+              determined.
+        """
+        if self._normalized_timestamp is None:
+            timestamp = self._GetSupportedTimestamp()
+            if timestamp is not None:
+                units_per_second = self._UNITS_PER_SECOND
+
+                self._normalized_timestamp = decimal.Decimal(
+                    timestamp - self._GetPosixBaseInUnits()
+                )
+                if units_per_second != 1:
+                    self._normalized_timestamp /= units_per_second
+
+                if self._time_zone_offset:
+                    self._normalized_timestamp -= self._time_zone_offset * 60
+
+        return self._normalized_timestamp
+
+    def _GetNumberOfUnitsSincePosixEpoch(self):
+        """Retrieves the number of units since January 1, 1970 00:00:00 UTC.
+
+        The integer arithmetic is equivalent to the decimal arithmetic of the
+        normalized timestamp for timestamps of 64-bit or less, since then the
+        normalized timestamp has less significant digits than the precision of
+        the decimal context.
+
+        Returns:
+          int: number of units since January 1, 1970 00:00:00 UTC or None if the
+              timestamp is not set, out of bounds or exceeds 64-bit.
+        """
+        timestamp = self._GetSupportedTimestamp()
+        if (
+            timestamp is None
+            or timestamp < self._INT64_MIN
+            or timestamp > self._UINT64_MAX
+        ):
+            return None
+
+        timestamp -= self._GetPosixBaseInUnits()
+        if self._time_zone_offset:
+            timestamp -= self._time_zone_offset * 60 * self._UNITS_PER_SECOND
+
+        return timestamp
+
+    def _GetPosixBaseInUnits(self):
+        """Retrieves the number of units between the epoch and the POSIX epoch.
+
+        Returns:
+          int: number of units between the epoch and January 1, 1970 00:00:00.
+        """
+        return self._POSIX_BASE * self._UNITS_PER_SECOND
+
+    def _GetSupportedTimestamp(self):
+        """Retrieves the timestamp if in the range of supported timestamps.
+
+        Returns:
+          int: timestamp or None if the timestamp is not set or out of bounds.
+        """
+        timestamp = self._timestamp
+        if timestamp is None:
+            return None
+
+        if self._MINIMUM_TIMESTAMP is not None and timestamp < self._MINIMUM_TIMESTAMP:
+            return None
+
+        if self._MAXIMUM_TIMESTAMP is not None and timestamp > self._MAXIMUM_TIMESTAMP:
+            return None
+
+        return timestamp
+
+    def CopyFromDateTimeString(self, time_string):
+        """Copies a timestamp from a date and time string.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
+
+        if (self._MINIMUM_YEAR is not None and year < self._MINIMUM_YEAR) or (
+            self._MAXIMUM_YEAR is not None and year > self._MAXIMUM_YEAR
+        ):
+            raise ValueError(self._UNSUPPORTED_YEAR_ERROR.format(year))
+
+        units_per_second = self._UNITS_PER_SECOND
+
+        timestamp = self._GetNumberOfSecondsFromElements(
+            year, month, day_of_month, hours, minutes, seconds
+        )
+        timestamp *= units_per_second
+
+        if units_per_second != 1:
+            timestamp += nanoseconds // (
+                definitions.NANOSECONDS_PER_SECOND // units_per_second
+            )
+
+        timestamp += self._GetPosixBaseInUnits()
+
+        if (
+            self._MINIMUM_TIMESTAMP is not None and timestamp < self._MINIMUM_TIMESTAMP
+        ) or (
+            self._MAXIMUM_TIMESTAMP is not None and timestamp > self._MAXIMUM_TIMESTAMP
+        ):
+            raise ValueError("Date time value not supported.")
+
+        self._normalized_timestamp = None
+        self._timestamp = timestamp
+        self._time_zone_offset = time_zone_offset
+
+    def CopyToDateTimeString(self):
+        """Copies the timestamp to a date and time string.
+
+        Returns:
+          str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss" with
+              a fraction of second of as many digits as the number of units per
+              second, such as "YYYY-MM-DD hh:mm:ss.#######", or None if the
+              timestamp is missing or invalid.
+        """
+        timestamp = self._GetSupportedTimestamp()
+        if timestamp is None:
+            return None
+
+        units_per_second = self._UNITS_PER_SECOND
+
+        # The epoch of the timestamp is not necessarily at the start of a day.
+        timestamp += -self._GetPosixBaseInUnits() % (
+            definitions.SECONDS_PER_DAY * units_per_second
+        )
+
+        if units_per_second == 1:
+            number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+            date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+            return f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+
+        timestamp, fraction_of_second = divmod(timestamp, units_per_second)
+        number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+        number_of_digits = self._FRACTION_OF_SECOND_DIGITS[units_per_second]
+        return (
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{fraction_of_second:0{number_of_digits:d}d}"
+        )
+
+    def CopyToPosixTimestamp(self):
+        """Copies the date time value to a POSIX timestamp.
+
+        Returns:
+          int: a POSIX timestamp in seconds or None if no timestamp is available.
+        """
+        timestamp = self._GetNumberOfUnitsSincePosixEpoch()
+        if timestamp is None:
+            return super().CopyToPosixTimestamp()
+
+        units_per_second = self._UNITS_PER_SECOND
+        if units_per_second == 1:
+            return timestamp
+
+        # The POSIX timestamp is truncated towards zero.
+        number_of_seconds = abs(timestamp) // units_per_second
+        return number_of_seconds if timestamp >= 0 else -number_of_seconds
+
+    def CopyToSerializableDict(self):
+        """Copies the date time value to a serializable dictionary.
+
+        Returns:
+          dict[str, object]: serializable dictionary.
+        """
+        serializable_dict = self._CreateSerializableDict()
+
+        serializable_dict["timestamp"] = self._timestamp
+
+        return serializable_dict
+
+    def GetPlasoTimestamp(self):
+        """Retrieves a timestamp that is compatible with Plaso.
+
+        Returns:
+          int: a POSIX timestamp in microseconds or None if no timestamp is
+              available.
+
+        Raises:
+          ValueError: if the timestamp cannot be determined.
+        """
+        timestamp = self._GetNumberOfUnitsSincePosixEpoch()
+        if timestamp is None:
+            return super().GetPlasoTimestamp()
+
+        units_per_second = self._UNITS_PER_SECOND
+        if units_per_second <= definitions.MICROSECONDS_PER_SECOND:
+            return timestamp * (definitions.MICROSECONDS_PER_SECOND // units_per_second)
+
+        units_per_microsecond = units_per_second // definitions.MICROSECONDS_PER_SECOND
+        microseconds, remainder = divmod(timestamp, units_per_microsecond)
+
+        # The POSIX timestamp is rounded half away from zero.
+        if 2 * remainder > units_per_microsecond or (
+            2 * remainder == units_per_microsecond and microseconds >= 0
+        ):
+            microseconds += 1
+
+        return microseconds
@@ -0,0 +1,536 @@
+"""Memory footprint benchmark of the date and time values representations.
+
+The benchmark determines the number of bytes per instance and the peak memory
+usage of a large number of date and time values objects of each type, before
+and after the normalized timestamp and date with time of day caches have been
+populated. It also determines the footprint of columnar and serialized
+alternatives of the same values, such as an array of raw timestamps.
+
+Usage:
+  python -m dfdatetime.memory_benchmark [--count COUNT] [--baseline FILE]
+      [--write-baseline FILE] [CASE ...]
+"""
+
+import argparse
+import array
+import gc
+import json
+import struct
+import sys
+import tracemalloc
+
+from dfdatetime import fat_date_time
+from dfdatetime import filetime
+from dfdatetime import golang_time
+from dfdatetime import posix_time
+from dfdatetime import systemtime
+from dfdatetime import time_elements
+
+
+class MemoryBenchmarkCase:
+    """Memory benchmark case.
+
+    Attributes:
+      name (str): name of the benchmark case.
+    """
+
+    def __init__(self, name, new_object_function, new_column_function=None):
+        """Initializes a memory benchmark case.
+
+        Args:
+          name (str): name of the benchmark case.
+          new_object_function (function): function to create a date and time
+              values object from an index, where the index is used to vary
+              the value.
+          new_column_function (Optional[function]): function to create a columnar
+              or serialized alternative from a number of values, or None if not
+              available.
+        """
+        super().__init__()
+        self._new_column_function = new_column_function
+        self._new_object_function = new_object_function
+        self.name = name
+
+    @property
+    def has_column(self):
+        """bool: True if the case has a columnar or serialized alternative."""
+        return self._new_column_function is not None
+
+    def NewColumn(self, number_of_values):
+        """Creates a columnar or serialized alternative.
+
+        Args:
+          number_of_values (int): number of values in the column.
+
+        Returns:
+          object: columnar or serialized alternative.
+        """
+        return self._new_column_function(number_of_values)
+
+    def NewObject(self, index):
+        """Creates a date and time values object.
+
+        Args:
+          index (int): index of the object, used to vary the value.
+
+        Returns:
+          dfdatetime.DateTimeValues: date and time values.
+        """
+        return self._new_object_function(index)
+
+
+class MemoryUsage:
+    """Memory usage.
+
+    Attributes:
+      bytes_per_instance (float): number of bytes per instance.
+      current_size (int): current traced memory size in bytes.
+      peak_size (int): peak traced memory size in bytes.
+    """
+
+    def __init__(self, current_size, peak_size, number_of_instances):
+        """Initializes memory usage.
+
+        Args:
+          current_size (int): current traced memory size in bytes.
+          peak_size (int): peak traced memory size in bytes.
+          number_of_instances (int): number of instances traced.
+        """
+        super().__init__()
+        self.bytes_per_instance = 0.0
+        self.current_size = current_size
+        self.peak_size = peak_size
+
+        if number_of_instances:
+            self.bytes_per_instance = float(current_size) / number_of_instances
+
+    def CopyToDict(self):
+        """Copies the memory usage to a dictionary.
+
+        Returns:
+          dict[str, object]: memory usage values.
+        """
+        return {
+            "bytes_per_instance": self.bytes_per_instance,
+            "current_size": self.current_size,
+            "peak_size": self.peak_size,
+        }
+
+
+class MemoryBenchmark:
+    """Memory footprint benchmark."""
+
+    _METRICS = ("objects", "objects_with_caches", "column")
+
+    def __init__(self, number_of_instances=1000000):
+        """Initializes a memory footprint benchmark.
+
+        Args:
+          number_of_instances (Optional[int]): number of instances to create per
+              benchmark case.
+        """
+        super().__init__()
+        self._cases = {}
+        self._number_of_instances = number_of_instances
+
+    def _TraceMemoryUsage(self, function):
+        """Traces the memory usage of a function.
+
+        Args:
+          function (function): function that returns the objects that should be
+              kept alive while measuring.
+
+        Returns:
+          tuple[MemoryUsage, object]: memory usage and the result of the function.
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            start_size, _ = tracemalloc.get_traced_memory()
+
+            result = function()
+
+            current_size, peak_size = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        memory_usage = MemoryUsage(
+            current_size - start_size,
+            peak_size - start_size,
+            self._number_of_instances,
+        )
+        return memory_usage, result
+
+    def AddCase(self, benchmark_case):
+        """Adds a benchmark case.
+
+        Args:
+          benchmark_case (MemoryBenchmarkCase): benchmark case.
+
+        Raises:
+          KeyError: if a benchmark case with the same name was already added.
+        """
+        if benchmark_case.name in self._cases:
+            raise KeyError(f"Benchmark case: {benchmark_case.name:s} already set.")
+
+        self._cases[benchmark_case.name] = benchmark_case
+
+    def GetCaseNames(self):
+        """Retrieves the names of the benchmark cases.
+
+        Returns:
+          list[str]: names of the benchmark cases.
+        """
+        return list(self._cases.keys())
+
+    def RunCase(self, name):
+        """Runs a benchmark case.
+
+        Args:
+          name (str): name of the benchmark case.
+
+        Returns:
+          dict[str, dict[str, object]]: memory usage per metric, such as
+              "objects", "objects_with_caches" and "column".
+
+        Raises:
+          KeyError: if the benchmark case does not exist.
+        """
+        benchmark_case = self._cases.get(name)
+        if not benchmark_case:
+            raise KeyError(f"Benchmark case: {name:s} not set.")
+
+        number_of_instances = self._number_of_instances
+
+        memory_usage, objects = self._TraceMemoryUsage(
+            lambda: [
+                benchmark_case.NewObject(index) for index in range(number_of_instances)
+            ]
+        )
+        results = {"objects": memory_usage.CopyToDict()}
+
+        def _PopulateCaches():
+            """Populates the normalized timestamp and date and time caches."""
+            for date_time_values in objects:
+                # pylint: disable=protected-access
+                date_time_values._GetNormalizedTimestamp()
+                date_time_values._GetDateWithTimeOfDay()
+
+        memory_usage, _ = self._TraceMemoryUsage(_PopulateCaches)
+
+        with_caches = memory_usage.CopyToDict()
+        with_caches["bytes_per_instance"] += results["objects"]["bytes_per_instance"]
+        with_caches["current_size"] += results["objects"]["current_size"]
+        with_caches["peak_size"] += results["objects"]["current_size"]
+        results["objects_with_caches"] = with_caches
+
+        del objects
+
+        if benchmark_case.has_column:
+            memory_usage, _ = self._TraceMemoryUsage(
+                lambda: benchmark_case.NewColumn(number_of_instances)
+            )
+            results["column"] = memory_usage.CopyToDict()
+
+        return results
+
+    def Run(self, names=None):
+        """Runs the benchmark cases.
+
+        Args:
+          names (Optional[list[str]]): names of the benchmark cases to run, where
+              None represents all cases.
+
+        Returns:
+          dict[str, dict[str, dict[str, object]]]: memory usage per metric per
+              benchmark case.
+        """
+        return {name: self.RunCase(name) for name in names or self._cases.keys()}
+
+    def CompareWithBaseline(self, results, baseline):
+        """Compares benchmark results with a baseline.
+
+        Args:
+          results (dict[str, dict[str, dict[str, object]]]): memory usage per
+              metric per benchmark case.
+          baseline (dict[str, dict[str, dict[str, object]]]): memory usage per
+              metric per benchmark case of the baseline.
+
+        Returns:
+          dict[str, dict[str, float]]: relative change in bytes per instance, as
+              a percentage of the baseline, per metric per benchmark case. Cases
+              and metrics that are not in the baseline are omitted.
+        """
+        trends = {}
+        for name, metrics in results.items():
+            baseline_metrics = baseline.get(name)
+            if not baseline_metrics:
+                continue
+
+            for metric, memory_usage in metrics.items():
+                baseline_memory_usage = baseline_metrics.get(metric)
+                if not baseline_memory_usage:
+                    continue
+
+                baseline_bytes = baseline_memory_usage["bytes_per_instance"]
+                if not baseline_bytes:
+                    continue
+
+                change = memory_usage["bytes_per_instance"] - baseline_bytes
+                trends.setdefault(name, {})[metric] = (change * 100.0) / baseline_bytes
+
+        return trends
+
+    def FormatReport(self, results, trends=None):
+        """Formats benchmark results as a text report.
+
+        Args:
+          results (dict[str, dict[str, dict[str, object]]]): memory usage per
+              metric per benchmark case.
+          trends (Optional[dict[str, dict[str, float]]]): relative change in bytes
+              per instance per metric per benchmark case.
+
+        Returns:
+          str: text report.
+        """
+        lines = [
+            f"Number of instances per case: {self._number_of_instances:d}",
+            "",
+            (
+                f"{'Case':<30s} {'Metric':<20s} {'Bytes/instance':>14s} "
+                f"{'Peak (MiB)':>11s} {'Trend':>9s}"
+            ),
+        ]
+        for name, metrics in results.items():
+            for metric in self._METRICS:
+                memory_usage = metrics.get(metric)
+                if not memory_usage:
+                    continue
+
+                peak_size = float(memory_usage["peak_size"]) / (1024 * 1024)
+
+                trend = (trends or {}).get(name, {}).get(metric)
+                if trend is None:
+                    trend_string = ""
+                else:
+                    trend_string = f"{trend:+.1f}%"
+
+                lines.append(
+                    f"{name:<30s} {metric:<20s} "
+                    f"{memory_usage['bytes_per_instance']:>14.1f} "
+                    f"{peak_size:>11.1f} {trend_string:>9s}"
+                )
+
+        return "\n".join(lines)
+
+
+# Base values that correspond to 2010-08-12 21:06:31.
+_FILETIME_BASE = 0x01CB3A623D0A17CE
+_POSIX_BASE = 1281647191
+
+
+def _NewFATDateTime(index):
+    """Creates a FAT date time.
+
+    Args:
+      index (int): index used to vary the value.
+
+    Returns:
+      int: FAT date time.
+    """
+    return 0xA8C03D0C + ((index % 30) << 16)
+
+
+def _NewGolangTimestamp(index):
+    """Creates a serialized Golang time.Time timestamp.
+
+    Args:
+      index (int): index used to vary the value.
+
+    Returns:
+      bytes: serialized Golang time.Time timestamp.
+    """
+    # pylint: disable=protected-access
+    number_of_seconds = golang_time.GolangTime._GOLANG_TO_POSIX_BASE + _POSIX_BASE
+    return struct.pack(">Bqih", 1, number_of_seconds + index, index % 1000000000, -1)
+
+
+def _NewSystemtimeTuple(index):
+    """Creates a SYSTEMTIME tuple.
+
+    Args:
+      index (int): index used to vary the value.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int, int]: SYSTEMTIME tuple.
+    """
+    minutes, seconds = divmod(index, 60)
+    hours, minutes = divmod(minutes, 60)
+    return (2010, 8, 4, 12, hours % 24, minutes, seconds, index % 1000)
+
+
+def _NewTimeElementsTuple(index):
+    """Creates a time elements tuple.
+
+    Args:
+      index (int): index used to vary the value.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: time elements tuple.
+    """
+    minutes, seconds = divmod(index, 60)
+    hours, minutes = divmod(minutes, 60)
+    return (2010, 8, 12, hours % 24, minutes, seconds)
+
+
+def GetDefaultCases():
+    """Retrieves the default benchmark cases.
+
+    Returns:
+      list[MemoryBenchmarkCase]: benchmark cases.
+    """
+    return [
+        MemoryBenchmarkCase(
+            "FATDateTime",
+            lambda index: fat_date_time.FATDateTime(
+                fat_date_time=_NewFATDateTime(index)
+            ),
+            lambda count: array.array(
+                "L", (_NewFATDateTime(index) for index in range(count))
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "Filetime",
+            lambda index: filetime.Filetime(timestamp=_FILETIME_BASE + index),
+            lambda count: array.array(
+                "Q", range(_FILETIME_BASE, _FILETIME_BASE + count)
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "GolangTime",
+            lambda index: golang_time.GolangTime(
+                golang_timestamp=_NewGolangTimestamp(index)
+            ),
+            lambda count: b"".join(
+                _NewGolangTimestamp(index) for index in range(count)
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "PosixTime",
+            lambda index: posix_time.PosixTime(timestamp=_POSIX_BASE + index),
+            lambda count: array.array("q", range(_POSIX_BASE, _POSIX_BASE + count)),
+        ),
+        MemoryBenchmarkCase(
+            "PosixTimeInNanoseconds",
+            lambda index: posix_time.PosixTimeInNanoseconds(
+                timestamp=(_POSIX_BASE * 1000000000) + index
+            ),
+            lambda count: array.array(
+                "q",
+                range(_POSIX_BASE * 1000000000, (_POSIX_BASE * 1000000000) + count),
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "Systemtime",
+            lambda index: systemtime.Systemtime(
+                system_time_tuple=_NewSystemtimeTuple(index)
+            ),
+            lambda count: b"".join(
+                struct.pack("<8H", *_NewSystemtimeTuple(index))
+                for index in range(count)
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "TimeElements",
+            lambda index: time_elements.TimeElements(
+                time_elements_tuple=_NewTimeElementsTuple(index)
+            ),
+            lambda count: array.array(
+                "q", (_POSIX_BASE + index for index in range(count))
+            ),
+        ),
+        MemoryBenchmarkCase(
+            "TimeElementsInNanoseconds",
+            lambda index: time_elements.TimeElementsInNanoseconds(
+                time_elements_tuple=(*_NewTimeElementsTuple(index), index)
+            ),
+            lambda count: array.array(
+                "q",
+                (
+                    ((_POSIX_BASE + index) * 1000000000) + index
+                    for index in range(count)
+                ),
+            ),
+        ),
+    ]
+
+
+def Main():
+    """Entry point of the memory footprint benchmark.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Benchmarks the memory footprint of date and time values."
+    )
+
+    argument_parser.add_argument(
+        "--baseline",
+        dest="baseline",
+        metavar="FILE",
+        help="JSON file with results of a previous run to compare against.",
+    )
+    argument_parser.add_argument(
+        "--count",
+        dest="count",
+        type=int,
+        default=1000000,
+        help="number of instances to create per case.",
+    )
+    argument_parser.add_argument(
+        "--write-baseline",
+        dest="write_baseline",
+        metavar="FILE",
+        help="JSON file to write the results to, for use as a future baseline.",
+    )
+    argument_parser.add_argument(
+        "cases", nargs="*", metavar="CASE", help="names of the cases to run."
+    )
+
+    options = argument_parser.parse_args()
+
+    memory_benchmark = MemoryBenchmark(number_of_instances=options.count)
+    for benchmark_case in GetDefaultCases():
+        memory_benchmark.AddCase(benchmark_case)
+
+    unsupported_cases = set(options.cases).difference(memory_benchmark.GetCaseNames())
+    if unsupported_cases:
+        names = ", ".join(sorted(unsupported_cases))
+        print(f"Unsupported cases: {names:s}")
+        return False
+
+    results = memory_benchmark.Run(names=options.cases or None)
+
+    trends = None
+    if options.baseline:
+        with open(options.baseline, "r", encoding="utf-8") as file_object:
+            baseline = json.load(file_object)
+
+        trends = memory_benchmark.CompareWithBaseline(results, baseline)
+
+    print(memory_benchmark.FormatReport(results, trends=trends))
+
+    if options.write_baseline:
+        with open(options.write_baseline, "w", encoding="utf-8") as file_object:
+            json.dump(results, file_object, indent=2, sort_keys=True)
+
+    return True
+
+
+if __name__ == "__main__":
+    if not Main():
+        sys.exit(1)
+    else:
+        sys.exit(0)
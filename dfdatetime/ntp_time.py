@@ -0,0 +1,264 @@
+"""NTP timestamp implementation."""
+
+import array
+import decimal
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import interface
+
+
+class NTPTimeEpoch(interface.DateTimeEpoch):
+    """NTP time epoch."""
+
+    def __init__(self):
+        """Initializes a NTP time epoch."""
+        super().__init__(1900, 1, 1)
+
+
+class NTPTime(interface.DateTimeValues):
+    """NTP timestamp.
+
+    The NTP timestamp is an unsigned 64-bit fixed-point value, of which the
+    upper 32 bits contain the number of seconds since 1900-01-01 00:00:00 and
+    the lower 32 bits the fraction of second in units of 2^-32 seconds. The
+    timestamp is stored in big-endian byte order, such as in the NTP packet
+    header, and a timestamp of 0 represents an unknown time.
+
+    Only NTP era 0 is supported, which ends at 2036-02-07 06:28:15.
+
+    Also see:
+      https://www.rfc-editor.org/rfc/rfc5905
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _EPOCH = NTPTimeEpoch()
+
+    _FRACTION_OF_SECOND_BITS = 32
+
+    # The difference between January 1, 1900 and January 1, 1970 in seconds.
+    _NTP_TO_POSIX_BASE = 2208988800
+
+    _VALUE_STRUCT = struct.Struct(">Q")
+
+    def __init__(self, precision=None, time_zone_offset=None, timestamp=None):
+        """Initializes a NTP timestamp.
+
+        Args:
+          precision (Optional[str]): precision of the date and time value, which
+              should be one of the PRECISION_VALUES in definitions.
+          time_zone_offset (Optional[int]): time zone offset in number of minutes
+              from UTC or None if not set.
+          timestamp (Optional[int]): NTP timestamp.
+        """
+        super().__init__(
+            precision=precision or definitions.PRECISION_1_NANOSECOND,
+            time_zone_offset=time_zone_offset,
+        )
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self):
+        """int: NTP timestamp or None if not set."""
+        return self._timestamp
+
+    def _GetNormalizedTimestamp(self):
+        """Retrieves the normalized timestamp.
+
+        Returns:
+          decimal.Decimal: normalized timestamp, which contains the number of
+              seconds since January 1, 1970 00:00:00 and a fraction of second used
+              for increased precision, or None if the normalized timestamp cannot be
+              determined.
+        """
+        if self._normalized_timestamp is None:
+            if (
+                self._timestamp is not None
+                and self._timestamp >= 0
+                and self._timestamp <= self._UINT64_MAX
+            ):
+                number_of_seconds = self._timestamp >> self._FRACTION_OF_SECOND_BITS
+                fraction_of_second = self._timestamp & self._UINT32_MAX
+
+                self._normalized_timestamp = decimal.Decimal(
+                    number_of_seconds - self._NTP_TO_POSIX_BASE
+                )
+                if fraction_of_second:
+                    self._normalized_timestamp += decimal.Decimal(
+                        fraction_of_second
+                    ) / (1 << self._FRACTION_OF_SECOND_BITS)
+
+                if self._time_zone_offset:
+                    self._normalized_timestamp -= self._time_zone_offset * 60
+
+        return self._normalized_timestamp
+
+    def CopyFromDateTimeString(self, time_string):
+        """Copies a NTP timestamp from a date and time string.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
+
+        if year < 1900:
+            raise ValueError(f"Year value: {year:d} not supported.")
+
+        number_of_seconds = self._GetNumberOfSecondsFromElements(
+            year, month, day_of_month, hours, minutes, seconds
+        )
+        number_of_seconds += self._NTP_TO_POSIX_BASE
+
+        if number_of_seconds > self._UINT32_MAX:
+            raise ValueError("Date time value not supported.")
+
+        # The fraction of second is rounded up so that it is converted back into
+        # the same number of nanoseconds.
+        fraction_of_second = (
+            (nanoseconds << self._FRACTION_OF_SECOND_BITS)
+            + definitions.NANOSECONDS_PER_SECOND
+            - 1
+        ) // definitions.NANOSECONDS_PER_SECOND
+
+        self._normalized_timestamp = None
+        self._timestamp = (
+            number_of_seconds << self._FRACTION_OF_SECOND_BITS
+        ) | fraction_of_second
+        self._time_zone_offset = time_zone_offset
+
+    def CopyToDateTimeString(self):
+        """Copies the NTP timestamp to a date and time string.
+
+        Returns:
+          str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#########"
+              or None if the timestamp is missing or invalid.
+        """
+        if (
+            self._timestamp is None
+            or self._timestamp < 0
+            or self._timestamp > self._UINT64_MAX
+        ):
+            return None
+
+        number_of_seconds = self._timestamp >> self._FRACTION_OF_SECOND_BITS
+        nanoseconds = (
+            (self._timestamp & self._UINT32_MAX) * definitions.NANOSECONDS_PER_SECOND
+        ) >> self._FRACTION_OF_SECOND_BITS
+
+        number_of_days, hours, minutes, seconds = self._GetTimeValues(number_of_seconds)
+
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+        return (
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{nanoseconds:09d}"
+        )
+
+    def CopyToSerializableDict(self):
+        """Copies the date time value to a serializable dictionary.
+
+        Returns:
+          dict[str, object]: serializable dictionary.
+        """
+        serializable_dict = self._CreateSerializableDict()
+
+        serializable_dict["timestamp"] = self._timestamp
+
+        return serializable_dict
+
+    @classmethod
+    def DecodeBuffer(cls, buffer, offset=0, stride=None):
+        """Decodes NTP timestamps stored at a fixed stride in a buffer in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): buffer, such as
+              concatenated NTP packets.
+          offset (Optional[int]): offset of the first NTP timestamp relative to
+              the start of the buffer, such as 40 for the transmit timestamp of
+              the first NTP packet.
+          stride (Optional[int]): number of bytes between the start of
+              consecutive NTP timestamps, such as 48 for NTP packets without
+              extension fields, or None if the NTP timestamps are consecutive.
+
+        Returns:
+          tuple[array.array, bytearray]: number of nanoseconds since January 1,
+              1970 00:00:00 per NTP timestamp, where unknown timestamps are
+              represented by 0, and validity mask, where 1 represents a known
+              and 0 an unknown NTP timestamp.
+
+        Raises:
+          ValueError: if the offset or stride is out of bounds.
+        """
+        ntp_to_posix_base = cls._NTP_TO_POSIX_BASE * definitions.NANOSECONDS_PER_SECOND
+        fraction_of_second_bits = cls._FRACTION_OF_SECOND_BITS
+        nanoseconds_per_second = definitions.NANOSECONDS_PER_SECOND
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for (timestamp,) in cls._UnpackBufferAtStride(
+            buffer, cls._VALUE_STRUCT, offset, stride
+        ):
+            if not timestamp:
+                timestamps.append(0)
+                validity_mask.append(0)
+            else:
+                timestamps.append(
+                    ((timestamp * nanoseconds_per_second) >> fraction_of_second_bits)
+                    - ntp_to_posix_base
+                )
+                validity_mask.append(1)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, offset=0, precision=None, stride=None):
+        """Creates NTP timestamps stored at a fixed stride in a buffer.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): buffer, such as
+              concatenated NTP packets.
+          offset (Optional[int]): offset of the first NTP timestamp relative to
+              the start of the buffer.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+          stride (Optional[int]): number of bytes between the start of
+              consecutive NTP timestamps or None if the NTP timestamps are
+              consecutive.
+
+        Returns:
+          list[NTPTime]: NTP timestamps, where unknown timestamps are
+              represented by None.
+
+        Raises:
+          ValueError: if the offset or stride is out of bounds.
+        """
+        return [
+            cls(precision=precision, timestamp=timestamp) if timestamp else None
+            for (timestamp,) in cls._UnpackBufferAtStride(
+                buffer, cls._VALUE_STRUCT, offset, stride
+            )
+        ]
+
+
+factory.Factory.RegisterDateTimeValues(NTPTime)
@@ -0,0 +1,170 @@
+"""MongoDB ObjectId timestamp implementation."""
+
+import array
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import linear_time
+from dfdatetime import posix_time
+
+
+class ObjectIdTime(linear_time.LinearTime):
+    """MongoDB ObjectId timestamp.
+
+    The MongoDB (BSON) ObjectId is a 12-byte value of which the first 4 bytes
+    contain an unsigned 32-bit big-endian integer with the number of seconds
+    since 1970-01-01 00:00:00 (also known as the POSIX epoch).
+
+    Also see:
+      https://www.mongodb.com/docs/manual/reference/method/ObjectId
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_SECOND
+
+    _EPOCH = posix_time.PosixTimeEpoch()
+
+    _MAXIMUM_TIMESTAMP = (1 << 32) - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    _RECORD_STRUCT = struct.Struct(">I8x")
+
+    @classmethod
+    def _GetBufferFromStrings(cls, object_id_strings):
+        """Retrieves concatenated ObjectIds from ObjectId strings.
+
+        Args:
+          object_id_strings (Sequence[str]): ObjectId strings of 24
+              case-insensitive hexadecimal digits.
+
+        Returns:
+          tuple[bytes, bytearray]: concatenated 12-byte ObjectIds, where invalid
+              ObjectId strings are represented by 12 bytes of 0, and validity
+              mask, where 1 represents a valid and 0 an invalid ObjectId string.
+        """
+        number_of_object_ids = len(object_id_strings)
+        joined_string = "".join(object_id_strings)
+
+        # Strings that all are valid are converted in a single pass.
+        if set(map(len, object_id_strings)) <= {24}:
+            try:
+                buffer = bytes.fromhex(joined_string)
+            except ValueError:
+                buffer = None
+
+            # Note that bytes.fromhex() ignores whitespace.
+            if buffer is not None and len(buffer) == 12 * number_of_object_ids:
+                return buffer, bytearray(b"\x01" * number_of_object_ids)
+
+        invalid_object_id = bytes(12)
+
+        object_ids = []
+        validity_mask = bytearray()
+        for object_id_string in object_id_strings:
+            object_id = None
+            if len(object_id_string) == 24:
+                try:
+                    object_id = bytes.fromhex(object_id_string)
+                except ValueError:
+                    pass
+
+            if not object_id or len(object_id) != 12:
+                object_ids.append(invalid_object_id)
+                validity_mask.append(0)
+            else:
+                object_ids.append(object_id)
+                validity_mask.append(1)
+
+        return b"".join(object_ids), validity_mask
+
+    @classmethod
+    def DecodeBuffer(cls, buffer):
+        """Decodes the timestamps of concatenated ObjectIds in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 12-byte ObjectIds.
+
+        Returns:
+          tuple[array.array, bytearray]: number of seconds since January 1, 1970
+              00:00:00 per ObjectId and validity mask, where 1 represents a valid
+              ObjectId, which is every ObjectId in the buffer.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 12.
+        """
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+        if buffer_size % cls._RECORD_STRUCT.size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{cls._RECORD_STRUCT.size:d}."
+            )
+
+        timestamps = array.array(
+            "q", [timestamp for (timestamp,) in cls._RECORD_STRUCT.iter_unpack(view)]
+        )
+        return timestamps, bytearray(b"\x01" * len(timestamps))
+
+    @classmethod
+    def DecodeStrings(cls, object_id_strings):
+        """Decodes the timestamps of ObjectId strings in bulk.
+
+        Args:
+          object_id_strings (Sequence[str]): ObjectId strings of 24
+              case-insensitive hexadecimal digits.
+
+        Returns:
+          tuple[array.array, bytearray]: number of seconds since January 1, 1970
+              00:00:00 per ObjectId string, where invalid ObjectId strings are
+              represented by 0, and validity mask, where 1 represents a valid and
+              0 an invalid ObjectId string.
+        """
+        buffer, validity_mask = cls._GetBufferFromStrings(object_id_strings)
+        timestamps, _ = cls.DecodeBuffer(buffer)
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, precision=None):
+        """Creates ObjectId timestamps from concatenated ObjectIds.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 12-byte ObjectIds.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[ObjectIdTime]: ObjectId timestamps.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 12.
+        """
+        timestamps, _ = cls.DecodeBuffer(buffer)
+        return [
+            cls(precision=precision, timestamp=timestamp) for timestamp in timestamps
+        ]
+
+    @classmethod
+    def NewFromStrings(cls, object_id_strings, precision=None):
+        """Creates ObjectId timestamps from ObjectId strings.
+
+        Args:
+          object_id_strings (Sequence[str]): ObjectId strings of 24
+              case-insensitive hexadecimal digits.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[ObjectIdTime]: ObjectId timestamps, where invalid ObjectId strings
+              are represented by None.
+        """
+        timestamps, validity_mask = cls.DecodeStrings(object_id_strings)
+        return [
+            cls(precision=precision, timestamp=timestamp) if is_valid else None
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+
+factory.Factory.RegisterDateTimeValues(ObjectIdTime)
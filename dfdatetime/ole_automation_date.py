@@ -1,7 +1,5 @@
 """OLE automation date (or Floatingtime or Application time) implementation."""
 
-import decimal
-
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -67,14 +65,12 @@ class OLEAutomationDate(interface.DateTimeValues):
         """
         if self._normalized_timestamp is None:
             if self._timestamp is not None:
-                self._normalized_timestamp = (
-                    decimal.Decimal(self._timestamp)
-                    - self._OLE_AUTOMATION_DATE_TO_POSIX_BASE
+                self._normalized_timestamp = self._GetNormalizedTimestampFromFloat(
+                    self._timestamp,
+                    self._OLE_AUTOMATION_DATE_TO_POSIX_BASE,
+                    definitions.SECONDS_PER_DAY,
+                    self._time_zone_offset,
                 )
-                self._normalized_timestamp *= definitions.SECONDS_PER_DAY
-
-                if self._time_zone_offset:
-                    self._normalized_timestamp -= self._time_zone_offset * 60
 
         return self._normalized_timestamp
 
@@ -93,16 +89,16 @@ class OLEAutomationDate(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         timestamp = self._GetNumberOfSecondsFromElements(
             year, month, day_of_month, hours, minutes, seconds
@@ -132,14 +128,12 @@ class OLEAutomationDate(interface.DateTimeValues):
 
         number_of_days, hours, minutes, seconds = self._GetTimeValues(int(timestamp))
 
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
         microseconds = int((timestamp % 1) * definitions.MICROSECONDS_PER_SECOND)
 
         return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}.{microseconds:06d}"
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{microseconds:06d}"
         )
 
     def CopyToSerializableDict(self):
@@ -154,5 +148,32 @@ class OLEAutomationDate(interface.DateTimeValues):
 
         return serializable_dict
 
+    @classmethod
+    def DecodeToPosixTimestampsInMicroseconds(cls, timestamps, time_zone_offset=None):
+        """Decodes OLE Automation dates to POSIX timestamps in bulk.
+
+        This is considerably faster than creating an OLE Automation date object
+        per value, for example to decode a date column of a spreadsheet export.
+        The POSIX timestamps are identical to those of GetPlasoTimestamp.
+
+        Args:
+          timestamps (Iterable[float]): OLE Automation dates, such as an array of
+              64-bit floating-point values.
+          time_zone_offset (Optional[int]): time zone offset in number of minutes
+              from UTC or None if not set.
+
+        Returns:
+          tuple[array.array, bytearray]: POSIX timestamps in microseconds, where
+              invalid OLE Automation dates are represented by 0, and validity mask,
+              where 1 represents a valid and 0 an invalid OLE Automation date, such
+              as infinity or NaN.
+        """
+        return cls._GetPosixTimestampsInMicrosecondsFromFloats(
+            timestamps,
+            cls._OLE_AUTOMATION_DATE_TO_POSIX_BASE,
+            definitions.SECONDS_PER_DAY,
+            time_zone_offset,
+        )
+
 
 factory.Factory.RegisterDateTimeValues(OLEAutomationDate)
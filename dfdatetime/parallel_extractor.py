@@ -0,0 +1,270 @@
+"""Parallel extractors of timestamps embedded in large text files."""
+
+import array
+import collections
+import concurrent.futures
+import os
+
+from dfdatetime import timestamp_extractor
+
+
+class ExtractedTimestamps:
+    """Columns of timestamps extracted from a text file.
+
+    The timestamps are stored in compact arrays instead of date time values
+    objects, which makes them cheap to transfer between processes.
+
+    Attributes:
+      format_codes (array.array): index of the format in the format names of the
+          extractor per timestamp.
+      line_offsets (array.array): offset, in bytes, of the line that contains
+          the timestamp per timestamp.
+      timestamps (array.array): number of microseconds since January 1, 1970
+          00:00:00 UTC per timestamp.
+    """
+
+    def __init__(self):
+        """Initializes extracted timestamps."""
+        super().__init__()
+        self.format_codes = array.array("B")
+        self.line_offsets = array.array("q")
+        self.timestamps = array.array("q")
+
+    def __len__(self):
+        """Retrieves the number of timestamps.
+
+        Returns:
+          int: number of timestamps.
+        """
+        return len(self.timestamps)
+
+    def Append(self, line_offset, timestamp, format_code):
+        """Appends a timestamp.
+
+        Args:
+          line_offset (int): offset, in bytes, of the line that contains the
+              timestamp.
+          timestamp (int): number of microseconds since January 1, 1970 00:00:00
+              UTC.
+          format_code (int): index of the format in the format names of the
+              extractor.
+        """
+        self.format_codes.append(format_code)
+        self.line_offsets.append(line_offset)
+        self.timestamps.append(timestamp)
+
+    def Extend(self, extracted_timestamps):
+        """Extends the timestamps with other extracted timestamps.
+
+        Args:
+          extracted_timestamps (ExtractedTimestamps): extracted timestamps.
+        """
+        self.format_codes.extend(extracted_timestamps.format_codes)
+        self.line_offsets.extend(extracted_timestamps.line_offsets)
+        self.timestamps.extend(extracted_timestamps.timestamps)
+
+
+class ParallelTimestampExtractor:
+    """Extractor of timestamps embedded in large text files using a process pool.
+
+    The text file is split into chunks on end of line boundaries and the chunks
+    are extracted in worker processes. The text file is expected to be in an
+    ASCII compatible encoding, such as UTF-8, since the chunks are decoded as
+    ISO-8859-1 to keep offsets in characters equivalent to offsets in bytes.
+
+    Attributes:
+      format_names (list[str]): names of the formats, where the format code of
+          a timestamp is the index of its format in the list.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+    # Timestamp extractors of the current process per strptime-style formats.
+    _extractors = {}
+
+    def __init__(self, chunk_size=None, number_of_workers=None, strptime_formats=None):
+        """Initializes an extractor.
+
+        Args:
+          chunk_size (Optional[int]): approximate size of a chunk in bytes, where
+              None represents DEFAULT_CHUNK_SIZE.
+          number_of_workers (Optional[int]): number of worker processes, where
+              None represents the number of CPUs and 1 represents extraction in
+              the current process.
+          strptime_formats (Optional[list[str]]): strptime-style format strings
+              to match after the other formats, where None represents the
+              default formats of the timestamp extractor.
+
+        Raises:
+          ValueError: if the chunk size or number of workers is out of bounds or
+              a strptime-style format string is not supported.
+        """
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_CHUNK_SIZE
+
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size value: {chunk_size:d} out of bounds.")
+
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+
+        if number_of_workers < 1:
+            raise ValueError(
+                f"Number of workers value: {number_of_workers:d} out of bounds."
+            )
+
+        if strptime_formats is not None:
+            strptime_formats = tuple(strptime_formats)
+
+        extractor = self._GetExtractor(strptime_formats)
+
+        super().__init__()
+        self._chunk_size = chunk_size
+        self._number_of_workers = number_of_workers
+        self._strptime_formats = strptime_formats
+
+        self.format_names = list(extractor.format_names)
+
+    @classmethod
+    def _ExtractFromChunk(cls, path, start_offset, end_offset, strptime_formats):
+        """Extracts timestamps from a chunk of a text file.
+
+        Args:
+          path (str): path of the text file.
+          start_offset (int): offset of the start of the chunk.
+          end_offset (int): offset of the end of the chunk.
+          strptime_formats (tuple[str]): strptime-style format strings or None
+              for the default formats.
+
+        Returns:
+          ExtractedTimestamps: timestamps extracted from the chunk.
+        """
+        extractor = cls._GetExtractor(strptime_formats)
+
+        with open(path, "rb") as file_object:
+            file_object.seek(start_offset, os.SEEK_SET)
+            data = file_object.read(end_offset - start_offset)
+
+        text = data.decode("iso-8859-1")
+
+        extracted_timestamps = ExtractedTimestamps()
+
+        # pylint: disable=protected-access
+        for match, format_index, date_time_values in extractor._ParseMatches(text):
+            line_offset = text.rfind("\n", 0, match.start()) + 1
+            extracted_timestamps.Append(
+                start_offset + line_offset,
+                date_time_values.GetPlasoTimestamp(),
+                format_index,
+            )
+
+        return extracted_timestamps
+
+    def _GetChunkRanges(self, path):
+        """Retrieves the ranges of the chunks of a text file.
+
+        Args:
+          path (str): path of the text file.
+
+        Yields:
+          tuple[int, int]: start and end offset of a chunk, where the end offset
+              is the offset after an end of line character or the end of the file.
+        """
+        file_size = os.path.getsize(path)
+
+        with open(path, "rb") as file_object:
+            start_offset = 0
+            while start_offset < file_size:
+                end_offset = start_offset + self._chunk_size
+                if end_offset < file_size:
+                    file_object.seek(end_offset - 1, os.SEEK_SET)
+                    file_object.readline()
+                    end_offset = file_object.tell()
+                else:
+                    end_offset = file_size
+
+                yield start_offset, end_offset
+
+                start_offset = end_offset
+
+    @classmethod
+    def _GetExtractor(cls, strptime_formats):
+        """Retrieves a timestamp extractor of the current process.
+
+        Args:
+          strptime_formats (tuple[str]): strptime-style format strings or None
+              for the default formats.
+
+        Returns:
+          TimestampExtractor: timestamp extractor.
+
+        Raises:
+          ValueError: if a strptime-style format string is not supported.
+        """
+        extractor = cls._extractors.get(strptime_formats)
+        if not extractor:
+            extractor = timestamp_extractor.TimestampExtractor(
+                strptime_formats=strptime_formats
+            )
+            cls._extractors[strptime_formats] = extractor
+
+        return extractor
+
+    def ExtractColumnsFromFile(self, path):
+        """Extracts the timestamps from a text file into a single set of columns.
+
+        Args:
+          path (str): path of the text file.
+
+        Returns:
+          ExtractedTimestamps: timestamps extracted from the text file, in file
+              order.
+        """
+        extracted_timestamps = ExtractedTimestamps()
+        for chunk_extracted_timestamps in self.ExtractFromFile(path):
+            extracted_timestamps.Extend(chunk_extracted_timestamps)
+
+        return extracted_timestamps
+
+    def ExtractFromFile(self, path):
+        """Extracts the timestamps from a text file per chunk.
+
+        Args:
+          path (str): path of the text file.
+
+        Yields:
+          ExtractedTimestamps: timestamps extracted from a chunk, in file order.
+        """
+        chunk_ranges = self._GetChunkRanges(path)
+
+        if self._number_of_workers == 1:
+            for start_offset, end_offset in chunk_ranges:
+                yield self._ExtractFromChunk(
+                    path, start_offset, end_offset, self._strptime_formats
+                )
+            return
+
+        # The number of pending chunks is bounded to keep memory usage
+        # independent of the size of the text file.
+        maximum_number_of_pending_chunks = 2 * self._number_of_workers
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._number_of_workers
+        ) as executor:
+            pending_futures = collections.deque()
+
+            for start_offset, end_offset in chunk_ranges:
+                if len(pending_futures) >= maximum_number_of_pending_chunks:
+                    yield pending_futures.popleft().result()
+
+                future = executor.submit(
+                    self._ExtractFromChunk,
+                    path,
+                    start_offset,
+                    end_offset,
+                    self._strptime_formats,
+                )
+                pending_futures.append(future)
+
+            while pending_futures:
+                yield pending_futures.popleft().result()
@@ -0,0 +1,330 @@
+"""Packet capture (pcap and pcapng) timestamp implementation."""
+
+import array
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import posix_time
+
+
+class PcapTime(posix_time.PosixTimeInNanoseconds):
+    """Packet capture timestamp.
+
+    The timestamp of a packet in a pcap or pcapng capture file, which is
+    a signed integer that contains the number of nanoseconds since 1970-01-01
+    00:00:00 (also known as the POSIX epoch).
+
+    In a pcap file the timestamp is stored in the record header of the packet
+    as the number of seconds and the number of microseconds or nanoseconds.
+    In a pcapng file the timestamp is stored in the packet block as a 64-bit
+    number of units since the POSIX epoch, where the units are defined per
+    interface by the if_tsresol option, which is microseconds by default.
+
+    Also see:
+      https://www.ietf.org/archive/id/draft-ietf-opsawg-pcap-04.html
+      https://www.ietf.org/archive/id/draft-ietf-opsawg-pcapng-02.html
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _MAXIMUM_TIMESTAMP = (1 << 63) - 1
+    _MINIMUM_TIMESTAMP = -(1 << 63)
+
+    # Byte order and number of nanoseconds per unit of the fraction of second
+    # per pcap file signature.
+    _PCAP_NANOSECONDS_PER_UNIT = {
+        b"\xd4\xc3\xb2\xa1": ("<", 1000),
+        b"\xa1\xb2\xc3\xd4": (">", 1000),
+        b"\x4d\x3c\xb2\xa1": ("<", 1),
+        b"\xa1\xb2\x3c\x4d": (">", 1),
+    }
+
+    _PCAP_FILE_HEADER_SIZE = 24
+
+    # Byte order per pcapng byte-order magic.
+    _PCAPNG_BYTE_ORDERS = {b"\x4d\x3c\x2b\x1a": "<", b"\x1a\x2b\x3c\x4d": ">"}
+
+    _PCAPNG_SECTION_HEADER_BLOCK_TYPE = b"\x0a\x0d\x0d\x0a"
+
+    # Default resolution of a pcapng timestamp, which is 10^-6 seconds.
+    _PCAPNG_DEFAULT_TIMESTAMP_RESOLUTION = 6
+
+    _PCAPNG_BLOCK_TYPE_ENHANCED_PACKET = 6
+    _PCAPNG_BLOCK_TYPE_INTERFACE_DESCRIPTION = 1
+    _PCAPNG_BLOCK_TYPE_PACKET = 2
+
+    _PCAPNG_OPTION_END_OF_OPTIONS = 0
+    _PCAPNG_OPTION_IF_TSOFFSET = 14
+    _PCAPNG_OPTION_IF_TSRESOL = 9
+
+    @classmethod
+    def _DecodePcapRecords(cls, view):
+        """Decodes the packet timestamps of pcap records.
+
+        Args:
+          view (memoryview): pcap file data.
+
+        Yields:
+          int: number of nanoseconds since January 1, 1970 00:00:00 per packet.
+        """
+        byte_order, nanoseconds_per_unit = cls._PCAP_NANOSECONDS_PER_UNIT[
+            view[:4].tobytes()
+        ]
+        record_header_struct = struct.Struct(f"{byte_order:s}IIIxxxx")
+
+        nanoseconds_per_second = definitions.NANOSECONDS_PER_SECOND
+        record_header_size = record_header_struct.size
+
+        buffer_size = len(view)
+
+        # A truncated record at the end of the capture file, such as written by
+        # an interrupted capture, is ignored.
+        offset = cls._PCAP_FILE_HEADER_SIZE
+        while offset + record_header_size <= buffer_size:
+            number_of_seconds, fraction_of_second, captured_size = (
+                record_header_struct.unpack_from(view, offset)
+            )
+            yield (number_of_seconds * nanoseconds_per_second) + (
+                fraction_of_second * nanoseconds_per_unit
+            )
+
+            offset += record_header_size + captured_size
+
+    @classmethod
+    def _DecodePcapngBlocks(cls, view):
+        """Decodes the packet timestamps of pcapng blocks.
+
+        Args:
+          view (memoryview): pcapng file data.
+
+        Yields:
+          int: number of nanoseconds since January 1, 1970 00:00:00 per packet
+              or None if the interface of the packet is not defined.
+
+        Raises:
+          ValueError: if the pcapng file data is not supported or truncated.
+        """
+        buffer_size = len(view)
+
+        byte_order = "<"
+        interfaces = []
+
+        offset = 0
+        while offset + 12 <= buffer_size:
+            if view[offset : offset + 4] == cls._PCAPNG_SECTION_HEADER_BLOCK_TYPE:
+                byte_order = cls._PCAPNG_BYTE_ORDERS.get(
+                    view[offset + 8 : offset + 12].tobytes(), None
+                )
+                if not byte_order:
+                    raise ValueError(
+                        f"Unsupported pcapng byte-order magic at offset: {offset:d}."
+                    )
+
+                interfaces = []
+
+            block_type, block_size = struct.unpack_from(
+                f"{byte_order:s}II", view, offset
+            )
+            if block_size < 12 or block_size % 4:
+                raise ValueError(
+                    f"Unsupported pcapng block size: {block_size:d} at offset: "
+                    f"{offset:d}."
+                )
+
+            if offset + block_size > buffer_size:
+                raise ValueError(f"Truncated pcapng block at offset: {offset:d}.")
+
+            if block_type == cls._PCAPNG_BLOCK_TYPE_INTERFACE_DESCRIPTION:
+                interfaces.append(
+                    cls._GetPcapngInterfaceTimestampValues(
+                        view[offset + 16 : offset + block_size - 4], byte_order
+                    )
+                )
+
+            elif block_type in (
+                cls._PCAPNG_BLOCK_TYPE_ENHANCED_PACKET,
+                cls._PCAPNG_BLOCK_TYPE_PACKET,
+            ):
+                if block_type == cls._PCAPNG_BLOCK_TYPE_ENHANCED_PACKET:
+                    interface_identifier, upper_32bit, lower_32bit = struct.unpack_from(
+                        f"{byte_order:s}III", view, offset + 8
+                    )
+                else:
+                    interface_identifier, _, upper_32bit, lower_32bit = (
+                        struct.unpack_from(f"{byte_order:s}HHII", view, offset + 8)
+                    )
+
+                if interface_identifier >= len(interfaces):
+                    yield None
+
+                else:
+                    units_per_second, fraction_of_second_bits, timestamp_offset = (
+                        interfaces[interface_identifier]
+                    )
+                    timestamp = (upper_32bit << 32) | lower_32bit
+                    if fraction_of_second_bits:
+                        timestamp = (
+                            timestamp * definitions.NANOSECONDS_PER_SECOND
+                        ) >> fraction_of_second_bits
+                    elif units_per_second <= definitions.NANOSECONDS_PER_SECOND:
+                        timestamp *= (
+                            definitions.NANOSECONDS_PER_SECOND // units_per_second
+                        )
+                    else:
+                        timestamp //= (
+                            units_per_second // definitions.NANOSECONDS_PER_SECOND
+                        )
+
+                    yield timestamp + timestamp_offset
+
+            offset += block_size
+
+    @classmethod
+    def _DecodeRecords(cls, buffer):
+        """Decodes the packet timestamps of a capture file.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): data of a pcap or
+              pcapng capture file.
+
+        Returns:
+          generator[int]: number of nanoseconds since January 1, 1970 00:00:00
+              per packet or None if the interface of the packet is not defined.
+
+        Raises:
+          ValueError: if the capture file format is not supported.
+        """
+        view = memoryview(buffer).cast("B")
+
+        signature = view[:4].tobytes()
+        if signature == cls._PCAPNG_SECTION_HEADER_BLOCK_TYPE:
+            return cls._DecodePcapngBlocks(view)
+
+        if (
+            signature in cls._PCAP_NANOSECONDS_PER_UNIT
+            and len(view) >= cls._PCAP_FILE_HEADER_SIZE
+        ):
+            return cls._DecodePcapRecords(view)
+
+        raise ValueError("Unsupported capture file format.")
+
+    @classmethod
+    def _GetPcapngInterfaceTimestampValues(cls, options_data, byte_order):
+        """Retrieves the timestamp values of a pcapng interface.
+
+        Args:
+          options_data (memoryview): options of an interface description block.
+          byte_order (str): byte order of the section, either "<" or ">".
+
+        Returns:
+          tuple[int, int, int]: number of units per second, where 0 represents
+              a resolution that is a negative power of 2, number of bits of the
+              fraction of second, where 0 represents a resolution that is
+              a negative power of 10, and timestamp offset in nanoseconds.
+
+        Raises:
+          ValueError: if the options are not supported.
+        """
+        timestamp_resolution = cls._PCAPNG_DEFAULT_TIMESTAMP_RESOLUTION
+        timestamp_offset = 0
+
+        options_data_size = len(options_data)
+
+        option_header_struct = struct.Struct(f"{byte_order:s}HH")
+
+        offset = 0
+        while offset + 4 <= options_data_size:
+            option_code, option_size = option_header_struct.unpack_from(
+                options_data, offset
+            )
+            if option_code == cls._PCAPNG_OPTION_END_OF_OPTIONS:
+                break
+
+            offset += 4
+            if offset + option_size > options_data_size:
+                raise ValueError("Truncated pcapng interface option.")
+
+            if option_code == cls._PCAPNG_OPTION_IF_TSRESOL and option_size == 1:
+                timestamp_resolution = options_data[offset]
+
+            elif option_code == cls._PCAPNG_OPTION_IF_TSOFFSET and option_size == 8:
+                (timestamp_offset,) = struct.unpack_from(
+                    f"{byte_order:s}q", options_data, offset
+                )
+
+            offset += (option_size + 3) & ~3
+
+        timestamp_offset *= definitions.NANOSECONDS_PER_SECOND
+
+        if timestamp_resolution & 0x80:
+            return 0, timestamp_resolution & 0x7F, timestamp_offset
+
+        return 10**timestamp_resolution, 0, timestamp_offset
+
+    @classmethod
+    def DecodeCaptureBuffer(cls, buffer):
+        """Decodes the packet timestamps of a capture file in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): data of a pcap or
+              pcapng capture file, such as a memory-mapped capture file.
+
+        Returns:
+          tuple[array.array, bytearray]: number of nanoseconds since January 1,
+              1970 00:00:00 per packet, where invalid timestamps are represented
+              by 0, and validity mask, where 1 represents a valid and 0 an
+              invalid timestamp, such as the timestamp of a packet of an
+              interface that is not defined.
+
+        Raises:
+          ValueError: if the capture file format is not supported or the capture
+              file data is truncated.
+        """
+        maximum_timestamp = cls._MAXIMUM_TIMESTAMP
+        minimum_timestamp = cls._MINIMUM_TIMESTAMP
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for timestamp in cls._DecodeRecords(buffer):
+            if (
+                timestamp is None
+                or timestamp < minimum_timestamp
+                or timestamp > maximum_timestamp
+            ):
+                timestamps.append(0)
+                validity_mask.append(0)
+            else:
+                timestamps.append(timestamp)
+                validity_mask.append(1)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromCaptureBuffer(cls, buffer, precision=None):
+        """Creates packet capture timestamps from the packets of a capture file.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): data of a pcap or
+              pcapng capture file, such as a memory-mapped capture file.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[PcapTime]: packet capture timestamps, where invalid timestamps are
+              represented by None.
+
+        Raises:
+          ValueError: if the capture file format is not supported or the capture
+              file data is truncated.
+        """
+        timestamps, validity_mask = cls.DecodeCaptureBuffer(buffer)
+        return [
+            cls(precision=precision, timestamp=timestamp) if is_valid else None
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+
+factory.Factory.RegisterDateTimeValues(PcapTime)
@@ -0,0 +1,727 @@
+"""Profiler of date and time values workloads.
+
+Runs a workload, which consists of a corpus file and an operation, under
+cProfile and tracemalloc and reports the dfDateTime internal hotspots. The
+call stacks can be written in collapsed stack format, which can be used to
+generate flame graphs with tools such as flamegraph.pl or speedscope.
+
+Usage:
+  python -m dfdatetime.profile [--collapsed-stacks FILE] [--repeat N]
+      [--top N] OPERATION CORPUS
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import time_elements
+
+
+class Operation:
+    """Workload operation.
+
+    Attributes:
+      description (str): description of the operation.
+      name (str): name of the operation.
+    """
+
+    def __init__(self, name, description, prepare_function, run_function):
+        """Initializes a workload operation.
+
+        Args:
+          name (str): name of the operation.
+          description (str): description of the operation.
+          prepare_function (function): function to convert a line of the corpus
+              into the input of the run function, which is not profiled.
+          run_function (function): function to run the operation on an input.
+        """
+        super().__init__()
+        self._prepare_function = prepare_function
+        self._run_function = run_function
+        self.description = description
+        self.name = name
+
+    def Prepare(self, line):
+        """Prepares the input of the operation.
+
+        Args:
+          line (str): line of the corpus, without end-of-line character.
+
+        Returns:
+          object: input of the operation.
+
+        Raises:
+          ValueError: if the line cannot be converted.
+        """
+        return self._prepare_function(line)
+
+    def Run(self, value):
+        """Runs the operation.
+
+        Args:
+          value (object): input of the operation.
+        """
+        self._run_function(value)
+
+
+def _CopyFromDateTimeString(time_string):
+    """Copies time elements from a date and time string.
+
+    Args:
+      time_string (str): date and time string.
+    """
+    time_elements_object = time_elements.TimeElementsInMicroseconds()
+    time_elements_object.CopyFromDateTimeString(time_string)
+
+
+def _CopyFromStringISO8601(time_string):
+    """Copies time elements from an ISO 8601 date and time string.
+
+    Args:
+      time_string (str): ISO 8601 date and time string.
+    """
+    time_elements_object = time_elements.TimeElementsInMicroseconds()
+    time_elements_object.CopyFromStringISO8601(time_string)
+
+
+def _CopyFromStringRFC1123(time_string):
+    """Copies time elements from a RFC 1123 date and time string.
+
+    Args:
+      time_string (str): RFC 1123 date and time string.
+    """
+    time_elements_object = time_elements.TimeElements()
+    time_elements_object.CopyFromStringRFC1123(time_string)
+
+
+def _FormatFiletime(timestamp):
+    """Formats a FILETIME timestamp as a date and time string.
+
+    Args:
+      timestamp (int): FILETIME timestamp.
+    """
+    filetime.Filetime(timestamp=timestamp).CopyToDateTimeString()
+
+
+def _FormatFiletimeISO8601(timestamp):
+    """Formats a FILETIME timestamp as an ISO 8601 date and time string.
+
+    Args:
+      timestamp (int): FILETIME timestamp.
+    """
+    filetime.Filetime(timestamp=timestamp).CopyToDateTimeStringISO8601()
+
+
+def _FormatPosixTime(timestamp):
+    """Formats a POSIX timestamp as a date and time string.
+
+    Args:
+      timestamp (int): POSIX timestamp.
+    """
+    posix_time.PosixTime(timestamp=timestamp).CopyToDateTimeString()
+
+
+def _NormalizeFiletime(timestamp):
+    """Determines the date and time values of a FILETIME timestamp.
+
+    Args:
+      timestamp (int): FILETIME timestamp.
+    """
+    filetime.Filetime(timestamp=timestamp).GetDateWithTimeOfDay()
+
+
+def _ParseInteger(line):
+    """Parses an integer.
+
+    Args:
+      line (str): integer, such as "1281647191" or "0x01cb3a623d0a17ce".
+
+    Returns:
+      int: integer.
+    """
+    return int(line, 0)
+
+
+OPERATIONS = {
+    operation.name: operation
+    for operation in [
+        Operation(
+            "format_filetime",
+            "FILETIME timestamp to date and time string",
+            _ParseInteger,
+            _FormatFiletime,
+        ),
+        Operation(
+            "format_filetime_iso8601",
+            "FILETIME timestamp to ISO 8601 date and time string",
+            _ParseInteger,
+            _FormatFiletimeISO8601,
+        ),
+        Operation(
+            "format_posix_time",
+            "POSIX timestamp to date and time string",
+            _ParseInteger,
+            _FormatPosixTime,
+        ),
+        Operation(
+            "normalize_filetime",
+            "FILETIME timestamp to date and time of day in UTC",
+            _ParseInteger,
+            _NormalizeFiletime,
+        ),
+        Operation(
+            "parse_date_time_string",
+            'date and time string "YYYY-MM-DD hh:mm:ss.######" to time elements',
+            str,
+            _CopyFromDateTimeString,
+        ),
+        Operation(
+            "parse_iso8601",
+            "ISO 8601 date and time string to time elements",
+            str,
+            _CopyFromStringISO8601,
+        ),
+        Operation(
+            "parse_rfc1123",
+            "RFC 1123 date and time string to time elements",
+            str,
+            _CopyFromStringRFC1123,
+        ),
+    ]
+}
+
+
+class Workload:
+    """Workload.
+
+    Attributes:
+      number_of_errors (int): number of inputs of which the operation raised
+          a ValueError during the last run.
+      operation (Operation): operation.
+      values (list[object]): inputs of the operation.
+    """
+
+    def __init__(self, operation, values):
+        """Initializes a workload.
+
+        Args:
+          operation (Operation): operation.
+          values (list[object]): inputs of the operation.
+        """
+        super().__init__()
+        self.number_of_errors = 0
+        self.operation = operation
+        self.values = values
+
+    def Run(self, repeat=1):
+        """Runs the workload.
+
+        Args:
+          repeat (Optional[int]): number of times to run the operation on all
+              inputs.
+        """
+        run_function = self.operation.Run
+
+        number_of_errors = 0
+        for _ in range(repeat):
+            for value in self.values:
+                try:
+                    run_function(value)
+                except ValueError:
+                    number_of_errors += 1
+
+        self.number_of_errors = number_of_errors
+
+
+class CollapsedStacksProfiler:
+    """Profiler that determines the time spent per call stack.
+
+    The call stacks are formatted as collapsed stacks, where each line contains
+    the semicolon separated frames of a stack and the time spent in the last
+    frame, excluding its callees, in microseconds.
+    """
+
+    _OMITTED_PREFIXES = (f"{__name__:s}.", "__main__.")
+
+    def __init__(self):
+        """Initializes a collapsed stacks profiler."""
+        super().__init__()
+        self._stack = []
+        self._stack_times = {}
+
+    def _GetFrameLabel(self, frame, event, argument):
+        """Retrieves the label of a frame.
+
+        Args:
+          frame (frame): Python stack frame.
+          event (str): profile event.
+          argument (object): profile event argument.
+
+        Returns:
+          str: label of the frame.
+        """
+        if event.startswith("c_"):
+            module_name = getattr(argument, "__module__", None) or ""
+            qualified_name = getattr(argument, "__qualname__", None) or repr(argument)
+            if module_name:
+                return f"{module_name:s}.{qualified_name:s}"
+            return qualified_name
+
+        code = frame.f_code
+        module_name = frame.f_globals.get("__name__", "")
+        qualified_name = getattr(code, "co_qualname", code.co_name)
+        return f"{module_name:s}.{qualified_name:s}"
+
+    def _ProfileFunction(self, frame, event, argument):
+        """Handles a profile event.
+
+        Args:
+          frame (frame): Python stack frame.
+          event (str): profile event.
+          argument (object): profile event argument.
+        """
+        current_time = time.perf_counter_ns()
+
+        if event in ("call", "c_call"):
+            label = self._GetFrameLabel(frame, event, argument)
+            self._stack.append([label, current_time, 0])
+
+        elif self._stack:
+            label, start_time, callees_time = self._stack.pop()
+            elapsed_time = current_time - start_time
+
+            # Frames of the profiler and the workload driver are omitted.
+            key = ";".join(
+                stack_frame[0]
+                for stack_frame in self._stack + [[label]]
+                if not stack_frame[0].startswith(self._OMITTED_PREFIXES)
+            )
+            if key:
+                self._stack_times[key] = self._stack_times.get(key, 0) + (
+                    elapsed_time - callees_time
+                )
+            if self._stack:
+                self._stack[-1][2] += elapsed_time
+
+    def GetCollapsedStacks(self):
+        """Retrieves the collapsed stacks.
+
+        Returns:
+          list[str]: collapsed stacks, with time in microseconds, sorted by stack.
+        """
+        lines = []
+        for key, stack_time in sorted(self._stack_times.items()):
+            microseconds = stack_time // 1000
+            if microseconds > 0:
+                lines.append(f"{key:s} {microseconds:d}")
+
+        return lines
+
+    def Profile(self, function):
+        """Profiles a function.
+
+        Args:
+          function (function): function to profile.
+        """
+        self._stack = []
+        sys.setprofile(self._ProfileFunction)
+        try:
+            function()
+        finally:
+            sys.setprofile(None)
+
+        self._stack = []
+
+
+class WorkloadProfiler:
+    """Profiler of date and time values workloads."""
+
+    # Categories of hotspots, as (name, substrings of the function description).
+    _CATEGORIES = [
+        ("Decimal arithmetic", ("decimal.Decimal", "_pydecimal.py", "decimal.py")),
+        ("Integer parsing and conversion", ("<built-in method builtins.int>",)),
+        ("String methods", ("of 'str' objects", "builtins.len")),
+        ("Date values", ("_GetDateValues", "_GetDaysPerMonth", "_GetNumberOf")),
+        ("Time values", ("_GetTimeValues",)),
+        ("String parsing", ("FromString",)),
+    ]
+
+    def __init__(self, package_path=None):
+        """Initializes a workload profiler.
+
+        Args:
+          package_path (Optional[str]): path of the dfDateTime package, where
+              None represents the path of the package this module is part of.
+        """
+        super().__init__()
+        self._package_path = package_path or os.path.dirname(os.path.abspath(__file__))
+
+    def _FormatFunction(self, function_key):
+        """Formats a pstats function key.
+
+        Args:
+          function_key (tuple[str, int, str]): filename, line number and function
+              name.
+
+        Returns:
+          str: formatted function.
+        """
+        filename, line_number, function_name = function_key
+        if filename == "~":
+            return function_name
+
+        if filename.startswith(self._package_path):
+            filename = os.path.join(
+                "dfdatetime", os.path.relpath(filename, self._package_path)
+            )
+        return f"{filename:s}:{line_number:d}({function_name:s})"
+
+    def _IsInternal(self, filename):
+        """Determines if a filename is part of the dfDateTime package.
+
+        Args:
+          filename (str): filename.
+
+        Returns:
+          bool: True if the filename is part of the dfDateTime package.
+        """
+        return filename.startswith(self._package_path) and not filename.endswith(
+            "profile.py"
+        )
+
+    def GetCategoryTimes(self, cpu_statistics):
+        """Determines the time spent per hotspot category.
+
+        Args:
+          cpu_statistics (pstats.Stats): CPU statistics.
+
+        Returns:
+          list[tuple[str, float]]: category names and times, in seconds, excluding
+              callees, sorted by decreasing time.
+        """
+        category_times = {name: 0.0 for name, _ in self._CATEGORIES}
+
+        # pylint: disable=no-member
+        for function_key, values in cpu_statistics.stats.items():
+            description = self._FormatFunction(function_key)
+            for name, substrings in self._CATEGORIES:
+                if any(substring in description for substring in substrings):
+                    category_times[name] += values[2]
+                    break
+
+        return sorted(category_times.items(), key=lambda item: item[1], reverse=True)
+
+    def GetHotspots(self, cpu_statistics, maximum_number_of_entries=20):
+        """Determines the hotspots.
+
+        Hotspots are dfDateTime internal functions and the functions they call
+        directly, such as Decimal arithmetic and string methods.
+
+        Args:
+          cpu_statistics (pstats.Stats): CPU statistics.
+          maximum_number_of_entries (Optional[int]): maximum number of hotspots.
+
+        Returns:
+          list[tuple[str, int, float, float]]: function, number of calls, time
+              excluding callees and time including callees, in seconds, sorted by
+              decreasing time excluding callees.
+        """
+        hotspots = []
+        # pylint: disable=no-member
+        for function_key, values in cpu_statistics.stats.items():
+            _, number_of_calls, own_time, cumulative_time, callers = values
+
+            is_internal = self._IsInternal(function_key[0])
+            if not is_internal:
+                is_internal = any(
+                    self._IsInternal(caller_key[0]) for caller_key in callers
+                )
+
+            if is_internal:
+                hotspots.append(
+                    (
+                        self._FormatFunction(function_key),
+                        number_of_calls,
+                        own_time,
+                        cumulative_time,
+                    )
+                )
+
+        hotspots.sort(key=lambda hotspot: hotspot[2], reverse=True)
+        return hotspots[:maximum_number_of_entries]
+
+    def GetMemoryHotspots(self, memory_snapshot, maximum_number_of_entries=10):
+        """Determines the dfDateTime internal memory allocation hotspots.
+
+        Args:
+          memory_snapshot (tracemalloc.Snapshot): memory snapshot.
+          maximum_number_of_entries (Optional[int]): maximum number of hotspots.
+
+        Returns:
+          list[tuple[str, int, int]]: source line, size in bytes and number of
+              allocations, sorted by decreasing size.
+        """
+        memory_snapshot = memory_snapshot.filter_traces(
+            [tracemalloc.Filter(True, os.path.join(self._package_path, "*"))]
+        )
+
+        hotspots = []
+        for statistic in memory_snapshot.statistics("lineno"):
+            frame = statistic.traceback[0]
+            if not self._IsInternal(frame.filename):
+                continue
+
+            location = self._FormatFunction((frame.filename, frame.lineno, ""))
+            hotspots.append((location[:-2], statistic.size, statistic.count))
+
+        return hotspots[:maximum_number_of_entries]
+
+    def ProfileCPU(self, workload, repeat=1):
+        """Profiles the CPU usage of a workload.
+
+        Args:
+          workload (Workload): workload.
+          repeat (Optional[int]): number of times to run the workload.
+
+        Returns:
+          pstats.Stats: CPU statistics.
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            workload.Run(repeat=repeat)
+        finally:
+            profiler.disable()
+
+        return pstats.Stats(profiler)
+
+    def ProfileMemory(self, workload, repeat=1):
+        """Profiles the memory allocations of a workload.
+
+        Args:
+          workload (Workload): workload.
+          repeat (Optional[int]): number of times to run the workload.
+
+        Returns:
+          tuple[tracemalloc.Snapshot, int]: memory snapshot and peak traced memory
+              size in bytes.
+        """
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            workload.Run(repeat=repeat)
+            memory_snapshot = tracemalloc.take_snapshot()
+            _, peak_size = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return memory_snapshot, peak_size
+
+    def ProfileStacks(self, workload, repeat=1):
+        """Profiles the call stacks of a workload.
+
+        Args:
+          workload (Workload): workload.
+          repeat (Optional[int]): number of times to run the workload.
+
+        Returns:
+          list[str]: collapsed stacks.
+        """
+        profiler = CollapsedStacksProfiler()
+        profiler.Profile(lambda: workload.Run(repeat=repeat))
+        return profiler.GetCollapsedStacks()
+
+    def FormatReport(
+        self, workload, cpu_statistics, memory_snapshot, peak_size, top=20
+    ):
+        """Formats a hotspot report.
+
+        Args:
+          workload (Workload): workload.
+          cpu_statistics (pstats.Stats): CPU statistics.
+          memory_snapshot (tracemalloc.Snapshot): memory snapshot.
+          peak_size (int): peak traced memory size in bytes.
+          top (Optional[int]): maximum number of hotspots per section.
+
+        Returns:
+          str: text report.
+        """
+        # pylint: disable=no-member
+        total_time = cpu_statistics.total_tt
+
+        lines = [
+            f"Operation: {workload.operation.name:s} "
+            f"({workload.operation.description:s})",
+            f"Number of inputs: {len(workload.values):d}",
+            f"Number of errors: {workload.number_of_errors:d}",
+            f"Total time: {total_time:.3f} seconds",
+            f"Peak traced memory: {peak_size:d} bytes",
+            "",
+            "Time per category (excluding callees):",
+        ]
+        for name, category_time in self.GetCategoryTimes(cpu_statistics):
+            percentage = (category_time * 100.0 / total_time) if total_time else 0.0
+            lines.append(f"  {name:<32s} {category_time:9.3f}s {percentage:6.1f}%")
+
+        lines.extend(
+            [
+                "",
+                "CPU hotspots:",
+                f"  {'own (s)':>9s} {'cum (s)':>9s} {'calls':>10s}  function",
+            ]
+        )
+        for function, number_of_calls, own_time, cumulative_time in self.GetHotspots(
+            cpu_statistics, maximum_number_of_entries=top
+        ):
+            lines.append(
+                f"  {own_time:9.3f} {cumulative_time:9.3f} {number_of_calls:10d}  "
+                f"{function:s}"
+            )
+
+        lines.extend(
+            [
+                "",
+                "Memory allocation hotspots (remaining at end of workload):",
+                f"  {'bytes':>12s} {'blocks':>8s}  source line",
+            ]
+        )
+        for location, size, count in self.GetMemoryHotspots(
+            memory_snapshot, maximum_number_of_entries=top
+        ):
+            lines.append(f"  {size:12d} {count:8d}  {location:s}")
+
+        return "\n".join(lines)
+
+
+def ReadCorpus(path, operation):
+    """Reads a corpus file.
+
+    Args:
+      path (str): path of the corpus file, which contains one input per line.
+      operation (Operation): operation used to prepare the inputs.
+
+    Returns:
+      list[object]: inputs of the operation, excluding empty lines.
+
+    Raises:
+      ValueError: if a line cannot be converted into an input.
+    """
+    values = []
+    with open(path, "r", encoding="utf-8") as file_object:
+        for line_number, line in enumerate(file_object, start=1):
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+
+            try:
+                values.append(operation.Prepare(line))
+            except ValueError as exception:
+                raise ValueError(
+                    f"Unable to prepare line: {line_number:d} with error: "
+                    f"{exception!s}"
+                )
+
+    return values
+
+
+def Main():
+    """Entry point of the workload profiler.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    operation_names = "\n".join(
+        f"  {name:s}: {operation.description:s}"
+        for name, operation in sorted(OPERATIONS.items())
+    )
+    argument_parser = argparse.ArgumentParser(
+        description="Profiles a date and time values workload.",
+        epilog=f"Supported operations:\n{operation_names:s}",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    argument_parser.add_argument(
+        "--collapsed-stacks",
+        dest="collapsed_stacks",
+        metavar="FILE",
+        help="file to write the collapsed stacks to, for use with flame graphs.",
+    )
+    argument_parser.add_argument(
+        "--output",
+        dest="output",
+        metavar="FILE",
+        help="file to write the report to instead of stdout.",
+    )
+    argument_parser.add_argument(
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=1,
+        help="number of times to run the operation on the corpus.",
+    )
+    argument_parser.add_argument(
+        "--top",
+        dest="top",
+        type=int,
+        default=20,
+        help="maximum number of hotspots per section of the report.",
+    )
+    argument_parser.add_argument("operation", help="name of the operation.")
+    argument_parser.add_argument(
+        "corpus", help="path of the corpus file, with one input per line."
+    )
+
+    options = argument_parser.parse_args()
+
+    operation = OPERATIONS.get(options.operation)
+    if not operation:
+        print(f"Unsupported operation: {options.operation:s}")
+        return False
+
+    try:
+        values = ReadCorpus(options.corpus, operation)
+    except (IOError, ValueError) as exception:
+        print(f"Unable to read corpus with error: {exception!s}")
+        return False
+
+    workload = Workload(operation, values)
+    workload_profiler = WorkloadProfiler()
+
+    cpu_statistics = workload_profiler.ProfileCPU(workload, repeat=options.repeat)
+    memory_snapshot, peak_size = workload_profiler.ProfileMemory(
+        workload, repeat=options.repeat
+    )
+
+    report = workload_profiler.FormatReport(
+        workload, cpu_statistics, memory_snapshot, peak_size, top=options.top
+    )
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file_object:
+            file_object.write(report)
+            file_object.write("\n")
+    else:
+        print(report)
+
+    if options.collapsed_stacks:
+        collapsed_stacks = workload_profiler.ProfileStacks(
+            workload, repeat=options.repeat
+        )
+        with open(options.collapsed_stacks, "w", encoding="utf-8") as file_object:
+            for line in collapsed_stacks:
+                file_object.write(line)
+                file_object.write("\n")
+
+    return True
+
+
+if __name__ == "__main__":
+    if not Main():
+        sys.exit(1)
+    else:
+        sys.exit(0)
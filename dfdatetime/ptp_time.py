@@ -0,0 +1,130 @@
+"""PTP timestamp implementation."""
+
+import array
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import linear_time
+from dfdatetime import posix_time
+
+
+class PTPTime(linear_time.LinearTime):
+    """PTP timestamp.
+
+    The PTP (IEEE 1588 Precision Time Protocol) timestamp consists of an
+    unsigned 48-bit integer that contains the number of seconds since
+    1970-01-01 00:00:00 in the PTP timescale and an unsigned 32-bit integer
+    that contains the number of nanoseconds, both in big-endian byte order.
+    The timestamp is the number of nanoseconds since the epoch.
+
+    The PTP timescale is TAI, which is ahead of UTC by the current UTC offset,
+    such as 37 seconds since 2017, and the timestamp is not corrected for this
+    offset.
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_NANOSECOND
+
+    _EPOCH = posix_time.PosixTimeEpoch()
+
+    _MAXIMUM_TIMESTAMP = (1 << 48) * definitions.NANOSECONDS_PER_SECOND - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    _UNITS_PER_SECOND = definitions.NANOSECONDS_PER_SECOND
+
+    _VALUE_STRUCT = struct.Struct(">HII")
+
+    @classmethod
+    def DecodeBuffer(cls, buffer, offset=0, stride=None, utc_offset=0):
+        """Decodes PTP timestamps stored at a fixed stride in a buffer in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): buffer, such as
+              concatenated PTP messages.
+          offset (Optional[int]): offset of the first 10-byte PTP timestamp
+              relative to the start of the buffer, such as 34 for the origin
+              timestamp of the first PTP message.
+          stride (Optional[int]): number of bytes between the start of
+              consecutive PTP timestamps, such as 44 for PTP Sync messages, or
+              None if the PTP timestamps are consecutive.
+          utc_offset (Optional[int]): number of seconds that the PTP timescale
+              is ahead of UTC, such as the current UTC offset of PTP Announce
+              messages, to subtract from the PTP timestamps.
+
+        Returns:
+          tuple[array.array, bytearray]: number of nanoseconds since January 1,
+              1970 00:00:00 per PTP timestamp, where invalid timestamps are
+              represented by 0, and validity mask, where 1 represents a valid
+              and 0 an invalid PTP timestamp.
+
+        Raises:
+          ValueError: if the offset or stride is out of bounds.
+        """
+        maximum_timestamp = cls._INT64_MAX
+        nanoseconds_per_second = definitions.NANOSECONDS_PER_SECOND
+        utc_offset *= nanoseconds_per_second
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for upper_16bit, lower_32bit, nanoseconds in cls._UnpackBufferAtStride(
+            buffer, cls._VALUE_STRUCT, offset, stride
+        ):
+            timestamp = (
+                (((upper_16bit << 32) | lower_32bit) * nanoseconds_per_second)
+                + nanoseconds
+                - utc_offset
+            )
+            if nanoseconds >= nanoseconds_per_second or timestamp > maximum_timestamp:
+                timestamps.append(0)
+                validity_mask.append(0)
+            else:
+                timestamps.append(timestamp)
+                validity_mask.append(1)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, offset=0, precision=None, stride=None):
+        """Creates PTP timestamps stored at a fixed stride in a buffer.
+
+        Args:
+          buffer (bytes|bytearray|memoryview|mmap.mmap): buffer, such as
+              concatenated PTP messages.
+          offset (Optional[int]): offset of the first 10-byte PTP timestamp
+              relative to the start of the buffer.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+          stride (Optional[int]): number of bytes between the start of
+              consecutive PTP timestamps or None if the PTP timestamps are
+              consecutive.
+
+        Returns:
+          list[PTPTime]: PTP timestamps, where invalid timestamps are represented
+              by None.
+
+        Raises:
+          ValueError: if the offset or stride is out of bounds.
+        """
+        nanoseconds_per_second = definitions.NANOSECONDS_PER_SECOND
+
+        ptp_times = []
+        for upper_16bit, lower_32bit, nanoseconds in cls._UnpackBufferAtStride(
+            buffer, cls._VALUE_STRUCT, offset, stride
+        ):
+            ptp_time = None
+            if nanoseconds < nanoseconds_per_second:
+                timestamp = (
+                    ((upper_16bit << 32) | lower_32bit) * nanoseconds_per_second
+                ) + nanoseconds
+                ptp_time = cls(precision=precision, timestamp=timestamp)
+
+            ptp_times.append(ptp_time)
+
+        return ptp_times
+
+
+factory.Factory.RegisterDateTimeValues(PTPTime)
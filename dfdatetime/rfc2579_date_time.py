@@ -1,6 +1,8 @@
 """RFC2579 date-time implementation."""
 
+import array
 import decimal
+import struct
 
 from dfdatetime import definitions
 from dfdatetime import factory
@@ -41,6 +43,19 @@ class RFC2579DateTime(interface.DateTimeValues):
 
     # TODO: make attributes read-only.
 
+    # Direction from UTC characters, as byte values.
+    _DIRECTION_FROM_UTC_MINUS = 0x2D
+    _DIRECTION_FROM_UTC_PLUS = 0x2B
+
+    # RFC2579 date-time octet strings are stored in network byte order.
+    _OCTET_STRING_STRUCTS = {
+        8: struct.Struct(">H6B"),
+        11: struct.Struct(">H9B"),
+    }
+
+    # Time zone values of an octet string without time zone information.
+    _UTC_TIME_ZONE_VALUES = (_DIRECTION_FROM_UTC_PLUS, 0, 0)
+
     # pylint: disable=missing-type-doc
 
     def __init__(self, precision=None, rfc2579_date_time_tuple=None):
@@ -137,6 +152,104 @@ class RFC2579DateTime(interface.DateTimeValues):
                 self._seconds,
             )
 
+    @classmethod
+    def _DecodeRecords(cls, records):
+        """Decodes RFC2579 date-time records in bulk.
+
+        Args:
+          records (Iterable[tuple[int, int, int, int, int, int, int, int, int,
+              int]]): RFC2579 date-time records, which contain year, month, day of
+              month, hours, minutes, seconds, deciseconds, direction from UTC as
+              byte value, hours from UTC and minutes from UTC, where None
+              represents an invalid record.
+
+        Returns:
+          tuple[array.array, array.array, bytearray]: number of deciseconds since
+              January 1, 1970 00:00:00 UTC and time zone offset in minutes per
+              record, where invalid records are represented by 0, and validity
+              mask, where 1 represents a valid and 0 an invalid record.
+        """
+        days_before_month = definitions.DAYS_BEFORE_MONTH
+        days_per_month = definitions.DAYS_PER_MONTH
+        days_per_year = definitions.DAYS_PER_YEAR
+        days_per_year_in_posix_epoch = definitions.DAYS_PER_YEAR_IN_POSIX_EPOCH
+        direction_from_utc_minus = cls._DIRECTION_FROM_UTC_MINUS
+        direction_from_utc_plus = cls._DIRECTION_FROM_UTC_PLUS
+
+        timestamps = array.array("q")
+        time_zone_offsets = array.array("h")
+        validity_mask = bytearray()
+
+        for record in records:
+            if record is None:
+                timestamps.append(0)
+                time_zone_offsets.append(0)
+                validity_mask.append(0)
+                continue
+
+            (
+                year,
+                month,
+                day_of_month,
+                hours,
+                minutes,
+                seconds,
+                deciseconds,
+                direction_from_utc,
+                hours_from_utc,
+                minutes_from_utc,
+            ) = record
+
+            number_of_days = days_per_year_in_posix_epoch.get(year)
+            if (
+                number_of_days is None
+                or month < 1
+                or month > 12
+                or day_of_month < 1
+                or hours > 23
+                or minutes > 59
+                or seconds > 59
+                or deciseconds > 9
+                or hours_from_utc > 13
+                or minutes_from_utc > 59
+                or direction_from_utc
+                not in (direction_from_utc_minus, direction_from_utc_plus)
+            ):
+                timestamps.append(0)
+                time_zone_offsets.append(0)
+                validity_mask.append(0)
+                continue
+
+            number_of_days_in_month = days_per_month[month - 1]
+            number_of_days += days_before_month[month - 1] + day_of_month - 1
+            if days_per_year[year] == 366:
+                if month == 2:
+                    number_of_days_in_month += 1
+                elif month > 2:
+                    number_of_days += 1
+
+            if day_of_month > number_of_days_in_month:
+                timestamps.append(0)
+                time_zone_offsets.append(0)
+                validity_mask.append(0)
+                continue
+
+            time_zone_offset = hours_from_utc * 60 + minutes_from_utc
+            if direction_from_utc == direction_from_utc_minus:
+                time_zone_offset = -time_zone_offset
+
+            number_of_seconds = (
+                ((number_of_days * 24 + hours) * 60 + minutes - time_zone_offset) * 60
+            ) + seconds
+
+            timestamps.append(
+                number_of_seconds * definitions.DECISECONDS_PER_SECOND + deciseconds
+            )
+            time_zone_offsets.append(time_zone_offset)
+            validity_mask.append(1)
+
+        return timestamps, time_zone_offsets, validity_mask
+
     def _GetNormalizedTimestamp(self):
         """Retrieves the normalized timestamp.
 
@@ -159,6 +272,31 @@ class RFC2579DateTime(interface.DateTimeValues):
 
         return self._normalized_timestamp
 
+    @classmethod
+    def _GetRecordsFromOctetStrings(cls, octet_strings):
+        """Retrieves RFC2579 date-time records from octet strings.
+
+        Args:
+          octet_strings (Iterable[bytes]): RFC2579 date-time octet strings.
+
+        Yields:
+          tuple[int, int, int, int, int, int, int, int, int, int]: RFC2579
+              date-time record or None if the size of the octet string is not
+              supported.
+        """
+        octet_string_structs = cls._OCTET_STRING_STRUCTS
+        utc_time_zone_values = cls._UTC_TIME_ZONE_VALUES
+
+        for octet_string in octet_strings:
+            octet_string_size = len(octet_string)
+            octet_string_struct = octet_string_structs.get(octet_string_size)
+            if not octet_string_struct:
+                yield None
+            elif octet_string_size == 8:
+                yield octet_string_struct.unpack(octet_string) + utc_time_zone_values
+            else:
+                yield octet_string_struct.unpack(octet_string)
+
     @property
     def deciseconds(self):
         """int: number of deciseconds or None if not set."""
@@ -209,16 +347,16 @@ class RFC2579DateTime(interface.DateTimeValues):
         Raises:
           ValueError: if the date string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         deciseconds, _ = divmod(nanoseconds, definitions.NANOSECONDS_PER_DECISECOND)
 
@@ -285,5 +423,72 @@ class RFC2579DateTime(interface.DateTimeValues):
             ),
         }
 
+    @classmethod
+    def DecodeBuffer(cls, buffer, octet_string_size=11):
+        """Decodes concatenated RFC2579 date-time octet strings in bulk.
+
+        The octet strings are validated like the RFC2579 date-time tuple of a
+        RFC2579 date-time object, without creating an object per octet string,
+        for example to decode a DateAndTime column of a SNMP table. Octet strings
+        of 8 bytes have no time zone information and are considered to be in
+        UTC.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated RFC2579 date-time
+              octet strings of the same size.
+          octet_string_size (Optional[int]): size of an octet string, either 8
+              or 11 bytes.
+
+        Returns:
+          tuple[array.array, array.array, bytearray]: number of deciseconds since
+              January 1, 1970 00:00:00 UTC and time zone offset in minutes per
+              octet string, where invalid octet strings are represented by 0, and
+              validity mask, where 1 represents a valid and 0 an invalid octet
+              string.
+
+        Raises:
+          ValueError: if the octet string size is not supported or the size of
+              the buffer is not a multiple of the octet string size.
+        """
+        octet_string_struct = cls._OCTET_STRING_STRUCTS.get(octet_string_size)
+        if not octet_string_struct:
+            raise ValueError(f"Unsupported octet string size: {octet_string_size!s}.")
+
+        buffer_size = len(memoryview(buffer).cast("B"))
+        if buffer_size % octet_string_size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{octet_string_size:d}."
+            )
+
+        records = octet_string_struct.iter_unpack(buffer)
+        if octet_string_size == 8:
+            utc_time_zone_values = cls._UTC_TIME_ZONE_VALUES
+            records = (record + utc_time_zone_values for record in records)
+
+        return cls._DecodeRecords(records)
+
+    @classmethod
+    def DecodeOctetStrings(cls, octet_strings):
+        """Decodes RFC2579 date-time octet strings in bulk.
+
+        The octet strings can be of different sizes, such as the values of a SNMP
+        walk. Octet strings of 8 bytes have no time zone information and are
+        considered to be in UTC. Octet strings of other sizes than 8 or 11 bytes
+        are invalid.
+
+        Args:
+          octet_strings (Iterable[bytes]): RFC2579 date-time octet strings.
+
+        Returns:
+          tuple[array.array, array.array, bytearray]: number of deciseconds since
+              January 1, 1970 00:00:00 UTC and time zone offset in minutes per
+              octet string, where invalid octet strings are represented by 0, and
+              validity mask, where 1 represents a valid and 0 an invalid octet
+              string.
+        """
+        records = cls._GetRecordsFromOctetStrings(octet_strings)
+        return cls._DecodeRecords(records)
+
 
 factory.Factory.RegisterDateTimeValues(RFC2579DateTime)
@@ -202,6 +202,19 @@ class SemanticTime(interface.DateTimeValues):
         """
         return 0
 
+    def TryCopyFromDateTimeString(self, time_string):
+        """Tries to copy semantic time from a date and time string.
+
+        Args:
+          time_string (str): semantic representation of the time, such as:
+              "Never", "Not set".
+
+        Returns:
+          bool: True since semantic time can be copied from any string.
+        """
+        self._string = time_string
+        return True
+
 
 class InvalidTime(SemanticTime):
     """Semantic time that represents invalid."""
@@ -0,0 +1,247 @@
+"""Snowflake identifier timestamp implementation."""
+
+import array
+import sys
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import interface
+from dfdatetime import linear_time
+
+
+class SnowflakeTimeEpoch(interface.DateTimeEpoch):
+    """Twitter Snowflake time epoch."""
+
+    def __init__(self):
+        """Initializes a Twitter Snowflake time epoch."""
+        super().__init__(2010, 11, 4)
+
+
+class DiscordSnowflakeTimeEpoch(interface.DateTimeEpoch):
+    """Discord Snowflake time epoch."""
+
+    def __init__(self):
+        """Initializes a Discord Snowflake time epoch."""
+        super().__init__(2015, 1, 1)
+
+
+class SnowflakeTime(linear_time.LinearTime):
+    """Twitter Snowflake timestamp.
+
+    The Snowflake identifier is a positive signed 64-bit integer of which the
+    upper 41 bits, after the sign bit, contain the number of milliseconds since
+    the Snowflake epoch. The timestamp is the number of milliseconds since
+    the Twitter Snowflake epoch of 2010-11-04 01:42:54.657.
+
+    Snowflake identifiers with another epoch are supported by subclasses that
+    define _EPOCH and _SNOWFLAKE_EPOCH.
+
+    Also see:
+      https://en.wikipedia.org/wiki/Snowflake_ID
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_MILLISECOND
+
+    _EPOCH = SnowflakeTimeEpoch()
+
+    _MAXIMUM_TIMESTAMP = (1 << 41) - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    # The number of milliseconds between January 1, 1970 and the epoch.
+    _SNOWFLAKE_EPOCH = 1288834974657
+
+    _UNITS_PER_SECOND = definitions.MILLISECONDS_PER_SECOND
+
+    def _GetPosixBaseInUnits(self):
+        """Retrieves the number of units between the epoch and the POSIX epoch.
+
+        Returns:
+          int: number of units between the epoch and January 1, 1970 00:00:00.
+        """
+        return -self._SNOWFLAKE_EPOCH
+
+    @classmethod
+    def _GetTimestampsFromIdentifiers(cls, identifiers):
+        """Retrieves the timestamps from Snowflake identifiers.
+
+        Args:
+          identifiers (Iterable[int]): Snowflake identifiers.
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per Snowflake identifier, where invalid identifiers
+              are represented by 0, and validity mask, where 1 represents a valid
+              and 0 an invalid Snowflake identifier.
+        """
+        maximum_timestamp = cls._MAXIMUM_TIMESTAMP
+        snowflake_epoch = cls._SNOWFLAKE_EPOCH
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for identifier in identifiers:
+            timestamp = identifier >> 22
+            if identifier < 0 or timestamp > maximum_timestamp:
+                timestamps.append(0)
+                validity_mask.append(0)
+            else:
+                timestamps.append(timestamp + snowflake_epoch)
+                validity_mask.append(1)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def DecodeBuffer(cls, buffer, byte_order="big"):
+        """Decodes the timestamps of concatenated Snowflake identifiers in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 64-bit Snowflake
+              identifiers.
+          byte_order (Optional[str]): byte order of the Snowflake identifiers,
+              either "big" or "little".
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per Snowflake identifier, where invalid identifiers
+              are represented by 0, and validity mask, where 1 represents a valid
+              and 0 an invalid Snowflake identifier.
+
+        Raises:
+          ValueError: if the byte order is not supported or the size of the
+              buffer is not a multiple of 8.
+        """
+        if byte_order not in ("big", "little"):
+            raise ValueError(f"Unsupported byte order: {byte_order!s}.")
+
+        identifiers = array.array("Q")
+        buffer_size = len(memoryview(buffer).cast("B"))
+        if buffer_size % identifiers.itemsize:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{identifiers.itemsize:d}."
+            )
+
+        identifiers.frombytes(buffer)
+        if byte_order != sys.byteorder:
+            identifiers.byteswap()
+
+        return cls._GetTimestampsFromIdentifiers(identifiers)
+
+    @classmethod
+    def DecodeStrings(cls, identifier_strings):
+        """Decodes the timestamps of Snowflake identifier strings in bulk.
+
+        Args:
+          identifier_strings (Sequence[str]): Snowflake identifiers formatted as
+              decimal integers.
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per Snowflake identifier string, where invalid
+              identifier strings are represented by 0, and validity mask, where
+              1 represents a valid and 0 an invalid Snowflake identifier string.
+        """
+        # Note that isascii() and isdigit() are checked since int() also
+        # accepts non-ASCII digits, signs, underscores and whitespace.
+        joined_string = "".join(identifier_strings)
+        if joined_string.isascii() and joined_string.isdigit():
+            try:
+                identifiers = list(map(int, identifier_strings))
+            except ValueError:
+                identifiers = None
+
+            if identifiers is not None:
+                return cls._GetTimestampsFromIdentifiers(identifiers)
+
+        identifiers = []
+        for identifier_string in identifier_strings:
+            if identifier_string.isascii() and identifier_string.isdigit():
+                identifiers.append(int(identifier_string))
+            else:
+                identifiers.append(-1)
+
+        return cls._GetTimestampsFromIdentifiers(identifiers)
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, byte_order="big", precision=None):
+        """Creates Snowflake timestamps from concatenated Snowflake identifiers.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 64-bit Snowflake
+              identifiers.
+          byte_order (Optional[str]): byte order of the Snowflake identifiers,
+              either "big" or "little".
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[SnowflakeTime]: Snowflake timestamps, where invalid Snowflake
+              identifiers are represented by None.
+
+        Raises:
+          ValueError: if the byte order is not supported or the size of the
+              buffer is not a multiple of 8.
+        """
+        snowflake_epoch = cls._SNOWFLAKE_EPOCH
+
+        timestamps, validity_mask = cls.DecodeBuffer(buffer, byte_order=byte_order)
+        return [
+            (
+                cls(precision=precision, timestamp=timestamp - snowflake_epoch)
+                if is_valid
+                else None
+            )
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+    @classmethod
+    def NewFromStrings(cls, identifier_strings, precision=None):
+        """Creates Snowflake timestamps from Snowflake identifier strings.
+
+        Args:
+          identifier_strings (Sequence[str]): Snowflake identifiers formatted as
+              decimal integers.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[SnowflakeTime]: Snowflake timestamps, where invalid Snowflake
+              identifier strings are represented by None.
+        """
+        snowflake_epoch = cls._SNOWFLAKE_EPOCH
+
+        timestamps, validity_mask = cls.DecodeStrings(identifier_strings)
+        return [
+            (
+                cls(precision=precision, timestamp=timestamp - snowflake_epoch)
+                if is_valid
+                else None
+            )
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+
+class DiscordSnowflakeTime(SnowflakeTime):
+    """Discord Snowflake timestamp.
+
+    The timestamp is the number of milliseconds since the Discord Snowflake
+    epoch of 2015-01-01 00:00:00.
+
+    Also see:
+      https://discord.com/developers/docs/reference#snowflakes
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _EPOCH = DiscordSnowflakeTimeEpoch()
+
+    # The number of milliseconds between January 1, 1970 and the epoch.
+    _SNOWFLAKE_EPOCH = 1420070400000
+
+
+factory.Factory.RegisterDateTimeValues(SnowflakeTime)
+factory.Factory.RegisterDateTimeValues(DiscordSnowflakeTime)
@@ -0,0 +1,489 @@
+"""Formatters of date and time values in strftime-style formats."""
+
+
+class StrftimeFormatter:
+    """Formatter of date and time values in a strftime-style format.
+
+    The format string is compiled once into a format template and a list of
+    field converters, which makes repeated formatting considerably faster than
+    reformatting the output of CopyToDateTimeString.
+
+    The date and time values are formatted as represented by CopyToDateTimeString,
+    hence not adjusted to UTC, with the fraction of second in the precision of
+    the date and time values type.
+
+    Supported directives:
+    * %Y: year, 4 digits
+    * %y: year without century, 2 digits
+    * %m: month, 2 digits
+    * %b and %h: abbreviated month name, such as "Jan"
+    * %B: full month name, such as "January"
+    * %d: day of month, 2 digits
+    * %j: day of year, 3 digits
+    * %a: abbreviated weekday name, such as "Mon"
+    * %A: full weekday name, such as "Monday"
+    * %u: weekday, where 1 represents Monday and 7 Sunday
+    * %H: hours in 24-hour clock, 2 digits
+    * %I: hours in 12-hour clock, 2 digits
+    * %p: AM or PM
+    * %M: minutes, 2 digits
+    * %S: seconds, 2 digits
+    * %f: fraction of second in the precision of the date and time values, such
+          as 7 digits for FILETIME, or an empty string if the precision is
+          seconds or less
+    * %3f, %6f, %7f and %9f: fraction of second of exactly 3, 6, 7 or 9 digits,
+          which is truncated or padded with zeros
+    * %s: number of seconds since 1970-01-01 00:00:00 UTC
+    * %z: time zone offset formatted as: [+-]hhmm, or an empty string if the
+          date and time values are in local time without a time zone offset
+    * %:z: time zone offset formatted as: [+-]hh:mm
+    * %F: equivalent of %Y-%m-%d
+    * %T: equivalent of %H:%M:%S
+    * %%: a literal "%"
+
+    Attributes:
+      format_string (str): strftime-style format string.
+    """
+
+    # Indexes of the fields.
+    _INDEX_YEAR = 0
+    _INDEX_MONTH = 1
+    _INDEX_DAY_OF_MONTH = 2
+    _INDEX_HOURS = 3
+    _INDEX_MINUTES = 4
+    _INDEX_SECONDS = 5
+    _INDEX_FRACTION_OF_SECOND = 6
+
+    _MONTH_NAMES = [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ]
+
+    _WEEKDAY_NAMES = [
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    ]
+
+    # Fields that are a substring of the date and time string.
+    _FIELD_DIRECTIVES = {
+        "d": _INDEX_DAY_OF_MONTH,
+        "f": _INDEX_FRACTION_OF_SECOND,
+        "H": _INDEX_HOURS,
+        "m": _INDEX_MONTH,
+        "M": _INDEX_MINUTES,
+        "S": _INDEX_SECONDS,
+        "Y": _INDEX_YEAR,
+    }
+
+    # Directives that are equivalent to a sequence of directives.
+    _COMPOUND_DIRECTIVES = {
+        "F": "%Y-%m-%d",
+        "T": "%H:%M:%S",
+    }
+
+    def __init__(self, format_string):
+        """Initializes a formatter.
+
+        Args:
+          format_string (str): strftime-style format string.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        super().__init__()
+        self._converters = []
+
+        self.format_string = format_string
+
+        self._template = self._CompileFormatString(format_string)
+
+    def _AddConverter(self, converter):
+        """Adds a field converter.
+
+        Args:
+          converter (function): function that determines the formatted value of
+              a field from the date and time string fields and the date and time
+              values.
+
+        Returns:
+          str: format template placeholder of the field.
+        """
+        index = self._INDEX_FRACTION_OF_SECOND + 1 + len(self._converters)
+        self._converters.append(converter)
+        return f"{{{index:d}}}"
+
+    def _CompileDirective(self, directive, number_of_digits):
+        """Compiles a directive.
+
+        Args:
+          directive (str): directive character, such as "Y".
+          number_of_digits (int): number of digits defined by the directive, such
+              as 3 for "%3f", or None if not defined.
+
+        Returns:
+          str: format template of the directive.
+
+        Raises:
+          ValueError: if the directive is not supported.
+        """
+        if number_of_digits is not None:
+            if directive != "f" or number_of_digits not in (3, 6, 7, 9):
+                raise ValueError(
+                    f"Unsupported format directive: %{number_of_digits:d}"
+                    f"{directive:s}."
+                )
+
+            return self._AddConverter(
+                lambda fields, _: fields[self._INDEX_FRACTION_OF_SECOND].ljust(
+                    number_of_digits, "0"
+                )[:number_of_digits]
+            )
+
+        if directive == "%":
+            return "%"
+
+        compound_format_string = self._COMPOUND_DIRECTIVES.get(directive)
+        if compound_format_string:
+            return self._CompileFormatString(compound_format_string)
+
+        field_index = self._FIELD_DIRECTIVES.get(directive)
+        if field_index is not None:
+            return f"{{{field_index:d}}}"
+
+        if directive == "y":
+            return self._AddConverter(lambda fields, _: fields[self._INDEX_YEAR][-2:])
+
+        if directive in ("b", "B", "h"):
+            month_names = self._MONTH_NAMES
+            if directive != "B":
+                month_names = [name[:3] for name in month_names]
+
+            return self._AddConverter(
+                lambda fields, _: month_names[int(fields[self._INDEX_MONTH], 10) - 1]
+            )
+
+        if directive in ("a", "A"):
+            weekday_names = self._WEEKDAY_NAMES
+            if directive == "a":
+                weekday_names = [name[:3] for name in weekday_names]
+
+            return self._AddConverter(
+                lambda fields, _: weekday_names[self._GetDayOfWeek(fields)]
+            )
+
+        if directive == "u":
+            return self._AddConverter(
+                lambda fields, _: f"{self._GetDayOfWeek(fields) + 1:d}"
+            )
+
+        if directive == "j":
+            return self._AddConverter(self._GetDayOfYearString)
+
+        if directive == "I":
+            return self._AddConverter(self._GetHoursIn12HourClockString)
+
+        if directive == "p":
+            return self._AddConverter(
+                lambda fields, _: "AM" if fields[self._INDEX_HOURS] < "12" else "PM"
+            )
+
+        if directive == "s":
+            return self._AddConverter(
+                lambda _, date_time_values: (
+                    f"{date_time_values.CopyToPosixTimestamp():d}"
+                )
+            )
+
+        if directive == "z":
+            return self._AddConverter(
+                lambda _, date_time_values: self._GetTimeZoneOffsetString(
+                    date_time_values, ""
+                )
+            )
+
+        raise ValueError(f"Unsupported format directive: %{directive:s}.")
+
+    def _CompileFormatString(self, format_string):
+        """Compiles a format string.
+
+        Args:
+          format_string (str): strftime-style format string.
+
+        Returns:
+          str: format template of the format string.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        template_parts = []
+
+        format_string_index = 0
+        format_string_length = len(format_string)
+        while format_string_index < format_string_length:
+            character = format_string[format_string_index]
+            format_string_index += 1
+
+            if character != "%":
+                if character in ("{", "}"):
+                    character = character * 2
+                template_parts.append(character)
+                continue
+
+            if format_string.startswith(":z", format_string_index):
+                format_string_index += 2
+                template_parts.append(
+                    self._AddConverter(
+                        lambda _, date_time_values: self._GetTimeZoneOffsetString(
+                            date_time_values, ":"
+                        )
+                    )
+                )
+                continue
+
+            number_of_digits = None
+            if (
+                format_string_index < format_string_length
+                and format_string[format_string_index].isdigit()
+            ):
+                number_of_digits = int(format_string[format_string_index], 10)
+                format_string_index += 1
+
+            if format_string_index >= format_string_length:
+                raise ValueError("Unsupported format string - incomplete directive.")
+
+            directive = format_string[format_string_index]
+            format_string_index += 1
+
+            template_parts.append(self._CompileDirective(directive, number_of_digits))
+
+        return "".join(template_parts)
+
+    def _GetDayOfWeek(self, fields):
+        """Determines the day of week.
+
+        Args:
+          fields (list[str]): date and time string fields.
+
+        Returns:
+          int: day of week, where 0 represents Monday and 6 Sunday.
+        """
+        year = int(fields[self._INDEX_YEAR], 10)
+        month = int(fields[self._INDEX_MONTH], 10)
+        day_of_month = int(fields[self._INDEX_DAY_OF_MONTH], 10)
+
+        # Shift the start of the year to March so that the leap day is the last
+        # day of the year.
+        if month < 3:
+            year -= 1
+            month += 12
+
+        number_of_days = (
+            year * 365
+            + year // 4
+            - year // 100
+            + year // 400
+            + (153 * (month - 3) + 2) // 5
+            + day_of_month
+        )
+        # 0000-03-01 in the proleptic Gregorian calendar is a Wednesday.
+        return (number_of_days + 1) % 7
+
+    def _GetDayOfYearString(self, fields, date_time_values):
+        """Retrieves the day of year string.
+
+        Args:
+          fields (list[str]): date and time string fields.
+          date_time_values (DateTimeValues): date and time values.
+
+        Returns:
+          str: day of year, 3 digits.
+        """
+        # pylint: disable=protected-access
+        day_of_year = date_time_values._GetDayOfYear(
+            int(fields[self._INDEX_YEAR], 10),
+            int(fields[self._INDEX_MONTH], 10),
+            int(fields[self._INDEX_DAY_OF_MONTH], 10),
+        )
+        return f"{day_of_year:03d}"
+
+    def _GetFields(self, date_time_string):
+        """Retrieves the fields of a date and time string.
+
+        Args:
+          date_time_string (str): date and time string formatted as:
+              "YYYY-MM-DD hh:mm:ss" with an optional fraction of second.
+
+        Returns:
+          list[str]: year, month, day of month, hours, minutes, seconds and
+              fraction of second fields or None if the date and time string is
+              not supported, such as the string of semantic time.
+        """
+        if (
+            len(date_time_string) >= 19
+            and date_time_string[4] == "-"
+            and date_time_string[10] == " "
+        ):
+            return [
+                date_time_string[0:4],
+                date_time_string[5:7],
+                date_time_string[8:10],
+                date_time_string[11:13],
+                date_time_string[14:16],
+                date_time_string[17:19],
+                date_time_string[20:],
+            ]
+
+        # Years before 0 or after 9999.
+        date_string, _, time_string = date_time_string.partition(" ")
+        date_fields = date_string[1:].split("-")
+        time_fields = time_string.replace(".", ":").split(":")
+        if len(date_fields) != 3 or len(time_fields) not in (3, 4):
+            return None
+
+        date_fields[0] = "".join([date_string[0], date_fields[0]])
+        if len(time_fields) == 3:
+            time_fields.append("")
+
+        return date_fields + time_fields
+
+    def _GetHoursIn12HourClockString(self, fields, date_time_values):
+        """Retrieves the hours in 12-hour clock string.
+
+        Args:
+          fields (list[str]): date and time string fields.
+          date_time_values (DateTimeValues): date and time values.
+
+        Returns:
+          str: hours in 12-hour clock, 2 digits.
+        """
+        # pylint: disable=unused-argument
+        hours = int(fields[self._INDEX_HOURS], 10) % 12
+        return f"{hours or 12:02d}"
+
+    def _GetTimeZoneOffsetString(self, date_time_values, separator):
+        """Retrieves the time zone offset string.
+
+        Args:
+          date_time_values (DateTimeValues): date and time values.
+          separator (str): separator between the hours and minutes.
+
+        Returns:
+          str: time zone offset formatted as: [+-]hh[separator]mm, or an empty
+              string if the date and time values are in local time without a time
+              zone offset.
+        """
+        time_zone_offset = date_time_values.time_zone_offset
+        if time_zone_offset is None:
+            if date_time_values.is_local_time:
+                return ""
+
+            time_zone_offset = 0
+
+        time_zone_offset_sign = "+"
+        if time_zone_offset < 0:
+            time_zone_offset_sign = "-"
+            time_zone_offset *= -1
+
+        hours, minutes = divmod(time_zone_offset, 60)
+        return f"{time_zone_offset_sign:s}{hours:02d}{separator:s}{minutes:02d}"
+
+    def Format(self, date_time_values):
+        """Formats date and time values.
+
+        Args:
+          date_time_values (DateTimeValues): date and time values.
+
+        Returns:
+          str: formatted date and time values or None if the date and time values
+              cannot be represented as a date and time, such as semantic time.
+        """
+        date_time_string = date_time_values.CopyToDateTimeString()
+        if not date_time_string:
+            return None
+
+        fields = self._GetFields(date_time_string)
+        if not fields:
+            return None
+
+        for converter in self._converters:
+            fields.append(converter(fields, date_time_values))
+
+        return self._template.format(*fields)
+
+    def FormatValues(self, date_time_values_list):
+        """Formats a sequence of date and time values.
+
+        Args:
+          date_time_values_list (Iterable[DateTimeValues]): date and time values.
+
+        Returns:
+          list[str]: formatted date and time values, where None represents date
+              and time values that cannot be represented as a date and time.
+        """
+        converters = self._converters
+        get_fields = self._GetFields
+        template = self._template
+
+        formatted_values = []
+        for date_time_values in date_time_values_list:
+            date_time_string = date_time_values.CopyToDateTimeString()
+            fields = get_fields(date_time_string) if date_time_string else None
+            if not fields:
+                formatted_values.append(None)
+                continue
+
+            for converter in converters:
+                fields.append(converter(fields, date_time_values))
+
+            formatted_values.append(template.format(*fields))
+
+        return formatted_values
+
+
+class StrftimeFormatterFactory:
+    """Factory of formatters of date and time values in strftime-style formats."""
+
+    _MAXIMUM_NUMBER_OF_CACHED_FORMATTERS = 256
+
+    _formatters = {}
+
+    @classmethod
+    def GetFormatter(cls, format_string):
+        """Retrieves a formatter for a specific format string.
+
+        Compiled formatters are cached per format string.
+
+        Args:
+          format_string (str): strftime-style format string.
+
+        Returns:
+          StrftimeFormatter: formatter.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        formatter = cls._formatters.get(format_string)
+        if formatter is None:
+            formatter = StrftimeFormatter(format_string)
+
+            if len(cls._formatters) >= cls._MAXIMUM_NUMBER_OF_CACHED_FORMATTERS:
+                cls._formatters.clear()
+
+            cls._formatters[format_string] = formatter
+
+        return formatter
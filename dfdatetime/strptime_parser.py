@@ -0,0 +1,561 @@
+"""Parsers of date and time strings in strptime-style formats."""
+
+import re
+
+from dfdatetime import definitions
+from dfdatetime import time_elements
+
+
+class StrptimeParser:
+    """Parser of date and time strings in a strptime-style format.
+
+    The format string is compiled once into a regular expression and a list of
+    field converters, which makes repeated parsing considerably faster than
+    datetime.strptime.
+
+    Supported directives:
+    * %Y: 4-digit year
+    * %y: 2-digit year, where 69 to 99 represent 1969 to 1999 and 00 to 68
+          represent 2000 to 2068
+    * %m: month, 1 or 2 digits
+    * %b and %h: abbreviated month name, such as "Jan"
+    * %B: full month name, such as "January"
+    * %d: day of month, 1 or 2 digits
+    * %a: abbreviated weekday name, which is ignored
+    * %A: full weekday name, which is ignored
+    * %H: hours in 24-hour clock, 1 or 2 digits
+    * %I: hours in 12-hour clock, 1 or 2 digits
+    * %p: AM or PM
+    * %M: minutes, 1 or 2 digits
+    * %S: seconds, 1 or 2 digits
+    * %f: fraction of second of 1 to 6 digits, in microseconds precision
+    * %3f, %6f and %9f: fraction of second of exactly 3, 6 or 9 digits, in
+          milliseconds, microseconds and nanoseconds precision
+    * %z: time zone offset formatted as: Z, [+-]hhmm or [+-]hh:mm
+    * %Z: time zone name, either UTC, GMT or Z
+    * %T: equivalent of %H:%M:%S
+    * %%: a literal "%"
+
+    Names are matched case insensitive and whitespace in the format string
+    matches one or more whitespace characters. Date and time values that are
+    not defined by the format default to January 1, 1900 00:00:00, like
+    datetime.strptime.
+
+    Attributes:
+      format_string (str): strptime-style format string.
+      precision (str): precision of the parsed date and time values, which is
+          determined by the fraction of second directive.
+    """
+
+    # Indexes of the values of the fields.
+    _INDEX_YEAR = 0
+    _INDEX_MONTH = 1
+    _INDEX_DAY_OF_MONTH = 2
+    _INDEX_HOURS = 3
+    _INDEX_MINUTES = 4
+    _INDEX_SECONDS = 5
+    _INDEX_FRACTION_OF_SECOND = 6
+    _INDEX_TIME_ZONE_OFFSET = 7
+    _INDEX_AM_PM = 8
+
+    _MONTH_NAMES = [
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    ]
+
+    _MONTHS_PER_NAME = {}
+    for _month, _name in enumerate(_MONTH_NAMES, start=1):
+        _MONTHS_PER_NAME[_name] = _month
+        _MONTHS_PER_NAME[_name[:3]] = _month
+
+    del _month, _name
+
+    _WEEKDAY_NAMES = [
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+    ]
+
+    # Time elements types per number of fraction of second digits, where None
+    # represents a variable number of digits in microseconds precision.
+    _TIME_ELEMENTS_TYPES = {
+        3: (time_elements.TimeElementsInMilliseconds, 1000),
+        6: (time_elements.TimeElementsInMicroseconds, 1000000),
+        9: (time_elements.TimeElementsInNanoseconds, 1000000000),
+        None: (time_elements.TimeElementsInMicroseconds, 1000000),
+    }
+
+    def __init__(self, format_string):
+        """Initializes a parser.
+
+        Args:
+          format_string (str): strptime-style format string.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        super().__init__()
+        self._fields = []
+        self._number_of_time_elements = 6
+        self._time_elements_type = time_elements.TimeElements
+
+        self.format_string = format_string
+        self.precision = definitions.PRECISION_1_SECOND
+
+        expression = self._CompileFormatString(format_string)
+        self._expression = re.compile(expression)
+
+    @property
+    def expression(self):
+        """str: regular expression of the format string."""
+        return self._expression.pattern
+
+    def _CompileDirective(self, directive, number_of_digits):
+        """Compiles a directive.
+
+        Args:
+          directive (str): directive character, such as "Y".
+          number_of_digits (int): number of digits defined by the directive, such
+              as 3 for "%3f", or None if not defined.
+
+        Returns:
+          str: regular expression of the directive.
+
+        Raises:
+          ValueError: if the directive is not supported.
+        """
+        if number_of_digits is not None and directive != "f":
+            raise ValueError(
+                f"Unsupported format directive: %{number_of_digits:d}{directive:s}."
+            )
+
+        if directive == "%":
+            return "%"
+
+        if directive == "T":
+            return "".join(
+                [
+                    self._CompileDirective("H", None),
+                    ":",
+                    self._CompileDirective("M", None),
+                    ":",
+                    self._CompileDirective("S", None),
+                ]
+            )
+
+        if directive in ("a", "A"):
+            weekday_names = self._WEEKDAY_NAMES
+            if directive == "a":
+                weekday_names = [name[:3] for name in weekday_names]
+            return f"(?i:{'|'.join(weekday_names):s})"
+
+        if directive in ("b", "B", "h"):
+            month_names = self._MONTH_NAMES
+            if directive != "B":
+                month_names = [name[:3] for name in month_names]
+
+            self._fields.append((self._INDEX_MONTH, self._GetMonthFromName))
+            return f"(?i:({'|'.join(month_names):s}))"
+
+        if directive == "f":
+            if self._number_of_time_elements == 7:
+                raise ValueError("Unsupported multiple fraction of second directives.")
+
+            if number_of_digits not in self._TIME_ELEMENTS_TYPES:
+                raise ValueError(
+                    f"Unsupported format directive: %{number_of_digits:d}f."
+                )
+
+            self._time_elements_type, multiplier = self._TIME_ELEMENTS_TYPES[
+                number_of_digits
+            ]
+            self._number_of_time_elements = 7
+            self.precision = self._time_elements_type().precision
+
+            if number_of_digits is None:
+                self._fields.append(
+                    (
+                        self._INDEX_FRACTION_OF_SECOND,
+                        lambda string: int(string, 10) * 10 ** (6 - len(string)),
+                    )
+                )
+                return "([0-9]{1,6})"
+
+            self._fields.append((self._INDEX_FRACTION_OF_SECOND, int))
+            return f"([0-9]{{{number_of_digits:d}}})"
+
+        if directive == "p":
+            self._fields.append((self._INDEX_AM_PM, self._GetIsPostMeridiem))
+            return "(?i:(am|pm))"
+
+        if directive == "y":
+            self._fields.append((self._INDEX_YEAR, self._GetYearFromTwoDigitYear))
+            return "([0-9]{2})"
+
+        if directive == "Y":
+            self._fields.append((self._INDEX_YEAR, int))
+            return "([0-9]{4})"
+
+        if directive == "z":
+            self._fields.append(
+                (self._INDEX_TIME_ZONE_OFFSET, self._GetTimeZoneOffsetFromString)
+            )
+            return "(Z|[+-][0-9]{2}:?[0-9]{2})"
+
+        if directive == "Z":
+            self._fields.append((self._INDEX_TIME_ZONE_OFFSET, lambda string: 0))
+            return "(?i:(utc|gmt|z))"
+
+        field_index = {
+            "d": self._INDEX_DAY_OF_MONTH,
+            "H": self._INDEX_HOURS,
+            "I": self._INDEX_HOURS,
+            "m": self._INDEX_MONTH,
+            "M": self._INDEX_MINUTES,
+            "S": self._INDEX_SECONDS,
+        }.get(directive)
+
+        if field_index is None:
+            raise ValueError(f"Unsupported format directive: %{directive:s}.")
+
+        self._fields.append((field_index, int))
+        return "([0-9]{1,2})"
+
+    def _CompileFormatString(self, format_string):
+        """Compiles a format string.
+
+        Args:
+          format_string (str): strptime-style format string.
+
+        Returns:
+          str: regular expression of the format string.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        expression_parts = []
+
+        format_string_index = 0
+        format_string_length = len(format_string)
+        while format_string_index < format_string_length:
+            character = format_string[format_string_index]
+            format_string_index += 1
+
+            if character.isspace():
+                while (
+                    format_string_index < format_string_length
+                    and format_string[format_string_index].isspace()
+                ):
+                    format_string_index += 1
+
+                expression_parts.append(r"\s+")
+                continue
+
+            if character != "%":
+                expression_parts.append(re.escape(character))
+                continue
+
+            number_of_digits = None
+            if (
+                format_string_index < format_string_length
+                and format_string[format_string_index].isdigit()
+            ):
+                number_of_digits = int(format_string[format_string_index], 10)
+                format_string_index += 1
+
+            if format_string_index >= format_string_length:
+                raise ValueError("Unsupported format string - incomplete directive.")
+
+            directive = format_string[format_string_index]
+            format_string_index += 1
+
+            expression_parts.append(self._CompileDirective(directive, number_of_digits))
+
+        has_am_pm = any(index == self._INDEX_AM_PM for index, _ in self._fields)
+        if has_am_pm and "%I" not in format_string:
+            raise ValueError("Unsupported format string - %p requires %I.")
+
+        return "".join(expression_parts)
+
+    def _GetIsPostMeridiem(self, string):
+        """Determines if an AM or PM string represents post meridiem.
+
+        Args:
+          string (str): AM or PM string.
+
+        Returns:
+          bool: True if the string represents post meridiem (PM).
+        """
+        return string.lower() == "pm"
+
+    def _GetMonthFromName(self, string):
+        """Retrieves the month from a month name.
+
+        Args:
+          string (str): full or abbreviated month name.
+
+        Returns:
+          int: month, where 1 represents January.
+        """
+        return self._MONTHS_PER_NAME[string.lower()]
+
+    def _GetTimeElementsFromTuple(self, date_time_tuple):
+        """Retrieves time elements from a date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, fraction of second in
+              the precision of the parser and time zone offset in minutes.
+
+        Returns:
+          TimeElements: time elements, where the type corresponds to the precision
+              of the parser, such as TimeElementsInMilliseconds for "%3f".
+        """
+        return self._time_elements_type(
+            time_elements_tuple=date_time_tuple[: self._number_of_time_elements],
+            time_zone_offset=date_time_tuple[self._INDEX_TIME_ZONE_OFFSET],
+        )
+
+    def _GetTimeZoneOffsetFromString(self, string):
+        """Retrieves the time zone offset from a string.
+
+        Args:
+          string (str): time zone offset formatted as: Z, [+-]hhmm or [+-]hh:mm.
+
+        Returns:
+          int: time zone offset in minutes or None if the time zone offset is out
+              of bounds.
+        """
+        if string == "Z":
+            return 0
+
+        hours_from_utc = int(string[1:3], 10)
+        minutes_from_utc = int(string[-2:], 10)
+
+        if hours_from_utc > 14 or minutes_from_utc > 59:
+            return None
+
+        time_zone_offset = (hours_from_utc * 60) + minutes_from_utc
+        if string[0] == "-":
+            time_zone_offset = -time_zone_offset
+
+        return time_zone_offset
+
+    def _GetYearFromTwoDigitYear(self, string):
+        """Retrieves the year from a 2-digit year.
+
+        Args:
+          string (str): 2-digit year.
+
+        Returns:
+          int: year, where 69 to 99 represent 1969 to 1999 and 00 to 68 represent
+              2000 to 2068.
+        """
+        year = int(string, 10)
+        if year < 69:
+            return year + 2000
+
+        return year + 1900
+
+    def _ParseDateTimeTupleFromString(self, time_string):
+        """Parses a date and time tuple from a date and time string.
+
+        An invalid time string is signaled by the return value, hence rejecting
+        a string does not raise an exception.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          tuple[tuple[int, int, int, int, int, int, int, int], str]: year, month,
+              day of month, hours, minutes, seconds, fraction of second in the
+              precision of the parser and time zone offset in minutes, where the
+              time zone offset is None if not defined, and None, or None and the
+              reason the time string does not match the format or contains an
+              out of bounds value.
+        """
+        match = None
+        if time_string:
+            match = self._expression.fullmatch(time_string)
+
+        if not match:
+            return None, (
+                f"Time string: {time_string!s} does not match format: "
+                f"{self.format_string:s}."
+            )
+
+        values = [1900, 1, 1, 0, 0, 0, 0, None, None]
+        for (field_index, converter), string in zip(self._fields, match.groups()):
+            value = converter(string)
+            if value is None:
+                # Only a time zone offset can be out of bounds.
+                if int(string[1:3], 10) > 14:
+                    return None, "Time zone hours offset value out of bounds."
+
+                return None, "Time zone minutes offset value out of bounds."
+
+            values[field_index] = value
+
+        year, month, day_of_month, hours, minutes, seconds = values[:6]
+
+        is_post_meridiem = values[self._INDEX_AM_PM]
+        if is_post_meridiem is not None:
+            if hours < 1 or hours > 12:
+                return None, f"Hours value: {hours:d} out of bounds."
+
+            if hours == 12:
+                hours = 0
+            if is_post_meridiem:
+                hours += 12
+
+            values[self._INDEX_HOURS] = hours
+
+        if hours > 23:
+            return None, f"Hours value: {hours:d} out of bounds."
+
+        if minutes > 59:
+            return None, f"Minutes value: {minutes:d} out of bounds."
+
+        # TODO: support a leap second?
+        if seconds > 59:
+            return None, f"Seconds value: {seconds:d} out of bounds."
+
+        if month < 1 or month > 12:
+            return None, "Month value out of bounds."
+
+        days_per_month = definitions.DAYS_PER_MONTH[month - 1]
+        if month == 2 and definitions.DAYS_PER_YEAR[year] == 366:
+            days_per_month += 1
+
+        if day_of_month < 1 or day_of_month > days_per_month:
+            return None, f"Day of month value: {day_of_month:d} out of bounds."
+
+        return tuple(values[:8]), None
+
+    def ParseTuple(self, time_string):
+        """Parses a date and time string into a tuple.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, fraction of second in the precision of the
+              parser and time zone offset in minutes, where the time zone offset
+              is None if not defined.
+
+        Raises:
+          ValueError: if the time string does not match the format or contains
+              an out of bounds value.
+        """
+        date_time_tuple, error_message = self._ParseDateTimeTupleFromString(time_string)
+        if error_message:
+            raise ValueError(error_message)
+
+        return date_time_tuple
+
+    def Parse(self, time_string):
+        """Parses a date and time string.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          TimeElements: time elements, where the type corresponds to the precision
+              of the parser, such as TimeElementsInMilliseconds for "%3f".
+
+        Raises:
+          ValueError: if the time string does not match the format or contains
+              an out of bounds value.
+        """
+        date_time_tuple = self.ParseTuple(time_string)
+
+        return self._GetTimeElementsFromTuple(date_time_tuple)
+
+    def TryParse(self, time_string):
+        """Tries to parse a date and time string.
+
+        Unlike Parse a time string that does not match the format or contains an
+        out of bounds value is signaled by the return value instead of an
+        exception.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          TimeElements: time elements or None if the time string does not match
+              the format or contains an out of bounds value.
+        """
+        date_time_tuple, _ = self._ParseDateTimeTupleFromString(time_string)
+        if not date_time_tuple:
+            return None
+
+        return self._GetTimeElementsFromTuple(date_time_tuple)
+
+    def TryParseTuple(self, time_string):
+        """Tries to parse a date and time string into a tuple.
+
+        Unlike ParseTuple a time string that does not match the format or
+        contains an out of bounds value is signaled by the return value instead
+        of an exception.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, fraction of second in the precision of the
+              parser and time zone offset in minutes, where the time zone offset
+              is None if not defined, or None if the time string does not match
+              the format or contains an out of bounds value.
+        """
+        date_time_tuple, _ = self._ParseDateTimeTupleFromString(time_string)
+        return date_time_tuple
+
+
+class StrptimeParserFactory:
+    """Factory of parsers of date and time strings in strptime-style formats."""
+
+    _MAXIMUM_NUMBER_OF_CACHED_PARSERS = 256
+
+    _parsers = {}
+
+    @classmethod
+    def GetParser(cls, format_string):
+        """Retrieves a parser for a specific format string.
+
+        Compiled parsers are cached per format string.
+
+        Args:
+          format_string (str): strptime-style format string.
+
+        Returns:
+          StrptimeParser: parser.
+
+        Raises:
+          ValueError: if the format string is not supported.
+        """
+        parser = cls._parsers.get(format_string)
+        if parser is None:
+            parser = StrptimeParser(format_string)
+
+            if len(cls._parsers) >= cls._MAXIMUM_NUMBER_OF_CACHED_PARSERS:
+                cls._parsers.clear()
+
+            cls._parsers[format_string] = parser
+
+        return parser
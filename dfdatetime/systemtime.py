@@ -1,6 +1,8 @@
 """SYSTEMTIME structure implementation."""
 
+import array
 import decimal
+import struct
 
 from dfdatetime import definitions
 from dfdatetime import factory
@@ -24,6 +26,8 @@ class Systemtime(interface.DateTimeValues):
     }
     """
 
+    _RECORD_STRUCT = struct.Struct("<8H")
+
     def __init__(self, precision=None, system_time_tuple=None, time_zone_offset=None):
         """Initializes a SYSTEMTIME structure.
 
@@ -181,16 +185,16 @@ class Systemtime(interface.DateTimeValues):
         Raises:
           ValueError: if the date string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
-
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
 
         milliseconds, _ = divmod(nanoseconds, definitions.NANOSECONDS_PER_MILLISECOND)
 
@@ -249,5 +253,130 @@ class Systemtime(interface.DateTimeValues):
         )
         return serializable_dict
 
+    @classmethod
+    def DecodeBuffer(cls, buffer, check_day_of_week=False):
+        """Decodes concatenated SYSTEMTIME structures in bulk.
+
+        The structures are validated like the system time tuple of a SYSTEMTIME
+        structure object, without creating an object per structure, for example
+        to decode the SYSTEMTIME structures of Windows event logs, job files or
+        Registry values.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte little-endian
+              SYSTEMTIME structures.
+          check_day_of_week (Optional[bool]): True if the day of week must match
+              the date for a structure to be valid.
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per structure, where invalid structures are
+              represented by 0, and validity mask, where 1 represents a valid
+              and 0 an invalid structure.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        buffer_size = len(memoryview(buffer).cast("B"))
+        if buffer_size % cls._RECORD_STRUCT.size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{cls._RECORD_STRUCT.size:d}."
+            )
+
+        days_before_month = definitions.DAYS_BEFORE_MONTH
+        days_per_month = definitions.DAYS_PER_MONTH
+        days_per_year = definitions.DAYS_PER_YEAR
+        days_per_year_in_posix_epoch = definitions.DAYS_PER_YEAR_IN_POSIX_EPOCH
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for (
+            year,
+            month,
+            day_of_week,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            milliseconds,
+        ) in cls._RECORD_STRUCT.iter_unpack(buffer):
+            number_of_days = days_per_year_in_posix_epoch.get(year)
+            if (
+                number_of_days is None
+                or year < 1601
+                or month < 1
+                or month > 12
+                or day_of_week > 6
+                or day_of_month < 1
+                or hours > 23
+                or minutes > 59
+                or seconds > 59
+                or milliseconds > 999
+            ):
+                timestamps.append(0)
+                validity_mask.append(0)
+                continue
+
+            is_leap_year = days_per_year[year] == 366
+            number_of_days_in_month = days_per_month[month - 1]
+            number_of_days += days_before_month[month - 1] + day_of_month - 1
+            if is_leap_year:
+                if month == 2:
+                    number_of_days_in_month += 1
+                elif month > 2:
+                    number_of_days += 1
+
+            # January 1, 1970 was a Thursday and day of week 0 represents Sunday.
+            if day_of_month > number_of_days_in_month or (
+                check_day_of_week and (number_of_days + 4) % 7 != day_of_week
+            ):
+                timestamps.append(0)
+                validity_mask.append(0)
+                continue
+
+            number_of_seconds = (
+                (number_of_days * 24 + hours) * 60 + minutes
+            ) * 60 + seconds
+            timestamps.append(
+                number_of_seconds * definitions.MILLISECONDS_PER_SECOND + milliseconds
+            )
+            validity_mask.append(1)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, check_day_of_week=False, precision=None):
+        """Creates SYSTEMTIME structures from concatenated SYSTEMTIME structures.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte little-endian
+              SYSTEMTIME structures.
+          check_day_of_week (Optional[bool]): True if the day of week must match
+              the date for a structure to be valid.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[Systemtime]: SYSTEMTIME structures, where None represents an
+              invalid structure.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        _, validity_mask = cls.DecodeBuffer(buffer, check_day_of_week=check_day_of_week)
+
+        return [
+            (
+                cls(precision=precision, system_time_tuple=system_time_tuple)
+                if is_valid
+                else None
+            )
+            for system_time_tuple, is_valid in zip(
+                cls._RECORD_STRUCT.iter_unpack(buffer), validity_mask
+            )
+        ]
+
 
 factory.Factory.RegisterDateTimeValues(Systemtime)
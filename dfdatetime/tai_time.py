@@ -0,0 +1,250 @@
+"""TAI timestamp implementation."""
+
+import array
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import leap_seconds
+from dfdatetime import linear_time
+from dfdatetime import posix_time
+
+
+class TAITime(linear_time.LinearTime):
+    """TAI timestamp.
+
+    The TAI (International Atomic Time) timestamp is a signed 64-bit integer
+    that contains the number of nanoseconds since 1970-01-01 00:00:00 TAI, such
+    as the Linux CLOCK_TAI clock. TAI does not have leap seconds and is ahead
+    of UTC by the TAI - UTC offset, which is determined with a leap second
+    table.
+
+    A leap second is represented as second 60 in a date and time string and,
+    like in POSIX time, by the second that follows it in a normalized
+    timestamp.
+
+    TAI based timestamps with another epoch are supported by subclasses that
+    define _EPOCH, _POSIX_BASE and _TAI_BASE.
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_NANOSECOND
+
+    _EPOCH = posix_time.PosixTimeEpoch()
+
+    _LEAP_SECOND_TABLE = leap_seconds.LeapSecondTable()
+
+    _MAXIMUM_TIMESTAMP = (1 << 63) - 1
+    _MINIMUM_TIMESTAMP = -(1 << 63)
+
+    # The number of seconds between the epoch and January 1, 1970 00:00:00 UTC
+    # without leap seconds.
+    _POSIX_BASE = 0
+
+    # The number of seconds between January 1, 1970 00:00:00 TAI and the epoch.
+    _TAI_BASE = 0
+
+    _UNITS_PER_SECOND = definitions.NANOSECONDS_PER_SECOND
+
+    def __init__(
+        self,
+        leap_second_table=None,
+        precision=None,
+        time_zone_offset=None,
+        timestamp=None,
+    ):
+        """Initializes a TAI timestamp.
+
+        Args:
+          leap_second_table (Optional[LeapSecondTable]): leap second table, where
+              None represents the leap second table with the leap seconds up to
+              and including 2017-01-01.
+          precision (Optional[str]): precision of the date and time value, which
+              should be one of the PRECISION_VALUES in definitions.
+          time_zone_offset (Optional[int]): time zone offset in number of minutes
+              from UTC or None if not set.
+          timestamp (Optional[int]): timestamp.
+        """
+        super().__init__(
+            precision=precision,
+            time_zone_offset=time_zone_offset,
+            timestamp=timestamp,
+        )
+        self._leap_second_table = leap_second_table or self._LEAP_SECOND_TABLE
+
+    def _GetPosixBaseInUnits(self):
+        """Retrieves the number of units between the epoch and the POSIX epoch.
+
+        The number of units depends on the TAI - UTC offset at the time of
+        the timestamp.
+
+        Returns:
+          int: number of units between the epoch and January 1, 1970 00:00:00.
+        """
+        units_per_second = self._UNITS_PER_SECOND
+
+        tai_timestamp = (self._timestamp // units_per_second) + self._TAI_BASE
+        offset, _ = self._leap_second_table.GetOffsetFromTAITimestamp(tai_timestamp)
+
+        return (offset - self._TAI_BASE) * units_per_second
+
+    def CopyFromDateTimeString(self, time_string):
+        """Copies a timestamp from a date and time string.
+
+        The time zone offset is applied to the timestamp, since the TAI - UTC
+        offset is determined for UTC.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The seconds can be 60
+              for a leap second. The time of day, seconds fraction and time zone
+              offset are optional. The default time zone is UTC.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        # A leap second is not supported by the date and time string parser,
+        # hence it is parsed as second 59 and the second is added afterwards.
+        is_leap_second = time_string[16:19] == ":60"
+        if is_leap_second:
+            time_string = "".join([time_string[:17], "59", time_string[19:]])
+
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromString(time_string)
+
+        posix_timestamp = self._GetNumberOfSecondsFromElements(
+            year, month, day_of_month, hours, minutes, seconds
+        )
+        if time_zone_offset:
+            posix_timestamp -= time_zone_offset * 60
+
+        offset = self._leap_second_table.GetOffsetFromPOSIXTimestamp(posix_timestamp)
+        if is_leap_second:
+            posix_timestamp += 1
+
+            next_offset = self._leap_second_table.GetOffsetFromPOSIXTimestamp(
+                posix_timestamp
+            )
+            if next_offset <= offset:
+                raise ValueError("Seconds value: 60 out of bounds.")
+
+        units_per_second = self._UNITS_PER_SECOND
+
+        timestamp = (posix_timestamp + offset - self._TAI_BASE) * units_per_second
+        timestamp += nanoseconds // (
+            definitions.NANOSECONDS_PER_SECOND // units_per_second
+        )
+
+        if timestamp < self._MINIMUM_TIMESTAMP or timestamp > self._MAXIMUM_TIMESTAMP:
+            raise ValueError("Date time value not supported.")
+
+        self._normalized_timestamp = None
+        self._timestamp = timestamp
+        self._time_zone_offset = None
+
+    def CopyToDateTimeString(self):
+        """Copies the timestamp to a date and time string.
+
+        Returns:
+          str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#########",
+              where the seconds are 60 for a leap second, or None if the timestamp
+              is missing or invalid.
+        """
+        timestamp = self._GetSupportedTimestamp()
+        if timestamp is None:
+            return None
+
+        units_per_second = self._UNITS_PER_SECOND
+
+        number_of_seconds, fraction_of_second = divmod(timestamp, units_per_second)
+
+        tai_timestamp = number_of_seconds + self._TAI_BASE
+        offset, is_leap_second = self._leap_second_table.GetOffsetFromTAITimestamp(
+            tai_timestamp
+        )
+
+        # A leap second is represented as second 60 of the second that precedes
+        # it.
+        number_of_seconds = tai_timestamp - offset + self._POSIX_BASE
+        if is_leap_second:
+            number_of_seconds -= 1
+
+        number_of_days, hours, minutes, seconds = self._GetTimeValues(number_of_seconds)
+        if is_leap_second:
+            seconds += 1
+
+        date_string = self._GetDateStringWithEpoch(number_of_days, self._EPOCH)
+        number_of_digits = self._FRACTION_OF_SECOND_DIGITS[units_per_second]
+        return (
+            f"{date_string:s} {hours:02d}:{minutes:02d}:{seconds:02d}"
+            f".{fraction_of_second:0{number_of_digits:d}d}"
+        )
+
+    @classmethod
+    def DecodeTimestamps(cls, timestamps, leap_second_table=None):
+        """Converts timestamps to POSIX timestamps in bulk.
+
+        Timestamps in the same interval between leap seconds as the preceding
+        timestamp, such as sorted timestamps of a log, are converted without
+        looking up the TAI - UTC offset.
+
+        Args:
+          timestamps (Iterable[int]): timestamps, such as an array of 64-bit
+              integers.
+          leap_second_table (Optional[LeapSecondTable]): leap second table, where
+              None represents the leap second table with the leap seconds up to
+              and including 2017-01-01.
+
+        Returns:
+          tuple[array.array, bytearray]: number of nanoseconds since January 1,
+              1970 00:00:00 UTC per timestamp, where a leap second is represented
+              by the second that follows it and timestamps that are out of bounds
+              by 0, and validity mask, where 1 represents a valid and 0 an
+              invalid timestamp.
+        """
+        leap_second_table = leap_second_table or cls._LEAP_SECOND_TABLE
+        units_per_second = cls._UNITS_PER_SECOND
+
+        tai_base = cls._TAI_BASE * units_per_second
+        if tai_base:
+            timestamps = (timestamp + tai_base for timestamp in timestamps)
+
+        posix_timestamps = leap_second_table.CopyTAIToPOSIXTimestamps(
+            timestamps, units_per_second=units_per_second
+        )
+        if not posix_timestamps or (
+            min(posix_timestamps) >= cls._INT64_MIN
+            and max(posix_timestamps) <= cls._INT64_MAX
+        ):
+            return (
+                array.array("q", posix_timestamps),
+                bytearray(b"\x01" * len(posix_timestamps)),
+            )
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for posix_timestamp in posix_timestamps:
+            if cls._INT64_MIN <= posix_timestamp <= cls._INT64_MAX:
+                timestamps.append(posix_timestamp)
+                validity_mask.append(1)
+            else:
+                timestamps.append(0)
+                validity_mask.append(0)
+
+        return timestamps, validity_mask
+
+
+factory.Factory.RegisterDateTimeValues(TAITime)
@@ -1,7 +1,9 @@
 """Time elements implementation."""
 
 import decimal
+import re
 
+from dfdatetime import caches
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -75,6 +77,59 @@ class TimeElements(interface.DateTimeValues):
 
     _RFC_WEEKDAYS = frozenset(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
 
+    # Maps the RFC 822, RFC 1123 and RFC 2822 time zone strings to their
+    # corresponding time zone offset in minutes.
+    _RFC_TIME_ZONE_OFFSETS = {
+        time_zone_string: hours_from_utc * 60
+        for time_zone_string, hours_from_utc in _RFC_TIME_ZONE_MAPPINGS.items()
+    }
+    _RFC_TIME_ZONE_OFFSETS.update(
+        {
+            f"{sign:s}{hours:02d}{minutes:02d}": (hours * 60 + minutes) * factor
+            for sign, factor in (("+", 1), ("-", -1))
+            for hours in range(0, 15)
+            for minutes in range(0, 60)
+        }
+    )
+
+    # RFC 2822 considers military time zones equivalent to "-0000", since their
+    # signs were defined incorrectly in RFC 822.
+    _RFC2822_TIME_ZONE_OFFSETS = dict(_RFC_TIME_ZONE_OFFSETS)
+    _RFC2822_TIME_ZONE_OFFSETS.update(
+        {
+            time_zone_string: 0
+            for time_zone_string in _RFC_TIME_ZONE_MAPPINGS
+            if len(time_zone_string) == 1
+        }
+    )
+
+    # Common shape of a RFC 822, RFC 1123 or RFC 2822 date and time string:
+    # "[DAY, ]D MONTH YYYY hh:mm[:ss] ZONE".
+    _RFC_DATE_TIME_RE = re.compile(
+        r"(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), )?"
+        r"([0-9]{1,2}) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) "
+        r"([0-9]{2,4}) ([0-9]{2}):([0-9]{2})(?::([0-9]{2}))? "
+        r"([+-][0-9]{4}|[A-Z]{1,3})"
+    )
+
+    # ISO 8601 date notations, as (regular expression, notation), in order of
+    # how common they are.
+    _ISO8601_DATE_NOTATIONS = [
+        (re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})"), "calendar"),
+        (re.compile(r"([0-9]{4})([0-9]{2})([0-9]{2})"), "calendar"),
+        (re.compile(r"([0-9]{4})-W([0-9]{2})(?:-([1-7]))?"), "week"),
+        (re.compile(r"([0-9]{4})W([0-9]{2})([1-7])?"), "week"),
+        (re.compile(r"([0-9]{4})-([0-9]{3})"), "ordinal"),
+        (re.compile(r"([0-9]{4})([0-9]{3})"), "ordinal"),
+    ]
+
+    # Extended format ISO 8601 time of day with an optional fraction of second
+    # and an optional "Z" or "[+-]hh:mm" time zone designator.
+    _ISO8601_TIME_RE = re.compile(
+        r"([0-9]{2}):([0-9]{2}):([0-9]{2})(?:[.,]([0-9]{1,9}))?"
+        r"(?:(Z)|([+-])([0-9]{2}):([0-9]{2}))?"
+    )
+
     def __init__(
         self,
         is_delta=False,
@@ -161,32 +216,26 @@ class TimeElements(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        if not time_string:
-            raise ValueError("Invalid time string.")
-
-        time_string_length = len(time_string)
-
-        year, month, day_of_month = self._CopyDateFromString(time_string)
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = self._CopyDateTimeTupleFromStringISO8601(time_string)
 
-        if time_string_length <= 10:
-            return {"year": year, "month": month, "day_of_month": day_of_month}
+        date_time_values = {"year": year, "month": month, "day_of_month": day_of_month}
 
-        # If a time of day is specified the time string it should at least
-        # contain 'YYYY-MM-DDThh'.
-        if time_string[10] != "T":
-            raise ValueError("Invalid time string - missing date and time separator.")
+        if hours is not None:
+            date_time_values["hours"] = hours
+        if minutes is not None:
+            date_time_values["minutes"] = minutes
+        if seconds is not None:
+            date_time_values["seconds"] = seconds
 
-        hours, minutes, seconds, nanoseconds, time_zone_offset = (
-            self._CopyTimeFromStringISO8601(time_string[11:])
-        )
-        date_time_values = {
-            "year": year,
-            "month": month,
-            "day_of_month": day_of_month,
-            "hours": hours,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
         if nanoseconds is not None:
             date_time_values["nanoseconds"] = nanoseconds
         if time_zone_offset is not None:
@@ -194,6 +243,36 @@ class TimeElements(interface.DateTimeValues):
 
         return date_time_values
 
+    def _CopyDateTimeTupleFromStringISO8601(self, time_string):
+        """Copies a date and time from an ISO 8601 date and time string.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DDThh:mm:ss.######[+-]##:##
+
+              Where the date can also be formatted in basic format or as a week
+              or ordinal date and the time of day can also be formatted in basic
+              format or with a fractional hours or minutes value.
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the hours, minutes and seconds are None if not defined, the
+              nanoseconds are None if no fraction of second was defined and the
+              time zone offset is None if not defined.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        date_time_tuple = self._GetDateTimeTupleFromStringISO8601(time_string)
+        if not date_time_tuple:
+            # Parse the time string again to determine why it is invalid, which
+            # is not cached.
+            _, error_message = self._ParseDateTimeTupleFromStringISO8601(time_string)
+            raise ValueError(error_message)
+
+        return date_time_tuple
+
     def _CopyDateTimeFromStringRFC822(self, time_string):
         """Copies a date and time from a RFC 822 date and time string.
 
@@ -211,56 +290,431 @@ class TimeElements(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        if not time_string:
-            raise ValueError("Invalid time string.")
+        date_time_tuple = self._CopyDateTimeTupleFromStringRFC(time_string, "822")
+        return self._GetDateTimeValuesFromTupleRFC(date_time_tuple)
 
-        string_segments = time_string.split(" ")
+    def _CopyDateTimeFromStringRFC1123(self, time_string):
+        """Copies a date and time from a RFC 1123 date and time string.
 
-        if len(string_segments) not in (5, 6):
-            raise ValueError("Unsupported number of time string segments.")
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
 
-        weekday_string = string_segments[0]
-        if weekday_string.endswith(","):
-            weekday_string = weekday_string[:-1]
-            if weekday_string not in self._RFC_WEEKDAYS:
-                raise ValueError(f"Invalid weekday: {weekday_string:s}.")
+              Where weekday (DAY) and seconds (ss) are optional and day of
+              month (D) can consist of 1 or 2 digits.
 
-            string_segments.pop(0)
+        Returns:
+          dict[str, int]: date and time values, such as year, month, day of month,
+              hours, minutes, seconds, time zone offset in minutes.
 
-        day_of_month_string = string_segments[0]
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        date_time_tuple = self._CopyDateTimeTupleFromStringRFC(time_string, "1123")
+        return self._GetDateTimeValuesFromTupleRFC(date_time_tuple)
 
-        day_of_month = 0
-        if len(day_of_month_string) in (1, 2):
-            try:
-                day_of_month = int(day_of_month_string, 10)
-            except ValueError:
-                pass
+    def _CopyDateTimeTupleFromStringRFC(self, time_string, rfc):
+        """Copies a date and time from a RFC 822, RFC 1123 or RFC 2822 string.
 
-        if day_of_month == 0:
-            raise ValueError(f"Invalid day of month: {day_of_month_string:s}.")
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
 
-        month_string = string_segments[1]
+              Where weekday (DAY) and seconds (ss) are optional and day of
+              month (D) can consist of 1 or 2 digits.
+          rfc (str): RFC that defines the format of the date and time string,
+              either "822", "1123" or "2822".
 
-        month = self._RFC_MONTH_MAPPINGS.get(month_string)
-        if not month:
-            raise ValueError(f"Invalid month: {month_string:s}.")
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the seconds are None if not defined and the nanoseconds are
+              always None.
 
-        year_string = string_segments[2]
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        date_time_tuple = self._GetDateTimeTupleFromStringRFC(time_string, rfc)
+        if not date_time_tuple:
+            # Parse the time string again to determine why it is invalid, which
+            # is not cached.
+            _, error_message = self._ParseDateTimeTupleFromStringRFC(time_string, rfc)
+            raise ValueError(error_message)
 
-        year = None
-        if len(year_string) == 2:
-            try:
-                year = int(year_string, 10)
-            except ValueError:
-                pass
+        return date_time_tuple
 
-        if year is None:
-            raise ValueError(f"Invalid year: {0:s}.")
+    def _CopyFromDateTimeTuple(self, date_time_tuple):
+        """Copies time elements from a date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes.
+        """
+        year, month, day_of_month, hours, minutes, seconds, _, time_zone_offset = (
+            date_time_tuple
+        )
+
+        self._normalized_timestamp = None
+        self._number_of_seconds = self._GetNumberOfSecondsFromElements(
+            year, month, day_of_month, hours, minutes, seconds
+        )
+        self._time_elements_tuple = (year, month, day_of_month, hours, minutes, seconds)
+        self._time_zone_offset = time_zone_offset
+
+    def _CopyFromDateTimeTupleISO8601(self, date_time_tuple):
+        """Copies time elements from an ISO 8601 date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes, where the hours, minutes, seconds and
+              nanoseconds can be None.
+        """
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = date_time_tuple
+
+        # The time of day can be defined with a reduced precision, such as
+        # "hh:mm" or "hh", where the values that are not defined are 0.
+        self._CopyFromDateTimeTuple(
+            (
+                year,
+                month,
+                day_of_month,
+                hours or 0,
+                minutes or 0,
+                seconds or 0,
+                nanoseconds or 0,
+                time_zone_offset,
+            )
+        )
+
+    def _CopyFromDateTimeTupleRFC(self, date_time_tuple):
+        """Copies time elements from a RFC date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes, where the seconds and nanoseconds can be
+              None.
+        """
+        year, month, day_of_month, hours, minutes, seconds, _, time_zone_offset = (
+            date_time_tuple
+        )
+        self._CopyFromDateTimeTuple(
+            (
+                year,
+                month,
+                day_of_month,
+                hours,
+                minutes,
+                seconds or 0,
+                0,
+                time_zone_offset,
+            )
+        )
+
+    def _CopyFromDateTimeValues(self, date_time_values):
+        """Copies time elements from date and time values.
+
+        Args:
+          date_time_values  (dict[str, int]): date and time values, such as year,
+              month, day of month, hours, minutes, seconds, nanoseconds, time zone
+              offset in minutes.
+        """
+        self._CopyFromDateTimeTuple(
+            (
+                date_time_values.get("year", 0),
+                date_time_values.get("month", 0),
+                date_time_values.get("day_of_month", 0),
+                date_time_values.get("hours", 0),
+                date_time_values.get("minutes", 0),
+                date_time_values.get("seconds", 0),
+                date_time_values.get("nanoseconds", 0),
+                date_time_values.get("time_zone_offset"),
+            )
+        )
+
+    def _CopyTimeFromStringISO8601(self, time_string):
+        """Copies a time from an ISO 8601 time string.
+
+        Args:
+          time_string (str): time value formatted as:
+              hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9. The time can also be
+              formatted in basic format, as hhmmss, and the minutes and seconds can
+              be omitted, in which case the fraction applies to the last value
+              that is defined. The fraction of second and time zone offset are
+              optional. The time zone offset can also be formatted as Z,
+              [+-]#### or [+-]##.
 
-        year += 1900
+        Returns:
+          tuple[int, int, int, int, int]: hours, minutes, seconds, nanoseconds,
+              time zone offset in minutes.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        time_tuple, error_message = self._ParseTimeFromStringISO8601(time_string)
+        if error_message:
+            raise ValueError(error_message)
+
+        return time_tuple
+
+    def _CopyTimeFromStringRFC(self, time_string, time_zone_string):
+        """Copies a time from a RFC 822, RFC 1123 or RFC 2822 time string.
+
+        Args:
+          time_string (str): time value formatted as: hh:mm[:ss], where seconds (ss)
+              are optional.
+          time_zone_string (str): time zone value formatted as predefined time zone
+              indicator or [+-]HHMM
+
+        Returns:
+          tuple[int, int, int, int]: hours, minutes, seconds, time zone offset in
+              minutes.
 
-        hours, minutes, seconds, time_zone_offset = self._CopyTimeFromStringRFC(
-            string_segments[3], string_segments[4]
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        time_tuple, error_message = self._ParseTimeFromStringRFC(
+            time_string, time_zone_string
+        )
+        if error_message:
+            raise ValueError(error_message)
+
+        return time_tuple
+
+    def _GetDateFromOrdinalDate(self, year, day_of_year):
+        """Retrieves the date of an ordinal date.
+
+        Args:
+          year (int): year e.g. 1970.
+          day_of_year (int): day of year, where 1 represents January 1.
+
+        Returns:
+          tuple[int, int, int]: year, month, day of month or None if the day of
+              year value is out of bounds.
+        """
+        if day_of_year < 1 or day_of_year > self._GetNumberOfDaysInYear(year):
+            return None
+
+        month = 1
+        days_per_month = self._GetDaysPerMonth(year, month)
+        while day_of_year > days_per_month:
+            day_of_year -= days_per_month
+            month += 1
+            days_per_month = self._GetDaysPerMonth(year, month)
+
+        return year, month, day_of_year
+
+    def _GetDateFromWeekDateISO8601(self, year, week_number, day_of_week):
+        """Retrieves the date of an ISO 8601 week date.
+
+        Args:
+          year (int): ISO 8601 week-numbering year e.g. 1970.
+          week_number (int): week number, where week 1 is the week that contains
+              January 4.
+          day_of_week (int): day of week, where 1 represents Monday.
+
+        Returns:
+          tuple[int, int, int]: year, month, day of month or None if the week
+              number or day of week value is out of bounds.
+        """
+        # Determine the day of week of January 4 using Gauss's algorithm, where
+        # 0 represents Sunday.
+        previous_year = year - 1
+        january4_day_of_week = (
+            4
+            + 5 * (previous_year % 4)
+            + 4 * (previous_year % 100)
+            + 6 * (previous_year % 400)
+        ) % 7
+        if january4_day_of_week == 0:
+            january4_day_of_week = 7
+
+        # A year has 53 weeks if January 1 is a Thursday, or a Wednesday in
+        # a leap year.
+        number_of_weeks = 52
+        if january4_day_of_week == 7 or (
+            january4_day_of_week == 6 and self._IsLeapYear(year)
+        ):
+            number_of_weeks = 53
+
+        if week_number < 1 or week_number > number_of_weeks:
+            return None
+
+        if day_of_week < 1 or day_of_week > 7:
+            return None
+
+        day_of_year = (week_number * 7) + day_of_week - (january4_day_of_week + 3)
+        if day_of_year < 1:
+            year -= 1
+            day_of_year += self._GetNumberOfDaysInYear(year)
+        else:
+            number_of_days_in_year = self._GetNumberOfDaysInYear(year)
+            if day_of_year > number_of_days_in_year:
+                year += 1
+                day_of_year -= number_of_days_in_year
+
+        return self._GetDateFromOrdinalDate(year, day_of_year)
+
+    def _GetDateTimeTupleFromMatchRFC(self, match, rfc):
+        """Retrieves a date and time tuple from a RFC date and time string match.
+
+        Args:
+          match (re.Match): match of the common RFC date and time string regular
+              expression.
+          rfc (str): RFC that defines the format of the date and time string,
+              either "822", "1123" or "2822".
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes
+              or None if a value is out of bounds or not supported.
+        """
+        (
+            day_of_month,
+            month_string,
+            year_string,
+            hours,
+            minutes,
+            seconds,
+            time_zone_string,
+        ) = match.groups()
+
+        year = self._GetYearFromStringRFC(year_string, rfc)
+        if year is None or year > 9999:
+            return None
+
+        if rfc == "2822":
+            time_zone_offset = self._RFC2822_TIME_ZONE_OFFSETS.get(time_zone_string)
+        else:
+            time_zone_offset = self._RFC_TIME_ZONE_OFFSETS.get(time_zone_string)
+
+        if time_zone_offset is None:
+            return None
+
+        month = self._RFC_MONTH_MAPPINGS[month_string]
+        day_of_month = int(day_of_month, 10)
+        hours = int(hours, 10)
+        minutes = int(minutes, 10)
+
+        days_per_month = self._GetDaysPerMonth(year, month)
+        if day_of_month < 1 or day_of_month > days_per_month:
+            return None
+
+        if hours > 23 or minutes > 59:
+            return None
+
+        if seconds is not None:
+            seconds = int(seconds, 10)
+            if seconds > 59:
+                return None
+
+        return (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            None,
+            time_zone_offset,
+        )
+
+    def _GetDateTimeTupleFromStringISO8601(self, time_string):
+        """Retrieves a date and time from an ISO 8601 date and time string.
+
+        The date and time tuple is retrieved from the "iso8601" parse cache when
+        enabled.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DDThh:mm:ss.######[+-]##:##
+
+              Where the date can also be formatted in basic format or as a week
+              or ordinal date and the time of day can also be formatted in basic
+              format or with a fractional hours or minutes value.
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the hours, minutes and seconds are None if not defined, the
+              nanoseconds are None if no fraction of second was defined and the
+              time zone offset is None if not defined, or None if the time string
+              is invalid or not supported.
+        """
+        cache = caches.ParseCaches.GetCache("iso8601")
+        if cache is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromStringISO8601(time_string)
+            return date_time_tuple
+
+        date_time_tuple = cache.Get(time_string)
+        if date_time_tuple is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromStringISO8601(time_string)
+            if date_time_tuple:
+                cache.Put(time_string, date_time_tuple)
+
+        return date_time_tuple
+
+    def _GetDateTimeTupleFromStringRFC(self, time_string, rfc):
+        """Retrieves a date and time from a RFC 822, RFC 1123 or RFC 2822 string.
+
+        The date and time tuple is retrieved from the "rfc822", "rfc1123" or
+        "rfc2822" parse cache when enabled.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
+
+              Where weekday (DAY) and seconds (ss) are optional and day of
+              month (D) can consist of 1 or 2 digits.
+          rfc (str): RFC that defines the format of the date and time string,
+              either "822", "1123" or "2822".
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes,
+              where the seconds are None if not defined and the nanoseconds are
+              always None, or None if the time string is invalid or not supported.
+        """
+        cache = caches.ParseCaches.GetCache("".join(["rfc", rfc]))
+        if cache is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromStringRFC(time_string, rfc)
+            return date_time_tuple
+
+        date_time_tuple = cache.Get(time_string)
+        if date_time_tuple is None:
+            date_time_tuple, _ = self._ParseDateTimeTupleFromStringRFC(time_string, rfc)
+            if date_time_tuple:
+                cache.Put(time_string, date_time_tuple)
+
+        return date_time_tuple
+
+    def _GetDateTimeValuesFromTupleRFC(self, date_time_tuple):
+        """Retrieves date and time values from a RFC date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes.
+
+        Returns:
+          dict[str, int]: date and time values, such as year, month, day of month,
+              hours, minutes, seconds, time zone offset in minutes.
+        """
+        year, month, day_of_month, hours, minutes, seconds, _, time_zone_offset = (
+            date_time_tuple
         )
         date_time_values = {
             "year": year,
@@ -275,8 +729,300 @@ class TimeElements(interface.DateTimeValues):
 
         return date_time_values
 
-    def _CopyDateTimeFromStringRFC1123(self, time_string):
-        """Copies a date and time from a RFC 1123 date and time string.
+    def _GetTimeTupleFromMatchISO8601(self, match):
+        """Retrieves a time tuple from an ISO 8601 time of day match.
+
+        Args:
+          match (re.Match): match of the extended format ISO 8601 time of day
+              regular expression.
+
+        Returns:
+          tuple[int, int, int, int, int]: hours, minutes, seconds, nanoseconds and
+              time zone offset in minutes or None if a value is out of bounds.
+        """
+        (
+            hours,
+            minutes,
+            seconds,
+            fraction_of_second,
+            utc_designator,
+            time_zone_sign,
+            time_zone_hours,
+            time_zone_minutes,
+        ) = match.groups()
+
+        hours = int(hours, 10)
+        minutes = int(minutes, 10)
+        seconds = int(seconds, 10)
+
+        if hours > 23 or minutes > 59 or seconds > 59:
+            return None
+
+        nanoseconds = None
+        if fraction_of_second:
+            nanoseconds = int(fraction_of_second, 10) * (
+                10 ** (9 - len(fraction_of_second))
+            )
+
+        time_zone_offset = None
+        if utc_designator:
+            time_zone_offset = 0
+
+        elif time_zone_sign:
+            time_zone_hours = int(time_zone_hours, 10)
+            time_zone_minutes = int(time_zone_minutes, 10)
+
+            if time_zone_hours > 14 or time_zone_minutes > 59:
+                return None
+
+            time_zone_offset = (time_zone_hours * 60) + time_zone_minutes
+            if time_zone_sign == "-":
+                time_zone_offset = -time_zone_offset
+
+        return hours, minutes, seconds, nanoseconds, time_zone_offset
+
+    def _GetYearFromStringRFC(self, year_string, rfc):
+        """Retrieves the year from a RFC year string.
+
+        RFC 822 defines a 2-digit year in the 20th century and RFC 1123 a 4-digit
+        year. RFC 2822 defines a year of 4 or more digits and the obsolete 2-digit
+        years, where 00 to 49 represent 2000 to 2049 and 50 to 99 represent 1950
+        to 1999, and 3-digit years, which are relative to 1900.
+
+        Args:
+          year_string (str): year string.
+          rfc (str): RFC that defines the format of the year string, either
+              "822", "1123" or "2822".
+
+        Returns:
+          int: year or None if the year string is invalid or not supported.
+        """
+        year_string_length = len(year_string)
+
+        if rfc == "822":
+            is_supported = year_string_length == 2
+        elif rfc == "1123":
+            is_supported = year_string_length == 4
+        else:
+            is_supported = year_string_length >= 2
+
+        if not is_supported:
+            return None
+
+        year = self._GetIntegerFromString(year_string)
+        if year is None:
+            return None
+
+        if rfc == "822":
+            year += 1900
+
+        elif rfc == "2822":
+            if year_string_length == 2 and year < 50:
+                year += 2000
+            elif year_string_length in (2, 3):
+                year += 1900
+
+        return year
+
+    def _NormalizeStringRFC2822(self, time_string):
+        """Normalizes a RFC 2822 date and time string.
+
+        Comments are removed, folding whitespace is collapsed into single spaces
+        and the case of weekdays, months and time zones is normalized.
+
+        Args:
+          time_string (str): RFC 2822 date and time string.
+
+        Returns:
+          str: normalized date and time string or None if a comment in the time
+              string is not terminated.
+        """
+        if "(" in time_string:
+            characters = []
+            comment_depth = 0
+            is_quoted_pair = False
+
+            for character in time_string:
+                if is_quoted_pair:
+                    is_quoted_pair = False
+                elif comment_depth and character == "\\":
+                    is_quoted_pair = True
+                elif character == "(":
+                    comment_depth += 1
+                    if comment_depth == 1:
+                        characters.append(" ")
+                elif character == ")" and comment_depth:
+                    comment_depth -= 1
+                elif not comment_depth:
+                    characters.append(character)
+
+            if comment_depth:
+                return None
+
+            time_string = "".join(characters)
+
+        time_string = time_string.replace(",", ", ")
+
+        words = []
+        for word in time_string.split():
+            if word == "," and words:
+                words[-1] = f"{words[-1]:s},"
+                continue
+
+            normalized_word = word.title()
+            if (
+                normalized_word[:3] in self._RFC_WEEKDAYS
+                or normalized_word in self._RFC_MONTH_MAPPINGS
+            ):
+                word = normalized_word
+            elif word.upper() in self._RFC_TIME_ZONE_MAPPINGS:
+                word = word.upper()
+
+            words.append(word)
+
+        return " ".join(words)
+
+    def _ParseDateFromStringISO8601(self, date_string):
+        """Parses a date from an ISO 8601 date string.
+
+        Args:
+          date_string (str): date value formatted as: YYYY-MM-DD, YYYYMMDD,
+              YYYY-Www-D, YYYYWwwD, YYYY-Www, YYYYWww, YYYY-DDD or YYYYDDD.
+
+        Returns:
+          tuple[tuple[int, int, int], str]: year, month and day of month and None,
+              None and the reason the date string contains an out of bounds
+              value, or None and None if the date string is not formatted in
+              one of the supported notations.
+        """
+        for expression, notation in self._ISO8601_DATE_NOTATIONS:
+            match = expression.fullmatch(date_string)
+            if not match:
+                continue
+
+            if notation == "calendar":
+                year, month, day_of_month = match.groups()
+                year = int(year, 10)
+                month = int(month, 10)
+                day_of_month = int(day_of_month, 10)
+
+                if month not in range(1, 13):
+                    return None, "Month value out of bounds."
+
+                days_per_month = self._GetDaysPerMonth(year, month)
+                if day_of_month < 1 or day_of_month > days_per_month:
+                    return None, "Day of month value out of bounds."
+
+                return (year, month, day_of_month), None
+
+            if notation == "week":
+                year, week_number, day_of_week = match.groups()
+                week_number = int(week_number, 10)
+                day_of_week = int(day_of_week or "1", 10)
+
+                date_tuple = self._GetDateFromWeekDateISO8601(
+                    int(year, 10), week_number, day_of_week
+                )
+                # The day of week is limited to 1 - 7 by the notation, hence only
+                # the week number can be out of bounds.
+                if not date_tuple:
+                    return None, f"Week number value: {week_number:d} out of bounds."
+
+                # The last week of 9999 ends in 10000, which is not supported.
+                if date_tuple[0] > 9999:
+                    return None, f"Year value: {date_tuple[0]:d} out of bounds."
+
+                return date_tuple, None
+
+            year, day_of_year = match.groups()
+            day_of_year = int(day_of_year, 10)
+
+            date_tuple = self._GetDateFromOrdinalDate(int(year, 10), day_of_year)
+            if not date_tuple:
+                return None, f"Day of year value: {day_of_year:d} out of bounds."
+
+            return date_tuple, None
+
+        return None, None
+
+    def _ParseDateTimeTupleFromStringISO8601(self, time_string):
+        """Parses a date and time from an ISO 8601 date and time string.
+
+        The date notation is determined from a table of the supported notations
+        and an extended format time of day is parsed in a single pass. Other
+        time of day formats are parsed field by field, which also determines
+        the reason an invalid string is rejected. An invalid string is signaled
+        by the return value, hence rejecting a string does not raise an
+        exception.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DDThh:mm:ss.######[+-]##:##
+
+              Where the date can also be formatted in basic format or as a week
+              or ordinal date and the time of day can also be formatted in basic
+              format or with a fractional hours or minutes value.
+
+        Returns:
+          tuple[tuple[int, int, int, int, int, int, int, int], str]: year, month,
+              day of month, hours, minutes, seconds, nanoseconds and time zone
+              offset in minutes, where the hours, minutes and seconds are None if
+              not defined, the nanoseconds are None if no fraction of second was
+              defined and the time zone offset is None if not defined, and None,
+              or None and the reason the time string is invalid or not supported.
+        """
+        if not time_string:
+            return None, "Invalid time string."
+
+        date_string, separator, time_of_day_string = time_string.partition("T")
+
+        date_tuple, error_message = self._ParseDateFromStringISO8601(date_string)
+        if error_message:
+            return None, error_message
+
+        if not date_tuple:
+            date_tuple, error_message = self._ParseDateFromString(time_string)
+            if error_message:
+                return None, error_message
+
+            separator = None
+            if len(time_string) > 10:
+                # If a time of day is specified the time string it should at least
+                # contain 'YYYY-MM-DDThh'.
+                if time_string[10] != "T":
+                    return None, (
+                        "Invalid time string - missing date and time separator."
+                    )
+
+                separator = "T"
+                time_of_day_string = time_string[11:]
+
+        if not separator:
+            return date_tuple + (None, None, None, None, None), None
+
+        time_tuple = None
+
+        match = self._ISO8601_TIME_RE.fullmatch(time_of_day_string)
+        if match:
+            time_tuple = self._GetTimeTupleFromMatchISO8601(match)
+
+        if not time_tuple:
+            time_tuple, error_message = self._ParseTimeFromStringISO8601(
+                time_of_day_string
+            )
+            if error_message:
+                return None, error_message
+
+        return date_tuple + time_tuple, None
+
+    def _ParseDateTimeTupleFromStringRFC(self, time_string, rfc):
+        """Parses a date and time from a RFC 822, RFC 1123 or RFC 2822 string.
+
+        Strings in the common "[DAY, ]D MONTH YYYY hh:mm[:ss] ZONE" shape are
+        parsed in a single pass, other strings are parsed segment by segment,
+        which also determines the reason an invalid string is rejected. An
+        invalid string is signaled by the return value, hence rejecting a string
+        does not raise an exception.
 
         Args:
           time_string (str): date and time value formatted as:
@@ -284,116 +1030,125 @@ class TimeElements(interface.DateTimeValues):
 
               Where weekday (DAY) and seconds (ss) are optional and day of
               month (D) can consist of 1 or 2 digits.
+          rfc (str): RFC that defines the format of the date and time string,
+              either "822", "1123" or "2822".
 
         Returns:
-          dict[str, int]: date and time values, such as year, month, day of month,
-              hours, minutes, seconds, time zone offset in minutes.
-
-        Raises:
-          ValueError: if the time string is invalid or not supported.
+          tuple[tuple[int, int, int, int, int, int, int, int], str]: year, month,
+              day of month, hours, minutes, seconds, nanoseconds and time zone
+              offset in minutes, where the seconds are None if not defined and the
+              nanoseconds are always None, and None, or None and the reason the
+              time string is invalid or not supported.
         """
         if not time_string:
-            raise ValueError("Invalid time string.")
+            return None, "Invalid time string."
+
+        match = self._RFC_DATE_TIME_RE.fullmatch(time_string)
+        if match:
+            date_time_tuple = self._GetDateTimeTupleFromMatchRFC(match, rfc)
+            if date_time_tuple:
+                return date_time_tuple, None
+
+        if rfc == "2822":
+            time_string = self._NormalizeStringRFC2822(time_string)
+            if time_string is None:
+                return None, "Invalid time string - unterminated comment."
 
         string_segments = time_string.split(" ")
 
         if len(string_segments) not in (5, 6):
-            raise ValueError("Unsupported number of time string segments.")
+            return None, "Unsupported number of time string segments."
 
         weekday_string = string_segments[0]
         if weekday_string.endswith(","):
             weekday_string = weekday_string[:-1]
             if weekday_string not in self._RFC_WEEKDAYS:
-                raise ValueError(f"Invalid weekday: {weekday_string:s}.")
+                return None, f"Invalid weekday: {weekday_string:s}."
 
             string_segments.pop(0)
 
         day_of_month_string = string_segments[0]
 
-        day_of_month = 0
+        day_of_month = None
         if len(day_of_month_string) in (1, 2):
-            try:
-                day_of_month = int(day_of_month_string, 10)
-            except ValueError:
-                pass
+            day_of_month = self._GetIntegerFromString(day_of_month_string)
 
-        if day_of_month == 0:
-            raise ValueError(f"Invalid day of month: {day_of_month_string:s}.")
+        if not day_of_month:
+            return None, f"Invalid day of month: {day_of_month_string:s}."
 
         month_string = string_segments[1]
 
         month = self._RFC_MONTH_MAPPINGS.get(month_string)
         if not month:
-            raise ValueError(f"Invalid month: {month_string:s}.")
+            return None, f"Invalid month: {month_string:s}."
 
         year_string = string_segments[2]
 
-        year = None
-        if len(year_string) == 4:
-            try:
-                year = int(year_string, 10)
-            except ValueError:
-                pass
-
+        year = self._GetYearFromStringRFC(year_string, rfc)
         if year is None:
-            raise ValueError(f"Invalid year: {year_string:s}.")
-
-        hours, minutes, seconds, time_zone_offset = self._CopyTimeFromStringRFC(
-            string_segments[3], string_segments[4]
+            return None, f"Invalid year: {year_string:s}."
+
+        if len(string_segments) < 5:
+            return None, "Unsupported number of time string segments."
+
+        time_zone_string = string_segments[4]
+        if (
+            rfc == "2822"
+            and len(time_zone_string) == 1
+            and time_zone_string in self._RFC_TIME_ZONE_MAPPINGS
+        ):
+            # RFC 2822 considers military time zones equivalent to "-0000".
+            time_zone_string = "-0000"
+
+        time_tuple, error_message = self._ParseTimeFromStringRFC(
+            string_segments[3], time_zone_string
         )
-        date_time_values = {
-            "year": year,
-            "month": month,
-            "day_of_month": day_of_month,
-            "hours": hours,
-            "minutes": minutes,
-            "time_zone_offset": time_zone_offset,
-        }
-        if seconds is not None:
-            date_time_values["seconds"] = seconds
+        if error_message:
+            return None, error_message
 
-        return date_time_values
+        # Years of more than 4 digits are not supported by time elements.
+        if year < -9999 or year > 9999:
+            return None, f"Year value: {year:d} out of bounds."
 
-    def _CopyFromDateTimeValues(self, date_time_values):
-        """Copies time elements from date and time values.
+        days_per_month = self._GetDaysPerMonth(year, month)
+        if day_of_month < 1 or day_of_month > days_per_month:
+            return None, f"Day of month value: {day_of_month:d} out of bounds."
 
-        Args:
-          date_time_values  (dict[str, int]): date and time values, such as year,
-              month, day of month, hours, minutes, seconds, nanoseconds, time zone
-              offset in minutes.
-        """
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        hours, minutes, seconds, time_zone_offset = time_tuple
 
-        self._normalized_timestamp = None
-        self._number_of_seconds = self._GetNumberOfSecondsFromElements(
-            year, month, day_of_month, hours, minutes, seconds
+        date_time_tuple = (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            None,
+            time_zone_offset,
         )
-        self._time_elements_tuple = (year, month, day_of_month, hours, minutes, seconds)
-        self._time_zone_offset = time_zone_offset
+        return date_time_tuple, None
 
-    def _CopyTimeFromStringISO8601(self, time_string):
-        """Copies a time from an ISO 8601 time string.
+    def _ParseTimeFromStringISO8601(self, time_string):
+        """Parses a time from an ISO 8601 time string.
+
+        An invalid time string is signaled by the return value, hence rejecting
+        a string does not raise an exception.
 
         Args:
           time_string (str): time value formatted as:
               hh:mm:ss.######[+-]##:##
 
-              Where # are numeric digits ranging from 0 to 9 and the seconds
-              fraction can be either 3, 6 or 9 digits. The fraction of second and
-              time zone offset are optional.
+              Where # are numeric digits ranging from 0 to 9. The time can also be
+              formatted in basic format, as hhmmss, and the minutes and seconds can
+              be omitted, in which case the fraction applies to the last value
+              that is defined. The fraction of second and time zone offset are
+              optional. The time zone offset can also be formatted as Z,
+              [+-]#### or [+-]##.
 
         Returns:
-          tuple[int, int, int, int, int]: hours, minutes, seconds, nanoseconds,
-              time zone offset in minutes.
-
-        Raises:
-          ValueError: if the time string is invalid or not supported.
+          tuple[tuple[int, int, int, int, int], str]: hours, minutes, seconds,
+              nanoseconds and time zone offset in minutes and None, or None and
+              the reason the time string is invalid or not supported.
         """
         if time_string.endswith("Z"):
             time_string = "".join([time_string[:-1], "+00:00"])
@@ -402,15 +1157,14 @@ class TimeElements(interface.DateTimeValues):
 
         # The time string should at least contain 'hh'.
         if time_string_length < 2:
-            raise ValueError("Time string too short.")
+            return None, "Time string too short."
 
-        try:
-            hours = int(time_string[0:2], 10)
-        except ValueError:
-            raise ValueError("Unable to parse hours.")
+        hours = self._GetIntegerFromString(time_string[0:2])
+        if hours is None:
+            return None, "Unable to parse hours."
 
         if hours not in range(0, 24):
-            raise ValueError(f"Hours value: {hours:d} out of bounds.")
+            return None, f"Hours value: {hours:d} out of bounds."
 
         minutes = None
         seconds = None
@@ -423,18 +1177,18 @@ class TimeElements(interface.DateTimeValues):
         # 'hh[.,]###'.
         if time_string_index + 1 < time_string_length and time_string[
             time_string_index
-        ] not in (".", ","):
+        ] not in (".", ",", "+", "-"):
             if time_string[time_string_index] == ":":
                 time_string_index += 1
 
             if time_string_index + 2 > time_string_length:
-                raise ValueError("Time string too short.")
+                return None, "Time string too short."
 
-            try:
-                minutes = time_string[time_string_index : time_string_index + 2]
-                minutes = int(minutes, 10)
-            except ValueError:
-                raise ValueError("Unable to parse minutes.")
+            minutes = self._GetIntegerFromString(
+                time_string[time_string_index : time_string_index + 2]
+            )
+            if minutes is None:
+                return None, "Unable to parse minutes."
 
             time_string_index += 2
 
@@ -442,18 +1196,18 @@ class TimeElements(interface.DateTimeValues):
         # part 'hh:mm[.,]###' or 'hhmm[.,]###'.
         if time_string_index + 1 < time_string_length and time_string[
             time_string_index
-        ] not in (".", ","):
+        ] not in (".", ",", "+", "-"):
             if time_string[time_string_index] == ":":
                 time_string_index += 1
 
             if time_string_index + 2 > time_string_length:
-                raise ValueError("Time string too short.")
+                return None, "Time string too short."
 
-            try:
-                seconds = time_string[time_string_index : time_string_index + 2]
-                seconds = int(seconds, 10)
-            except ValueError:
-                raise ValueError("Unable to parse day of seconds.")
+            seconds = self._GetIntegerFromString(
+                time_string[time_string_index : time_string_index + 2]
+            )
+            if seconds is None:
+                return None, "Unable to parse day of seconds."
 
             time_string_index += 2
 
@@ -475,14 +1229,15 @@ class TimeElements(interface.DateTimeValues):
             time_string_index += 1
             time_fraction_length = time_zone_string_index - time_string_index
 
-            try:
-                time_fraction = time_string[time_string_index:time_zone_string_index]
-                time_fraction = int(time_fraction, 10)
-                time_fraction = decimal.Decimal(time_fraction) / decimal.Decimal(
-                    10**time_fraction_length
-                )
-            except ValueError:
-                raise ValueError("Unable to parse time fraction.")
+            time_fraction = self._GetIntegerFromString(
+                time_string[time_string_index:time_zone_string_index]
+            )
+            if time_fraction is None:
+                return None, "Unable to parse time fraction."
+
+            time_fraction = decimal.Decimal(time_fraction) / decimal.Decimal(
+                10**time_fraction_length
+            )
 
             if minutes is None:
                 time_fraction *= 60
@@ -498,49 +1253,60 @@ class TimeElements(interface.DateTimeValues):
             nanoseconds = int(time_fraction)
 
         if minutes is not None and minutes not in range(0, 60):
-            raise ValueError(f"Minutes value: {minutes:d} out of bounds.")
+            return None, f"Minutes value: {minutes:d} out of bounds."
 
         # TODO: support a leap second?
         if seconds is not None and seconds not in range(0, 60):
-            raise ValueError(f"Seconds value: {seconds:d} out of bounds.")
+            return None, f"Seconds value: {seconds:d} out of bounds."
 
         if time_zone_string_index < time_string_length:
+            # The time zone offset is either specified as '[+-]hh:mm', '[+-]hhmm'
+            # or '[+-]hh'.
+            time_zone_string_length = time_string_length - time_zone_string_index
             if (
-                time_string_length - time_zone_string_index != 6
-                or time_string[time_zone_string_index + 3] != ":"
+                time_zone_string_length == 6
+                and time_string[time_zone_string_index + 3] == ":"
+            ):
+                minutes_string_index = time_zone_string_index + 4
+            elif time_zone_string_length in (3, 5) and ":" not in (
+                time_string[time_zone_string_index:]
             ):
-                raise ValueError("Invalid time string.")
+                minutes_string_index = time_zone_string_index + 3
+            else:
+                return None, "Invalid time string."
 
-            try:
-                hours_from_utc = int(
-                    time_string[time_zone_string_index + 1 : time_zone_string_index + 3]
-                )
-            except ValueError:
-                raise ValueError("Unable to parse time zone hours offset.")
+            hours_from_utc = self._GetIntegerFromString(
+                time_string[time_zone_string_index + 1 : time_zone_string_index + 3]
+            )
+            if hours_from_utc is None:
+                return None, "Unable to parse time zone hours offset."
 
             if hours_from_utc not in range(0, 15):
-                raise ValueError("Time zone hours offset value out of bounds.")
+                return None, "Time zone hours offset value out of bounds."
 
-            try:
-                minutes_from_utc = int(
-                    time_string[time_zone_string_index + 4 : time_zone_string_index + 6]
+            minutes_from_utc = 0
+            if time_zone_string_length != 3:
+                minutes_from_utc = self._GetIntegerFromString(
+                    time_string[minutes_string_index : minutes_string_index + 2]
                 )
-            except ValueError:
-                raise ValueError("Unable to parse time zone minutes offset.")
+                if minutes_from_utc is None:
+                    return None, "Unable to parse time zone minutes offset."
 
             if minutes_from_utc not in range(0, 60):
-                raise ValueError("Time zone minutes offset value out of bounds.")
+                return None, "Time zone minutes offset value out of bounds."
 
-            # pylint: disable=invalid-unary-operand-type
             time_zone_offset = (hours_from_utc * 60) + minutes_from_utc
 
             if time_string[time_zone_string_index] == "-":
                 time_zone_offset = -time_zone_offset
 
-        return hours, minutes, seconds, nanoseconds, time_zone_offset
+        return (hours, minutes, seconds, nanoseconds, time_zone_offset), None
 
-    def _CopyTimeFromStringRFC(self, time_string, time_zone_string):
-        """Copies a time from a RFC 822, RFC 1123 or RFC 2822 time string.
+    def _ParseTimeFromStringRFC(self, time_string, time_zone_string):
+        """Parses a time from a RFC 822, RFC 1123 or RFC 2822 time string.
+
+        An invalid time string is signaled by the return value, hence rejecting
+        a string does not raise an exception.
 
         Args:
           time_string (str): time value formatted as: hh:mm[:ss], where seconds (ss)
@@ -549,92 +1315,85 @@ class TimeElements(interface.DateTimeValues):
               indicator or [+-]HHMM
 
         Returns:
-          tuple[int, int, int, int]: hours, minutes, seconds, time zone offset in
-              minutes.
-
-        Raises:
-          ValueError: if the time string is invalid or not supported.
+          tuple[tuple[int, int, int, int], str]: hours, minutes, seconds and time
+              zone offset in minutes and None, or None and the reason the time
+              string is invalid or not supported.
         """
         time_string_length = len(time_string)
 
         # The time string should at least contain 'hh:mm'.
         if time_string_length < 5:
-            raise ValueError("Time string too short.")
+            return None, "Time string too short."
 
         if time_string_length > 8:
-            raise ValueError("Time string too long.")
+            return None, "Time string too long."
 
         if time_string[2] != ":":
-            raise ValueError("Invalid hours and minutes separator.")
+            return None, "Invalid hours and minutes separator."
 
-        try:
-            hours = int(time_string[0:2], 10)
-        except ValueError:
-            raise ValueError("Unable to parse hours.")
+        hours = self._GetIntegerFromString(time_string[0:2])
+        if hours is None:
+            return None, "Unable to parse hours."
 
         if hours not in range(0, 24):
-            raise ValueError(f"Hours value: {hours:d} out of bounds.")
+            return None, f"Hours value: {hours:d} out of bounds."
 
-        try:
-            minutes = int(time_string[3:5], 10)
-        except ValueError:
-            raise ValueError("Unable to parse minutes.")
+        minutes = self._GetIntegerFromString(time_string[3:5])
+        if minutes is None:
+            return None, "Unable to parse minutes."
 
         if minutes not in range(0, 60):
-            raise ValueError(f"Minutes value: {minutes:d} out of bounds.")
+            return None, f"Minutes value: {minutes:d} out of bounds."
 
         seconds = None
 
         if time_string_length > 5:
             if time_string_length < 8:
-                raise ValueError("Time string too short.")
+                return None, "Time string too short."
 
             if time_string[5] != ":":
-                raise ValueError("Invalid minutes and seconds separator.")
+                return None, "Invalid minutes and seconds separator."
 
-            try:
-                seconds = int(time_string[6:8], 10)
-            except ValueError:
-                raise ValueError("Unable to parse seconds.")
+            seconds = self._GetIntegerFromString(time_string[6:8])
+            if seconds is None:
+                return None, "Unable to parse seconds."
 
             if seconds not in range(0, 60):
-                raise ValueError(f"Seconds value: {seconds:d} out of bounds.")
+                return None, f"Seconds value: {seconds:d} out of bounds."
 
         time_zone_string_length = len(time_zone_string)
         if time_zone_string_length > 5:
-            raise ValueError("Time zone string too long.")
+            return None, "Time zone string too long."
 
         if time_zone_string_length < 5:
             hours_from_utc = self._RFC_TIME_ZONE_MAPPINGS.get(time_zone_string)
             minutes_from_utc = 0
             if hours_from_utc is None:
-                raise ValueError(f"Invalid time zone: {time_zone_string:s}.")
+                return None, f"Invalid time zone: {time_zone_string:s}."
 
         else:
             if time_zone_string[0] not in ("+", "-"):
-                raise ValueError(f"Invalid time zone: {time_zone_string:s}.")
+                return None, f"Invalid time zone: {time_zone_string:s}."
 
-            try:
-                hours_from_utc = int(time_zone_string[1:3], 10)
-            except ValueError:
-                raise ValueError("Unable to parse time zone hours offset.")
+            hours_from_utc = self._GetIntegerFromString(time_zone_string[1:3])
+            if hours_from_utc is None:
+                return None, "Unable to parse time zone hours offset."
 
             if hours_from_utc not in range(0, 15):
-                raise ValueError("Time zone hours offset value out of bounds.")
+                return None, "Time zone hours offset value out of bounds."
 
-            try:
-                minutes_from_utc = int(time_zone_string[3:5], 10)
-            except ValueError:
-                raise ValueError("Unable to parse time zone minutes offset.")
+            minutes_from_utc = self._GetIntegerFromString(time_zone_string[3:5])
+            if minutes_from_utc is None:
+                return None, "Unable to parse time zone minutes offset."
 
             if minutes_from_utc not in range(0, 60):
-                raise ValueError("Time zone minutes offset value out of bounds.")
+                return None, "Time zone minutes offset value out of bounds."
 
         time_zone_offset = (hours_from_utc * 60) + minutes_from_utc
         if time_zone_string[0] == "-":
             time_zone_offset = -time_zone_offset
 
-        return hours, minutes, seconds, time_zone_offset
+        return (hours, minutes, seconds, time_zone_offset), None
 
     @property
     def day_of_month(self):
@@ -713,35 +1472,37 @@ class TimeElements(interface.DateTimeValues):
               fraction and time zone offset are optional. The default time zone
               is UTC.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
+        date_time_tuple = self._CopyDateTimeTupleFromString(time_string)
 
-        self._CopyFromDateTimeValues(date_time_values)
+        self._CopyFromDateTimeTuple(date_time_tuple)
 
     def CopyFromStringISO8601(self, time_string):
         """Copies time elements from an ISO 8601 date and time string.
 
+        Supported date notations:
+        * Calendar date notation "2016-08-17" or "20160817"
+        * Week notation "2016-W33" or "2016W33"
+        * Date with week number notation "2016-W33-3" or "2016W333"
+        * Ordinal date notation "2016-230" or "2016230"
+
         Currently not supported:
         * Duration notation: "P..."
-        * Week notation "2016-W33"
-        * Date with week number notation "2016-W33-3"
         * Date without year notation "--08-17"
-        * Ordinal date notation "2016-230"
 
         Args:
           time_string (str): date and time value formatted as:
               YYYY-MM-DDThh:mm:ss.######[+-]##:##
 
-              Where # are numeric digits ranging from 0 to 9 and the seconds
-              fraction can be either 3, 6 or 9 digits. The time of day, seconds
-              fraction and time zone offset are optional. The default time zone
-              is UTC.
+              Where # are numeric digits ranging from 0 to 9. The time of day,
+              seconds fraction and time zone offset are optional. The default
+              time zone is UTC.
 
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromStringISO8601(time_string)
+        date_time_tuple = self._CopyDateTimeTupleFromStringISO8601(time_string)
 
-        self._CopyFromDateTimeValues(date_time_values)
+        self._CopyFromDateTimeTupleISO8601(date_time_tuple)
 
     def CopyFromStringRFC822(self, time_string):
         """Copies time elements from a RFC 822 date and time string.
@@ -756,9 +1517,9 @@ class TimeElements(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromStringRFC822(time_string)
+        date_time_tuple = self._CopyDateTimeTupleFromStringRFC(time_string, "822")
 
-        self._CopyFromDateTimeValues(date_time_values)
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
 
     def CopyFromStringRFC1123(self, time_string):
         """Copies time elements from a RFC 1123 date and time string.
@@ -773,9 +1534,30 @@ class TimeElements(interface.DateTimeValues):
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        date_time_values = self._CopyDateTimeFromStringRFC1123(time_string)
+        date_time_tuple = self._CopyDateTimeTupleFromStringRFC(time_string, "1123")
 
-        self._CopyFromDateTimeValues(date_time_values)
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
+
+    def CopyFromStringRFC2822(self, time_string):
+        """Copies time elements from a RFC 2822 date and time string.
+
+        Besides the RFC 1123 format the obsolete 2-digit and 3-digit years and
+        time zones, comments and folding whitespace are supported, for example
+        "Fri, 21 Nov 97 09:55:06 (Central) CST".
+
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
+
+              Where weekday (DAY) and seconds (ss) are optional and day of
+              month (D) can consist of 1 or 2 digits.
+
+        Raises:
+          ValueError: if the time string is invalid or not supported.
+        """
+        date_time_tuple = self._CopyDateTimeTupleFromStringRFC(time_string, "2822")
+
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
 
     def CopyFromStringTuple(self, time_elements_tuple):
         """Copies time elements from string-based time elements tuple.
@@ -927,6 +1709,137 @@ class TimeElements(interface.DateTimeValues):
         """
         return self.NewFromDeltaAndDate(year, 0, 0)
 
+    def TryCopyFromDateTimeString(self, time_string):
+        """Tries to copy time elements from a date and time string.
+
+        Unlike CopyFromDateTimeString an invalid or unsupported time string is
+        signaled by the return value instead of an exception.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+
+              Where # are numeric digits ranging from 0 to 9 and the seconds
+              fraction can be either 3, 6 or 9 digits. The time of day, seconds
+              fraction and time zone offset are optional. The default time zone
+              is UTC.
+
+        Returns:
+          bool: True if the time elements were copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        if not self._IsDateTimeStringCandidate(time_string):
+            return False
+
+        date_time_tuple = self._GetDateTimeTupleFromString(time_string)
+        if not date_time_tuple:
+            return False
+
+        self._CopyFromDateTimeTuple(date_time_tuple)
+        return True
+
+    def TryCopyFromStringISO8601(self, time_string):
+        """Tries to copy time elements from an ISO 8601 date and time string.
+
+        Unlike CopyFromStringISO8601 an invalid or unsupported time string is
+        signaled by the return value instead of an exception. Strings that
+        cannot be an ISO 8601 date and time string are rejected without being
+        parsed.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              YYYY-MM-DDThh:mm:ss.######[+-]##:##
+
+        Returns:
+          bool: True if the time elements were copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        # All supported date notations start with a 4-digit year.
+        if not time_string or not time_string[:4].isdigit():
+            if not self._IsDateTimeStringCandidate(time_string):
+                return False
+
+        date_time_tuple = self._GetDateTimeTupleFromStringISO8601(time_string)
+        if not date_time_tuple:
+            return False
+
+        self._CopyFromDateTimeTupleISO8601(date_time_tuple)
+        return True
+
+    def TryCopyFromStringRFC822(self, time_string):
+        """Tries to copy time elements from a RFC 822 date and time string.
+
+        Unlike CopyFromStringRFC822 an invalid or unsupported time string is
+        signaled by the return value instead of an exception. Strings that do
+        not consist of 5 or 6 segments are rejected without being parsed.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YY hh:mm:ss ZONE
+
+        Returns:
+          bool: True if the time elements were copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        if not time_string or time_string.count(" ") not in (4, 5):
+            return False
+
+        date_time_tuple = self._GetDateTimeTupleFromStringRFC(time_string, "822")
+        if not date_time_tuple:
+            return False
+
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
+        return True
+
+    def TryCopyFromStringRFC1123(self, time_string):
+        """Tries to copy time elements from a RFC 1123 date and time string.
+
+        Unlike CopyFromStringRFC1123 an invalid or unsupported time string is
+        signaled by the return value instead of an exception. Strings that do
+        not consist of 5 or 6 segments are rejected without being parsed.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
+
+        Returns:
+          bool: True if the time elements were copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        if not time_string or time_string.count(" ") not in (4, 5):
+            return False
+
+        date_time_tuple = self._GetDateTimeTupleFromStringRFC(time_string, "1123")
+        if not date_time_tuple:
+            return False
+
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
+        return True
+
+    def TryCopyFromStringRFC2822(self, time_string):
+        """Tries to copy time elements from a RFC 2822 date and time string.
+
+        Unlike CopyFromStringRFC2822 an invalid or unsupported time string is
+        signaled by the return value instead of an exception.
+
+        Args:
+          time_string (str): date and time value formatted as:
+              DAY, D MONTH YYYY hh:mm:ss ZONE
+
+        Returns:
+          bool: True if the time elements were copied from the time string or
+              False if the time string is invalid or not supported.
+        """
+        if not time_string:
+            return False
+
+        date_time_tuple = self._GetDateTimeTupleFromStringRFC(time_string, "2822")
+        if not date_time_tuple:
+            return False
+
+        self._CopyFromDateTimeTupleRFC(date_time_tuple)
+        return True
+
 
 class TimeElementsWithFractionOfSecond(TimeElements):
     """Time elements with a fraction of second interface.
@@ -1000,25 +1913,27 @@ class TimeElementsWithFractionOfSecond(TimeElements):
 
         return self._normalized_timestamp
 
-    def _CopyFromDateTimeValues(self, date_time_values):
-        """Copies time elements from date and time values.
+    def _CopyFromDateTimeTuple(self, date_time_tuple):
+        """Copies time elements from a date and time tuple.
 
         Args:
-          date_time_values  (dict[str, int]): date and time values, such as year,
-              month, day of month, hours, minutes, seconds, nanoseconds, time zone
-              offset in minutes.
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes.
 
         Raises:
           ValueError: if no helper can be created for the current precision.
         """
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+        (
+            year,
+            month,
+            day_of_month,
+            hours,
+            minutes,
+            seconds,
+            nanoseconds,
+            time_zone_offset,
+        ) = date_time_tuple
 
         precision_helper = precisions.PrecisionHelperFactory.CreatePrecisionHelper(
             self._precision
@@ -0,0 +1,827 @@
+"""Time zones compiled from TZif files."""
+
+import bisect
+import calendar
+import datetime
+import math
+import os
+import re
+import struct
+import threading
+import zoneinfo
+
+from dfdatetime import definitions
+
+
+class TimeZone:
+    """Time zone.
+
+    The time zone is compiled into sorted lists of the transition times and
+    the UTC offsets that apply from each transition, in which the UTC offset
+    of a POSIX or local timestamp is looked up with a binary search. After the
+    last transition the rule of the POSIX TZ string applies, of which the
+    transitions are added per year on demand.
+
+    Attributes:
+      name (str): name of the time zone, such as "Europe/Amsterdam".
+    """
+
+    # Daylight saving time rule of a POSIX TZ string without a rule.
+    _DEFAULT_RULE = ("M3.2.0", "M11.1.0")
+
+    _EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+    _MAXIMUM_ORDINAL = datetime.date.max.toordinal()
+
+    # Last year of which transitions are added by the rule.
+    _MAXIMUM_YEAR = datetime.MAXYEAR - 1
+
+    _OFFSET_RE = re.compile(r"([+-])?(\d{1,3})(?::(\d{2}))?(?::(\d{2}))?")
+
+    _POSIX_TZ_STRING_RE = re.compile(
+        r"(?:[A-Za-z]{3,}|<[+\-0-9A-Za-z]{3,}>)(?P<std_offset>[+\-0-9:]+)"
+        r"(?:(?:[A-Za-z]{3,}|<[+\-0-9A-Za-z]{3,}>)(?P<dst_offset>[+\-0-9:]+)?"
+        r"(?:,(?P<start>[^,]+),(?P<end>[^,]+))?)?"
+    )
+
+    _RULE_DATE_RE = re.compile(
+        r"(?:M(?P<month>\d{1,2})\.(?P<week>[1-5])\.(?P<weekday>[0-6])|"
+        r"J(?P<julian_day>\d{1,3})|(?P<day>\d{1,3}))(?:/(?P<time>[+\-0-9:]+))?"
+    )
+
+    _TZIF_HEADER = struct.Struct(">4sc15x6I")
+
+    _TZIF_SIGNATURE = b"TZif"
+
+    def __init__(
+        self, name, transition_times, utc_offsets, initial_utc_offset, rule=None
+    ):
+        """Initializes a time zone.
+
+        Args:
+          name (str): name of the time zone, such as "Europe/Amsterdam".
+          transition_times (list[int]): POSIX timestamps in seconds of the
+              transitions, which should be sorted.
+          utc_offsets (list[int]): UTC offset in seconds that applies from each
+              transition.
+          initial_utc_offset (int): UTC offset in seconds that applies before the
+              first transition.
+          rule (Optional[tuple[int, int, tuple[object, ...], tuple[object, ...]]]):
+              UTC offset in seconds of standard time and daylight saving time
+              and the start and end dates of daylight saving time, that applies
+              after the last transition, or None if not set.
+        """
+        super().__init__()
+        self._horizon = math.inf
+        self._initial_utc_offset = initial_utc_offset
+        self._lock = threading.Lock()
+        self._rule = rule
+        self._rule_year = None
+        self._transitions = None
+        self.name = name
+
+        self._SetTransitions(transition_times, utc_offsets)
+
+        if rule:
+            # The transitions of the rule are added from the year of the last
+            # transition.
+            if transition_times:
+                self._rule_year = self._GetYear(transition_times[-1]) - 1
+            else:
+                self._rule_year = 1969
+
+            self._horizon = self._GetStartOfYear(self._rule_year + 1)
+
+    def _AddRuleTransitions(self, timestamp):
+        """Adds the transitions of the rule up to and including the next year.
+
+        Args:
+          timestamp (int): POSIX or local timestamp in seconds.
+        """
+        year = min(self._GetYear(timestamp) + 1, self._MAXIMUM_YEAR)
+
+        transition_times = list(self._transitions[0])
+        utc_offsets = list(self._transitions[1])
+
+        for rule_year in range(self._rule_year + 1, year + 1):
+            for transition_time, utc_offset in self._GetRuleTransitions(rule_year):
+                if not transition_times or transition_time > transition_times[-1]:
+                    transition_times.append(transition_time)
+                    utc_offsets.append(utc_offset)
+
+                # The start of daylight saving time can coincide with the end of
+                # that of the previous year, in which case the later transition
+                # determines the UTC offset.
+                elif transition_time == transition_times[-1]:
+                    utc_offsets[-1] = utc_offset
+
+        self._rule_year = year
+        self._SetTransitions(transition_times, utc_offsets)
+
+        if year >= self._MAXIMUM_YEAR:
+            self._horizon = math.inf
+        else:
+            self._horizon = self._GetStartOfYear(year + 1)
+
+    def _GetOffsetIntervalFromLocalTimestamp(self, local_timestamp, ambiguity_policy):
+        """Retrieves the UTC offset of a local timestamp and its interval.
+
+        Args:
+          local_timestamp (int): number of seconds since January 1, 1970
+              00:00:00 in local time.
+          ambiguity_policy (str): policy to resolve an ambiguous or nonexistent
+              local time, which should be one of the TIME_ZONE_AMBIGUITY_POLICIES
+              in definitions.
+
+        Returns:
+          tuple[int, int|float, int|float]: UTC offset in seconds, and the
+              inclusive lower and exclusive upper bound of the local timestamps
+              to which the UTC offset applies, where infinity represents no
+              bound.
+
+        Raises:
+          ValueError: if the local time is ambiguous or does not exist and
+              the ambiguity policy is to raise.
+        """
+        _, utc_offsets, local_start_times, local_end_times = self._GetTransitions(
+            local_timestamp
+        )
+
+        index = bisect.bisect_right(local_start_times, local_timestamp)
+        if index == 0:
+            upper_bound = local_start_times[0] if local_start_times else math.inf
+            return self._initial_utc_offset, -math.inf, upper_bound
+
+        index -= 1
+        utc_offset = utc_offsets[index]
+
+        if local_timestamp >= local_end_times[index]:
+            if index + 1 < len(local_start_times):
+                upper_bound = local_start_times[index + 1]
+            else:
+                upper_bound = math.inf
+
+            return utc_offset, local_end_times[index], upper_bound
+
+        # The local time is ambiguous, if the clock was set back, or does not
+        # exist, if the clock was set forward, by the transition.
+        if ambiguity_policy == definitions.TIME_ZONE_AMBIGUITY_RAISE:
+            raise ValueError(
+                f"Local time: {local_timestamp:d} is ambiguous or does not exist "
+                f"in time zone: {self.name:s}."
+            )
+
+        if index == 0:
+            previous_utc_offset = self._initial_utc_offset
+        else:
+            previous_utc_offset = utc_offsets[index - 1]
+
+        # The earliest time is that of the largest UTC offset.
+        if ambiguity_policy == definitions.TIME_ZONE_AMBIGUITY_EARLIEST:
+            utc_offset = max(utc_offset, previous_utc_offset)
+        else:
+            utc_offset = min(utc_offset, previous_utc_offset)
+
+        return utc_offset, local_start_times[index], local_end_times[index]
+
+    def _GetRuleTime(self, rule_date, year):
+        """Retrieves the time of a rule date in a specific year.
+
+        Args:
+          rule_date (tuple[object, ...]): rule date, which consists of the type
+              of the rule date, "M", "J" or "N", the month, week and day of week
+              or day of year, and the time of day in seconds.
+          year (int): year.
+
+        Returns:
+          int: number of seconds since January 1, 1970 00:00:00 in local time.
+        """
+        rule_date_type = rule_date[0]
+        time_of_day = rule_date[-1]
+
+        ordinal = datetime.date(year, 1, 1).toordinal()
+        if rule_date_type == "J":
+            # The Julian day ranges from 1 to 365 and does not count February 29.
+            day_of_year = rule_date[1] - 1
+            if day_of_year >= 59 and calendar.isleap(year):
+                day_of_year += 1
+
+            ordinal += day_of_year
+
+        elif rule_date_type == "N":
+            ordinal += rule_date[1]
+
+        else:
+            _, month, week, weekday, _ = rule_date
+
+            first_day_of_month = datetime.date(year, month, 1)
+            first_weekday = (first_day_of_month.weekday() + 1) % 7
+
+            # Week 5 represents the last week of the month.
+            day_of_month = 1 + ((weekday - first_weekday) % 7) + ((week - 1) * 7)
+            days_per_month = calendar.monthrange(year, month)[1]
+            while day_of_month > days_per_month:
+                day_of_month -= 7
+
+            ordinal = first_day_of_month.toordinal() + day_of_month - 1
+
+        return ((ordinal - self._EPOCH_ORDINAL) * definitions.SECONDS_PER_DAY) + (
+            time_of_day
+        )
+
+    def _GetRuleTransitions(self, year):
+        """Retrieves the transitions of the rule in a specific year.
+
+        Args:
+          year (int): year.
+
+        Returns:
+          list[tuple[int, int]]: POSIX timestamp in seconds of the transition and
+              the UTC offset in seconds that applies from the transition, sorted
+              by POSIX timestamp.
+        """
+        standard_utc_offset, daylight_utc_offset, start_date, end_date = self._rule
+
+        # The start of daylight saving time is in standard time and the end in
+        # daylight saving time.
+        start_time = self._GetRuleTime(start_date, year) - standard_utc_offset
+        end_time = self._GetRuleTime(end_date, year) - daylight_utc_offset
+
+        return sorted(
+            [(start_time, daylight_utc_offset), (end_time, standard_utc_offset)]
+        )
+
+    def _GetStartOfYear(self, year):
+        """Retrieves the start of a year, minus a day for the UTC offset.
+
+        Args:
+          year (int): year.
+
+        Returns:
+          int: number of seconds since January 1, 1970 00:00:00 of the day before
+              the start of the year.
+        """
+        ordinal = datetime.date(year, 1, 1).toordinal()
+        return (ordinal - self._EPOCH_ORDINAL - 1) * definitions.SECONDS_PER_DAY
+
+    def _GetTransitions(self, timestamp):
+        """Retrieves the transitions, adding those of the rule on demand.
+
+        Args:
+          timestamp (int): POSIX or local timestamp in seconds.
+
+        Returns:
+          tuple[list[int], list[int], list[int], list[int]]: POSIX timestamps of
+              the transitions, UTC offsets that apply from each transition, and
+              the first and last local timestamp, exclusive, that are ambiguous
+              or do not exist per transition.
+        """
+        if timestamp >= self._horizon:
+            with self._lock:
+                if timestamp >= self._horizon:
+                    self._AddRuleTransitions(timestamp)
+
+        return self._transitions
+
+    def _GetYear(self, timestamp):
+        """Retrieves the year of a timestamp.
+
+        Args:
+          timestamp (int): POSIX or local timestamp in seconds.
+
+        Returns:
+          int: year.
+        """
+        ordinal = self._EPOCH_ORDINAL + (timestamp // definitions.SECONDS_PER_DAY)
+        ordinal = min(max(ordinal, 1), self._MAXIMUM_ORDINAL)
+        return datetime.date.fromordinal(ordinal).year
+
+    @classmethod
+    def _ParseOffset(cls, offset_string):
+        """Parses an offset of a POSIX TZ string.
+
+        Args:
+          offset_string (str): offset formatted as: [+-]hh[:mm[:ss]]
+
+        Returns:
+          int: offset in seconds.
+
+        Raises:
+          ValueError: if the offset string is invalid.
+        """
+        match = cls._OFFSET_RE.fullmatch(offset_string or "")
+        if not match:
+            raise ValueError(f"Invalid offset: {offset_string!s}.")
+
+        sign, hours, minutes, seconds = match.groups()
+        offset = (int(hours, 10) * 3600) + (int(minutes or "0", 10) * 60)
+        offset += int(seconds or "0", 10)
+
+        return -offset if sign == "-" else offset
+
+    @classmethod
+    def _ParsePosixTimeZoneString(cls, tz_string):
+        """Parses a POSIX TZ string.
+
+        Args:
+          tz_string (str): POSIX TZ string, such as "CET-1CEST,M3.5.0,M10.5.0/3".
+
+        Returns:
+          tuple[int, int, tuple[object, ...], tuple[object, ...]]: UTC offset in
+              seconds of standard time and daylight saving time and the start and
+              end dates of daylight saving time, or None if the time zone does not
+              have daylight saving time.
+
+        Raises:
+          ValueError: if the POSIX TZ string is invalid.
+        """
+        match = cls._POSIX_TZ_STRING_RE.fullmatch(tz_string)
+        if not match:
+            raise ValueError(f"Invalid POSIX TZ string: {tz_string:s}.")
+
+        # The offset of a POSIX TZ string is the offset of UTC from local time,
+        # which is the negative UTC offset.
+        standard_utc_offset = -cls._ParseOffset(match.group("std_offset"))
+
+        if match.end("std_offset") == len(tz_string):
+            return None
+
+        daylight_utc_offset = standard_utc_offset + 3600
+        if match.group("dst_offset"):
+            daylight_utc_offset = -cls._ParseOffset(match.group("dst_offset"))
+
+        rule_dates = []
+        for rule_date_string in (
+            match.group("start") or cls._DEFAULT_RULE[0],
+            match.group("end") or cls._DEFAULT_RULE[1],
+        ):
+            rule_date_match = cls._RULE_DATE_RE.fullmatch(rule_date_string)
+            if not rule_date_match:
+                raise ValueError(f"Invalid POSIX TZ string: {tz_string:s}.")
+
+            time_of_day = 7200
+            if rule_date_match.group("time"):
+                time_of_day = cls._ParseOffset(rule_date_match.group("time"))
+
+            if rule_date_match.group("month"):
+                month = int(rule_date_match.group("month"), 10)
+                if month not in range(1, 13):
+                    raise ValueError(f"Invalid POSIX TZ string: {tz_string:s}.")
+
+                rule_dates.append(
+                    (
+                        "M",
+                        month,
+                        int(rule_date_match.group("week"), 10),
+                        int(rule_date_match.group("weekday"), 10),
+                        time_of_day,
+                    )
+                )
+
+            elif rule_date_match.group("julian_day"):
+                julian_day = int(rule_date_match.group("julian_day"), 10)
+                if julian_day not in range(1, 366):
+                    raise ValueError(f"Invalid POSIX TZ string: {tz_string:s}.")
+
+                rule_dates.append(("J", julian_day, time_of_day))
+
+            else:
+                day = int(rule_date_match.group("day"), 10)
+                if day not in range(0, 366):
+                    raise ValueError(f"Invalid POSIX TZ string: {tz_string:s}.")
+
+                rule_dates.append(("N", day, time_of_day))
+
+        return standard_utc_offset, daylight_utc_offset, rule_dates[0], rule_dates[1]
+
+    def _SetTransitions(self, transition_times, utc_offsets):
+        """Sets the transitions.
+
+        Args:
+          transition_times (list[int]): POSIX timestamps in seconds of the
+              transitions.
+          utc_offsets (list[int]): UTC offset in seconds that applies from each
+              transition.
+        """
+        local_start_times = []
+        local_end_times = []
+
+        previous_utc_offset = self._initial_utc_offset
+        for transition_time, utc_offset in zip(transition_times, utc_offsets):
+            local_start_times.append(
+                transition_time + min(previous_utc_offset, utc_offset)
+            )
+            local_end_times.append(
+                transition_time + max(previous_utc_offset, utc_offset)
+            )
+            previous_utc_offset = utc_offset
+
+        # The transitions are replaced at once, since they can be read by other
+        # threads.
+        self._transitions = (
+            transition_times,
+            utc_offsets,
+            local_start_times,
+            local_end_times,
+        )
+
+    def CopyLocalToPOSIXTimestamps(
+        self,
+        local_timestamps,
+        ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_EARLIEST,
+        units_per_second=1,
+    ):
+        """Copies local timestamps to POSIX timestamps in bulk.
+
+        The UTC offset is only looked up for a local timestamp that is outside
+        the interval between transitions of the previous local timestamp, hence
+        timestamps that are sorted, such as those of a log, are converted at
+        the cost of a comparison per timestamp.
+
+        Args:
+          local_timestamps (Iterable[int]): number of units since January 1, 1970
+              00:00:00 in local time.
+          ambiguity_policy (Optional[str]): policy to resolve an ambiguous or
+              nonexistent local time, which should be one of the
+              TIME_ZONE_AMBIGUITY_POLICIES in definitions.
+          units_per_second (Optional[int]): number of units per second.
+
+        Returns:
+          list[int]: number of units since January 1, 1970 00:00:00 UTC per local
+              timestamp.
+
+        Raises:
+          ValueError: if the ambiguity policy is not supported or a local time is
+              ambiguous or does not exist and the ambiguity policy is to raise.
+        """
+        if ambiguity_policy not in definitions.TIME_ZONE_AMBIGUITY_POLICIES:
+            raise ValueError(f"Unsupported ambiguity policy: {ambiguity_policy!s}.")
+
+        posix_timestamps = []
+
+        lower_bound = 0
+        upper_bound = 0
+        utc_offset = 0
+        for local_timestamp in local_timestamps:
+            if local_timestamp < lower_bound or local_timestamp >= upper_bound:
+                number_of_seconds = local_timestamp // units_per_second
+                utc_offset, lower_bound, upper_bound = (
+                    self._GetOffsetIntervalFromLocalTimestamp(
+                        number_of_seconds, ambiguity_policy
+                    )
+                )
+                utc_offset *= units_per_second
+                lower_bound *= units_per_second
+                upper_bound *= units_per_second
+
+            posix_timestamps.append(local_timestamp - utc_offset)
+
+        return posix_timestamps
+
+    def GetOffsetFromLocalTimestamp(
+        self,
+        local_timestamp,
+        ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_EARLIEST,
+    ):
+        """Retrieves the UTC offset of a local timestamp.
+
+        Args:
+          local_timestamp (int): number of seconds since January 1, 1970
+              00:00:00 in local time.
+          ambiguity_policy (Optional[str]): policy to resolve an ambiguous or
+              nonexistent local time, which should be one of the
+              TIME_ZONE_AMBIGUITY_POLICIES in definitions.
+
+        Returns:
+          int: UTC offset in seconds.
+
+        Raises:
+          ValueError: if the ambiguity policy is not supported or the local time
+              is ambiguous or does not exist and the ambiguity policy is to raise.
+        """
+        if ambiguity_policy not in definitions.TIME_ZONE_AMBIGUITY_POLICIES:
+            raise ValueError(f"Unsupported ambiguity policy: {ambiguity_policy!s}.")
+
+        utc_offset, _, _ = self._GetOffsetIntervalFromLocalTimestamp(
+            local_timestamp, ambiguity_policy
+        )
+        return utc_offset
+
+    def GetOffsetFromPOSIXTimestamp(self, posix_timestamp):
+        """Retrieves the UTC offset of a POSIX timestamp.
+
+        Args:
+          posix_timestamp (int): number of seconds since January 1, 1970
+              00:00:00 UTC.
+
+        Returns:
+          int: UTC offset in seconds.
+        """
+        transition_times, utc_offsets, _, _ = self._GetTransitions(posix_timestamp)
+
+        index = bisect.bisect_right(transition_times, posix_timestamp)
+        if index == 0:
+            return self._initial_utc_offset
+
+        return utc_offsets[index - 1]
+
+    @classmethod
+    def NewFromTZifData(cls, name, data):
+        """Creates a time zone from TZif data.
+
+        Also see:
+          https://www.rfc-editor.org/rfc/rfc8536
+
+        Args:
+          name (str): name of the time zone, such as "Europe/Amsterdam".
+          data (bytes): TZif data, such as the contents of a TZif file.
+
+        Returns:
+          TimeZone: time zone.
+
+        Raises:
+          ValueError: if the TZif data is invalid or not supported.
+        """
+        header_size = cls._TZIF_HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Truncated TZif data.")
+
+        (
+            signature,
+            format_version,
+            number_of_utc_indicators,
+            number_of_standard_indicators,
+            number_of_leap_seconds,
+            number_of_transitions,
+            number_of_types,
+            number_of_characters,
+        ) = cls._TZIF_HEADER.unpack_from(data, 0)
+
+        if signature != cls._TZIF_SIGNATURE:
+            raise ValueError("Unsupported TZif signature.")
+
+        data_offset = header_size
+        time_size = 4
+
+        # The data of version 2 and later follows that of version 1 and contains
+        # 64-bit transition times.
+        if format_version != b"\x00":
+            data_offset += (
+                (number_of_transitions * 5)
+                + (number_of_types * 6)
+                + number_of_characters
+                + (number_of_leap_seconds * 8)
+                + number_of_standard_indicators
+                + number_of_utc_indicators
+            )
+            if len(data) < data_offset + header_size:
+                raise ValueError("Truncated TZif data.")
+
+            (
+                signature,
+                _,
+                number_of_utc_indicators,
+                number_of_standard_indicators,
+                number_of_leap_seconds,
+                number_of_transitions,
+                number_of_types,
+                number_of_characters,
+            ) = cls._TZIF_HEADER.unpack_from(data, data_offset)
+
+            if signature != cls._TZIF_SIGNATURE:
+                raise ValueError("Unsupported TZif signature.")
+
+            data_offset += header_size
+            time_size = 8
+
+        if number_of_leap_seconds:
+            raise ValueError("Unsupported TZif data with leap seconds.")
+
+        if not number_of_types:
+            raise ValueError("Missing TZif local time types.")
+
+        data_size = (
+            (number_of_transitions * (time_size + 1))
+            + (number_of_types * 6)
+            + number_of_characters
+            + number_of_standard_indicators
+            + number_of_utc_indicators
+        )
+        if len(data) < data_offset + data_size:
+            raise ValueError("Truncated TZif data.")
+
+        time_format = "q" if time_size == 8 else "i"
+        transition_times = list(
+            struct.unpack_from(
+                f">{number_of_transitions:d}{time_format:s}", data, data_offset
+            )
+        )
+        data_offset += number_of_transitions * time_size
+
+        type_indexes = data[data_offset : data_offset + number_of_transitions]
+        data_offset += number_of_transitions
+
+        utc_offsets_per_type = [
+            utc_offset
+            for utc_offset, _, _ in struct.iter_unpack(
+                ">iBB", data[data_offset : data_offset + (number_of_types * 6)]
+            )
+        ]
+        data_offset += data_size - (number_of_transitions * (time_size + 1))
+
+        if any(type_index >= number_of_types for type_index in type_indexes):
+            raise ValueError("Invalid TZif local time type index.")
+
+        utc_offsets = [utc_offsets_per_type[type_index] for type_index in type_indexes]
+
+        # The footer of version 2 and later contains a POSIX TZ string between
+        # new lines, that applies after the last transition.
+        rule = None
+        if time_size == 8 and data[data_offset : data_offset + 1] == b"\n":
+            footer_end_offset = data.find(b"\n", data_offset + 1)
+            if footer_end_offset == -1:
+                raise ValueError("Invalid TZif footer.")
+
+            try:
+                tz_string = data[data_offset + 1 : footer_end_offset].decode("ascii")
+            except UnicodeDecodeError:
+                raise ValueError("Invalid TZif footer.")
+
+            if tz_string:
+                rule = cls._ParsePosixTimeZoneString(tz_string)
+
+        return cls(name, transition_times, utc_offsets, utc_offsets_per_type[0], rule)
+
+
+class TimeZones:
+    """Time zones compiled from the TZif files of the system.
+
+    The TZif file of a time zone is read and compiled once, after which the
+    time zone is cached. Besides the names of the TZif files, such as
+    "Europe/Amsterdam", time zones with a fixed UTC offset, such as "UTC+1" or
+    "UTC-05:30", are supported.
+    """
+
+    _FIXED_UTC_OFFSET_RE = re.compile(r"UTC([+-])(\d{1,2})(?::?(\d{2}))?")
+
+    _lock = threading.Lock()
+
+    _search_paths = tuple(zoneinfo.TZPATH)
+
+    _time_zones = {}
+
+    @classmethod
+    def _ReadTimeZone(cls, name):
+        """Reads a time zone.
+
+        Args:
+          name (str): name of the time zone, such as "Europe/Amsterdam" or
+              "UTC+1".
+
+        Returns:
+          TimeZone: time zone.
+
+        Raises:
+          ValueError: if the time zone is not supported.
+        """
+        match = cls._FIXED_UTC_OFFSET_RE.fullmatch(name)
+        if match:
+            sign, hours, minutes = match.groups()
+            hours = int(hours, 10)
+            minutes = int(minutes or "0", 10)
+            if hours not in range(0, 25) or minutes not in range(0, 60):
+                raise ValueError(f"Unsupported time zone: {name:s}.")
+
+            utc_offset = (hours * 3600) + (minutes * 60)
+            if sign == "-":
+                utc_offset = -utc_offset
+
+            return TimeZone(name, [], [], utc_offset)
+
+        # The name is relative to the search paths.
+        normalized_name = os.path.normpath(name)
+        if (
+            not name
+            or "\x00" in name
+            or os.path.isabs(normalized_name)
+            or normalized_name.split(os.sep)[0] in (os.curdir, os.pardir)
+        ):
+            raise ValueError(f"Unsupported time zone: {name!s}.")
+
+        for search_path in cls._search_paths:
+            path = os.path.join(search_path, normalized_name)
+            if os.path.isfile(path):
+                with open(path, "rb") as file_object:
+                    data = file_object.read()
+
+                return TimeZone.NewFromTZifData(name, data)
+
+        raise ValueError(f"Unsupported time zone: {name:s}.")
+
+    @classmethod
+    def _ResetAfterFork(cls):
+        """Resets the lock in a child process after a fork."""
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def ApplyTimeZone(
+        cls,
+        date_time_values,
+        ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_EARLIEST,
+        time_zone_name=None,
+    ):
+        """Applies a time zone to date and time values in local time.
+
+        The time zone offset of the date and time values is set to the UTC offset
+        of the time zone at their local time, rounded to minutes, after which
+        the date and time values are no longer in local time. Date and time values
+        that are not in local time or of which the time zone offset is set are
+        not changed.
+
+        Args:
+          date_time_values (DateTimeValues): date and time values.
+          ambiguity_policy (Optional[str]): policy to resolve an ambiguous or
+              nonexistent local time, which should be one of the
+              TIME_ZONE_AMBIGUITY_POLICIES in definitions.
+          time_zone_name (Optional[str]): name of the time zone, such as
+              "Europe/Amsterdam", where None represents the time zone hint of
+              the date and time values.
+
+        Raises:
+          ValueError: if the time zone is missing or not supported, the ambiguity
+              policy is not supported or the local time is ambiguous or does not
+              exist and the ambiguity policy is to raise.
+        """
+        if (
+            not date_time_values.is_local_time
+            or date_time_values.time_zone_offset is not None
+        ):
+            return
+
+        time_zone_name = time_zone_name or date_time_values.time_zone_hint
+        if not time_zone_name:
+            raise ValueError("Missing time zone.")
+
+        time_zone = cls.GetTimeZone(time_zone_name)
+
+        normalized_timestamp = (
+            date_time_values._GetNormalizedTimestamp()  # pylint: disable=protected-access
+        )
+        if normalized_timestamp is None:
+            return
+
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(
+            math.floor(normalized_timestamp), ambiguity_policy=ambiguity_policy
+        )
+
+        date_time_values.time_zone_offset = (utc_offset + 30) // 60
+        date_time_values.is_local_time = False
+
+    @classmethod
+    def ClearCache(cls):
+        """Removes all time zones from the cache."""
+        with cls._lock:
+            cls._time_zones = {}
+
+    @classmethod
+    def GetTimeZone(cls, name):
+        """Retrieves a time zone.
+
+        Args:
+          name (str): name of the time zone, such as "Europe/Amsterdam" or
+              "UTC+1".
+
+        Returns:
+          TimeZone: time zone.
+
+        Raises:
+          ValueError: if the time zone is not supported.
+        """
+        time_zone = cls._time_zones.get(name)
+        if time_zone is None:
+            time_zone = cls._ReadTimeZone(name)
+
+            with cls._lock:
+                time_zone = cls._time_zones.setdefault(name, time_zone)
+
+        return time_zone
+
+    @classmethod
+    def SetSearchPaths(cls, search_paths):
+        """Sets the paths of the directories that contain the TZif files.
+
+        The cache is cleared, since the time zones can differ per path.
+
+        Args:
+          search_paths (Iterable[str]): paths of the directories that contain the
+              TZif files, such as "/usr/share/zoneinfo", in order of preference.
+        """
+        with cls._lock:
+            cls._search_paths = tuple(search_paths)
+            cls._time_zones = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=TimeZones._ResetAfterFork  # pylint: disable=protected-access
+    )
@@ -0,0 +1,400 @@
+"""Extractors of timestamps embedded in free text, such as log lines."""
+
+import re
+
+from dfdatetime import strptime_parser
+from dfdatetime import time_elements
+
+
+class TimestampExtractor:
+    """Extractor of timestamps embedded in free text.
+
+    The grammars of the supported formats are combined into a single regular
+    expression, hence the text is scanned once regardless of the number of
+    formats. Every candidate timestamp found by the scan is validated by the
+    non-raising parser of the corresponding format and candidates that are not
+    valid, such as "2010-13-45", are ignored. Time elements are only created
+    for the candidates that are valid.
+
+    Supported formats:
+    * date and time strings formatted as: YYYY-MM-DD hh:mm:ss.######[+-]##:##
+    * ISO 8601 date and time strings in extended format, such as:
+          YYYY-MM-DDThh:mm:ss.######[+-]##:##
+    * RFC 822, RFC 1123 and RFC 2822 date and time strings, where a weekday
+          must match the date
+    * strptime-style formats
+
+    If every format contains a ":", such as the one of a time of day, the text
+    is first scanned for consecutive lines that contain a ":" and the combined
+    expression is only matched in these lines, hence a timestamp that spans
+    lines might not be extracted.
+
+    Attributes:
+      format_names (list[str]): names of the formats in order of matching, where
+          "date_time" represents date and time strings and ISO 8601, "rfc"
+          represents RFC 822, RFC 1123 and RFC 2822 and other names are
+          strptime-style format strings.
+    """
+
+    DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+    # strptime-style formats that do not consist of digits only, since these
+    # would match arbitrary numbers in free text.
+    DEFAULT_STRPTIME_FORMATS = [
+        "%d/%b/%Y:%H:%M:%S %z",
+        "%Y/%m/%d %H:%M:%S",
+        "%a %b %d %H:%M:%S %Y",
+    ]
+
+    _DATE_TIME_EXPRESSION = (
+        r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+        r"[T ][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:[.,][0-9]{1,9})?)?"
+        r"(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?"
+    )
+
+    # Day of week per RFC weekday, where 0 represents Monday and 6 Sunday.
+    _DAY_OF_WEEK_PER_WEEKDAY = {
+        "Mon": 0,
+        "Tue": 1,
+        "Wed": 2,
+        "Thu": 3,
+        "Fri": 4,
+        "Sat": 5,
+        "Sun": 6,
+    }
+
+    # Consecutive lines that do not contain a ":".
+    _LINES_WITHOUT_COLON_RE = re.compile(r"(?:[^:\n]*\n)*")
+
+    # End of line followed by a line that does not contain a ":".
+    _LINE_WITHOUT_COLON_START_RE = re.compile(r"\n(?=[^:\n]*\n)")
+
+    _RFC_EXPRESSION = (
+        r"(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), )?"
+        r"[0-9]{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) "
+        r"[0-9]{2,4} [0-9]{2}:[0-9]{2}(?::[0-9]{2})? "
+        r"(?:UT|GMT|[ECMP][SD]T|[A-IK-Z]|[+-][0-9]{4})"
+    )
+
+    def __init__(self, strptime_formats=None):
+        """Initializes an extractor.
+
+        Args:
+          strptime_formats (Optional[list[str]]): strptime-style format strings
+              to match after the other formats, where None represents
+              DEFAULT_STRPTIME_FORMATS.
+
+        Raises:
+          ValueError: if a strptime-style format string is not supported.
+        """
+        if strptime_formats is None:
+            strptime_formats = self.DEFAULT_STRPTIME_FORMATS
+
+        grammars = [
+            (
+                "date_time",
+                self._DATE_TIME_EXPRESSION,
+                self._GetDateTimeTupleFromString,
+                self._GetTimeElementsFromTupleISO8601,
+            ),
+            (
+                "rfc",
+                self._RFC_EXPRESSION,
+                self._GetDateTimeTupleFromStringRFC,
+                self._GetTimeElementsFromTupleRFC,
+            ),
+        ]
+
+        has_colon = True
+
+        # pylint: disable=protected-access
+        for format_string in strptime_formats:
+            parser = strptime_parser.StrptimeParserFactory.GetParser(format_string)
+            grammars.append(
+                (
+                    format_string,
+                    parser.expression,
+                    parser.TryParseTuple,
+                    parser._GetTimeElementsFromTuple,
+                )
+            )
+
+            if ":" not in format_string and "%T" not in format_string:
+                has_colon = False
+
+        expression_parts = []
+        format_index_per_group = {}
+        parse_functions_per_group = {}
+        for format_index, (_, expression, *parse_functions) in enumerate(grammars):
+            group_name = f"g{format_index:d}"
+            expression_parts.append(f"(?P<{group_name:s}>{expression:s})")
+            format_index_per_group[group_name] = format_index
+            parse_functions_per_group[group_name] = parse_functions
+
+        expression = "|".join(expression_parts)
+
+        super().__init__()
+        self._expression = re.compile(
+            f"(?<![0-9A-Za-z])(?:{expression:s})(?![0-9A-Za-z])"
+        )
+        self._format_index_per_group = format_index_per_group
+        self._parse_functions_per_group = parse_functions_per_group
+        self._skip_lines_without_colon = has_colon
+        # Time elements of which the parse methods are used to retrieve date and
+        # time tuples, these methods do not change the time elements.
+        self._time_elements = time_elements.TimeElementsInNanoseconds()
+
+        self.format_names = [format_name for format_name, *_ in grammars]
+
+    def _ExtractFromText(self, text, offset):
+        """Extracts timestamps from text.
+
+        Args:
+          text (str): text.
+          offset (int): offset of the text, which is added to the start and end
+              offsets of the timestamps.
+
+        Yields:
+          tuple[int, int, TimeElements]: start offset, end offset and time
+              elements of a timestamp.
+        """
+        for match, _, date_time_values in self._ParseMatches(text):
+            yield offset + match.start(), offset + match.end(), date_time_values
+
+    def _GetDateTimeTupleFromString(self, time_string):
+        """Retrieves a date and time tuple from a date and time string.
+
+        Args:
+          time_string (str): date and time string formatted as:
+              YYYY-MM-DD hh:mm:ss.######[+-]##:## or
+              YYYY-MM-DDThh:mm:ss.######[+-]##:##
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes
+              or None if the time string is invalid or not supported.
+        """
+        # pylint: disable=protected-access
+
+        # Only ISO 8601 date and time strings use "T" as the date and time
+        # separator.
+        if time_string[10] == "T":
+            return self._time_elements._GetDateTimeTupleFromStringISO8601(time_string)
+
+        return self._time_elements._GetDateTimeTupleFromString(time_string)
+
+    def _GetDateTimeTupleFromStringRFC(self, time_string):
+        """Retrieves a date and time tuple from a RFC date and time string.
+
+        Unlike the RFC parsers of time elements, a weekday that does not match
+        the date, such as "Mon, 12 Aug 2010", is considered invalid, since such a
+        candidate is unlikely to be a timestamp.
+
+        Args:
+          time_string (str): RFC 822, RFC 1123 or RFC 2822 date and time string
+              formatted as: DAY, D MONTH YYYY hh:mm:ss ZONE
+
+        Returns:
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes
+              or None if the time string is invalid or not supported.
+        """
+        day_of_week = None
+        if time_string[3] == ",":
+            day_of_week = self._DAY_OF_WEEK_PER_WEEKDAY[time_string[:3]]
+
+        # pylint: disable=protected-access
+        for rfc in ("1123", "822", "2822"):
+            date_time_tuple = self._time_elements._GetDateTimeTupleFromStringRFC(
+                time_string, rfc
+            )
+            # A 2-digit year is interpreted differently per RFC, hence the next
+            # RFC is tried if the weekday does not match the date.
+            if date_time_tuple and (
+                day_of_week is None
+                or self._GetDayOfWeek(*date_time_tuple[:3]) == day_of_week
+            ):
+                return date_time_tuple
+
+        return None
+
+    def _GetDayOfWeek(self, year, month, day_of_month):
+        """Determines the day of week.
+
+        Args:
+          year (int): year.
+          month (int): month, where 1 represents January.
+          day_of_month (int): day of month.
+
+        Returns:
+          int: day of week, where 0 represents Monday and 6 Sunday.
+        """
+        # Shift the start of the year to March so that the leap day is the last
+        # day of the year.
+        if month < 3:
+            year -= 1
+            month += 12
+
+        number_of_days = (
+            year * 365
+            + year // 4
+            - year // 100
+            + year // 400
+            + (153 * (month - 3) + 2) // 5
+            + day_of_month
+        )
+        # 0000-03-01 in the proleptic Gregorian calendar is a Wednesday.
+        return (number_of_days + 1) % 7
+
+    def _GetMatches(self, text):
+        """Retrieves the matches of the combined expression.
+
+        Lines without a ":" are skipped if every format contains a ":". Scanning
+        for such lines is considerably cheaper than scanning for the combined
+        expression, which is matched in the remaining consecutive lines at once.
+
+        Args:
+          text (str): text.
+
+        Yields:
+          re.Match: match of the combined expression.
+        """
+        if not self._skip_lines_without_colon:
+            yield from self._expression.finditer(text)
+            return
+
+        text_length = len(text)
+
+        position = 0
+        while position < text_length:
+            match = self._LINES_WITHOUT_COLON_RE.match(text, position)
+            position = match.end()
+
+            match = self._LINE_WITHOUT_COLON_START_RE.search(text, position)
+            if match:
+                end_offset = match.end()
+            else:
+                end_offset = text_length
+
+            yield from self._expression.finditer(text, position, end_offset)
+
+            position = end_offset
+
+    def _GetTimeElementsFromTupleISO8601(self, date_time_tuple):
+        """Retrieves time elements from an ISO 8601 date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes, where the hours, minutes, seconds and
+              nanoseconds can be None.
+
+        Returns:
+          TimeElementsInNanoseconds: time elements.
+        """
+        # pylint: disable=protected-access
+        date_time_values = time_elements.TimeElementsInNanoseconds()
+        date_time_values._CopyFromDateTimeTupleISO8601(date_time_tuple)
+        return date_time_values
+
+    def _GetTimeElementsFromTupleRFC(self, date_time_tuple):
+        """Retrieves time elements from a RFC date and time tuple.
+
+        Args:
+          date_time_tuple (tuple[int, int, int, int, int, int, int, int]): year,
+              month, day of month, hours, minutes, seconds, nanoseconds and time
+              zone offset in minutes, where the seconds and nanoseconds can be
+              None.
+
+        Returns:
+          TimeElementsInNanoseconds: time elements.
+        """
+        # pylint: disable=protected-access
+        date_time_values = time_elements.TimeElementsInNanoseconds()
+        date_time_values._CopyFromDateTimeTupleRFC(date_time_tuple)
+        return date_time_values
+
+    def _ParseMatches(self, text):
+        """Parses the timestamps matched in text.
+
+        Args:
+          text (str): text.
+
+        Yields:
+          tuple[re.Match, int, TimeElements]: match, index of the format in
+              format_names and time elements of a timestamp.
+        """
+        format_index_per_group = self._format_index_per_group
+        parse_functions_per_group = self._parse_functions_per_group
+
+        for match in self._GetMatches(text):
+            group_name = match.lastgroup
+            get_tuple_function, get_time_elements_function = parse_functions_per_group[
+                group_name
+            ]
+
+            date_time_tuple = get_tuple_function(match.group(0))
+            if date_time_tuple:
+                yield (
+                    match,
+                    format_index_per_group[group_name],
+                    get_time_elements_function(date_time_tuple),
+                )
+
+    def ExtractFromFileObject(self, file_object, chunk_size=None):
+        """Extracts timestamps from a text file-like object.
+
+        The file-like object is read in chunks that are split at the last end of
+        line character, hence a timestamp cannot span chunks.
+
+        Args:
+          file_object (file): text file-like object.
+          chunk_size (Optional[int]): number of characters to read at a time,
+              where None represents DEFAULT_CHUNK_SIZE.
+
+        Yields:
+          tuple[int, int, TimeElements]: start offset, end offset and time
+              elements of a timestamp, where the offsets are relative to the
+              start of the file-like object, in characters.
+
+        Raises:
+          ValueError: if the chunk size is out of bounds.
+        """
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_CHUNK_SIZE
+
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size value: {chunk_size:d} out of bounds.")
+
+        offset = 0
+        remainder = ""
+
+        text = file_object.read(chunk_size)
+        while text:
+            text = "".join([remainder, text])
+
+            end_of_line_offset = text.rfind("\n") + 1
+            if end_of_line_offset:
+                yield from self._ExtractFromText(text[:end_of_line_offset], offset)
+
+                offset += end_of_line_offset
+                remainder = text[end_of_line_offset:]
+            else:
+                remainder = text
+
+            text = file_object.read(chunk_size)
+
+        if remainder:
+            yield from self._ExtractFromText(remainder, offset)
+
+    def ExtractFromString(self, string):
+        """Extracts timestamps from a string, such as a log line.
+
+        Args:
+          string (str): string.
+
+        Yields:
+          tuple[int, int, TimeElements]: start offset, end offset and time
+              elements of a timestamp.
+        """
+        yield from self._ExtractFromText(string, 0)
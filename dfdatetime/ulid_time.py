@@ -0,0 +1,179 @@
+"""ULID timestamp implementation."""
+
+import array
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import linear_time
+from dfdatetime import posix_time
+
+
+class ULIDTime(linear_time.LinearTime):
+    """ULID timestamp.
+
+    The Universally Unique Lexicographically Sortable Identifier (ULID) is
+    a 16-byte value of which the first 6 bytes contain an unsigned 48-bit
+    big-endian integer with the number of milliseconds since 1970-01-01
+    00:00:00 (also known as the POSIX epoch). The ULID string consists of 26
+    case-insensitive characters of Crockford's Base32, of which the first 10
+    characters contain the timestamp.
+
+    Also see:
+      https://github.com/ulid/spec
+
+    Attributes:
+      is_local_time (bool): True if the date and time value is in local time.
+    """
+
+    # Table to translate the characters of Crockford's Base32 into the digits
+    # of int() with base 32, where the letters that are not in the alphabet
+    # are translated into a character that is not a digit.
+    _BASE32_TRANSLATION_TABLE = str.maketrans(
+        "0123456789ABCDEFGHJKMNPQRSTVWXYZabcdefghjkmnpqrstvwxyzILOUilou",
+        "0123456789abcdefghijklmnopqrstuvabcdefghijklmnopqrstuv!!!!!!!!",
+    )
+
+    _DEFAULT_PRECISION = definitions.PRECISION_1_MILLISECOND
+
+    _EPOCH = posix_time.PosixTimeEpoch()
+
+    _MAXIMUM_TIMESTAMP = (1 << 48) - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    _RECORD_STRUCT = struct.Struct(">HI10x")
+
+    _UNITS_PER_SECOND = definitions.MILLISECONDS_PER_SECOND
+
+    @classmethod
+    def DecodeBuffer(cls, buffer):
+        """Decodes the timestamps of concatenated ULIDs in bulk.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte ULIDs.
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per ULID and validity mask, where 1 represents
+              a valid ULID, which is every ULID in the buffer.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+        if buffer_size % cls._RECORD_STRUCT.size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{cls._RECORD_STRUCT.size:d}."
+            )
+
+        timestamps = array.array(
+            "q",
+            [
+                (upper_16bit << 32) | lower_32bit
+                for upper_16bit, lower_32bit in cls._RECORD_STRUCT.iter_unpack(view)
+            ],
+        )
+        return timestamps, bytearray(b"\x01" * len(timestamps))
+
+    @classmethod
+    def DecodeStrings(cls, ulid_strings):
+        """Decodes the timestamps of ULID strings in bulk.
+
+        Args:
+          ulid_strings (Sequence[str]): ULID strings of 26 case-insensitive
+              characters of Crockford's Base32.
+
+        Returns:
+          tuple[array.array, bytearray]: number of milliseconds since January 1,
+              1970 00:00:00 per ULID string, where invalid ULID strings are
+              represented by 0, and validity mask, where 1 represents a valid and
+              0 an invalid ULID string.
+        """
+        number_of_ulids = len(ulid_strings)
+        translated_string = "".join(ulid_strings).translate(
+            cls._BASE32_TRANSLATION_TABLE
+        )
+
+        # Strings that all are valid are converted in a single pass. Note that
+        # the first character of a ULID string is at most "7" since a ULID is
+        # 128-bit, and that isascii() and isalnum() are checked since int()
+        # also accepts non-ASCII digits, signs, underscores and whitespace.
+        if (
+            set(map(len, ulid_strings)) <= {26}
+            and translated_string.isascii()
+            and translated_string.isalnum()
+            and max(translated_string[::26], default="0") <= "7"
+        ):
+            timestamps = array.array(
+                "q",
+                [
+                    int(translated_string[index : index + 10], 32)
+                    for index in range(0, 26 * number_of_ulids, 26)
+                ],
+            )
+            return timestamps, bytearray(b"\x01" * number_of_ulids)
+
+        timestamps = array.array("q")
+        validity_mask = bytearray()
+
+        for ulid_string in ulid_strings:
+            translated_string = ulid_string.translate(cls._BASE32_TRANSLATION_TABLE)
+
+            if (
+                len(translated_string) == 26
+                and translated_string.isascii()
+                and translated_string.isalnum()
+                and translated_string[0] <= "7"
+            ):
+                timestamps.append(int(translated_string[:10], 32))
+                validity_mask.append(1)
+            else:
+                timestamps.append(0)
+                validity_mask.append(0)
+
+        return timestamps, validity_mask
+
+    @classmethod
+    def NewFromBuffer(cls, buffer, precision=None):
+        """Creates ULID timestamps from concatenated ULIDs.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte ULIDs.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[ULIDTime]: ULID timestamps.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        timestamps, _ = cls.DecodeBuffer(buffer)
+        return [
+            cls(precision=precision, timestamp=timestamp) for timestamp in timestamps
+        ]
+
+    @classmethod
+    def NewFromStrings(cls, ulid_strings, precision=None):
+        """Creates ULID timestamps from ULID strings.
+
+        Args:
+          ulid_strings (Sequence[str]): ULID strings of 26 case-insensitive
+              characters of Crockford's Base32.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[ULIDTime]: ULID timestamps, where invalid ULID strings are
+              represented by None.
+        """
+        timestamps, validity_mask = cls.DecodeStrings(ulid_strings)
+        return [
+            cls(precision=precision, timestamp=timestamp) if is_valid else None
+            for timestamp, is_valid in zip(timestamps, validity_mask)
+        ]
+
+
+factory.Factory.RegisterDateTimeValues(ULIDTime)
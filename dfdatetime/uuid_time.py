@@ -1,10 +1,13 @@
 """UUID version 1 time implementation."""
 
-import decimal
+import array
+import struct
 
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
+from dfdatetime import linear_time
+from dfdatetime import posix_time
 
 
 class UUIDTimeEpoch(interface.DateTimeEpoch):
@@ -15,11 +18,12 @@ class UUIDTimeEpoch(interface.DateTimeEpoch):
         super().__init__(1582, 10, 15)
 
 
-class UUIDTime(interface.DateTimeValues):
+class UUIDTime(linear_time.LinearTime):
     """UUID version 1 timestamp.
 
     The UUID version 1 timestamp is an unsigned 60-bit value that contains
     the number of 100th nano seconds intervals since 1582-10-15 00:00:00.
+    UUID version 6 contains the same timestamp with its bits reordered.
 
     Also see:
       https://en.wikipedia.org/wiki/Universally_unique_identifier
@@ -28,11 +32,29 @@ class UUIDTime(interface.DateTimeValues):
       is_local_time (bool): True if the date and time value is in local time.
     """
 
+    _DEFAULT_PRECISION = definitions.PRECISION_100_NANOSECONDS
+
     _EPOCH = UUIDTimeEpoch()
 
+    _MAXIMUM_TIMESTAMP = (1 << 60) - 1
+    _MINIMUM_TIMESTAMP = 0
+
+    _MINIMUM_YEAR = 1582
+
+    # Fields of an UUID up to the clock sequence, in big-endian byte order:
+    # time low, time mid, time high and version, clock sequence high and
+    # variant.
+    _RECORD_STRUCT = struct.Struct(">IHHB7x")
+
     # The difference between October 15, 1582 and January 1, 1970 in seconds.
     _UUID_TO_POSIX_BASE = 12219292800
 
+    _POSIX_BASE = _UUID_TO_POSIX_BASE
+
+    _UNITS_PER_SECOND = 10000000
+
+    _UNSUPPORTED_YEAR_ERROR = "Year value not supported."
+
     def __init__(self, precision=None, time_zone_offset=None, timestamp=None):
         """Initializes an UUID version 1 timestamp.
 
@@ -50,121 +72,317 @@ class UUIDTime(interface.DateTimeValues):
             raise ValueError("Invalid UUID version 1 timestamp.")
 
         super().__init__(
-            precision=precision or definitions.PRECISION_100_NANOSECONDS,
-            time_zone_offset=time_zone_offset,
+            precision=precision, time_zone_offset=time_zone_offset, timestamp=timestamp
         )
-        self._timestamp = timestamp
 
-    @property
-    def timestamp(self):
-        """int: UUID timestamp or None if not set."""
-        return self._timestamp
+    @classmethod
+    def _DecodeRecords(cls, buffer):
+        """Decodes the timestamps of concatenated UUIDs.
 
-    def _GetNormalizedTimestamp(self):
-        """Retrieves the normalized timestamp.
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte UUIDs in
+              big-endian byte order.
 
-        Returns:
-          decimal.Decimal: normalized timestamp, which contains the number of
-              seconds since January 1, 1970 00:00:00 and a fraction of second
-              used for increased precision, or None if the normalized timestamp
-              cannot be determined.
+        Yields:
+          tuple[int, int]: version of the UUID, where 0 represents an UUID that
+              is not of the RFC 4122 variant, and timestamp of the UUID, which
+              is the UUID version 1 timestamp for version 1 and 6, the number of
+              milliseconds since January 1, 1970 00:00:00 for version 7 and None
+              for other versions.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
         """
-        if self._normalized_timestamp is None:
-            if (
-                self._timestamp is not None
-                and self._timestamp >= 0
-                and self._timestamp <= self._UINT60_MAX
-            ):
-                self._normalized_timestamp = (
-                    decimal.Decimal(self._timestamp) / self._100_NANOSECONDS_PER_SECOND
+        view = memoryview(buffer).cast("B")
+        buffer_size = len(view)
+        if buffer_size % cls._RECORD_STRUCT.size:
+            raise ValueError(
+                f"Unsupported buffer size: {buffer_size:d} not a multiple of: "
+                f"{cls._RECORD_STRUCT.size:d}."
+            )
+
+        for (
+            time_low,
+            time_mid,
+            time_high_and_version,
+            clock_sequence_high_and_variant,
+        ) in cls._RECORD_STRUCT.iter_unpack(view):
+            if clock_sequence_high_and_variant & 0xC0 != 0x80:
+                yield 0, None
+                continue
+
+            version = time_high_and_version >> 12
+            if version == 1:
+                timestamp = (
+                    ((time_high_and_version & 0x0FFF) << 48)
+                    | (time_mid << 32)
+                    | time_low
+                )
+            elif version == 6:
+                timestamp = (
+                    (time_low << 28)
+                    | (time_mid << 12)
+                    | (time_high_and_version & 0x0FFF)
                 )
-                self._normalized_timestamp -= self._UUID_TO_POSIX_BASE
+            elif version == 7:
+                timestamp = (time_low << 16) | time_mid
+            else:
+                timestamp = None
+
+            yield version, timestamp
+
+    @classmethod
+    def _GetBufferFromUUIDStrings(cls, uuid_strings):
+        """Retrieves concatenated UUIDs from UUID strings.
+
+        Args:
+          uuid_strings (Sequence[str]): UUID strings formatted as:
+              "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", with or without hyphens or
+              enclosing braces, where x is a case-insensitive hexadecimal digit.
 
-                if self._time_zone_offset:
-                    self._normalized_timestamp -= self._time_zone_offset * 60
+        Returns:
+          bytes: concatenated 16-byte UUIDs in big-endian byte order, where an
+              invalid UUID string is represented by the nil UUID.
+        """
+        number_of_uuids = len(uuid_strings)
+        joined_string = "".join(uuid_strings)
 
-        return self._normalized_timestamp
+        # Strings that all are in the hyphenated form are converted in a single
+        # pass.
+        if (
+            set(map(len, uuid_strings)) <= {36}
+            and joined_string[8::36].count("-") == number_of_uuids
+            and joined_string[13::36].count("-") == number_of_uuids
+            and joined_string[18::36].count("-") == number_of_uuids
+            and joined_string[23::36].count("-") == number_of_uuids
+        ):
+            hexadecimal_string = joined_string.replace("-", "")
+            if len(hexadecimal_string) == 32 * number_of_uuids:
+                try:
+                    buffer = bytes.fromhex(hexadecimal_string)
+                except ValueError:
+                    buffer = None
 
-    def CopyFromDateTimeString(self, time_string):
-        """Copies an UUID timestamp from a date and time string.
+                if buffer is not None and len(buffer) == 16 * number_of_uuids:
+                    return buffer
+
+        nil_uuid = bytes(16)
+
+        uuids = []
+        for uuid_string in uuid_strings:
+            uuid_bytes = cls._GetUUIDBytesFromString(uuid_string)
+            uuids.append(uuid_bytes or nil_uuid)
+
+        return b"".join(uuids)
+
+    @classmethod
+    def _GetUUIDBytesFromString(cls, uuid_string):
+        """Retrieves an UUID from an UUID string.
 
         Args:
-          time_string (str): date and time value formatted as:
-              YYYY-MM-DD hh:mm:ss.######[+-]##:##
+          uuid_string (str): UUID string formatted as:
+              "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", with or without hyphens or
+              enclosing braces, where x is a case-insensitive hexadecimal digit.
+
+        Returns:
+          bytes: 16-byte UUID in big-endian byte order or None if the UUID string
+              is invalid.
+        """
+        if len(uuid_string) == 38 and uuid_string[0] == "{" and uuid_string[-1] == "}":
+            uuid_string = uuid_string[1:-1]
+
+        if len(uuid_string) == 36 and (
+            uuid_string[8]
+            == uuid_string[13]
+            == uuid_string[18]
+            == uuid_string[23]
+            == "-"
+        ):
+            uuid_string = uuid_string.replace("-", "")
+
+        if len(uuid_string) != 32:
+            return None
 
-              Where # are numeric digits ranging from 0 to 9 and the seconds
-              fraction can be either 3, 6 or 9 digits. The time of day, seconds
-              fraction and time zone offset are optional. The default time zone
-              is UTC.
+        try:
+            uuid_bytes = bytes.fromhex(uuid_string)
+        except ValueError:
+            return None
+
+        # Note that bytes.fromhex() ignores whitespace.
+        if len(uuid_bytes) != 16:
+            return None
+
+        return uuid_bytes
+
+    @classmethod
+    def _NewFromBuffer(cls, buffer, precision):
+        """Creates date time values from concatenated UUIDs.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte UUIDs in
+              big-endian byte order.
+          precision (str): precision of the date and time values, which should be
+              one of the PRECISION_VALUES in definitions, or None for the
+              precision of the UUID version.
+
+        Returns:
+          list[DateTimeValues]: date time values, where UUIDs without a timestamp
+              are represented by None.
 
         Raises:
-          ValueError: if the time string is invalid or not supported.
+          ValueError: if the size of the buffer is not a multiple of 16.
         """
-        date_time_values = self._CopyDateTimeFromString(time_string)
+        date_time_values = []
+        for version, timestamp in cls._DecodeRecords(buffer):
+            if version in (1, 6):
+                date_time_value = cls(precision=precision, timestamp=timestamp)
+            elif version == 7:
+                date_time_value = posix_time.PosixTimeInMilliseconds(
+                    precision=precision, timestamp=timestamp
+                )
+            else:
+                date_time_value = None
+
+            date_time_values.append(date_time_value)
+
+        return date_time_values
 
-        year = date_time_values.get("year", 0)
-        month = date_time_values.get("month", 0)
-        day_of_month = date_time_values.get("day_of_month", 0)
-        hours = date_time_values.get("hours", 0)
-        minutes = date_time_values.get("minutes", 0)
-        seconds = date_time_values.get("seconds", 0)
-        nanoseconds = date_time_values.get("nanoseconds", 0)
-        time_zone_offset = date_time_values.get("time_zone_offset")
+    @classmethod
+    def DecodeUUIDBuffer(cls, buffer):
+        """Decodes the timestamps of concatenated UUIDs in bulk.
 
-        if year < 1582:
-            raise ValueError("Year value not supported.")
+        The timestamps are decoded directly from the buffer, without creating
+        an UUID object per UUID, for example to decode an UUID column of
+        a database.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte UUIDs in
+              big-endian byte order, as used by uuid.UUID.bytes.
 
-        nanoseconds, _ = divmod(nanoseconds, 100)
+        Returns:
+          tuple[array.array, bytearray, bytearray]: number of 100th nano seconds
+              since January 1, 1970 00:00:00 per UUID, where UUIDs without
+              a timestamp are represented by 0, version per UUID, where 0
+              represents an UUID that is not of the RFC 4122 variant, and
+              validity mask, where 1 represents an UUID version 1, 6 or 7 with
+              a timestamp and 0 other UUIDs.
 
-        timestamp = self._GetNumberOfSecondsFromElements(
-            year, month, day_of_month, hours, minutes, seconds
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        uuid_to_posix_base = cls._UUID_TO_POSIX_BASE * cls._UNITS_PER_SECOND
+        units_per_millisecond = (
+            cls._UNITS_PER_SECOND // definitions.MILLISECONDS_PER_SECOND
         )
-        timestamp += self._UUID_TO_POSIX_BASE
-        timestamp *= self._100_NANOSECONDS_PER_SECOND
-        timestamp += nanoseconds
 
-        self._normalized_timestamp = None
-        self._timestamp = timestamp
-        self._time_zone_offset = time_zone_offset
+        timestamps = array.array("q")
+        versions = bytearray()
+        validity_mask = bytearray()
+
+        for version, timestamp in cls._DecodeRecords(buffer):
+            if version in (1, 6):
+                timestamps.append(timestamp - uuid_to_posix_base)
+                validity_mask.append(1)
+            elif version == 7:
+                timestamps.append(timestamp * units_per_millisecond)
+                validity_mask.append(1)
+            else:
+                timestamps.append(0)
+                validity_mask.append(0)
+
+            versions.append(version)
 
-    def CopyToDateTimeString(self):
-        """Copies the UUID timestamp to a date and time string.
+        return timestamps, versions, validity_mask
+
+    @classmethod
+    def DecodeUUIDStrings(cls, uuid_strings):
+        """Decodes the timestamps of UUID strings in bulk.
+
+        Args:
+          uuid_strings (Sequence[str]): UUID strings formatted as:
+              "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", with or without hyphens or
+              enclosing braces, where x is a case-insensitive hexadecimal digit.
 
         Returns:
-          str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#######" or
-              None if the timestamp is missing or invalid.
+          tuple[array.array, bytearray, bytearray]: number of 100th nano seconds
+              since January 1, 1970 00:00:00 per UUID string, where UUID strings
+              without a timestamp are represented by 0, version per UUID string,
+              where 0 represents an invalid UUID string or an UUID that is not of
+              the RFC 4122 variant, and validity mask, where 1 represents an UUID
+              version 1, 6 or 7 with a timestamp and 0 other UUID strings.
         """
-        if (
-            self._timestamp is None
-            or self._timestamp < 0
-            or self._timestamp > self._UINT60_MAX
-        ):
-            return None
+        buffer = cls._GetBufferFromUUIDStrings(uuid_strings)
+        return cls.DecodeUUIDBuffer(buffer)
 
-        timestamp, fraction_of_second = divmod(
-            self._timestamp, self._100_NANOSECONDS_PER_SECOND
-        )
-        number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+    @classmethod
+    def NewFromUUID(cls, uuid_value, precision=None):
+        """Creates a date time value from an UUID.
 
-        year, month, day_of_month = self._GetDateValuesWithEpoch(
-            number_of_days, self._EPOCH
-        )
-        return (
-            f"{year:04d}-{month:02d}-{day_of_month:02d} "
-            f"{hours:02d}:{minutes:02d}:{seconds:02d}.{fraction_of_second:07d}"
-        )
+        Args:
+          uuid_value (bytes|str): 16-byte UUID in big-endian byte order or UUID
+              string formatted as: "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", with
+              or without hyphens or enclosing braces.
+          precision (Optional[str]): precision of the date and time value, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          DateTimeValues: UUID version 1 timestamp for an UUID version 1 or 6,
+              POSIX timestamp in milliseconds for an UUID version 7 or None for
+              other UUIDs.
+
+        Raises:
+          ValueError: if the UUID is invalid.
+        """
+        if isinstance(uuid_value, str):
+            buffer = cls._GetUUIDBytesFromString(uuid_value)
+            if not buffer:
+                raise ValueError(f"Invalid UUID string: {uuid_value:s}.")
+
+        else:
+            buffer = bytes(uuid_value)
+            if len(buffer) != 16:
+                raise ValueError(f"Unsupported UUID size: {len(buffer):d}.")
 
-    def CopyToSerializableDict(self):
-        """Copies the date time value to a serializable dictionary.
+        return cls._NewFromBuffer(buffer, precision)[0]
+
+    @classmethod
+    def NewFromUUIDBuffer(cls, buffer, precision=None):
+        """Creates date time values from concatenated UUIDs.
+
+        Args:
+          buffer (bytes|bytearray|memoryview): concatenated 16-byte UUIDs in
+              big-endian byte order, as used by uuid.UUID.bytes.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
 
         Returns:
-          dict[str, object]: serializable dictionary.
+          list[DateTimeValues]: UUID version 1 timestamps for UUIDs version 1 or
+              6, POSIX timestamps in milliseconds for UUIDs version 7 and None for
+              other UUIDs.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
         """
-        serializable_dict = self._CreateSerializableDict()
+        return cls._NewFromBuffer(buffer, precision)
 
-        serializable_dict["timestamp"] = self._timestamp
+    @classmethod
+    def NewFromUUIDStrings(cls, uuid_strings, precision=None):
+        """Creates date time values from UUID strings.
 
-        return serializable_dict
+        Args:
+          uuid_strings (Sequence[str]): UUID strings formatted as:
+              "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", with or without hyphens or
+              enclosing braces, where x is a case-insensitive hexadecimal digit.
+          precision (Optional[str]): precision of the date and time values, which
+              should be one of the PRECISION_VALUES in definitions.
+
+        Returns:
+          list[DateTimeValues]: UUID version 1 timestamps for UUIDs version 1 or
+              6, POSIX timestamps in milliseconds for UUIDs version 7 and None for
+              invalid UUID strings and other UUIDs.
+        """
+        buffer = cls._GetBufferFromUUIDStrings(uuid_strings)
+        return cls._NewFromBuffer(buffer, precision)
 
 
 factory.Factory.RegisterDateTimeValues(UUIDTime)
@@ -0,0 +1,110 @@
+"""Validators of date and time strings."""
+
+from dfdatetime import time_elements
+
+
+class DateTimeStringValidator:
+    """Validator of date and time strings in a specific format.
+
+    The validator uses the non-raising TryCopyFrom* methods of time elements,
+    hence it accepts the same time strings as the corresponding CopyFrom*
+    methods.
+
+    Attributes:
+      string_format (str): format of the date and time strings, such as
+          "iso8601".
+    """
+
+    # Names of the methods that try to copy a date and time string per format.
+    _TRY_COPY_METHOD_NAMES = {
+        "date_time": "TryCopyFromDateTimeString",
+        "iso8601": "TryCopyFromStringISO8601",
+        "rfc822": "TryCopyFromStringRFC822",
+        "rfc1123": "TryCopyFromStringRFC1123",
+        "rfc2822": "TryCopyFromStringRFC2822",
+    }
+
+    STRING_FORMATS = frozenset(_TRY_COPY_METHOD_NAMES.keys())
+
+    def __init__(self, string_format, time_elements_type=None):
+        """Initializes a validator.
+
+        Args:
+          string_format (str): format of the date and time strings, which should
+              be one of STRING_FORMATS.
+          time_elements_type (Optional[type]): time elements type that defines
+              the precision of the parsed date and time values, where None
+              represents TimeElementsInNanoseconds.
+
+        Raises:
+          ValueError: if the string format is not supported.
+        """
+        method_name = self._TRY_COPY_METHOD_NAMES.get(string_format)
+        if not method_name:
+            raise ValueError(f"Unsupported string format: {string_format:s}.")
+
+        super().__init__()
+        self._time_elements_type = (
+            time_elements_type or time_elements.TimeElementsInNanoseconds
+        )
+        self._try_copy_method_name = method_name
+        self.string_format = string_format
+
+    def IsValid(self, time_string):
+        """Determines if a date and time string is valid.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          bool: True if the date and time string is valid.
+        """
+        date_time_values = self._time_elements_type()
+        try_copy_method = getattr(date_time_values, self._try_copy_method_name)
+        return try_copy_method(time_string)
+
+    def Parse(self, time_strings):
+        """Parses a sequence of date and time strings.
+
+        Args:
+          time_strings (Iterable[str]): date and time strings.
+
+        Returns:
+          list[TimeElements]: time elements of the date and time strings, where
+              None represents a date and time string that is invalid or not
+              supported.
+        """
+        return [self.TryParse(time_string) for time_string in time_strings]
+
+    def TryParse(self, time_string):
+        """Tries to parse a date and time string.
+
+        Args:
+          time_string (str): date and time string.
+
+        Returns:
+          TimeElements: time elements of the date and time string or None if the
+              date and time string is invalid or not supported.
+        """
+        date_time_values = self._time_elements_type()
+        try_copy_method = getattr(date_time_values, self._try_copy_method_name)
+        if not try_copy_method(time_string):
+            return None
+
+        return date_time_values
+
+    def Validate(self, time_strings):
+        """Validates a sequence of date and time strings.
+
+        Args:
+          time_strings (Iterable[str]): date and time strings.
+
+        Returns:
+          list[bool]: True for each date and time string that is valid.
+        """
+        # A single time elements object is reused since only the return value
+        # of the try copy method is of interest.
+        date_time_values = self._time_elements_type()
+        try_copy_method = getattr(date_time_values, self._try_copy_method_name)
+
+        return [try_copy_method(time_string) for time_string in time_strings]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Tests for the optional caches of parsed date and time strings."""
+
+import os
+import unittest
+
+from dfdatetime import caches
+from dfdatetime import posix_time
+from dfdatetime import time_elements
+
+
+class LRUCacheTest(unittest.TestCase):
+    """Tests for the LRU cache."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        cache = caches.LRUCache(16)
+        self.assertEqual(len(cache), 0)
+
+        with self.assertRaises(ValueError):
+            caches.LRUCache(0)
+
+    def testGetAndPut(self):
+        """Tests the Get and Put functions."""
+        cache = caches.LRUCache(2)
+
+        cache.Put("a", 1)
+        cache.Put("b", 2)
+        self.assertEqual(cache.Get("a"), 1)
+
+        # "b" is the least recently used value.
+        cache.Put("c", 3)
+        self.assertIsNone(cache.Get("b"))
+        self.assertEqual(cache.Get("a"), 1)
+        self.assertEqual(cache.Get("c"), 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def testClear(self):
+        """Tests the Clear function."""
+        cache = caches.LRUCache(2)
+
+        cache.Put("a", 1)
+        cache.Get("a")
+        cache.Clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+    def testGetStatistics(self):
+        """Tests the GetStatistics function."""
+        cache = caches.LRUCache(2)
+
+        statistics = cache.GetStatistics()
+        self.assertEqual(statistics["hit_rate"], 0.0)
+
+        cache.Put("a", 1)
+        cache.Get("a")
+        cache.Get("a")
+        cache.Get("a")
+        cache.Get("b")
+
+        statistics = cache.GetStatistics()
+        self.assertEqual(
+            statistics,
+            {
+                "evictions": 0,
+                "hit_rate": 0.75,
+                "hits": 3,
+                "maximum_size": 2,
+                "misses": 1,
+                "size": 1,
+            },
+        )
+
+
+class ParseCachesTest(unittest.TestCase):
+    """Tests for the caches of parsed date and time strings."""
+
+    def tearDown(self):
+        """Cleans up after running an individual test."""
+        caches.ParseCaches.Disable()
+
+    def testEnableAndDisable(self):
+        """Tests the Enable and Disable functions."""
+        self.assertFalse(caches.ParseCaches.IsEnabled())
+        self.assertIsNone(caches.ParseCaches.GetCache("date_time"))
+
+        caches.ParseCaches.Enable(maximum_size=8, parser_names=["iso8601"])
+        self.assertTrue(caches.ParseCaches.IsEnabled())
+        self.assertIsNone(caches.ParseCaches.GetCache("date_time"))
+
+        cache = caches.ParseCaches.GetCache("iso8601")
+        self.assertIsNotNone(cache)
+        self.assertEqual(cache.maximum_size, 8)
+
+        caches.ParseCaches.Disable()
+        self.assertFalse(caches.ParseCaches.IsEnabled())
+
+        with self.assertRaises(ValueError):
+            caches.ParseCaches.Enable(parser_names=["bogus"])
+
+        with self.assertRaises(ValueError):
+            caches.ParseCaches.Enable(maximum_size=0)
+
+    def testCopyFromDateTimeString(self):
+        """Tests CopyFromDateTimeString with the date and time cache."""
+        caches.ParseCaches.Enable()
+
+        posix_time_object = posix_time.PosixTime()
+        posix_time_object.CopyFromDateTimeString("2010-08-12 21:06:31")
+        posix_time_object.CopyFromDateTimeString("2010-08-12 21:06:31")
+        self.assertEqual(posix_time_object.timestamp, 1281647191)
+
+        with self.assertRaises(ValueError):
+            posix_time_object.CopyFromDateTimeString("2010-08-12 25:06:31")
+
+        statistics = caches.ParseCaches.GetStatistics()
+        self.assertEqual(statistics["date_time"]["hits"], 1)
+        self.assertEqual(statistics["date_time"]["misses"], 2)
+        self.assertEqual(statistics["date_time"]["size"], 1)
+
+    def testCopyFromStringISO8601(self):
+        """Tests CopyFromStringISO8601 with the ISO 8601 cache."""
+        caches.ParseCaches.Enable()
+
+        time_elements_object = time_elements.TimeElementsInMilliseconds()
+        time_elements_object.CopyFromStringISO8601("2010-08-12T21:06:31.546+01:00")
+        time_elements_object.CopyFromStringISO8601("2010-08-12T21:06:31.546+01:00")
+        self.assertEqual(
+            time_elements_object.CopyToDateTimeString(), "2010-08-12 21:06:31.546"
+        )
+        self.assertEqual(time_elements_object.time_zone_offset, 60)
+
+        time_elements_object = time_elements.TimeElements()
+        time_elements_object.CopyFromStringISO8601("2010-08-12T21:06:31.546+01:00")
+        self.assertEqual(
+            time_elements_object.CopyToDateTimeString(), "2010-08-12 21:06:31"
+        )
+
+        statistics = caches.ParseCaches.GetStatistics()
+        self.assertEqual(statistics["iso8601"]["hits"], 2)
+        self.assertEqual(statistics["iso8601"]["misses"], 1)
+
+    def testCopyFromStringRFC(self):
+        """Tests CopyFromStringRFC822 and CopyFromStringRFC1123 with caches."""
+        caches.ParseCaches.Enable()
+
+        time_elements_object = time_elements.TimeElements()
+        time_elements_object.CopyFromStringRFC822("Thu, 12 Aug 10 21:06:31 GMT")
+        time_elements_object.CopyFromStringRFC1123("Thu, 12 Aug 2010 21:06:31 GMT")
+        time_elements_object.CopyFromStringRFC1123("Thu, 12 Aug 2010 21:06:31 GMT")
+        self.assertEqual(
+            time_elements_object.CopyToDateTimeString(), "2010-08-12 21:06:31"
+        )
+
+        statistics = caches.ParseCaches.GetStatistics()
+        self.assertEqual(statistics["rfc822"]["misses"], 1)
+        self.assertEqual(statistics["rfc1123"]["hits"], 1)
+        self.assertEqual(statistics["rfc1123"]["misses"], 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def testResetAfterFork(self):
+        """Tests that the caches are reset in a child process after a fork."""
+        caches.ParseCaches.Enable()
+
+        posix_time_object = posix_time.PosixTime()
+        posix_time_object.CopyFromDateTimeString("2010-08-12 21:06:31")
+
+        read_file_descriptor, write_file_descriptor = os.pipe()
+
+        process_identifier = os.fork()
+        if process_identifier == 0:
+            os.close(read_file_descriptor)
+            cache = caches.ParseCaches.GetCache("date_time")
+            os.write(write_file_descriptor, f"{len(cache):d}".encode("ascii"))
+            os._exit(0)  # pylint: disable=protected-access
+
+        os.close(write_file_descriptor)
+        try:
+            data = os.read(read_file_descriptor, 16)
+        finally:
+            os.close(read_file_descriptor)
+            os.waitpid(process_identifier, 0)
+
+        self.assertEqual(data, b"0")
+
+        cache = caches.ParseCaches.GetCache("date_time")
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -120,6 +120,18 @@ class CocoaTimeTest(unittest.TestCase):
         serializable_dict = cocoa_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeToPosixTimestampsInMicroseconds(self):
+        """Tests the DecodeToPosixTimestampsInMicroseconds function."""
+        posix_timestamps, validity_mask = (
+            cocoa_time.CocoaTime.DecodeToPosixTimestampsInMicroseconds(
+                [395011845.0, 395011845.5, float("nan")], time_zone_offset=60
+            )
+        )
+        self.assertEqual(
+            list(posix_timestamps), [1373315445000000, 1373315445500000, 0]
+        )
+        self.assertEqual(list(validity_mask), [1, 1, 0])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         cocoa_time_object = cocoa_time.CocoaTime(timestamp=395011845.546875)
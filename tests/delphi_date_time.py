@@ -19,7 +19,7 @@ class DelphiDateTimeEpochTest(unittest.TestCase):
 class DelphiDateTimeInvalidYear(delphi_date_time.DelphiDateTime):
     """Delphi TDateTime timestamp for testing invalid year."""
 
-    def _CopyDateTimeFromString(self, time_string):
+    def _CopyDateTimeTupleFromString(self, time_string):
         """Copies a date and time from a string.
 
         Args:
@@ -32,20 +32,13 @@ class DelphiDateTimeInvalidYear(delphi_date_time.DelphiDateTime):
               is UTC.
 
         Returns:
-          dict[str, int]: date and time values, such as year, month, day of month,
-              hours, minutes, seconds, microseconds.
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes.
 
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        return {
-            "year": 10000,
-            "month": 1,
-            "day_of_month": 2,
-            "hours": 0,
-            "minutes": 0,
-            "seconds": 0,
-        }
+        return 10000, 1, 2, 0, 0, 0, 0, None
 
 
 class DelphiDateTimeTest(unittest.TestCase):
@@ -168,6 +161,16 @@ class DelphiDateTimeTest(unittest.TestCase):
         serializable_dict = delphi_date_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeToPosixTimestampsInMicroseconds(self):
+        """Tests the DecodeToPosixTimestampsInMicroseconds function."""
+        posix_timestamps, validity_mask = (
+            delphi_date_time.DelphiDateTime.DecodeToPosixTimestampsInMicroseconds(
+                [41443.8263953, -1e300]
+            )
+        )
+        self.assertEqual(list(posix_timestamps), [1371585000553920, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         delphi_date_time_object = delphi_date_time.DelphiDateTime(
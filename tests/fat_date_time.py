@@ -21,6 +21,27 @@ class FATDateTime(unittest.TestCase):
 
     # pylint: disable=protected-access
 
+    def testGetLookupTables(self):
+        """Tests the _GetLookupTables function."""
+        days_per_date, seconds_per_time_of_day = (
+            fat_date_time.FATDateTime._GetLookupTables()
+        )
+        self.assertEqual(len(days_per_date), 0x10000)
+        self.assertEqual(len(seconds_per_time_of_day), 0x10000)
+
+        self.assertEqual(days_per_date[0x0021], 0)
+        self.assertEqual(days_per_date[0x3D0C], 11181)
+        self.assertEqual(days_per_date[0x0000], -1)
+        self.assertEqual(days_per_date[0x005E], -1)
+
+        self.assertEqual(seconds_per_time_of_day[0x0000], 0)
+        self.assertEqual(seconds_per_time_of_day[0xA8D0], 75992)
+        self.assertEqual(seconds_per_time_of_day[0xBF7D], 86398)
+        self.assertEqual(seconds_per_time_of_day[0xBF7E], -1)
+
+        lookup_tables = fat_date_time.FATDateTime._GetLookupTables()
+        self.assertIs(lookup_tables[0], days_per_date)
+
     def testGetNormalizedTimestamp(self):
         """Tests the _GetNormalizedTimestamp function."""
         fat_date_time_object = fat_date_time.FATDateTime(fat_date_time=0xA8D03D0C)
@@ -81,7 +102,19 @@ class FATDateTime(unittest.TestCase):
         """Tests the _GetNumberOfSeconds function."""
         fat_date_time_object = fat_date_time.FATDateTime()
 
-        fat_date_time_object._GetNumberOfSeconds(0xA8D03D0C)
+        number_of_seconds = fat_date_time_object._GetNumberOfSeconds(0xA8D03D0C)
+        self.assertEqual(number_of_seconds, 966114392)
+
+        # 2081-01-01 00:00:00, which follows the leap year 2080.
+        number_of_seconds = fat_date_time_object._GetNumberOfSeconds(
+            (101 << 9) | (1 << 5) | 1
+        )
+        self.assertEqual(number_of_seconds, 3187382400)
+
+        # February 29, 2100 does not exist since 2100 is not a leap year.
+        test_fat_date_time = (120 << 9) | (2 << 5) | 29
+        with self.assertRaises(ValueError):
+            fat_date_time_object._GetNumberOfSeconds(test_fat_date_time)
 
         # Invalid number of seconds.
         test_fat_date_time = (0xA8D03D0C & ~(0x1F << 16)) | ((30 & 0x1F) << 16)
@@ -139,6 +172,16 @@ class FATDateTime(unittest.TestCase):
         serializable_dict = fat_date_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeToPosixTimestamps(self):
+        """Tests the DecodeToPosixTimestamps function."""
+        posix_timestamps = fat_date_time.FATDateTime.DecodeToPosixTimestamps(
+            [0xA8D03D0C, 0x00000021, 0xA8D03D00, 0xC0003D0C]
+        )
+        self.assertEqual(list(posix_timestamps), [1281647192, 315532800, -1, -1])
+
+        posix_timestamps = fat_date_time.FATDateTime.DecodeToPosixTimestamps([])
+        self.assertEqual(len(posix_timestamps), 0)
+
     def testGetDate(self):
         """Tests the GetDate function."""
         fat_date_time_object = fat_date_time.FATDateTime(fat_date_time=0xA8D03D0C)
@@ -290,6 +333,15 @@ class FATTimestampTest(unittest.TestCase):
         serializable_dict = fat_timestamp_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeToPosixTimestampsInMilliseconds(self):
+        """Tests the DecodeToPosixTimestampsInMilliseconds function."""
+        posix_timestamps = (
+            fat_date_time.FATTimestamp.DecodeToPosixTimestampsInMilliseconds(
+                [131033589024, 0]
+            )
+        )
+        self.assertEqual(list(posix_timestamps), [1625868690240, 315532800000])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         fat_timestamp_object = fat_date_time.FATTimestamp(timestamp=131033589024)
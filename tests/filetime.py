@@ -96,7 +96,7 @@ class FiletimeTest(unittest.TestCase):
         self.assertEqual(filetime_object._timestamp, 86400 * 10000000)
         self.assertEqual(filetime_object._time_zone_offset, None)
 
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, "^Year value not supported: 1500.$"):
             filetime_object.CopyFromDateTimeString("1500-01-02 00:00:00")
 
     def testCopyToDateTimeString(self):
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for the detectors of the format of date and time strings."""
+
+import unittest
+
+from dfdatetime import format_detector
+
+
+class DateTimeStringParserTest(unittest.TestCase):
+    """Tests for the parser of date and time strings in a detected format."""
+
+    def testParse(self):
+        """Tests the Parse function."""
+        detector = format_detector.DateTimeStringFormatDetector()
+
+        parser = detector.Detect(["12/Aug/2010:21:06:31 +0100"])
+        self.assertIsNotNone(parser)
+
+        date_time = parser.Parse("12/Aug/2010:21:06:31 +0100")
+        self.assertEqual(date_time.CopyToDateTimeString(), "2010-08-12 21:06:31")
+        self.assertEqual(date_time.time_zone_offset, 60)
+        self.assertEqual(parser.number_of_fallbacks, 0)
+
+        date_time = parser.Parse("2010-08-12 21:06:31")
+        self.assertIsNotNone(date_time)
+        self.assertEqual(parser.number_of_fallbacks, 1)
+
+        date_time = parser.Parse("bogus")
+        self.assertIsNone(date_time)
+        self.assertEqual(parser.number_of_fallbacks, 2)
+
+    def testParseValues(self):
+        """Tests the ParseValues function."""
+        detector = format_detector.DateTimeStringFormatDetector()
+
+        time_strings = ["2010-08-12T21:06:31Z", "", "2010-08-12T21:06:31.5+01:00"]
+        parser = detector.Detect(time_strings)
+        self.assertIsNotNone(parser)
+
+        results = parser.ParseValues(time_strings)
+        self.assertEqual(len(results), 3)
+        self.assertIsNotNone(results[0])
+        self.assertIsNone(results[1])
+        self.assertEqual(
+            results[2].CopyToDateTimeString(), "2010-08-12 21:06:31.500000000"
+        )
+
+
+class DateTimeStringFormatDetectorTest(unittest.TestCase):
+    """Tests for the detector of the format of date and time strings."""
+
+    # pylint: disable=protected-access
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        detector = format_detector.DateTimeStringFormatDetector()
+        self.assertIsNotNone(detector)
+
+        with self.assertRaises(ValueError):
+            format_detector.DateTimeStringFormatDetector(maximum_sample_size=0)
+
+        with self.assertRaises(ValueError):
+            format_detector.DateTimeStringFormatDetector(minimum_confidence=1.5)
+
+        with self.assertRaises(ValueError):
+            format_detector.DateTimeStringFormatDetector(strptime_formats=["%U"])
+
+    def testGetSample(self):
+        """Tests the _GetSample function."""
+        detector = format_detector.DateTimeStringFormatDetector(maximum_sample_size=4)
+
+        sample = detector._GetSample(["a", "", "b"])
+        self.assertEqual(sample, ["a", "b"])
+
+        sample = detector._GetSample([f"{index:d}" for index in range(10)])
+        self.assertEqual(sample, ["0", "2", "4", "6"])
+
+        sample = detector._GetSample([])
+        self.assertEqual(sample, [])
+
+    def testDetect(self):
+        """Tests the Detect function."""
+        detector = format_detector.DateTimeStringFormatDetector()
+
+        test_data = [
+            (["2010-08-12 21:06:31", "2010-08-12 21:06:32"], "date_time"),
+            (["2010-08-12T21:06:31+01:00"], "iso8601"),
+            (["Thu, 12 Aug 2010 21:06:31 GMT"], "rfc1123"),
+            (["Thu Aug 12 21:06:31 2010"], "%a %b %d %H:%M:%S %Y"),
+            (["08/12/2010 09:06:31 PM"], "%m/%d/%Y %I:%M:%S %p"),
+        ]
+        for time_strings, expected_format_name in test_data:
+            parser = detector.Detect(time_strings)
+            self.assertIsNotNone(parser)
+            self.assertEqual(parser.format_name, expected_format_name)
+            self.assertEqual(parser.confidence, 1.0)
+
+        parser = detector.Detect(
+            ["2010/08/12 21:06:31", "2010/08/12 21:06:32", "2010-08-12T21:06:31"]
+        )
+        self.assertIsNotNone(parser)
+        self.assertEqual(parser.format_name, "%Y/%m/%d %H:%M:%S")
+        self.assertAlmostEqual(parser.confidence, 2 / 3)
+
+        self.assertIsNone(detector.Detect(["bogus"]))
+        self.assertIsNone(detector.Detect([]))
+
+        detector = format_detector.DateTimeStringFormatDetector(
+            minimum_confidence=0.9, strptime_formats=[]
+        )
+        parser = detector.Detect(["2010-08-12 21:06:31", "bogus"])
+        self.assertIsNone(parser)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -98,6 +98,31 @@ class GolangTest(unittest.TestCase):
         normalized_timestamp = golang_time_object._GetNormalizedTimestamp()
         self.assertIsNone(normalized_timestamp)
 
+    def testDecodeRecords(self):
+        """Test the _DecodeRecords function."""
+        buffer = bytes.fromhex(
+            "010000000000000002000000030004" "02000000000000000500000006ffff08"
+        )
+        records = list(golang_time.GolangTime._DecodeRecords(buffer))
+        self.assertEqual(records, [(0, 15, 2, 3, 4), (15, 16, 5, 6, -1)])
+
+        buffer = bytes.fromhex(
+            "010000000000000002000000030004" "010000000000000005000000060005"
+        )
+        records = list(golang_time.GolangTime._DecodeRecords(memoryview(buffer)))
+        self.assertEqual(records, [(0, 15, 2, 3, 4), (15, 15, 5, 6, 5)])
+
+        records = list(golang_time.GolangTime._DecodeRecords(b""))
+        self.assertEqual(records, [])
+
+        with self.assertRaises(ValueError):
+            buffer = bytes.fromhex("0100000000000000020000000300")
+            list(golang_time.GolangTime._DecodeRecords(buffer))
+
+        with self.assertRaises(ValueError):
+            buffer = bytes.fromhex("ff0000000000000000000000000000")
+            list(golang_time.GolangTime._DecodeRecords(buffer))
+
     def testGetNumberOfSeconds(self):
         """Test the _GetNumberOfSeconds function."""
         golang_time_object = golang_time.GolangTime()
@@ -217,6 +242,47 @@ class GolangTest(unittest.TestCase):
         serializable_dict = golang_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeBuffer(self):
+        """Test the DecodeBuffer function."""
+        buffer = bytes.fromhex(
+            "010000000e7791f70000000000ffff" "02000000000000000500000006003c00"
+        )
+        numbers_of_seconds, nanoseconds, time_zone_offsets = (
+            golang_time.GolangTime.DecodeBuffer(buffer)
+        )
+        self.assertEqual(list(numbers_of_seconds), [62135596800, 5])
+        self.assertEqual(list(nanoseconds), [0, 6])
+        self.assertEqual(list(time_zone_offsets), [0, 60])
+
+    def testNewFromBuffer(self):
+        """Test the NewFromBuffer function."""
+        buffer = bytes.fromhex(
+            "010000000eafffe8d121d95050ffff" "010000000e7791f70000000000003c"
+        )
+        golang_time_objects = golang_time.GolangTime.NewFromBuffer(buffer)
+        self.assertEqual(len(golang_time_objects), 2)
+
+        golang_time_object = golang_time_objects[0]
+        self.assertEqual(golang_time_object.golang_timestamp, buffer[:15])
+        self.assertEqual(
+            golang_time_object.CopyToDateTimeString(), "2000-01-01 12:23:45.567890000"
+        )
+        self.assertEqual(golang_time_object.time_zone_offset, 0)
+
+        expected_golang_time_object = golang_time.GolangTime(
+            golang_timestamp=buffer[15:]
+        )
+        golang_time_object = golang_time_objects[1]
+        self.assertEqual(
+            golang_time_object.CopyToDateTimeString(),
+            expected_golang_time_object.CopyToDateTimeString(),
+        )
+        self.assertEqual(golang_time_object.time_zone_offset, 60)
+        self.assertEqual(
+            golang_time_object.CopyToSerializableDict(),
+            expected_golang_time_object.CopyToSerializableDict(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
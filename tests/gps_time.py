@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the GPS timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import gps_time
+
+
+class GPSTimeEpochTest(unittest.TestCase):
+    """Tests for the GPS time epoch."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        gps_time_epoch = gps_time.GPSTimeEpoch()
+        self.assertIsNotNone(gps_time_epoch)
+
+
+class GPSTimeTest(unittest.TestCase):
+    """Tests for the GPS timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        gps_time_object = gps_time.GPSTime(timestamp=0)
+
+        normalized_timestamp = gps_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("315964800"))
+
+        gps_time_object = gps_time.GPSTime(timestamp=1388448018500000000)
+
+        normalized_timestamp = gps_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1704412800.5"))
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        gps_time_object = gps_time.GPSTime()
+
+        gps_time_object.CopyFromDateTimeString("1980-01-06 00:00:00")
+        self.assertEqual(gps_time_object.timestamp, 0)
+
+        gps_time_object.CopyFromDateTimeString("2016-12-31 23:59:60")
+        self.assertEqual(gps_time_object.timestamp, 1167264017000000000)
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        gps_time_object = gps_time.GPSTime(timestamp=0)
+
+        date_time_string = gps_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "1980-01-06 00:00:00.000000000")
+
+        gps_time_object = gps_time.GPSTime(timestamp=1167264017000000000)
+
+        date_time_string = gps_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2016-12-31 23:59:60.000000000")
+
+    def testDecodeTimestamps(self):
+        """Tests the DecodeTimestamps function."""
+        timestamps, validity_mask = gps_time.GPSTime.DecodeTimestamps(
+            [0, 1388448018500000000, (1 << 63) - 1]
+        )
+        self.assertEqual(list(timestamps), [315964800000000000, 1704412800500000000, 0])
+        self.assertEqual(list(validity_mask), [1, 1, 0])
+
+    def testNewFromWeekAndSeconds(self):
+        """Tests the NewFromWeekAndSeconds function."""
+        gps_time_object = gps_time.GPSTime.NewFromWeekAndSeconds(2295, 432018.5)
+        self.assertEqual(gps_time_object.timestamp, 1388448018500000000)
+
+        date_time_string = gps_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2024-01-05 00:00:00.500000000")
+
+        gps_time_object = gps_time.GPSTime.NewFromWeekAndSeconds(
+            2295, decimal.Decimal("432018.000000001")
+        )
+        self.assertEqual(gps_time_object.timestamp, 1388448018000000001)
+
+        with self.assertRaises(ValueError):
+            gps_time.GPSTime.NewFromWeekAndSeconds(-1, 0)
+
+        with self.assertRaises(ValueError):
+            gps_time.GPSTime.NewFromWeekAndSeconds(0, 604800)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -90,7 +90,7 @@ class HFSTimeTest(unittest.TestCase):
         self.assertEqual(hfs_time_object._timestamp, 86400)
         self.assertEqual(hfs_time_object._time_zone_offset, None)
 
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, "^Year value not supported.$"):
             hfs_time_object.CopyFromDateTimeString("1600-01-02 00:00:00")
 
     def testCopyToDateTimeString(self):
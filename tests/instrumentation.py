@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Tests for the instrumentation of date and time values hot paths."""
+
+import unittest
+
+from dfdatetime import filetime
+from dfdatetime import instrumentation
+from dfdatetime import time_elements
+
+
+class MethodStatisticsTest(unittest.TestCase):
+    """Tests for the method statistics."""
+
+    def testAddLatency(self):
+        """Tests the AddLatency function."""
+        method_statistics = instrumentation.MethodStatistics()
+
+        method_statistics.AddLatency(100)
+        method_statistics.AddLatency(120)
+        method_statistics.AddLatency(1000)
+
+        self.assertEqual(method_statistics.latency_histogram, {128: 2, 1024: 1})
+        self.assertEqual(method_statistics.sampled_calls, 3)
+        self.assertEqual(method_statistics.sampled_latency, 1220)
+
+
+class InstrumentationTest(unittest.TestCase):
+    """Tests for the instrumentation of date and time values hot paths."""
+
+    def setUp(self):
+        """Makes preparations before running an individual test."""
+        instrumentation.Instrumentation.Reset()
+
+    def tearDown(self):
+        """Cleans up after running an individual test."""
+        if instrumentation.Instrumentation.IsEnabled():
+            instrumentation.Instrumentation.Disable()
+
+        instrumentation.Instrumentation.Reset()
+
+    def testEnableAndDisable(self):
+        """Tests the Enable and Disable functions."""
+        original_method = filetime.Filetime.CopyToDateTimeString
+
+        instrumentation.Instrumentation.Enable()
+        self.assertTrue(instrumentation.Instrumentation.IsEnabled())
+        self.assertIsNot(filetime.Filetime.CopyToDateTimeString, original_method)
+
+        with self.assertRaises(ValueError):
+            instrumentation.Instrumentation.Enable()
+
+        instrumentation.Instrumentation.Disable()
+        self.assertFalse(instrumentation.Instrumentation.IsEnabled())
+        self.assertIs(filetime.Filetime.CopyToDateTimeString, original_method)
+
+        with self.assertRaises(ValueError):
+            instrumentation.Instrumentation.Enable(sample_rate=0)
+
+    def testGetSnapshot(self):
+        """Tests the GetSnapshot function."""
+        instrumentation.Instrumentation.Enable(sample_rate=1)
+
+        filetime_object = filetime.Filetime(timestamp=0x01CB3A623D0A17CE)
+        filetime_object.GetDateWithTimeOfDay()
+        filetime_object.GetDateWithTimeOfDay()
+
+        with self.assertRaises(ValueError):
+            filetime_object.CopyFromDateTimeString("bogus")
+
+        snapshot = instrumentation.Instrumentation.GetSnapshot()
+
+        statistics = snapshot["Filetime._GetNormalizedTimestamp"]
+        self.assertEqual(statistics["calls"], 2)
+        self.assertEqual(statistics["cache_hits"], 1)
+        self.assertEqual(statistics["cache_misses"], 1)
+        self.assertEqual(statistics["sampled_calls"], 2)
+
+        statistics = snapshot["Filetime._GetDateWithTimeOfDay"]
+        self.assertEqual(statistics["calls"], 2)
+        self.assertEqual(statistics["cache_hits"], 1)
+        self.assertEqual(statistics["cache_misses"], 1)
+
+        statistics = snapshot["Filetime.CopyFromDateTimeString"]
+        self.assertEqual(statistics["calls"], 1)
+        self.assertEqual(statistics["exceptions"], 1)
+
+        instrumentation.Instrumentation.Reset()
+        snapshot = instrumentation.Instrumentation.GetSnapshot()
+        self.assertEqual(snapshot, {})
+
+    def testGetSnapshotWithOverriddenMethod(self):
+        """Tests the GetSnapshot function with an overridden method."""
+        instrumentation.Instrumentation.Enable()
+
+        time_elements_object = time_elements.TimeElementsInMilliseconds(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429)
+        )
+        time_elements_object.CopyToDateTimeString()
+
+        snapshot = instrumentation.Instrumentation.GetSnapshot()
+
+        statistics = snapshot["TimeElementsInMilliseconds.CopyToDateTimeString"]
+        self.assertEqual(statistics["calls"], 1)
+
+    def testGetSnapshotDifference(self):
+        """Tests the GetSnapshotDifference function."""
+        start_snapshot = {
+            "Filetime.CopyToDateTimeString": {
+                "calls": 2,
+                "latency_histogram": {128: 1},
+            },
+            "PosixTime.CopyToDateTimeString": {
+                "calls": 1,
+                "latency_histogram": {},
+            },
+        }
+        end_snapshot = {
+            "Filetime.CopyToDateTimeString": {
+                "calls": 5,
+                "latency_histogram": {128: 1, 256: 2},
+            },
+            "PosixTime.CopyToDateTimeString": {
+                "calls": 1,
+                "latency_histogram": {},
+            },
+        }
+        difference = instrumentation.Instrumentation.GetSnapshotDifference(
+            start_snapshot, end_snapshot
+        )
+        self.assertEqual(
+            difference,
+            {
+                "Filetime.CopyToDateTimeString": {
+                    "calls": 3,
+                    "latency_histogram": {256: 2},
+                }
+            },
+        )
+
+    def testScope(self):
+        """Tests the Scope function."""
+        filetime_object = filetime.Filetime(timestamp=0x01CB3A623D0A17CE)
+
+        with instrumentation.Instrumentation.Scope(name="export") as scope:
+            self.assertTrue(instrumentation.Instrumentation.IsEnabled())
+            filetime_object.CopyToDateTimeString()
+
+        self.assertFalse(instrumentation.Instrumentation.IsEnabled())
+        self.assertEqual(scope.name, "export")
+        self.assertEqual(
+            list(scope.statistics.keys()), ["Filetime.CopyToDateTimeString"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
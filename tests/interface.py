@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for the date and time interfaces."""
 
+import decimal
+import struct
 import unittest
 
 from dfdatetime import definitions
@@ -287,6 +289,74 @@ class DateTimeValuesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             date_time_values._CopyDateTimeFromString("2010-08-12T21:06:31.546875+01:00")
 
+    def testCopyDateTimeTupleFromString(self):
+        """Tests the _CopyDateTimeTupleFromString function."""
+        date_time_values = interface.DateTimeValues()
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString("2010-08-12")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 0, 0, 0, 0, None))
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-08-12 21:06:31"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 0, None))
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-08-12 21:06:31.546"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546000000, None))
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-08-12 21:06:31.546875-01:00"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546875000, -60))
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-08-12 21:06:31.546875333+01:30"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546875333, 90))
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-08-12 21:06:31+05:30"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 0, 330))
+
+        for time_string, expected_error_message in (
+            ("", "Invalid time string."),
+            ("2010-08", "Date string too short."),
+            ("2010-0x-12 21:06:31", "Unable to parse month."),
+            ("2010-02-29 21:06:31", "Day of month value out of bounds."),
+            ("2010-08-32 21:06:31", "Day of month value out of bounds."),
+            ("2010-13-01 00:00:00", "Month value out of bounds."),
+            ("2010-08-12 25:00:00", "Hours value: 25 out of bounds."),
+            ("2010-08-12 21:61:00", "Minutes value: 61 out of bounds."),
+            (
+                "2010-08-12 21:06:31+25:00",
+                "Time zone hours offset value out of bounds.",
+            ),
+            (
+                "2010-08-12T21:06:31",
+                "Invalid time string - space missing as date and time separator.",
+            ),
+            ("2010-08-12 21:06:31.5", "Invalid time string."),
+            ("2010-08-12 21:06:31+0100", "Invalid time string."),
+        ):
+            with self.assertRaisesRegex(ValueError, f"^{expected_error_message:s}$"):
+                date_time_values._CopyDateTimeTupleFromString(time_string)
+
+        # A value that int() supports, such as "+8", is supported as well.
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "2010-+8-12 21:06:31"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 0, None))
+
+        date_time_values = interface.DateTimeValues(is_delta=True)
+
+        date_time_tuple = date_time_values._CopyDateTimeTupleFromString(
+            "0001-02-29 00:00:00"
+        )
+        self.assertEqual(date_time_tuple, (1, 2, 29, 0, 0, 0, 0, None))
+
     def testCopyTimeFromString(self):
         """Tests the _CopyTimeFromString function."""
         date_time_values = interface.DateTimeValues()
@@ -376,6 +446,59 @@ class DateTimeValuesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             date_time_values._CopyTimeFromString("12:00:00+01:60")
 
+    def testGetDateTimeTupleFromString(self):
+        """Tests the _GetDateTimeTupleFromString function."""
+        date_time_values = interface.DateTimeValues()
+
+        date_time_tuple = date_time_values._GetDateTimeTupleFromString("2010-08-12")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 0, 0, 0, 0, None))
+
+        date_time_tuple = date_time_values._GetDateTimeTupleFromString(
+            "2010-08-12 21:06:31.546875-01:00"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546875000, -60))
+
+        # Characters between the seconds and the time zone offset are ignored
+        # by the field by field parser.
+        date_time_tuple = date_time_values._GetDateTimeTupleFromString(
+            "2010-08-12 21:06:31Z"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 0, None))
+
+        for time_string in (
+            None,
+            "",
+            "2010-02-29 21:06:31",
+            "2010-08-12 24:06:31",
+            "2010-08-12 21:06:31+15:00",
+            "2010-08-12T21:06:31",
+            "2010-08-12 21:06:31.5",
+            "2010-08-12 21:06:31+0100",
+        ):
+            self.assertIsNone(date_time_values._GetDateTimeTupleFromString(time_string))
+
+    def testGetDateStringWithEpoch(self):
+        """Tests the _GetDateStringWithEpoch function."""
+        date_time_epoch = interface.DateTimeEpoch(2000, 1, 1)
+        date_time_values = interface.DateTimeValues()
+
+        date_string = date_time_values._GetDateStringWithEpoch(0, date_time_epoch)
+        self.assertEqual(date_string, "2000-01-01")
+
+        date_string = date_time_values._GetDateStringWithEpoch(0, date_time_epoch)
+        self.assertEqual(date_string, "2000-01-01")
+
+        date_string = date_time_values._GetDateStringWithEpoch(-1, date_time_epoch)
+        self.assertEqual(date_string, "1999-12-31")
+
+        date_time_epoch = interface.DateTimeEpoch(1970, 1, 1)
+
+        date_string = date_time_values._GetDateStringWithEpoch(0, date_time_epoch)
+        self.assertEqual(date_string, "1970-01-01")
+
+        with self.assertRaises(ValueError):
+            date_time_values._GetDateStringWithEpoch(-1000000000, date_time_epoch)
+
     def testGetDateValues(self):
         """Tests the _GetDateValues function."""
         date_time_values = interface.DateTimeValues()
@@ -567,6 +690,59 @@ class DateTimeValuesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             date_time_values._GetDaysPerMonth(1999, 13)
 
+    def testGetIntegerFromString(self):
+        """Tests the _GetIntegerFromString function."""
+        date_time_values = interface.DateTimeValues()
+
+        for string, expected_integer in (
+            ("08", 8),
+            ("+8", 8),
+            (" 8", 8),
+            ("-1", -1),
+            ("1_0", 10),
+            ("0\u0663", 3),
+        ):
+            integer = date_time_values._GetIntegerFromString(string)
+            self.assertEqual(integer, expected_integer)
+
+        for string in ("", " ", "+", "0x", "1.", "1__0", "\u00b2", "\x1c1"):
+            integer = date_time_values._GetIntegerFromString(string)
+            self.assertIsNone(integer)
+
+    def testGetNormalizedTimestampFromFloat(self):
+        """Tests the _GetNormalizedTimestampFromFloat function."""
+        normalized_timestamp = (
+            interface.DateTimeValues._GetNormalizedTimestampFromFloat(
+                43581.5123456789, 25569, definitions.SECONDS_PER_DAY, None
+            )
+        )
+        self.assertEqual(
+            normalized_timestamp, decimal.Decimal("1556281066.666657011955976486")
+        )
+
+        normalized_timestamp = (
+            interface.DateTimeValues._GetNormalizedTimestampFromFloat(
+                43581.5123456789, 25569, definitions.SECONDS_PER_DAY, 60
+            )
+        )
+        self.assertEqual(
+            normalized_timestamp, decimal.Decimal("1556277466.666657011955976486")
+        )
+
+        normalized_timestamp = (
+            interface.DateTimeValues._GetNormalizedTimestampFromFloat(
+                395011845.5, -978307200, 1, None
+            )
+        )
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1373319045.5"))
+
+        normalized_timestamp = (
+            interface.DateTimeValues._GetNormalizedTimestampFromFloat(
+                float("inf"), 25569, definitions.SECONDS_PER_DAY, None
+            )
+        )
+        self.assertEqual(normalized_timestamp, decimal.Decimal("Infinity"))
+
     def testGetNumberOfDaysInCentury(self):
         """Tests the _GetNumberOfDaysInCentury function."""
         date_time_values = interface.DateTimeValues()
@@ -654,6 +830,31 @@ class DateTimeValuesTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             date_time_values._GetNumberOfSecondsFromElements(10000, 8, 12, 21, 6, 31)
 
+    def testGetPosixTimestampsInMicrosecondsFromFloats(self):
+        """Tests the _GetPosixTimestampsInMicrosecondsFromFloats function."""
+        posix_timestamps, validity_mask = (
+            interface.DateTimeValues._GetPosixTimestampsInMicrosecondsFromFloats(
+                [43581.5123456789, 25569.0, 0.0, float("nan"), 1e300],
+                25569,
+                definitions.SECONDS_PER_DAY,
+                None,
+            )
+        )
+        self.assertEqual(
+            list(posix_timestamps), [1556281066666657, 0, -2209161600000000, 0, 0]
+        )
+        self.assertEqual(list(validity_mask), [1, 1, 1, 0, 0])
+
+        # 5e-7 is slightly less than half a microsecond, but is rounded up by
+        # the decimal arithmetic of GetPlasoTimestamp.
+        posix_timestamps, validity_mask = (
+            interface.DateTimeValues._GetPosixTimestampsInMicrosecondsFromFloats(
+                [5e-7, -5e-7], -978307200, 1, 60
+            )
+        )
+        self.assertEqual(list(posix_timestamps), [978303600000001, 978303600000000])
+        self.assertEqual(list(validity_mask), [1, 1])
+
     def testGetTimeValues(self):
         """Tests the _GetTimeValues function."""
         date_time_values = interface.DateTimeValues()
@@ -706,6 +907,33 @@ class DateTimeValuesTest(unittest.TestCase):
         self.assertEqual(minutes, 56)
         self.assertEqual(seconds, 50)
 
+    def testGetTimeZoneOffsetString(self):
+        """Tests the _GetTimeZoneOffsetString function."""
+        date_time_values = interface.DateTimeValues()
+
+        time_zone_string = date_time_values._GetTimeZoneOffsetString(0)
+        self.assertEqual(time_zone_string, "+00:00")
+
+        time_zone_string = date_time_values._GetTimeZoneOffsetString(330)
+        self.assertEqual(time_zone_string, "+05:30")
+
+        time_zone_string = date_time_values._GetTimeZoneOffsetString(-90)
+        self.assertEqual(time_zone_string, "-01:30")
+
+    def testIsDateTimeStringCandidate(self):
+        """Tests the _IsDateTimeStringCandidate function."""
+        date_time_values = interface.DateTimeValues()
+
+        self.assertTrue(date_time_values._IsDateTimeStringCandidate("2010-08-12"))
+        self.assertTrue(
+            date_time_values._IsDateTimeStringCandidate("2010-08-12 21:06:31")
+        )
+
+        self.assertFalse(date_time_values._IsDateTimeStringCandidate(None))
+        self.assertFalse(date_time_values._IsDateTimeStringCandidate(""))
+        self.assertFalse(date_time_values._IsDateTimeStringCandidate("2010-08-1"))
+        self.assertFalse(date_time_values._IsDateTimeStringCandidate("20100812T21"))
+
     def testIsLeapYear(self):
         """Tests the _IsLeapYear function."""
         date_time_values = interface.DateTimeValues()
@@ -714,6 +942,95 @@ class DateTimeValuesTest(unittest.TestCase):
         self.assertTrue(date_time_values._IsLeapYear(2000))
         self.assertTrue(date_time_values._IsLeapYear(1996))
 
+    def testParseDateFromString(self):
+        """Tests the _ParseDateFromString function."""
+        date_time_values = interface.DateTimeValues()
+
+        result = date_time_values._ParseDateFromString("2010-08-12")
+        self.assertEqual(result, ((2010, 8, 12), None))
+
+        result = date_time_values._ParseDateFromString("2012-02-29 21:06:31")
+        self.assertEqual(result, ((2012, 2, 29), None))
+
+        for date_string, expected_error_message in (
+            ("", "Date string too short."),
+            ("2010-08-1", "Date string too short."),
+            ("2010/08/12", "Invalid date string."),
+            ("195a-01-02", "Unable to parse year."),
+            ("2010-a1-02", "Unable to parse month."),
+            ("2010-01-b2", "Unable to parse day of month."),
+            ("2010-13-12", "Month value out of bounds."),
+            ("2010-09-00", "Day of month value out of bounds."),
+            ("2010-02-29", "Day of month value out of bounds."),
+        ):
+            result = date_time_values._ParseDateFromString(date_string)
+            self.assertEqual(result, (None, expected_error_message))
+
+    def testParseTimeFromString(self):
+        """Tests the _ParseTimeFromString function."""
+        date_time_values = interface.DateTimeValues()
+
+        result = date_time_values._ParseTimeFromString("20:23:56")
+        self.assertEqual(result, ((20, 23, 56, None, None), None))
+
+        result = date_time_values._ParseTimeFromString("20:23:56.327124-05:00")
+        self.assertEqual(result, ((20, 23, 56, 327124000, -300), None))
+
+        for time_string, expected_error_message in (
+            ("14:00", "Time string too short."),
+            ("12b00:00", "Invalid time string."),
+            ("1s:00:00", "Unable to parse hours."),
+            ("24:00:00", "Hours value: 24 out of bounds."),
+            ("00:e0:00", "Unable to parse minutes."),
+            ("12:60:00", "Minutes value: 60 out of bounds."),
+            ("00:00:w0", "Unable to parse day of seconds."),
+            ("12:00:60", "Seconds value: 60 out of bounds."),
+            ("12:00:00.12", "Invalid time string."),
+            ("12:00:00.1\u00b23", "Unable to parse time fraction."),
+            ("12:00:00+0100", "Invalid time string."),
+            ("12:00:00+0w:00", "Unable to parse time zone hours offset."),
+            ("12:00:00+15:00", "Time zone hours offset value out of bounds."),
+            ("12:00:00+01:0w", "Unable to parse time zone minutes offset."),
+            ("12:00:00+01:60", "Time zone minutes offset value out of bounds."),
+        ):
+            result = date_time_values._ParseTimeFromString(time_string)
+            self.assertEqual(result, (None, expected_error_message))
+
+    def testUnpackBufferAtStride(self):
+        """Tests the _UnpackBufferAtStride function."""
+        value_struct = struct.Struct(">H")
+        buffer = bytes(range(10))
+
+        values = interface.DateTimeValues._UnpackBufferAtStride(
+            buffer, value_struct, 0, None
+        )
+        self.assertEqual(
+            values, [(0x0001,), (0x0203,), (0x0405,), (0x0607,), (0x0809,)]
+        )
+
+        values = interface.DateTimeValues._UnpackBufferAtStride(
+            buffer, value_struct, 1, 4
+        )
+        self.assertEqual(values, [(0x0102,), (0x0506,)])
+
+        values = interface.DateTimeValues._UnpackBufferAtStride(
+            memoryview(buffer), value_struct, 7, 4
+        )
+        self.assertEqual(values, [(0x0708,)])
+
+        values = interface.DateTimeValues._UnpackBufferAtStride(
+            buffer, value_struct, 9, None
+        )
+        self.assertEqual(values, [])
+
+        with self.assertRaises(ValueError):
+            interface.DateTimeValues._UnpackBufferAtStride(
+                buffer, value_struct, -1, None
+            )
+
+        with self.assertRaises(ValueError):
+            interface.DateTimeValues._UnpackBufferAtStride(buffer, value_struct, 0, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for the KSUID timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import ksuid_time
+
+
+class KSUIDTimeEpochTest(unittest.TestCase):
+    """Tests for the KSUID time epoch."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        ksuid_epoch = ksuid_time.KSUIDTimeEpoch()
+        self.assertIsNotNone(ksuid_epoch)
+
+
+class KSUIDTimeTest(unittest.TestCase):
+    """Tests for the KSUID timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        ksuid_time_object = ksuid_time.KSUIDTime(timestamp=107608047)
+
+        normalized_timestamp = ksuid_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1507608047"))
+
+        ksuid_time_object = ksuid_time.KSUIDTime(timestamp=-1)
+
+        normalized_timestamp = ksuid_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testGetTimestampFromString(self):
+        """Tests the _GetTimestampFromString function."""
+        timestamp = ksuid_time.KSUIDTime._GetTimestampFromString(
+            "0ujtsYcgvSTl8PAuAdqWYSMnLOv"
+        )
+        self.assertEqual(timestamp, 107608047)
+
+        timestamp = ksuid_time.KSUIDTime._GetTimestampFromString(
+            "aWgEPTl1tmebfsQzFP4bxwgy80V"
+        )
+        self.assertEqual(timestamp, 0xFFFFFFFF)
+
+        # The first 7 characters of this KSUID string do not determine the
+        # timestamp.
+        timestamp = ksuid_time.KSUIDTime._GetTimestampFromString(
+            "0ujtsYdzzzzzzzzzzzzzzzzzzzz"
+        )
+        self.assertEqual(timestamp, 107608047)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        ksuid_time_object = ksuid_time.KSUIDTime()
+
+        ksuid_time_object.CopyFromDateTimeString("2017-10-10 04:00:47")
+        self.assertEqual(ksuid_time_object.timestamp, 107608047)
+
+        with self.assertRaises(ValueError):
+            ksuid_time_object.CopyFromDateTimeString("2014-05-13 16:53:19")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        ksuid_time_object = ksuid_time.KSUIDTime(timestamp=107608047)
+
+        date_time_string = ksuid_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2017-10-10 04:00:47")
+
+        ksuid_time_object = ksuid_time.KSUIDTime(timestamp=0)
+
+        date_time_string = ksuid_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2014-05-13 16:53:20")
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = bytes.fromhex("0669f7efb5a1cd34b5f99d1154fb6853345c9735")
+
+        timestamps, validity_mask = ksuid_time.KSUIDTime.DecodeBuffer(buffer)
+        self.assertEqual(list(timestamps), [1507608047])
+        self.assertEqual(list(validity_mask), [1])
+
+        with self.assertRaises(ValueError):
+            ksuid_time.KSUIDTime.DecodeBuffer(bytes(21))
+
+    def testDecodeStrings(self):
+        """Tests the DecodeStrings function."""
+        timestamps, validity_mask = ksuid_time.KSUIDTime.DecodeStrings(
+            [
+                "0ujtsYcgvSTl8PAuAdqWYSMnLOv",
+                "aWgEPTl1tmebfsQzFP4bxwgy80W",
+                "0ujtsYcgvSTl8PAuAdqWYSMnLO",
+                "0ujtsYcgvSTl8PAuAdqWYSMnLO-",
+            ]
+        )
+        self.assertEqual(list(timestamps), [1507608047, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 0, 0, 0])
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = bytes.fromhex("0669f7efb5a1cd34b5f99d1154fb6853345c9735")
+
+        ksuid_time_objects = ksuid_time.KSUIDTime.NewFromBuffer(buffer)
+        self.assertEqual(len(ksuid_time_objects), 1)
+        self.assertEqual(ksuid_time_objects[0].timestamp, 107608047)
+
+    def testNewFromStrings(self):
+        """Tests the NewFromStrings function."""
+        ksuid_time_objects = ksuid_time.KSUIDTime.NewFromStrings(
+            ["0ujtsYcgvSTl8PAuAdqWYSMnLOv", "invalid"]
+        )
+        self.assertEqual(len(ksuid_time_objects), 2)
+        self.assertEqual(ksuid_time_objects[0].timestamp, 107608047)
+        self.assertIsNone(ksuid_time_objects[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
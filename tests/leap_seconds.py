@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for the leap second table."""
+
+import io
+import unittest
+
+from dfdatetime import leap_seconds
+
+
+class LeapSecondTableTest(unittest.TestCase):
+    """Tests for the leap second table."""
+
+    # pylint: disable=protected-access
+
+    _LEAP_SECONDS_LIST = "\n".join(
+        [
+            "# Leap seconds",
+            "#@\t3991593600",
+            "2272060800\t10\t# 1 Jan 1972",
+            "3644697600\t36\t# 1 Jul 2015",
+            "3692217600\t37\t# 1 Jan 2017",
+            "",
+        ]
+    )
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        leap_second_table = leap_seconds.LeapSecondTable()
+        self.assertEqual(len(leap_second_table), 28)
+
+        leap_second_table = leap_seconds.LeapSecondTable(
+            leap_seconds=[(1483228800, 37), (63072000, 10)]
+        )
+        self.assertEqual(len(leap_second_table), 2)
+
+        with self.assertRaises(ValueError):
+            leap_seconds.LeapSecondTable(leap_seconds=[])
+
+    def testGetOffsetInterval(self):
+        """Tests the _GetOffsetInterval function."""
+        leap_second_table = leap_seconds.LeapSecondTable()
+
+        interval = leap_second_table._GetOffsetInterval(1483228835)
+        self.assertEqual(interval, (36, 1435708836, 1483228836))
+
+        interval = leap_second_table._GetOffsetInterval(1483228836)
+        self.assertEqual(interval, (36, 1483228836, 1483228837))
+
+        interval = leap_second_table._GetOffsetInterval(1483228837)
+        self.assertEqual(interval, (37, 1483228837, float("inf")))
+
+        interval = leap_second_table._GetOffsetInterval(0)
+        self.assertEqual(interval, (10, float("-inf"), 63072010))
+
+    def testCopyTAIToPOSIXTimestamps(self):
+        """Tests the CopyTAIToPOSIXTimestamps function."""
+        leap_second_table = leap_seconds.LeapSecondTable()
+
+        posix_timestamps = leap_second_table.CopyTAIToPOSIXTimestamps(
+            [1483228835, 1483228836, 1483228837, 1435708834, 1435708835, 10]
+        )
+        self.assertEqual(
+            posix_timestamps,
+            [1483228799, 1483228800, 1483228800, 1435708799, 1435708800, 0],
+        )
+
+        posix_timestamps = leap_second_table.CopyTAIToPOSIXTimestamps(
+            [1483228835500, 1483228836500, 1483228837500], units_per_second=1000
+        )
+        self.assertEqual(
+            posix_timestamps, [1483228799500, 1483228800500, 1483228800500]
+        )
+
+    def testGetOffsetFromPOSIXTimestamp(self):
+        """Tests the GetOffsetFromPOSIXTimestamp function."""
+        leap_second_table = leap_seconds.LeapSecondTable()
+
+        offset = leap_second_table.GetOffsetFromPOSIXTimestamp(1483228799)
+        self.assertEqual(offset, 36)
+
+        offset = leap_second_table.GetOffsetFromPOSIXTimestamp(1483228800)
+        self.assertEqual(offset, 37)
+
+        offset = leap_second_table.GetOffsetFromPOSIXTimestamp(0)
+        self.assertEqual(offset, 10)
+
+    def testGetOffsetFromTAITimestamp(self):
+        """Tests the GetOffsetFromTAITimestamp function."""
+        leap_second_table = leap_seconds.LeapSecondTable()
+
+        offset = leap_second_table.GetOffsetFromTAITimestamp(1483228835)
+        self.assertEqual(offset, (36, False))
+
+        offset = leap_second_table.GetOffsetFromTAITimestamp(1483228836)
+        self.assertEqual(offset, (36, True))
+
+        offset = leap_second_table.GetOffsetFromTAITimestamp(1483228837)
+        self.assertEqual(offset, (37, False))
+
+        offset = leap_second_table.GetOffsetFromTAITimestamp(0)
+        self.assertEqual(offset, (10, False))
+
+    def testNewFromLeapSecondsList(self):
+        """Tests the NewFromLeapSecondsList function."""
+        file_object = io.StringIO(self._LEAP_SECONDS_LIST)
+
+        leap_second_table = leap_seconds.LeapSecondTable.NewFromLeapSecondsList(
+            file_object
+        )
+        self.assertEqual(len(leap_second_table), 3)
+
+        offset = leap_second_table.GetOffsetFromPOSIXTimestamp(1483228800)
+        self.assertEqual(offset, 37)
+
+        offset = leap_second_table.GetOffsetFromPOSIXTimestamp(1435708799)
+        self.assertEqual(offset, 10)
+
+        with self.assertRaises(ValueError):
+            leap_seconds.LeapSecondTable.NewFromLeapSecondsList(
+                io.StringIO("3692217600\n")
+            )
+
+        with self.assertRaises(ValueError):
+            leap_seconds.LeapSecondTable.NewFromLeapSecondsList(io.StringIO("# empty"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for the linear timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import definitions
+from dfdatetime import interface
+from dfdatetime import linear_time
+
+
+class TestLinearTime(linear_time.LinearTime):
+    """Linear timestamp for testing."""
+
+    _DEFAULT_PRECISION = definitions.PRECISION_100_NANOSECONDS
+
+    _EPOCH = interface.DateTimeEpoch(1900, 1, 1)
+
+    _MAXIMUM_TIMESTAMP = (1 << 32) * 10000000
+    _MINIMUM_TIMESTAMP = 0
+
+    _MAXIMUM_YEAR = 2099
+    _MINIMUM_YEAR = 1900
+
+    _POSIX_BASE = 2208988800
+
+    _UNITS_PER_SECOND = 10000000
+
+
+class LinearTimeTest(unittest.TestCase):
+    """Tests for the linear timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testProperties(self):
+        """Tests the properties."""
+        linear_time_object = TestLinearTime(timestamp=35111000000000000)
+        self.assertEqual(linear_time_object.timestamp, 35111000000000000)
+
+        linear_time_object = TestLinearTime()
+        self.assertIsNone(linear_time_object.timestamp)
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        linear_time_object = TestLinearTime(timestamp=35111000000000001)
+
+        normalized_timestamp = linear_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1302111200.0000001"))
+
+        linear_time_object = TestLinearTime(
+            time_zone_offset=60, timestamp=35111000000000001
+        )
+
+        normalized_timestamp = linear_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1302107600.0000001"))
+
+        linear_time_object = TestLinearTime(timestamp=-1)
+
+        normalized_timestamp = linear_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+        linear_time_object = TestLinearTime()
+
+        normalized_timestamp = linear_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        linear_time_object = TestLinearTime()
+
+        linear_time_object.CopyFromDateTimeString("2011-04-06 17:33:20.123456")
+        self.assertEqual(linear_time_object.timestamp, 35111000001234560)
+        self.assertEqual(linear_time_object._time_zone_offset, None)
+
+        linear_time_object.CopyFromDateTimeString("2011-04-06 17:33:20+01:00")
+        self.assertEqual(linear_time_object.timestamp, 35111000000000000)
+        self.assertEqual(linear_time_object._time_zone_offset, 60)
+        self.assertEqual(
+            linear_time_object._GetNormalizedTimestamp(),
+            decimal.Decimal("1302107600"),
+        )
+
+        with self.assertRaises(ValueError):
+            linear_time_object.CopyFromDateTimeString("1899-12-31 23:59:59")
+
+        with self.assertRaises(ValueError):
+            linear_time_object.CopyFromDateTimeString("2099-01-01 00:00:00")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        linear_time_object = TestLinearTime(timestamp=35111000001234567)
+
+        date_time_string = linear_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2011-04-06 17:33:20.1234567")
+
+        linear_time_object = TestLinearTime(timestamp=-1)
+
+        date_time_string = linear_time_object.CopyToDateTimeString()
+        self.assertIsNone(date_time_string)
+
+    def testCopyToPosixTimestamp(self):
+        """Tests the CopyToPosixTimestamp function."""
+        linear_time_object = TestLinearTime(timestamp=35111000009999999)
+
+        posix_timestamp = linear_time_object.CopyToPosixTimestamp()
+        self.assertEqual(posix_timestamp, 1302111200)
+
+        # Timestamps before the POSIX epoch are truncated towards zero.
+        linear_time_object = TestLinearTime(timestamp=22089887990000001)
+
+        posix_timestamp = linear_time_object.CopyToPosixTimestamp()
+        self.assertEqual(posix_timestamp, 0)
+
+        linear_time_object = TestLinearTime()
+
+        posix_timestamp = linear_time_object.CopyToPosixTimestamp()
+        self.assertIsNone(posix_timestamp)
+
+    def testGetPlasoTimestamp(self):
+        """Tests the GetPlasoTimestamp function."""
+        linear_time_object = TestLinearTime(timestamp=35111000000000005)
+
+        micro_posix_timestamp = linear_time_object.GetPlasoTimestamp()
+        self.assertEqual(micro_posix_timestamp, 1302111200000001)
+
+        linear_time_object = TestLinearTime(timestamp=35111000000000004)
+
+        micro_posix_timestamp = linear_time_object.GetPlasoTimestamp()
+        self.assertEqual(micro_posix_timestamp, 1302111200000000)
+
+        # Timestamps before the POSIX epoch are rounded half away from zero.
+        linear_time_object = TestLinearTime(timestamp=22089887999999995)
+
+        micro_posix_timestamp = linear_time_object.GetPlasoTimestamp()
+        self.assertEqual(micro_posix_timestamp, -1)
+
+        linear_time_object = TestLinearTime(timestamp=22089887999999996)
+
+        micro_posix_timestamp = linear_time_object.GetPlasoTimestamp()
+        self.assertEqual(micro_posix_timestamp, 0)
+
+        linear_time_object = TestLinearTime()
+
+        micro_posix_timestamp = linear_time_object.GetPlasoTimestamp()
+        self.assertIsNone(micro_posix_timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
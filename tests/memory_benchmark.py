@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the memory footprint benchmark."""
+
+import unittest
+
+from dfdatetime import memory_benchmark
+from dfdatetime import posix_time
+
+
+class MemoryBenchmarkTest(unittest.TestCase):
+    """Tests for the memory footprint benchmark."""
+
+    def testAddCase(self):
+        """Tests the AddCase function."""
+        test_benchmark = memory_benchmark.MemoryBenchmark(number_of_instances=10)
+
+        benchmark_case = memory_benchmark.MemoryBenchmarkCase(
+            "PosixTime", lambda index: posix_time.PosixTime(timestamp=index)
+        )
+        test_benchmark.AddCase(benchmark_case)
+        self.assertEqual(test_benchmark.GetCaseNames(), ["PosixTime"])
+
+        with self.assertRaises(KeyError):
+            test_benchmark.AddCase(benchmark_case)
+
+    def testRun(self):
+        """Tests the Run function."""
+        test_benchmark = memory_benchmark.MemoryBenchmark(number_of_instances=100)
+        for benchmark_case in memory_benchmark.GetDefaultCases():
+            test_benchmark.AddCase(benchmark_case)
+
+        results = test_benchmark.Run()
+        self.assertEqual(sorted(results.keys()), sorted(test_benchmark.GetCaseNames()))
+
+        filetime_results = results["Filetime"]
+        self.assertEqual(
+            sorted(filetime_results.keys()),
+            ["column", "objects", "objects_with_caches"],
+        )
+        self.assertGreater(filetime_results["objects"]["bytes_per_instance"], 0.0)
+        self.assertGreaterEqual(
+            filetime_results["objects_with_caches"]["bytes_per_instance"],
+            filetime_results["objects"]["bytes_per_instance"],
+        )
+        self.assertLess(
+            filetime_results["column"]["bytes_per_instance"],
+            filetime_results["objects"]["bytes_per_instance"],
+        )
+
+        with self.assertRaises(KeyError):
+            test_benchmark.RunCase("bogus")
+
+    def testCompareWithBaseline(self):
+        """Tests the CompareWithBaseline function."""
+        test_benchmark = memory_benchmark.MemoryBenchmark(number_of_instances=10)
+
+        results = {
+            "Filetime": {
+                "objects": {"bytes_per_instance": 150.0},
+                "column": {"bytes_per_instance": 8.0},
+            },
+            "PosixTime": {"objects": {"bytes_per_instance": 100.0}},
+        }
+        baseline = {
+            "Filetime": {
+                "objects": {"bytes_per_instance": 100.0},
+                "column": {"bytes_per_instance": 0.0},
+            }
+        }
+        trends = test_benchmark.CompareWithBaseline(results, baseline)
+        self.assertEqual(trends, {"Filetime": {"objects": 50.0}})
+
+    def testFormatReport(self):
+        """Tests the FormatReport function."""
+        test_benchmark = memory_benchmark.MemoryBenchmark(number_of_instances=10)
+
+        results = {
+            "Filetime": {
+                "objects": {
+                    "bytes_per_instance": 150.0,
+                    "current_size": 1500,
+                    "peak_size": 1500,
+                },
+            },
+        }
+        trends = {"Filetime": {"objects": 50.0}}
+
+        report = test_benchmark.FormatReport(results, trends=trends)
+        self.assertIn("Number of instances per case: 10", report)
+        self.assertIn("+50.0%", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
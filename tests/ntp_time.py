@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for the NTP timestamp implementation."""
+
+import decimal
+import struct
+import unittest
+
+from dfdatetime import ntp_time
+
+
+class NTPTimeEpochTest(unittest.TestCase):
+    """Tests for the NTP time epoch."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        ntp_time_epoch = ntp_time.NTPTimeEpoch()
+        self.assertIsNotNone(ntp_time_epoch)
+
+
+class NTPTimeTest(unittest.TestCase):
+    """Tests for the NTP timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testProperties(self):
+        """Tests the properties."""
+        ntp_time_object = ntp_time.NTPTime(timestamp=0xE93DFBA51F9ADD38)
+        self.assertEqual(ntp_time_object.timestamp, 0xE93DFBA51F9ADD38)
+
+        ntp_time_object = ntp_time.NTPTime()
+        self.assertIsNone(ntp_time_object.timestamp)
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        ntp_time_object = ntp_time.NTPTime(timestamp=0xE9B4CE1520000000)
+
+        normalized_timestamp = ntp_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1711951765.125"))
+
+        ntp_time_object = ntp_time.NTPTime(
+            time_zone_offset=60, timestamp=0xE9B4CE1520000000
+        )
+
+        normalized_timestamp = ntp_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1711948165.125"))
+
+        ntp_time_object = ntp_time.NTPTime(timestamp=0x10000000000000000)
+
+        normalized_timestamp = ntp_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+        ntp_time_object = ntp_time.NTPTime()
+
+        normalized_timestamp = ntp_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        ntp_time_object = ntp_time.NTPTime()
+
+        ntp_time_object.CopyFromDateTimeString("2024-01-02 03:04:05.123456789")
+        self.assertEqual(ntp_time_object._timestamp, 0xE93DFBA51F9ADD38)
+        self.assertEqual(ntp_time_object._time_zone_offset, None)
+
+        ntp_time_object.CopyFromDateTimeString("2024-04-01 06:09:25.125+01:00")
+        self.assertEqual(ntp_time_object._timestamp, 0xE9B4CE1520000000)
+        self.assertEqual(ntp_time_object._time_zone_offset, 60)
+
+        with self.assertRaises(ValueError):
+            ntp_time_object.CopyFromDateTimeString("1899-12-31 23:59:59")
+
+        with self.assertRaises(ValueError):
+            ntp_time_object.CopyFromDateTimeString("2036-02-07 06:28:16")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        ntp_time_object = ntp_time.NTPTime(timestamp=0xE93DFBA51F9ADD38)
+
+        date_time_string = ntp_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2024-01-02 03:04:05.123456789")
+
+        ntp_time_object = ntp_time.NTPTime()
+
+        date_time_string = ntp_time_object.CopyToDateTimeString()
+        self.assertIsNone(date_time_string)
+
+    def testCopyToSerializableDict(self):
+        """Tests the CopyToSerializableDict function."""
+        ntp_time_object = ntp_time.NTPTime(timestamp=0xE9B4CE1520000000)
+
+        expected_serializable_dict = {
+            "__class_name__": "NTPTime",
+            "__type__": "DateTimeValues",
+            "timestamp": 0xE9B4CE1520000000,
+        }
+        serializable_dict = ntp_time_object.CopyToSerializableDict()
+        self.assertEqual(serializable_dict, expected_serializable_dict)
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        # NTP packets of 48 bytes, of which the transmit timestamp is stored at
+        # offset 40.
+        buffer = b"".join(
+            bytes(40) + struct.pack(">Q", timestamp)
+            for timestamp in (0xE9B4CE1520000000, 0, 0xE93DFBA51F9ADD38)
+        )
+
+        timestamps, validity_mask = ntp_time.NTPTime.DecodeBuffer(
+            buffer, offset=40, stride=48
+        )
+        self.assertEqual(
+            list(timestamps), [1711951765125000000, 0, 1704164645123456789]
+        )
+        self.assertEqual(list(validity_mask), [1, 0, 1])
+
+        timestamps, validity_mask = ntp_time.NTPTime.DecodeBuffer(
+            struct.pack(">Q", 0xE9B4CE1520000000) + bytes(4)
+        )
+        self.assertEqual(list(timestamps), [1711951765125000000])
+        self.assertEqual(list(validity_mask), [1])
+
+        with self.assertRaises(ValueError):
+            ntp_time.NTPTime.DecodeBuffer(buffer, offset=-1)
+
+        with self.assertRaises(ValueError):
+            ntp_time.NTPTime.DecodeBuffer(buffer, stride=4)
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = struct.pack(">QQ", 0xE9B4CE1520000000, 0)
+
+        ntp_time_objects = ntp_time.NTPTime.NewFromBuffer(buffer)
+        self.assertEqual(len(ntp_time_objects), 2)
+        self.assertIsNone(ntp_time_objects[1])
+
+        date_time_string = ntp_time_objects[0].CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2024-04-01 06:09:25.125000000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the MongoDB ObjectId timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import object_id_time
+
+
+class ObjectIdTimeTest(unittest.TestCase):
+    """Tests for the MongoDB ObjectId timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        object_id_time_object = object_id_time.ObjectIdTime(timestamp=1350508407)
+
+        normalized_timestamp = object_id_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1350508407"))
+
+        object_id_time_object = object_id_time.ObjectIdTime(timestamp=0x100000000)
+
+        normalized_timestamp = object_id_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        object_id_time_object = object_id_time.ObjectIdTime()
+
+        object_id_time_object.CopyFromDateTimeString("2012-10-17 21:13:27")
+        self.assertEqual(object_id_time_object.timestamp, 1350508407)
+
+        with self.assertRaises(ValueError):
+            object_id_time_object.CopyFromDateTimeString("1969-12-31 23:59:59")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        object_id_time_object = object_id_time.ObjectIdTime(timestamp=1350508407)
+
+        date_time_string = object_id_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2012-10-17 21:13:27")
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = bytes.fromhex("507f1f77bcf86cd799439011" "000000010000000000000000")
+
+        timestamps, validity_mask = object_id_time.ObjectIdTime.DecodeBuffer(buffer)
+        self.assertEqual(list(timestamps), [1350508407, 1])
+        self.assertEqual(list(validity_mask), [1, 1])
+
+        with self.assertRaises(ValueError):
+            object_id_time.ObjectIdTime.DecodeBuffer(bytes(13))
+
+    def testDecodeStrings(self):
+        """Tests the DecodeStrings function."""
+        timestamps, validity_mask = object_id_time.ObjectIdTime.DecodeStrings(
+            ["507f1f77bcf86cd799439011", "507F1F77BCF86CD799439011"]
+        )
+        self.assertEqual(list(timestamps), [1350508407, 1350508407])
+        self.assertEqual(list(validity_mask), [1, 1])
+
+        timestamps, validity_mask = object_id_time.ObjectIdTime.DecodeStrings(
+            [
+                "507f1f77bcf86cd799439011",
+                "507f1f77bcf86cd79943901",
+                "507f1f77bcf86cd7994390111",
+                "507f1f77bcf86cd79943901x",
+                "507f1f77 bcf86cd79943901",
+            ]
+        )
+        self.assertEqual(list(timestamps), [1350508407, 0, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 0, 0, 0, 0])
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = bytes.fromhex("507f1f77bcf86cd799439011")
+
+        object_id_time_objects = object_id_time.ObjectIdTime.NewFromBuffer(buffer)
+        self.assertEqual(len(object_id_time_objects), 1)
+        self.assertEqual(object_id_time_objects[0].timestamp, 1350508407)
+
+    def testNewFromStrings(self):
+        """Tests the NewFromStrings function."""
+        object_id_time_objects = object_id_time.ObjectIdTime.NewFromStrings(
+            ["507f1f77bcf86cd799439011", "invalid"]
+        )
+        self.assertEqual(len(object_id_time_objects), 2)
+        self.assertEqual(object_id_time_objects[0].timestamp, 1350508407)
+        self.assertIsNone(object_id_time_objects[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
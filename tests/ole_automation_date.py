@@ -127,6 +127,24 @@ class OLEAutomationDateTest(unittest.TestCase):
         serializable_dict = ole_automation_date_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeToPosixTimestampsInMicroseconds(self):
+        """Tests the DecodeToPosixTimestampsInMicroseconds function."""
+        decode_function = (
+            ole_automation_date.OLEAutomationDate.DecodeToPosixTimestampsInMicroseconds
+        )
+
+        posix_timestamps, validity_mask = decode_function(
+            [43150.681090613425, float("inf")]
+        )
+        self.assertEqual(list(posix_timestamps), [1519057246229000, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        posix_timestamps, validity_mask = decode_function(
+            [43150.681090613425], time_zone_offset=60
+        )
+        self.assertEqual(list(posix_timestamps), [1519053646229000])
+        self.assertEqual(list(validity_mask), [1])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         ole_automation_date_object = ole_automation_date.OLEAutomationDate(
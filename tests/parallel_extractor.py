@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for the parallel extractors of timestamps in large text files."""
+
+import os
+import tempfile
+import unittest
+
+from dfdatetime import parallel_extractor
+
+
+class ExtractedTimestampsTest(unittest.TestCase):
+    """Tests for the columns of extracted timestamps."""
+
+    def testAppendAndExtend(self):
+        """Tests the Append and Extend functions."""
+        extracted_timestamps = parallel_extractor.ExtractedTimestamps()
+        self.assertEqual(len(extracted_timestamps), 0)
+
+        extracted_timestamps.Append(0, 1281647191000000, 1)
+        self.assertEqual(len(extracted_timestamps), 1)
+
+        other_extracted_timestamps = parallel_extractor.ExtractedTimestamps()
+        other_extracted_timestamps.Append(64, -1000000, 0)
+
+        extracted_timestamps.Extend(other_extracted_timestamps)
+        self.assertEqual(len(extracted_timestamps), 2)
+        self.assertEqual(list(extracted_timestamps.line_offsets), [0, 64])
+        self.assertEqual(
+            list(extracted_timestamps.timestamps), [1281647191000000, -1000000]
+        )
+        self.assertEqual(list(extracted_timestamps.format_codes), [1, 0])
+
+
+class ParallelTimestampExtractorTest(unittest.TestCase):
+    """Tests for the parallel extractor of timestamps in large text files."""
+
+    # pylint: disable=protected-access
+
+    _LINES = [
+        "2010-08-12T21:06:31Z first line\n",
+        "second line without timestamp\n",
+        '127.0.0.1 - - [12/Aug/2010:21:06:32 +0100] "GET / HTTP/1.1"\n',
+        "café 2010-08-12 21:06:33.500\n",
+        "Date: Thu, 12 Aug 2010 21:06:34 GMT",
+    ]
+
+    def setUp(self):
+        """Makes preparations before running an individual test."""
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._temporary_directory.name, "test.log")
+
+        with open(self._path, "w", encoding="utf-8") as file_object:
+            file_object.write("".join(self._LINES))
+
+        line_offsets = []
+        line_offset = 0
+        for line in self._LINES:
+            line_offsets.append(line_offset)
+            line_offset += len(line.encode("utf-8"))
+
+        self._line_offsets = line_offsets
+
+    def tearDown(self):
+        """Cleans up after running an individual test."""
+        self._temporary_directory.cleanup()
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        extractor = parallel_extractor.ParallelTimestampExtractor()
+        self.assertEqual(extractor.format_names[:2], ["date_time", "rfc"])
+
+        with self.assertRaises(ValueError):
+            parallel_extractor.ParallelTimestampExtractor(chunk_size=0)
+
+        with self.assertRaises(ValueError):
+            parallel_extractor.ParallelTimestampExtractor(number_of_workers=0)
+
+        with self.assertRaises(ValueError):
+            parallel_extractor.ParallelTimestampExtractor(strptime_formats=["%U"])
+
+    def testGetChunkRanges(self):
+        """Tests the _GetChunkRanges function."""
+        extractor = parallel_extractor.ParallelTimestampExtractor(chunk_size=40)
+
+        chunk_ranges = list(extractor._GetChunkRanges(self._path))
+
+        file_size = os.path.getsize(self._path)
+        expected_chunk_ranges = [
+            (0, self._line_offsets[2]),
+            (self._line_offsets[2], self._line_offsets[3]),
+            (self._line_offsets[3], file_size),
+        ]
+        self.assertEqual(chunk_ranges, expected_chunk_ranges)
+
+        extractor = parallel_extractor.ParallelTimestampExtractor()
+
+        chunk_ranges = list(extractor._GetChunkRanges(self._path))
+        self.assertEqual(chunk_ranges, [(0, file_size)])
+
+    def testExtractColumnsFromFile(self):
+        """Tests the ExtractColumnsFromFile function."""
+        expected_line_offsets = [
+            self._line_offsets[0],
+            self._line_offsets[2],
+            self._line_offsets[3],
+            self._line_offsets[4],
+        ]
+        expected_timestamps = [
+            1281647191000000,
+            1281647192000000 - 3600000000,
+            1281647193500000,
+            1281647194000000,
+        ]
+
+        for chunk_size, number_of_workers in ((40, 1), (40, 2), (None, 1)):
+            extractor = parallel_extractor.ParallelTimestampExtractor(
+                chunk_size=chunk_size, number_of_workers=number_of_workers
+            )
+            extracted_timestamps = extractor.ExtractColumnsFromFile(self._path)
+
+            self.assertEqual(
+                list(extracted_timestamps.line_offsets), expected_line_offsets
+            )
+            self.assertEqual(list(extracted_timestamps.timestamps), expected_timestamps)
+
+            format_names = [
+                extractor.format_names[format_code]
+                for format_code in extracted_timestamps.format_codes
+            ]
+            self.assertEqual(
+                format_names, ["date_time", "%d/%b/%Y:%H:%M:%S %z", "date_time", "rfc"]
+            )
+
+    def testExtractFromFile(self):
+        """Tests the ExtractFromFile function."""
+        extractor = parallel_extractor.ParallelTimestampExtractor(
+            chunk_size=40, number_of_workers=2
+        )
+
+        numbers_of_timestamps = [
+            len(extracted_timestamps)
+            for extracted_timestamps in extractor.ExtractFromFile(self._path)
+        ]
+        self.assertEqual(numbers_of_timestamps, [1, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
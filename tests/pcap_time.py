@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Tests for the packet capture (pcap and pcapng) timestamp implementation."""
+
+import struct
+import unittest
+
+from dfdatetime import pcap_time
+
+
+class PcapTimeTest(unittest.TestCase):
+    """Tests for the packet capture timestamp."""
+
+    def _CreatePcapngBlock(self, block_type, block_data, byte_order="<"):
+        """Creates a pcapng block.
+
+        Args:
+          block_type (int): block type.
+          block_data (bytes): block data.
+          byte_order (Optional[str]): byte order, either "<" or ">".
+
+        Returns:
+          bytes: pcapng block.
+        """
+        block_size = 12 + len(block_data)
+        return (
+            struct.pack(f"{byte_order:s}II", block_type, block_size)
+            + block_data
+            + struct.pack(f"{byte_order:s}I", block_size)
+        )
+
+    def _CreatePcapngBuffer(self, byte_order="<"):
+        """Creates a pcapng capture file.
+
+        Args:
+          byte_order (Optional[str]): byte order, either "<" or ">".
+
+        Returns:
+          bytes: pcapng capture file.
+        """
+        section_header_block = self._CreatePcapngBlock(
+            0x0A0D0D0A,
+            struct.pack(f"{byte_order:s}IHHq", 0x1A2B3C4D, 1, 0, -1),
+            byte_order=byte_order,
+        )
+        # Interface with the default resolution of microseconds.
+        interface_description_block1 = self._CreatePcapngBlock(
+            1, struct.pack(f"{byte_order:s}HHI", 1, 0, 0), byte_order=byte_order
+        )
+        # Interface with a resolution of 2^-10 seconds and an offset of 10
+        # seconds.
+        interface_description_block2 = self._CreatePcapngBlock(
+            1,
+            struct.pack(
+                f"{byte_order:s}HHIHHB3xHHqHH", 1, 0, 0, 9, 1, 0x8A, 14, 8, 10, 0, 0
+            ),
+            byte_order=byte_order,
+        )
+        enhanced_packet_blocks = b"".join(
+            self._CreatePcapngBlock(
+                6,
+                struct.pack(
+                    f"{byte_order:s}IIIII4s",
+                    interface_identifier,
+                    timestamp >> 32,
+                    timestamp & 0xFFFFFFFF,
+                    4,
+                    4,
+                    b"data",
+                ),
+                byte_order=byte_order,
+            )
+            for interface_identifier, timestamp in (
+                (0, 1281647191546875),
+                (1, 5632),
+                (2, 0),
+            )
+        )
+        packet_block = self._CreatePcapngBlock(
+            2,
+            struct.pack(f"{byte_order:s}HHIIII", 0, 0, 0, 1281647191, 4, 4),
+            byte_order=byte_order,
+        )
+        return b"".join(
+            [
+                section_header_block,
+                interface_description_block1,
+                interface_description_block2,
+                enhanced_packet_blocks,
+                packet_block,
+            ]
+        )
+
+    def _CreatePcapBuffer(self, signature, byte_order="<"):
+        """Creates a pcap capture file.
+
+        Args:
+          signature (int): signature.
+          byte_order (Optional[str]): byte order, either "<" or ">".
+
+        Returns:
+          bytes: pcap capture file.
+        """
+        file_header = struct.pack(
+            f"{byte_order:s}IHHiIII", signature, 2, 4, 0, 0, 65535, 1
+        )
+        record = struct.pack(f"{byte_order:s}IIII", 1281647191, 546875, 4, 4) + (
+            b"data"
+        )
+        # The capture file ends with a truncated record header.
+        return file_header + record + record + bytes(8)
+
+    def testDecodeCaptureBuffer(self):
+        """Tests the DecodeCaptureBuffer function."""
+        for byte_order in ("<", ">"):
+            buffer = self._CreatePcapBuffer(0xA1B2C3D4, byte_order=byte_order)
+
+            timestamps, validity_mask = pcap_time.PcapTime.DecodeCaptureBuffer(buffer)
+            self.assertEqual(
+                list(timestamps), [1281647191546875000, 1281647191546875000]
+            )
+            self.assertEqual(list(validity_mask), [1, 1])
+
+            buffer = self._CreatePcapBuffer(0xA1B23C4D, byte_order=byte_order)
+
+            timestamps, validity_mask = pcap_time.PcapTime.DecodeCaptureBuffer(
+                memoryview(buffer)
+            )
+            self.assertEqual(
+                list(timestamps), [1281647191000546875, 1281647191000546875]
+            )
+            self.assertEqual(list(validity_mask), [1, 1])
+
+            buffer = self._CreatePcapngBuffer(byte_order=byte_order)
+
+            timestamps, validity_mask = pcap_time.PcapTime.DecodeCaptureBuffer(buffer)
+            self.assertEqual(
+                list(timestamps),
+                [1281647191546875000, 15500000000, 0, 1281647191000],
+            )
+            self.assertEqual(list(validity_mask), [1, 1, 0, 1])
+
+        with self.assertRaises(ValueError):
+            pcap_time.PcapTime.DecodeCaptureBuffer(b"\x00" * 24)
+
+        with self.assertRaises(ValueError):
+            pcap_time.PcapTime.DecodeCaptureBuffer(self._CreatePcapngBuffer()[:-4])
+
+    def testNewFromCaptureBuffer(self):
+        """Tests the NewFromCaptureBuffer function."""
+        buffer = self._CreatePcapngBuffer()
+
+        pcap_time_objects = pcap_time.PcapTime.NewFromCaptureBuffer(buffer)
+        self.assertEqual(len(pcap_time_objects), 4)
+        self.assertIsNone(pcap_time_objects[2])
+
+        date_time_string = pcap_time_objects[0].CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2010-08-12 21:06:31.546875000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,9 @@ class PosixTimeTest(unittest.TestCase):
         self.assertEqual(posix_time_object._timestamp, -11644387200)
         self.assertEqual(posix_time_object._time_zone_offset, None)
 
+        with self.assertRaisesRegex(ValueError, "^Hours value: 25 out of bounds.$"):
+            posix_time_object.CopyFromDateTimeString("2010-08-12 25:00:00")
+
     def testCopyToDateTimeString(self):
         """Tests the CopyToDateTimeString function."""
         posix_time_object = posix_time.PosixTime(timestamp=1281643591)
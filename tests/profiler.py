@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Tests for the profiler of date and time values workloads."""
+
+import os
+import tempfile
+import unittest
+
+from dfdatetime import profile
+
+
+class CollapsedStacksProfilerTest(unittest.TestCase):
+    """Tests for the collapsed stacks profiler."""
+
+    def testProfile(self):
+        """Tests the Profile and GetCollapsedStacks functions."""
+        workload = profile.Workload(
+            profile.OPERATIONS["format_filetime"], [0x01CB3A623D0A17CE] * 50
+        )
+
+        profiler = profile.CollapsedStacksProfiler()
+        profiler.Profile(workload.Run)
+
+        collapsed_stacks = profiler.GetCollapsedStacks()
+        self.assertGreater(len(collapsed_stacks), 0)
+
+        for line in collapsed_stacks:
+            stack, _, stack_time = line.rpartition(" ")
+            self.assertTrue(stack)
+            self.assertGreater(int(stack_time, 10), 0)
+
+        self.assertTrue(
+            any(
+                "dfdatetime.linear_time.LinearTime" in line for line in collapsed_stacks
+            )
+        )
+
+
+class WorkloadTest(unittest.TestCase):
+    """Tests for the workload."""
+
+    def testRun(self):
+        """Tests the Run function."""
+        workload = profile.Workload(
+            profile.OPERATIONS["parse_iso8601"],
+            ["2010-08-12T21:06:31.546875+01:00", "bogus"],
+        )
+        workload.Run(repeat=2)
+        self.assertEqual(workload.number_of_errors, 2)
+
+
+class WorkloadProfilerTest(unittest.TestCase):
+    """Tests for the profiler of date and time values workloads."""
+
+    def testProfileAndFormatReport(self):
+        """Tests the Profile and FormatReport functions."""
+        workload = profile.Workload(
+            profile.OPERATIONS["parse_date_time_string"],
+            ["2010-08-12 21:06:31.546875"] * 100,
+        )
+        workload_profiler = profile.WorkloadProfiler()
+
+        cpu_statistics = workload_profiler.ProfileCPU(workload)
+        hotspots = workload_profiler.GetHotspots(cpu_statistics)
+        self.assertGreater(len(hotspots), 0)
+
+        functions = [hotspot[0] for hotspot in hotspots]
+        self.assertTrue(
+            any("_CopyDateTimeTupleFromString" in function for function in functions)
+        )
+
+        memory_snapshot, peak_size = workload_profiler.ProfileMemory(workload)
+        self.assertGreater(peak_size, 0)
+
+        report = workload_profiler.FormatReport(
+            workload, cpu_statistics, memory_snapshot, peak_size, top=5
+        )
+        self.assertIn("Operation: parse_date_time_string", report)
+        self.assertIn("Number of inputs: 100", report)
+        self.assertIn("Decimal arithmetic", report)
+        self.assertIn("CPU hotspots:", report)
+
+
+class ReadCorpusTest(unittest.TestCase):
+    """Tests for the ReadCorpus function."""
+
+    def testReadCorpus(self):
+        """Tests the ReadCorpus function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "corpus.txt")
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write("0x01cb3a623d0a17ce\n\n129261228716000000\n")
+
+            values = profile.ReadCorpus(path, profile.OPERATIONS["format_filetime"])
+            self.assertEqual(values, [0x01CB3A623D0A17CE, 129261228716000000])
+
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write("bogus\n")
+
+            with self.assertRaises(ValueError):
+                profile.ReadCorpus(path, profile.OPERATIONS["format_filetime"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the PTP timestamp implementation."""
+
+import decimal
+import struct
+import unittest
+
+from dfdatetime import ptp_time
+
+
+class PTPTimeTest(unittest.TestCase):
+    """Tests for the PTP timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        ptp_time_object = ptp_time.PTPTime(timestamp=1700000000000000005)
+
+        normalized_timestamp = ptp_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1700000000.000000005"))
+
+        ptp_time_object = ptp_time.PTPTime(timestamp=-1)
+
+        normalized_timestamp = ptp_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        ptp_time_object = ptp_time.PTPTime()
+
+        ptp_time_object.CopyFromDateTimeString("2023-11-14 22:13:20.000000005")
+        self.assertEqual(ptp_time_object.timestamp, 1700000000000000005)
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        ptp_time_object = ptp_time.PTPTime(timestamp=1700000000000000005)
+
+        date_time_string = ptp_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2023-11-14 22:13:20.000000005")
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        # PTP Sync messages of 44 bytes, of which the origin timestamp is stored
+        # at offset 34.
+        buffer = b"".join(
+            bytes(34) + struct.pack(">HII", 0, seconds, nanoseconds)
+            for seconds, nanoseconds in ((1700000000, 5), (1, 1000000000))
+        )
+
+        timestamps, validity_mask = ptp_time.PTPTime.DecodeBuffer(
+            buffer, offset=34, stride=44
+        )
+        self.assertEqual(list(timestamps), [1700000000000000005, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        timestamps, validity_mask = ptp_time.PTPTime.DecodeBuffer(
+            buffer, offset=34, stride=44, utc_offset=37
+        )
+        self.assertEqual(list(timestamps), [1699999963000000005, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        timestamps, validity_mask = ptp_time.PTPTime.DecodeBuffer(
+            struct.pack(">HII", 0xFFFF, 0xFFFFFFFF, 0)
+        )
+        self.assertEqual(list(timestamps), [0])
+        self.assertEqual(list(validity_mask), [0])
+
+        with self.assertRaises(ValueError):
+            ptp_time.PTPTime.DecodeBuffer(buffer, stride=8)
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = struct.pack(">HIIHII", 0, 1700000000, 5, 0, 1, 1000000000)
+
+        ptp_time_objects = ptp_time.PTPTime.NewFromBuffer(buffer)
+        self.assertEqual(len(ptp_time_objects), 2)
+        self.assertIsNone(ptp_time_objects[1])
+
+        date_time_string = ptp_time_objects[0].CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2023-11-14 22:13:20.000000005")
+
+
+if __name__ == "__main__":
+    unittest.main()
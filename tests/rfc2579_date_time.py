@@ -2,6 +2,7 @@
 """Tests for the RFC2579 date-time implementation."""
 
 import decimal
+import struct
 import unittest
 
 from dfdatetime import rfc2579_date_time
@@ -10,7 +11,7 @@ from dfdatetime import rfc2579_date_time
 class RFC2579DateTimeInvalidYear(rfc2579_date_time.RFC2579DateTime):
     """RFC2579 date-time for testing invalid year."""
 
-    def _CopyDateTimeFromString(self, time_string):
+    def _CopyDateTimeTupleFromString(self, time_string):
         """Copies a date and time from a string.
 
         Args:
@@ -23,20 +24,13 @@ class RFC2579DateTimeInvalidYear(rfc2579_date_time.RFC2579DateTime):
               is UTC.
 
         Returns:
-          dict[str, int]: date and time values, such as year, month, day of month,
-              hours, minutes, seconds, microseconds.
+          tuple[int, int, int, int, int, int, int, int]: year, month, day of month,
+              hours, minutes, seconds, nanoseconds and time zone offset in minutes.
 
         Raises:
           ValueError: if the time string is invalid or not supported.
         """
-        return {
-            "year": 70000,
-            "month": 1,
-            "day_of_month": 2,
-            "hours": 0,
-            "minutes": 0,
-            "seconds": 0,
-        }
+        return 70000, 1, 2, 0, 0, 0, 0, None
 
 
 class RFC2579DateTimeTest(unittest.TestCase):
@@ -264,6 +258,64 @@ class RFC2579DateTimeTest(unittest.TestCase):
         serializable_dict = rfc2579_date_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = b"".join(
+            [
+                struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"+", 0, 0),
+                struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"+", 1, 0),
+                struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"-", 5, 30),
+                struct.pack(">H6BcBB", 2011, 2, 29, 20, 6, 31, 6, b"+", 0, 0),
+                struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"x", 0, 0),
+                struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"+", 14, 0),
+            ]
+        )
+
+        timestamps, time_zone_offsets, validity_mask = (
+            rfc2579_date_time.RFC2579DateTime.DecodeBuffer(buffer)
+        )
+        self.assertEqual(
+            list(timestamps), [12816435916, 12816399916, 12816633916, 0, 0, 0]
+        )
+        self.assertEqual(list(time_zone_offsets), [0, 60, -330, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 1, 1, 0, 0, 0])
+
+        buffer = b"".join(
+            [
+                struct.pack(">H6B", 2010, 8, 12, 20, 6, 31, 6),
+                struct.pack(">H6B", 2010, 8, 12, 24, 6, 31, 6),
+            ]
+        )
+
+        timestamps, time_zone_offsets, validity_mask = (
+            rfc2579_date_time.RFC2579DateTime.DecodeBuffer(buffer, octet_string_size=8)
+        )
+        self.assertEqual(list(timestamps), [12816435916, 0])
+        self.assertEqual(list(time_zone_offsets), [0, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        with self.assertRaises(ValueError):
+            rfc2579_date_time.RFC2579DateTime.DecodeBuffer(buffer[:-1])
+
+        with self.assertRaises(ValueError):
+            rfc2579_date_time.RFC2579DateTime.DecodeBuffer(buffer, octet_string_size=9)
+
+    def testDecodeOctetStrings(self):
+        """Tests the DecodeOctetStrings function."""
+        octet_strings = [
+            struct.pack(">H6BcBB", 2010, 8, 12, 20, 6, 31, 6, b"+", 1, 0),
+            struct.pack(">H6B", 2010, 8, 12, 20, 6, 31, 6),
+            struct.pack(">H6BB", 2010, 8, 12, 20, 6, 31, 6, 0),
+            struct.pack(">H6B", 2010, 8, 12, 20, 6, 31, 10),
+        ]
+
+        timestamps, time_zone_offsets, validity_mask = (
+            rfc2579_date_time.RFC2579DateTime.DecodeOctetStrings(octet_strings)
+        )
+        self.assertEqual(list(timestamps), [12816399916, 12816435916, 0, 0])
+        self.assertEqual(list(time_zone_offsets), [60, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 1, 0, 0])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         rfc2579_date_time_object = rfc2579_date_time.RFC2579DateTime(
@@ -131,6 +131,14 @@ class SemanticTimeTest(unittest.TestCase):
         micro_posix_timestamp = semantic_time_object.GetPlasoTimestamp()
         self.assertEqual(micro_posix_timestamp, 0)
 
+    def testTryCopyFromDateTimeString(self):
+        """Tests the TryCopyFromDateTimeString function."""
+        semantic_time_object = semantic_time.SemanticTime()
+
+        result = semantic_time_object.TryCopyFromDateTimeString("Never")
+        self.assertTrue(result)
+        self.assertEqual(semantic_time_object.string, "Never")
+
 
 class InvalidTimeTest(unittest.TestCase):
     """Tests for semantic time that represents invalid.."""
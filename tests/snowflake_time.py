@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for the Snowflake identifier timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import snowflake_time
+
+
+class SnowflakeTimeEpochTest(unittest.TestCase):
+    """Tests for the Twitter Snowflake time epoch."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        snowflake_epoch = snowflake_time.SnowflakeTimeEpoch()
+        self.assertIsNotNone(snowflake_epoch)
+
+
+class SnowflakeTimeTest(unittest.TestCase):
+    """Tests for the Twitter Snowflake timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        snowflake_time_object = snowflake_time.SnowflakeTime(timestamp=367597485448)
+
+        normalized_timestamp = snowflake_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1656432460.105"))
+
+        snowflake_time_object = snowflake_time.SnowflakeTime(timestamp=1 << 41)
+
+        normalized_timestamp = snowflake_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        snowflake_time_object = snowflake_time.SnowflakeTime()
+
+        snowflake_time_object.CopyFromDateTimeString("2022-06-28 16:07:40.105")
+        self.assertEqual(snowflake_time_object.timestamp, 367597485448)
+
+        with self.assertRaises(ValueError):
+            snowflake_time_object.CopyFromDateTimeString("2010-11-04 01:42:54.656")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        snowflake_time_object = snowflake_time.SnowflakeTime(timestamp=367597485448)
+
+        date_time_string = snowflake_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2022-06-28 16:07:40.105")
+
+        snowflake_time_object = snowflake_time.SnowflakeTime(timestamp=0)
+
+        date_time_string = snowflake_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2010-11-04 01:42:54.657")
+
+    def testGetPlasoTimestamp(self):
+        """Tests the GetPlasoTimestamp function."""
+        snowflake_time_object = snowflake_time.SnowflakeTime(timestamp=367597485448)
+
+        micro_posix_timestamp = snowflake_time_object.GetPlasoTimestamp()
+        self.assertEqual(micro_posix_timestamp, 1656432460105000)
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = b"".join(
+            [
+                (1541815603606036480).to_bytes(8, "big"),
+                (1 << 63).to_bytes(8, "big"),
+            ]
+        )
+
+        timestamps, validity_mask = snowflake_time.SnowflakeTime.DecodeBuffer(buffer)
+        self.assertEqual(list(timestamps), [1656432460105, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        buffer = (1541815603606036480).to_bytes(8, "little")
+
+        timestamps, validity_mask = snowflake_time.SnowflakeTime.DecodeBuffer(
+            buffer, byte_order="little"
+        )
+        self.assertEqual(list(timestamps), [1656432460105])
+        self.assertEqual(list(validity_mask), [1])
+
+        with self.assertRaises(ValueError):
+            snowflake_time.SnowflakeTime.DecodeBuffer(bytes(9))
+
+        with self.assertRaises(ValueError):
+            snowflake_time.SnowflakeTime.DecodeBuffer(bytes(8), byte_order="middle")
+
+    def testDecodeStrings(self):
+        """Tests the DecodeStrings function."""
+        timestamps, validity_mask = snowflake_time.SnowflakeTime.DecodeStrings(
+            ["1541815603606036480", "0"]
+        )
+        self.assertEqual(list(timestamps), [1656432460105, 1288834974657])
+        self.assertEqual(list(validity_mask), [1, 1])
+
+        timestamps, validity_mask = snowflake_time.SnowflakeTime.DecodeStrings(
+            ["1541815603606036480", "", "-1", "1_000", "9223372036854775808"]
+        )
+        self.assertEqual(list(timestamps), [1656432460105, 0, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 0, 0, 0, 0])
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = (1541815603606036480).to_bytes(8, "big")
+
+        snowflake_time_objects = snowflake_time.SnowflakeTime.NewFromBuffer(buffer)
+        self.assertEqual(len(snowflake_time_objects), 1)
+        self.assertEqual(snowflake_time_objects[0].timestamp, 367597485448)
+
+    def testNewFromStrings(self):
+        """Tests the NewFromStrings function."""
+        snowflake_time_objects = snowflake_time.SnowflakeTime.NewFromStrings(
+            ["1541815603606036480", "invalid"]
+        )
+        self.assertEqual(len(snowflake_time_objects), 2)
+        self.assertEqual(snowflake_time_objects[0].timestamp, 367597485448)
+        self.assertIsNone(snowflake_time_objects[1])
+
+
+class DiscordSnowflakeTimeTest(unittest.TestCase):
+    """Tests for the Discord Snowflake timestamp."""
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        snowflake_time_object = snowflake_time.DiscordSnowflakeTime(
+            timestamp=41944705796
+        )
+
+        date_time_string = snowflake_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2016-04-30 11:18:25.796")
+
+    def testNewFromStrings(self):
+        """Tests the NewFromStrings function."""
+        snowflake_time_objects = snowflake_time.DiscordSnowflakeTime.NewFromStrings(
+            ["175928847299117063"]
+        )
+        self.assertEqual(len(snowflake_time_objects), 1)
+        self.assertIsInstance(
+            snowflake_time_objects[0], snowflake_time.DiscordSnowflakeTime
+        )
+        self.assertEqual(snowflake_time_objects[0].timestamp, 41944705796)
+
+
+if __name__ == "__main__":
+    unittest.main()
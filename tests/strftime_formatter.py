@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Tests for the formatters of date and time values in strftime-style formats."""
+
+import unittest
+
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import strftime_formatter
+from dfdatetime import time_elements
+
+
+class StrftimeFormatterTest(unittest.TestCase):
+    """Tests for the formatter of date and time values in a strftime-style format."""
+
+    # pylint: disable=protected-access
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        formatter = strftime_formatter.StrftimeFormatter("%Y%m%dT%H%M%S")
+        self.assertIsNotNone(formatter)
+
+        with self.assertRaises(ValueError):
+            strftime_formatter.StrftimeFormatter("%Y-%m-%d %U")
+
+        with self.assertRaises(ValueError):
+            strftime_formatter.StrftimeFormatter("%S.%4f")
+
+        with self.assertRaises(ValueError):
+            strftime_formatter.StrftimeFormatter("%3S")
+
+        with self.assertRaises(ValueError):
+            strftime_formatter.StrftimeFormatter("%Y-%m-%d %")
+
+    def testGetDayOfWeek(self):
+        """Tests the _GetDayOfWeek function."""
+        formatter = strftime_formatter.StrftimeFormatter("%a")
+
+        day_of_week = formatter._GetDayOfWeek(["1970", "01", "01"])
+        self.assertEqual(day_of_week, 3)
+
+        day_of_week = formatter._GetDayOfWeek(["2000", "02", "29"])
+        self.assertEqual(day_of_week, 1)
+
+        day_of_week = formatter._GetDayOfWeek(["1601", "01", "01"])
+        self.assertEqual(day_of_week, 0)
+
+    def testGetFields(self):
+        """Tests the _GetFields function."""
+        formatter = strftime_formatter.StrftimeFormatter("%Y")
+
+        fields = formatter._GetFields("2010-08-12 21:06:31.5468750")
+        self.assertEqual(fields, ["2010", "08", "12", "21", "06", "31", "5468750"])
+
+        fields = formatter._GetFields("10000-01-02 03:04:05")
+        self.assertEqual(fields, ["10000", "01", "02", "03", "04", "05", ""])
+
+        fields = formatter._GetFields("Not set")
+        self.assertIsNone(fields)
+
+    def testFormat(self):
+        """Tests the Format function."""
+        filetime_object = filetime.Filetime(timestamp=0x01CB3A623D0A17CE)
+
+        formatter = strftime_formatter.StrftimeFormatter("%Y%m%dT%H%M%S")
+        self.assertEqual(formatter.Format(filetime_object), "20100812T210631")
+
+        formatter = strftime_formatter.StrftimeFormatter("%F %T.%f%z")
+        self.assertEqual(
+            formatter.Format(filetime_object), "2010-08-12 21:06:31.5468750+0000"
+        )
+
+        formatter = strftime_formatter.StrftimeFormatter("%3f|%6f|%7f|%9f")
+        self.assertEqual(
+            formatter.Format(filetime_object), "546|546875|5468750|546875000"
+        )
+
+        formatter = strftime_formatter.StrftimeFormatter(
+            "%a %A %u %j %b %B %h %y %I %p %s"
+        )
+        self.assertEqual(
+            formatter.Format(filetime_object),
+            "Thu Thursday 4 224 Aug August Aug 10 09 PM 1281647191",
+        )
+
+        formatter = strftime_formatter.StrftimeFormatter("{%%}")
+        self.assertEqual(formatter.Format(filetime_object), "{%}")
+
+        posix_time_object = posix_time.PosixTime(timestamp=0)
+
+        formatter = strftime_formatter.StrftimeFormatter("%T.%f %I %p")
+        self.assertEqual(formatter.Format(posix_time_object), "00:00:00. 12 AM")
+
+        time_elements_object = time_elements.TimeElementsInMilliseconds(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429), time_zone_offset=-90
+        )
+
+        formatter = strftime_formatter.StrftimeFormatter("%FT%T.%f%:z")
+        self.assertEqual(
+            formatter.Format(time_elements_object), "2010-08-12T20:06:31.429-01:30"
+        )
+
+        time_elements_object = time_elements.TimeElements(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31)
+        )
+        time_elements_object.is_local_time = True
+
+        formatter = strftime_formatter.StrftimeFormatter("%T%z")
+        self.assertEqual(formatter.Format(time_elements_object), "20:06:31")
+
+        semantic_time_object = semantic_time.NotSet()
+        self.assertIsNone(formatter.Format(semantic_time_object))
+
+        posix_time_object = posix_time.PosixTime()
+        self.assertIsNone(formatter.Format(posix_time_object))
+
+    def testFormatValues(self):
+        """Tests the FormatValues function."""
+        formatter = strftime_formatter.StrftimeFormatter("%Y%m%d %T")
+
+        date_time_values_list = [
+            posix_time.PosixTime(timestamp=0),
+            semantic_time.Never(),
+            posix_time.PosixTime(timestamp=1281647191),
+        ]
+        formatted_values = formatter.FormatValues(date_time_values_list)
+        self.assertEqual(
+            formatted_values, ["19700101 00:00:00", None, "20100812 21:06:31"]
+        )
+
+
+class StrftimeFormatterFactoryTest(unittest.TestCase):
+    """Tests for the factory of strftime-style format formatters."""
+
+    def testGetFormatter(self):
+        """Tests the GetFormatter function."""
+        formatter = strftime_formatter.StrftimeFormatterFactory.GetFormatter("%F")
+        self.assertIsInstance(formatter, strftime_formatter.StrftimeFormatter)
+
+        cached_formatter = strftime_formatter.StrftimeFormatterFactory.GetFormatter(
+            "%F"
+        )
+        self.assertIs(cached_formatter, formatter)
+
+        with self.assertRaises(ValueError):
+            strftime_formatter.StrftimeFormatterFactory.GetFormatter("%U")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Tests for the parsers of date and time strings in strptime-style formats."""
+
+import unittest
+
+from dfdatetime import definitions
+from dfdatetime import strptime_parser
+from dfdatetime import time_elements
+
+
+class StrptimeParserTest(unittest.TestCase):
+    """Tests for the parser of date and time strings in a strptime-style format."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S")
+        self.assertEqual(parser.precision, definitions.PRECISION_1_SECOND)
+
+        parser = strptime_parser.StrptimeParser("%Y/%m")
+        self.assertEqual(parser.expression, "([0-9]{4})/([0-9]{1,2})")
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S.%3f")
+        self.assertEqual(parser.precision, definitions.PRECISION_1_MILLISECOND)
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S.%f")
+        self.assertEqual(parser.precision, definitions.PRECISION_1_MICROSECOND)
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S.%9f")
+        self.assertEqual(parser.precision, definitions.PRECISION_1_NANOSECOND)
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%Y-%m-%d %j")
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%Y-%m-%d %4f")
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%Y-%m-%d %3H")
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%S.%f.%f")
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%H:%M %p")
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParser("%Y-%m-%d %")
+
+    def testParse(self):
+        """Tests the Parse function."""
+        parser = strptime_parser.StrptimeParser("%d/%b/%Y:%H:%M:%S %z")
+
+        date_time = parser.Parse("10/Oct/2000:13:55:36 -0700")
+        self.assertIsInstance(date_time, time_elements.TimeElements)
+        self.assertEqual(date_time._time_elements_tuple, (2000, 10, 10, 13, 55, 36))
+        self.assertEqual(date_time.time_zone_offset, -420)
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%dT%H:%M:%S.%3f")
+
+        date_time = parser.Parse("2010-08-12T20:06:31.546")
+        self.assertIsInstance(date_time, time_elements.TimeElementsInMilliseconds)
+        self.assertEqual(date_time.CopyToDateTimeString(), "2010-08-12 20:06:31.546")
+        self.assertIsNone(date_time.time_zone_offset)
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S.%f")
+
+        date_time = parser.Parse("2010-08-12 20:06:31.42")
+        self.assertIsInstance(date_time, time_elements.TimeElementsInMicroseconds)
+        self.assertEqual(date_time.CopyToDateTimeString(), "2010-08-12 20:06:31.420000")
+
+        parser = strptime_parser.StrptimeParser("%Y%m%d%H%M%S%9f")
+
+        date_time = parser.Parse("20100812200631123456789")
+        self.assertIsInstance(date_time, time_elements.TimeElementsInNanoseconds)
+        self.assertEqual(
+            date_time.CopyToDateTimeString(), "2010-08-12 20:06:31.123456789"
+        )
+
+        parser = strptime_parser.StrptimeParser("%b %d %T")
+
+        date_time = parser.Parse("Aug 12  20:06:31")
+        self.assertEqual(date_time._time_elements_tuple, (1900, 8, 12, 20, 6, 31))
+
+        with self.assertRaisesRegex(
+            ValueError,
+            "^Time string: Bogus 12 20:06:31 does not match format: %b %d %T.$",
+        ):
+            parser.Parse("Bogus 12 20:06:31")
+
+        with self.assertRaisesRegex(
+            ValueError, "^Day of month value: 30 out of bounds.$"
+        ):
+            parser.Parse("Feb 30 20:06:31")
+
+        with self.assertRaisesRegex(ValueError, "^Hours value: 24 out of bounds.$"):
+            parser.Parse("Aug 12 24:06:31")
+
+    def testParseTuple(self):
+        """Tests the ParseTuple function."""
+        parser = strptime_parser.StrptimeParser("%a, %B %d %y %I:%M %p %Z")
+
+        date_time_tuple = parser.ParseTuple("tue, March 5 24 12:30 am UTC")
+        self.assertEqual(date_time_tuple, (2024, 3, 5, 0, 30, 0, 0, 0))
+
+        date_time_tuple = parser.ParseTuple("Sun, MARCH 5 69 12:30 PM GMT")
+        self.assertEqual(date_time_tuple, (1969, 3, 5, 12, 30, 0, 0, 0))
+
+        date_time_tuple = parser.ParseTuple("Sun, March 5 99 1:30 pm Z")
+        self.assertEqual(date_time_tuple, (1999, 3, 5, 13, 30, 0, 0, 0))
+
+        with self.assertRaisesRegex(ValueError, "^Hours value: 13 out of bounds.$"):
+            parser.ParseTuple("Sun, March 5 99 13:30 pm Z")
+
+        with self.assertRaisesRegex(ValueError, "^Hours value: 0 out of bounds.$"):
+            parser.ParseTuple("Sun, March 5 99 0:30 pm Z")
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %H:%M:%S%z")
+
+        date_time_tuple = parser.ParseTuple("2010-08-12 20:06:31Z")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 20, 6, 31, 0, 0))
+
+        date_time_tuple = parser.ParseTuple("2010-08-12 20:06:31+05:30")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 20, 6, 31, 0, 330))
+
+        with self.assertRaisesRegex(
+            ValueError, "^Time zone hours offset value out of bounds.$"
+        ):
+            parser.ParseTuple("2010-08-12 20:06:31+1500")
+
+        with self.assertRaisesRegex(
+            ValueError, "^Time zone minutes offset value out of bounds.$"
+        ):
+            parser.ParseTuple("2010-08-12 20:06:31+0560")
+
+        with self.assertRaisesRegex(ValueError, "^Month value out of bounds.$"):
+            parser.ParseTuple("2010-13-12 20:06:31Z")
+
+        with self.assertRaisesRegex(
+            ValueError, "^Day of month value: 29 out of bounds.$"
+        ):
+            parser.ParseTuple("2010-02-29 20:06:31Z")
+
+        with self.assertRaisesRegex(ValueError, "^Hours value: 24 out of bounds.$"):
+            parser.ParseTuple("2010-08-12 24:06:31Z")
+
+        parser = strptime_parser.StrptimeParser("100%% %Y")
+
+        date_time_tuple = parser.ParseTuple("100% 2010")
+        self.assertEqual(date_time_tuple, (2010, 1, 1, 0, 0, 0, 0, None))
+
+    def testTryParse(self):
+        """Tests the TryParse function."""
+        parser = strptime_parser.StrptimeParser("%b %d %T")
+
+        date_time = parser.TryParse("Aug 12  20:06:31")
+        self.assertIsNotNone(date_time)
+        self.assertEqual(date_time._time_elements_tuple, (1900, 8, 12, 20, 6, 31))
+
+        self.assertIsNone(parser.TryParse(None))
+        self.assertIsNone(parser.TryParse(""))
+        self.assertIsNone(parser.TryParse("Bogus 12 20:06:31"))
+        self.assertIsNone(parser.TryParse("Feb 30 20:06:31"))
+        self.assertIsNone(parser.TryParse("Feb 29 20:06:31"))
+        self.assertIsNone(parser.TryParse("Aug 12 20:60:31"))
+
+        parser = strptime_parser.StrptimeParser("%Y-%m-%d %I:%M %p%z")
+
+        date_time = parser.TryParse("2016-02-29 12:30 am+05:30")
+        self.assertIsNotNone(date_time)
+        self.assertEqual(date_time._time_elements_tuple, (2016, 2, 29, 0, 30, 0))
+        self.assertEqual(date_time.time_zone_offset, 330)
+
+        self.assertIsNone(parser.TryParse("2016-13-29 12:30 am+05:30"))
+        self.assertIsNone(parser.TryParse("2016-02-29 13:30 am+05:30"))
+        self.assertIsNone(parser.TryParse("2016-02-29 12:30 am+15:30"))
+
+    def testTryParseTuple(self):
+        """Tests the TryParseTuple function."""
+        parser = strptime_parser.StrptimeParser("%b %d %T")
+
+        date_time_tuple = parser.TryParseTuple("Aug 12  20:06:31")
+        self.assertEqual(date_time_tuple, (1900, 8, 12, 20, 6, 31, 0, None))
+
+        self.assertIsNone(parser.TryParseTuple(None))
+        self.assertIsNone(parser.TryParseTuple(""))
+        self.assertIsNone(parser.TryParseTuple("Bogus 12 20:06:31"))
+        self.assertIsNone(parser.TryParseTuple("Feb 30 20:06:31"))
+        self.assertIsNone(parser.TryParseTuple("Aug 12 20:60:31"))
+
+
+class StrptimeParserFactoryTest(unittest.TestCase):
+    """Tests for the factory of strptime-style format parsers."""
+
+    def testGetParser(self):
+        """Tests the GetParser function."""
+        parser = strptime_parser.StrptimeParserFactory.GetParser("%Y-%m-%d")
+        self.assertIsInstance(parser, strptime_parser.StrptimeParser)
+
+        cached_parser = strptime_parser.StrptimeParserFactory.GetParser("%Y-%m-%d")
+        self.assertIs(cached_parser, parser)
+
+        with self.assertRaises(ValueError):
+            strptime_parser.StrptimeParserFactory.GetParser("%j")
+
+
+if __name__ == "__main__":
+    unittest.main()
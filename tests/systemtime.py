@@ -2,6 +2,7 @@
 """Tests for the SYSTEMTIME structure implementation."""
 
 import decimal
+import struct
 import unittest
 
 from dfdatetime import systemtime
@@ -192,6 +193,68 @@ class SystemtimeTest(unittest.TestCase):
         serializable_dict = systemtime_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = b"".join(
+            [
+                struct.pack("<8H", 2010, 8, 4, 12, 20, 6, 31, 142),
+                struct.pack("<8H", 2012, 2, 3, 29, 0, 0, 0, 0),
+                struct.pack("<8H", 2011, 2, 2, 29, 0, 0, 0, 0),
+                struct.pack("<8H", 1600, 1, 6, 1, 0, 0, 0, 0),
+                struct.pack("<8H", 2010, 8, 3, 12, 20, 6, 31, 142),
+                struct.pack("<8H", 2010, 8, 4, 12, 24, 6, 31, 142),
+            ]
+        )
+
+        timestamps, validity_mask = systemtime.Systemtime.DecodeBuffer(buffer)
+        self.assertEqual(
+            list(timestamps),
+            [1281643591142, 1330473600000, 0, 0, 1281643591142, 0],
+        )
+        self.assertEqual(list(validity_mask), [1, 1, 0, 0, 1, 0])
+
+        timestamps, validity_mask = systemtime.Systemtime.DecodeBuffer(
+            buffer, check_day_of_week=True
+        )
+        self.assertEqual(list(timestamps), [1281643591142, 1330473600000, 0, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 1, 0, 0, 0, 0])
+
+        timestamps, validity_mask = systemtime.Systemtime.DecodeBuffer(b"")
+        self.assertEqual(list(timestamps), [])
+        self.assertEqual(list(validity_mask), [])
+
+        with self.assertRaises(ValueError):
+            systemtime.Systemtime.DecodeBuffer(buffer[:-1])
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = b"".join(
+            [
+                struct.pack("<8H", 2010, 8, 4, 12, 20, 6, 31, 142),
+                struct.pack("<8H", 2011, 2, 2, 29, 0, 0, 0, 0),
+                struct.pack("<8H", 2010, 8, 3, 12, 20, 6, 31, 142),
+            ]
+        )
+
+        systemtime_objects = systemtime.Systemtime.NewFromBuffer(buffer)
+        self.assertEqual(len(systemtime_objects), 3)
+        self.assertIsNotNone(systemtime_objects[0])
+        self.assertEqual(
+            systemtime_objects[0].CopyToDateTimeString(), "2010-08-12 20:06:31.142"
+        )
+        self.assertIsNone(systemtime_objects[1])
+        self.assertIsNotNone(systemtime_objects[2])
+
+        systemtime_objects = systemtime.Systemtime.NewFromBuffer(
+            buffer, check_day_of_week=True
+        )
+        self.assertIsNotNone(systemtime_objects[0])
+        self.assertIsNone(systemtime_objects[1])
+        self.assertIsNone(systemtime_objects[2])
+
+        with self.assertRaises(ValueError):
+            systemtime.Systemtime.NewFromBuffer(buffer[:-1])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         systemtime_object = systemtime.Systemtime(
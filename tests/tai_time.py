@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Tests for the TAI timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import leap_seconds
+from dfdatetime import tai_time
+
+
+class TAITimeTest(unittest.TestCase):
+    """Tests for the TAI timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        tai_time_object = tai_time.TAITime(timestamp=1704067237123456789)
+
+        normalized_timestamp = tai_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1704067200.123456789"))
+
+        # A leap second is represented by the second that follows it.
+        tai_time_object = tai_time.TAITime(timestamp=1483228836500000000)
+
+        normalized_timestamp = tai_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1483228800.5"))
+
+        leap_second_table = leap_seconds.LeapSecondTable(leap_seconds=[(63072000, 10)])
+        tai_time_object = tai_time.TAITime(
+            leap_second_table=leap_second_table, timestamp=1704067237123456789
+        )
+
+        normalized_timestamp = tai_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1704067227.123456789"))
+
+        tai_time_object = tai_time.TAITime()
+
+        normalized_timestamp = tai_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        tai_time_object = tai_time.TAITime()
+
+        tai_time_object.CopyFromDateTimeString("2024-01-01 00:00:00.123456789")
+        self.assertEqual(tai_time_object.timestamp, 1704067237123456789)
+
+        tai_time_object.CopyFromDateTimeString("2016-12-31 23:59:59")
+        self.assertEqual(tai_time_object.timestamp, 1483228835000000000)
+
+        tai_time_object.CopyFromDateTimeString("2016-12-31 23:59:60.500")
+        self.assertEqual(tai_time_object.timestamp, 1483228836500000000)
+
+        tai_time_object.CopyFromDateTimeString("2017-01-01 00:00:00")
+        self.assertEqual(tai_time_object.timestamp, 1483228837000000000)
+
+        tai_time_object.CopyFromDateTimeString("2017-01-01 00:59:60+01:00")
+        self.assertEqual(tai_time_object.timestamp, 1483228836000000000)
+        self.assertIsNone(tai_time_object.time_zone_offset)
+
+        with self.assertRaises(ValueError):
+            tai_time_object.CopyFromDateTimeString("2016-12-30 23:59:60")
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        tai_time_object = tai_time.TAITime(timestamp=1704067237123456789)
+
+        date_time_string = tai_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2024-01-01 00:00:00.123456789")
+
+        tai_time_object = tai_time.TAITime(timestamp=1483228836500000000)
+
+        date_time_string = tai_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2016-12-31 23:59:60.500000000")
+
+        tai_time_object = tai_time.TAITime(timestamp=1483228837000000000)
+
+        date_time_string = tai_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2017-01-01 00:00:00.000000000")
+
+        tai_time_object = tai_time.TAITime()
+
+        date_time_string = tai_time_object.CopyToDateTimeString()
+        self.assertIsNone(date_time_string)
+
+    def testDecodeTimestamps(self):
+        """Tests the DecodeTimestamps function."""
+        timestamps, validity_mask = tai_time.TAITime.DecodeTimestamps(
+            [1483228835000000000, 1483228836500000000, 1483228837000000000]
+        )
+        self.assertEqual(
+            list(timestamps),
+            [1483228799000000000, 1483228800500000000, 1483228800000000000],
+        )
+        self.assertEqual(list(validity_mask), [1, 1, 1])
+
+        timestamps, validity_mask = tai_time.TAITime.DecodeTimestamps(
+            [1483228835000000000, -(1 << 63)]
+        )
+        self.assertEqual(list(timestamps), [1483228799000000000, 0])
+        self.assertEqual(list(validity_mask), [1, 0])
+
+        timestamps, validity_mask = tai_time.TAITime.DecodeTimestamps([])
+        self.assertEqual(list(timestamps), [])
+        self.assertEqual(list(validity_mask), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
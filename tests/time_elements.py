@@ -421,6 +421,117 @@ class TimeElementsTest(unittest.TestCase):
 
     # TODO: add tests for _CopyFromDateTimeValues
 
+    def testCopyDateTimeTupleFromStringISO8601(self):
+        """Tests the _CopyDateTimeTupleFromStringISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "2010-08-12"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, None, None, None, None, None))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "2010-08-12T21:06:31.546875Z"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546875000, 0))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "2010-08-12T21:06:31,5-01:30"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 500000000, -90))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "20100812T210631+0100"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, None, 60))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "2016-W33-3T21:06"
+        )
+        self.assertEqual(date_time_tuple, (2016, 8, 17, 21, 6, None, None, None))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringISO8601(
+            "2016-230T21-05"
+        )
+        self.assertEqual(date_time_tuple, (2016, 8, 17, 21, None, None, None, -300))
+
+        for time_string, expected_error_message in (
+            ("", "Invalid time string."),
+            ("2010-08", "Date string too short."),
+            ("2010-13-01", "Month value out of bounds."),
+            ("2010-02-29T21:06:31", "Day of month value out of bounds."),
+            ("2010-W53", "Week number value: 53 out of bounds."),
+            ("2010-366", "Day of year value: 366 out of bounds."),
+            ("9999-W52-7", "Year value: 10000 out of bounds."),
+            (
+                "2010-08-12 21:06:31",
+                "Invalid time string - missing date and time separator.",
+            ),
+            ("2010-08-12T24:06:31Z", "Hours value: 24 out of bounds."),
+            ("2010-08-12T21:61:00Z", "Minutes value: 61 out of bounds."),
+            (
+                "2010-08-12T21:06:31+15:00",
+                "Time zone hours offset value out of bounds.",
+            ),
+        ):
+            with self.assertRaisesRegex(ValueError, f"^{expected_error_message:s}$"):
+                time_elements_object._CopyDateTimeTupleFromStringISO8601(time_string)
+
+    def testCopyDateTimeTupleFromStringRFC(self):
+        """Tests the _CopyDateTimeTupleFromStringRFC function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringRFC(
+            "Sun, 20 Jun 1982 11:57:09 -0500", "1123"
+        )
+        self.assertEqual(date_time_tuple, (1982, 6, 20, 11, 57, 9, None, -300))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringRFC(
+            "20 Jun 82 11:57 EST", "822"
+        )
+        self.assertEqual(date_time_tuple, (1982, 6, 20, 11, 57, None, None, -300))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringRFC(
+            "20 Jun 82 11:57 N", "822"
+        )
+        self.assertEqual(date_time_tuple, (1982, 6, 20, 11, 57, None, None, 60))
+
+        date_time_tuple = time_elements_object._CopyDateTimeTupleFromStringRFC(
+            "20 Jun 82 11:57 N", "2822"
+        )
+        self.assertEqual(date_time_tuple, (1982, 6, 20, 11, 57, None, None, 0))
+
+        for time_string, rfc, expected_error_message in (
+            (None, "822", "Invalid time string."),
+            ("Sun, 20 Jun 82 11:57:09 GMT", "1123", "Invalid year: 82."),
+            ("Sun, 20 Jun 1982 11:57:09 GMT", "822", "Invalid year: 1982."),
+            (
+                "Sun, 20 Jun 1982 11:57:09",
+                "1123",
+                "Unsupported number of time string segments.",
+            ),
+            ("Sun, 0 Jun 1982 11:57:09 GMT", "1123", "Invalid day of month: 0."),
+            ("Sun, 20 Jun 1982 25:57:09 GMT", "1123", "Hours value: 25 out of bounds."),
+            ("Sun, 20 Jun 1982 11:57:09 ZZZ", "1123", "Invalid time zone: ZZZ."),
+            (
+                "Sat, 29 Feb 2010 11:57:09 GMT",
+                "1123",
+                "Day of month value: 29 out of bounds.",
+            ),
+            (
+                "Fri, 21 Nov 12020 09:55:06 GMT",
+                "2822",
+                "Year value: 12020 out of bounds.",
+            ),
+            (
+                "Fri, 21 Nov 1997 09:55:06 (Central",
+                "2822",
+                "Invalid time string - unterminated comment.",
+            ),
+        ):
+            with self.assertRaisesRegex(ValueError, f"^{expected_error_message:s}$"):
+                time_elements_object._CopyDateTimeTupleFromStringRFC(time_string, rfc)
+
     def testCopyTimeFromStringISO8601(self):
         """Tests the _CopyTimeFromStringISO8601 function."""
         time_elements_object = time_elements.TimeElements()
@@ -505,6 +616,18 @@ class TimeElementsTest(unittest.TestCase):
         )
         self.assertEqual(time_tuple, expected_time_tuple)
 
+        expected_time_tuple = (8, 4, 32, None, 330)
+        time_tuple = time_elements_object._CopyTimeFromStringISO8601("08:04:32+0530")
+        self.assertEqual(time_tuple, expected_time_tuple)
+
+        expected_time_tuple = (8, 4, 32, None, -300)
+        time_tuple = time_elements_object._CopyTimeFromStringISO8601("080432-05")
+        self.assertEqual(time_tuple, expected_time_tuple)
+
+        expected_time_tuple = (8, 4, None, None, 60)
+        time_tuple = time_elements_object._CopyTimeFromStringISO8601("08:04+01:00")
+        self.assertEqual(time_tuple, expected_time_tuple)
+
         with self.assertRaises(ValueError):
             time_elements_object._CopyTimeFromStringISO8601("")
 
@@ -640,6 +763,246 @@ class TimeElementsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             time_elements_object._CopyTimeFromStringRFC("11:57", "+0160")
 
+    def testGetDateFromOrdinalDate(self):
+        """Tests the _GetDateFromOrdinalDate function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_tuple = time_elements_object._GetDateFromOrdinalDate(2016, 1)
+        self.assertEqual(date_tuple, (2016, 1, 1))
+
+        date_tuple = time_elements_object._GetDateFromOrdinalDate(2016, 60)
+        self.assertEqual(date_tuple, (2016, 2, 29))
+
+        date_tuple = time_elements_object._GetDateFromOrdinalDate(2016, 366)
+        self.assertEqual(date_tuple, (2016, 12, 31))
+
+        date_tuple = time_elements_object._GetDateFromOrdinalDate(2016, 0)
+        self.assertIsNone(date_tuple)
+
+        date_tuple = time_elements_object._GetDateFromOrdinalDate(2015, 366)
+        self.assertIsNone(date_tuple)
+
+    def testGetDateFromWeekDateISO8601(self):
+        """Tests the _GetDateFromWeekDateISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2016, 33, 3)
+        self.assertEqual(date_tuple, (2016, 8, 17))
+
+        # Week 1 of 2008 starts in 2007.
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2008, 1, 1)
+        self.assertEqual(date_tuple, (2007, 12, 31))
+
+        # 2009 has 53 weeks and week 53 ends in 2010.
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2009, 53, 7)
+        self.assertEqual(date_tuple, (2010, 1, 3))
+
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2010, 53, 1)
+        self.assertIsNone(date_tuple)
+
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2010, 0, 1)
+        self.assertIsNone(date_tuple)
+
+        date_tuple = time_elements_object._GetDateFromWeekDateISO8601(2010, 1, 8)
+        self.assertIsNone(date_tuple)
+
+    def testGetDateTimeTupleFromStringISO8601(self):
+        """Tests the _GetDateTimeTupleFromStringISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_time_tuple = time_elements_object._GetDateTimeTupleFromStringISO8601(
+            "2010-08-12T21:06:31.546875Z"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 546875000, 0))
+
+        date_time_tuple = time_elements_object._GetDateTimeTupleFromStringISO8601(
+            "2016-230T21-05"
+        )
+        self.assertEqual(date_time_tuple, (2016, 8, 17, 21, None, None, None, -300))
+
+        for time_string in (
+            None,
+            "",
+            "2010-08-12 21:06:31",
+            "2010-02-29T21:06:31",
+            "2010-08-12T24:06:31Z",
+            "2010-08-12T21:06:31,",
+            "2010-08-12T21:0\u00b2",
+            "2010-08-12T21:06:31+01:0\u00b2",
+            "9999-W52-7T21:06:31",
+        ):
+            date_time_tuple = time_elements_object._GetDateTimeTupleFromStringISO8601(
+                time_string
+            )
+            self.assertIsNone(date_time_tuple)
+
+    def testGetDateTimeTupleFromStringRFC(self):
+        """Tests the _GetDateTimeTupleFromStringRFC function."""
+        time_elements_object = time_elements.TimeElements()
+
+        date_time_tuple = time_elements_object._GetDateTimeTupleFromStringRFC(
+            "Sun, 20 Jun 1982 11:57:09 -0500", "1123"
+        )
+        self.assertEqual(date_time_tuple, (1982, 6, 20, 11, 57, 9, None, -300))
+
+        date_time_tuple = time_elements_object._GetDateTimeTupleFromStringRFC(
+            "Fri, 21 Nov 97 09:55:06 (Central) CST", "2822"
+        )
+        self.assertEqual(date_time_tuple, (1997, 11, 21, 9, 55, 6, None, -360))
+
+        for time_string, rfc in (
+            (None, "822"),
+            ("Sun, 20 Jun 82 11:57:09 GMT", "1123"),
+            ("Sun, 20 Jun 1982 11:57:09 GMT", "822"),
+            ("Sat, 29 Feb 2010 11:57:09 GMT", "1123"),
+            ("Fri, 21 Nov 1997 09:55:06 (Central", "2822"),
+            ("Fri, 21 Nov 12020 09:55:06 GMT", "2822"),
+            ("Fri, x1 Nov 1997 09:55:06 GMT", "2822"),
+        ):
+            date_time_tuple = time_elements_object._GetDateTimeTupleFromStringRFC(
+                time_string, rfc
+            )
+            self.assertIsNone(date_time_tuple)
+
+    def testGetYearFromStringRFC(self):
+        """Tests the _GetYearFromStringRFC function."""
+        time_elements_object = time_elements.TimeElements()
+
+        year = time_elements_object._GetYearFromStringRFC("82", "822")
+        self.assertEqual(year, 1982)
+
+        year = time_elements_object._GetYearFromStringRFC("1982", "1123")
+        self.assertEqual(year, 1982)
+
+        year = time_elements_object._GetYearFromStringRFC("49", "2822")
+        self.assertEqual(year, 2049)
+
+        year = time_elements_object._GetYearFromStringRFC("50", "2822")
+        self.assertEqual(year, 1950)
+
+        year = time_elements_object._GetYearFromStringRFC("104", "2822")
+        self.assertEqual(year, 2004)
+
+        year = time_elements_object._GetYearFromStringRFC("1982", "822")
+        self.assertIsNone(year)
+
+        year = time_elements_object._GetYearFromStringRFC("82", "1123")
+        self.assertIsNone(year)
+
+        year = time_elements_object._GetYearFromStringRFC("X982", "2822")
+        self.assertIsNone(year)
+
+    def testNormalizeStringRFC2822(self):
+        """Tests the _NormalizeStringRFC2822 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        time_string = time_elements_object._NormalizeStringRFC2822(
+            "fri ,21 nov 1997 09:55:06 (Central (Standard\\) Time)) cst"
+        )
+        self.assertEqual(time_string, "Fri, 21 Nov 1997 09:55:06 CST")
+
+        time_string = time_elements_object._NormalizeStringRFC2822(
+            "Fri, 21 Nov 1997\r\n\t09:55:06 -0600"
+        )
+        self.assertEqual(time_string, "Fri, 21 Nov 1997 09:55:06 -0600")
+
+        time_string = time_elements_object._NormalizeStringRFC2822(
+            "Fri, 21 Nov 1997 09:55:06 (Central"
+        )
+        self.assertIsNone(time_string)
+
+    def testParseDateFromStringISO8601(self):
+        """Tests the _ParseDateFromStringISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        for date_string, expected_date_tuple in (
+            ("2010-08-12", (2010, 8, 12)),
+            ("20100812", (2010, 8, 12)),
+            ("2016-W33-3", (2016, 8, 17)),
+            ("2016W333", (2016, 8, 17)),
+            ("2016-W33", (2016, 8, 15)),
+            ("2016-230", (2016, 8, 17)),
+            ("2016230", (2016, 8, 17)),
+        ):
+            result = time_elements_object._ParseDateFromStringISO8601(date_string)
+            self.assertEqual(result, (expected_date_tuple, None))
+
+        for date_string, expected_error_message in (
+            ("2010-8-12", None),
+            ("2010-02-29", "Day of month value out of bounds."),
+            ("2010-13-01", "Month value out of bounds."),
+            ("2010-W53", "Week number value: 53 out of bounds."),
+            ("2010-366", "Day of year value: 366 out of bounds."),
+            ("9999-W52-7", "Year value: 10000 out of bounds."),
+        ):
+            result = time_elements_object._ParseDateFromStringISO8601(date_string)
+            self.assertEqual(result, (None, expected_error_message))
+
+    def testParseTimeFromStringISO8601(self):
+        """Tests the _ParseTimeFromStringISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object._ParseTimeFromStringISO8601("2023.5")
+        self.assertEqual(result, ((20, 23, 30, 0, None), None))
+
+        result = time_elements_object._ParseTimeFromStringISO8601("080432-05")
+        self.assertEqual(result, ((8, 4, 32, None, -300), None))
+
+        for time_string, expected_error_message in (
+            ("1", "Time string too short."),
+            ("14:1", "Time string too short."),
+            ("1w:00:00", "Unable to parse hours."),
+            ("24:00:00", "Hours value: 24 out of bounds."),
+            ("12:w0:00", "Unable to parse minutes."),
+            ("12:60:00", "Minutes value: 60 out of bounds."),
+            ("12:00:w0", "Unable to parse day of seconds."),
+            ("12:00:60", "Seconds value: 60 out of bounds."),
+            ("12:00:00.", "Unable to parse time fraction."),
+            ("12:00:00.00w", "Unable to parse time fraction."),
+            ("12:00:00+01b00", "Invalid time string."),
+            ("12:00:00+0w:00", "Unable to parse time zone hours offset."),
+            ("12:00:00+20:00", "Time zone hours offset value out of bounds."),
+            ("12:00:00+01:0w", "Unable to parse time zone minutes offset."),
+            ("12:00:00+01:60", "Time zone minutes offset value out of bounds."),
+        ):
+            result = time_elements_object._ParseTimeFromStringISO8601(time_string)
+            self.assertEqual(result, (None, expected_error_message))
+
+    def testParseTimeFromStringRFC(self):
+        """Tests the _ParseTimeFromStringRFC function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object._ParseTimeFromStringRFC("11:57:09", "GMT")
+        self.assertEqual(result, ((11, 57, 9, 0), None))
+
+        result = time_elements_object._ParseTimeFromStringRFC("11:57", "-0500")
+        self.assertEqual(result, ((11, 57, None, -300), None))
+
+        for time_string, time_zone_string, expected_error_message in (
+            ("11:5", "GMT", "Time string too short."),
+            ("11:57:09:", "GMT", "Time string too long."),
+            ("11-57", "GMT", "Invalid hours and minutes separator."),
+            ("1w:57", "GMT", "Unable to parse hours."),
+            ("24:57", "GMT", "Hours value: 24 out of bounds."),
+            ("11:w7", "GMT", "Unable to parse minutes."),
+            ("11:60", "GMT", "Minutes value: 60 out of bounds."),
+            ("11:57:", "GMT", "Time string too short."),
+            ("11:57-09", "GMT", "Invalid minutes and seconds separator."),
+            ("11:57:w9", "GMT", "Unable to parse seconds."),
+            ("11:57:60", "GMT", "Seconds value: 60 out of bounds."),
+            ("11:57", "+01000", "Time zone string too long."),
+            ("11:57", "ZZZ", "Invalid time zone: ZZZ."),
+            ("11:57", "01000", "Invalid time zone: 01000."),
+            ("11:57", "+0w00", "Unable to parse time zone hours offset."),
+            ("11:57", "+1600", "Time zone hours offset value out of bounds."),
+            ("11:57", "+010w", "Unable to parse time zone minutes offset."),
+            ("11:57", "+0160", "Time zone minutes offset value out of bounds."),
+        ):
+            result = time_elements_object._ParseTimeFromStringRFC(
+                time_string, time_zone_string
+            )
+            self.assertEqual(result, (None, expected_error_message))
+
     def testCopyFromDatetime(self):
         """Tests the CopyFromDatetime function."""
         time_elements_object = time_elements.TimeElements()
@@ -800,6 +1163,32 @@ class TimeElementsTest(unittest.TestCase):
         self.assertEqual(time_elements_object._number_of_seconds, 1330980000)
         self.assertEqual(time_elements_object._time_zone_offset, 0)
 
+        # Time of day with a reduced precision.
+        test_data = [
+            ("2010-08-12T21:06", (2010, 8, 12, 21, 6, 0), None),
+            ("2010-08-12T21:06Z", (2010, 8, 12, 21, 6, 0), 0),
+            ("2010-08-12T21:06+01:00", (2010, 8, 12, 21, 6, 0), 60),
+            ("20160817T1230", (2016, 8, 17, 12, 30, 0), None),
+            ("20160817T1230+0100", (2016, 8, 17, 12, 30, 0), 60),
+            ("2010-08-12T21", (2010, 8, 12, 21, 0, 0), None),
+            ("2010-08-12T21Z", (2010, 8, 12, 21, 0, 0), 0),
+            ("2010-08-12T21+01", (2010, 8, 12, 21, 0, 0), 60),
+        ]
+        for (
+            time_string,
+            expected_time_elements_tuple,
+            expected_time_zone_offset,
+        ) in test_data:
+            time_elements_object.CopyFromStringISO8601(time_string)
+            self.assertEqual(
+                time_elements_object._time_elements_tuple,
+                expected_time_elements_tuple,
+            )
+            self.assertEqual(
+                time_elements_object._time_zone_offset, expected_time_zone_offset
+            )
+            self.assertIsNotNone(time_elements_object.CopyToDateTimeString())
+
         with self.assertRaises(ValueError):
             time_elements_object.CopyFromStringISO8601(None)
 
@@ -808,18 +1197,24 @@ class TimeElementsTest(unittest.TestCase):
                 "2010-08-12 21:06:31.546875+01:00"
             )
 
-        # Valid ISO 8601 notations currently not supported.
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33")
+        time_elements_object.CopyFromStringISO8601("2016-W33")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 15, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("--08-17")
+        time_elements_object.CopyFromStringISO8601("2016-230")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
+        # Valid ISO 8601 notations currently not supported.
         with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-230")
+            time_elements_object.CopyFromStringISO8601("--08-17")
 
     def testCopyFromStringRFC822(self):
         """Tests the CopyFromStringRFC822 function."""
@@ -845,6 +1240,50 @@ class TimeElementsTest(unittest.TestCase):
         self.assertEqual(time_elements_object._number_of_seconds, 393422229)
         self.assertEqual(time_elements_object._time_zone_offset, 0)
 
+    def testCopyFromStringRFC2822(self):
+        """Tests the CopyFromStringRFC2822 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        expected_time_elements_tuple = (1982, 6, 20, 11, 57, 9)
+        time_elements_object.CopyFromStringRFC2822("Sun, 20 Jun 1982 11:57:09 +0100")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, expected_time_elements_tuple
+        )
+        self.assertEqual(time_elements_object._time_zone_offset, 60)
+
+        expected_time_elements_tuple = (1997, 11, 21, 9, 55, 6)
+        time_elements_object.CopyFromStringRFC2822(
+            "Fri, 21 Nov 97 09:55:06 (Central) cst"
+        )
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, expected_time_elements_tuple
+        )
+        self.assertEqual(time_elements_object._time_zone_offset, -360)
+
+        expected_time_elements_tuple = (1969, 2, 13, 23, 32, 0)
+        time_elements_object.CopyFromStringRFC2822(
+            "Thu,\r\n 13\r\n  Feb\r\n    1969\r\n 23:32\r\n  -0330 (Newfoundland Time)"
+        )
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, expected_time_elements_tuple
+        )
+        self.assertEqual(time_elements_object._time_zone_offset, -210)
+
+        expected_time_elements_tuple = (2049, 1, 1, 0, 0, 0)
+        time_elements_object.CopyFromStringRFC2822("1 Jan 49 00:00 Z")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, expected_time_elements_tuple
+        )
+        self.assertEqual(time_elements_object._time_zone_offset, 0)
+
+        with self.assertRaises(ValueError):
+            time_elements_object.CopyFromStringRFC2822(
+                "Fri, 21 Nov 1997 09:55:06 (Central"
+            )
+
+        with self.assertRaises(ValueError):
+            time_elements_object.CopyFromStringRFC2822("Fri, 21 Nov 1997 09:55:06")
+
     def testCopyFromStringTuple(self):
         """Tests the CopyFromStringTuple function."""
         time_elements_object = time_elements.TimeElements()
@@ -937,6 +1376,12 @@ class TimeElementsTest(unittest.TestCase):
         date_time_string = time_elements_object.CopyToDateTimeStringISO8601()
         self.assertEqual(date_time_string, "2010-08-12T20:06:31-05:00")
 
+        time_elements_object = time_elements.TimeElements(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31), time_zone_offset=-90
+        )
+        date_time_string = time_elements_object.CopyToDateTimeStringISO8601()
+        self.assertEqual(date_time_string, "2010-08-12T20:06:31-01:30")
+
     def testCopyToPosixTimestamp(self):
         """Tests the CopyToPosixTimestamp function."""
         time_elements_object = time_elements.TimeElements(
@@ -1065,6 +1510,102 @@ class TimeElementsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             time_elements_object.NewFromDeltaAndYear(2009)
 
+    def testTryCopyFromDateTimeString(self):
+        """Tests the TryCopyFromDateTimeString function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object.TryCopyFromDateTimeString("2010-08-12 21:06:31")
+        self.assertTrue(result)
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2010, 8, 12, 21, 6, 31)
+        )
+
+        for time_string in (None, "", "bogus", "2010-08-12 25:06:31", "2010-13-12"):
+            result = time_elements_object.TryCopyFromDateTimeString(time_string)
+            self.assertFalse(result)
+
+    def testTryCopyFromStringISO8601(self):
+        """Tests the TryCopyFromStringISO8601 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object.TryCopyFromStringISO8601(
+            "2010-08-12T21:06:31+01:00"
+        )
+        self.assertTrue(result)
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2010, 8, 12, 21, 6, 31)
+        )
+        self.assertEqual(time_elements_object.time_zone_offset, 60)
+
+        result = time_elements_object.TryCopyFromStringISO8601("20100812T210631Z")
+        self.assertTrue(result)
+
+        for time_string in (
+            None,
+            "",
+            "bogus",
+            "2010-08-12T25:06:31",
+            "2010-W99",
+            "9999-W52-7",
+        ):
+            result = time_elements_object.TryCopyFromStringISO8601(time_string)
+            self.assertFalse(result)
+
+    def testTryCopyFromStringRFC822(self):
+        """Tests the TryCopyFromStringRFC822 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object.TryCopyFromStringRFC822(
+            "Sun, 20 Jun 82 11:57:09 GMT"
+        )
+        self.assertTrue(result)
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (1982, 6, 20, 11, 57, 9)
+        )
+
+        for time_string in (None, "", "bogus", "Sun, 20 Bog 82 11:57:09 GMT"):
+            result = time_elements_object.TryCopyFromStringRFC822(time_string)
+            self.assertFalse(result)
+
+    def testTryCopyFromStringRFC1123(self):
+        """Tests the TryCopyFromStringRFC1123 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object.TryCopyFromStringRFC1123(
+            "Thu, 12 Aug 2010 21:06:31 GMT"
+        )
+        self.assertTrue(result)
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2010, 8, 12, 21, 6, 31)
+        )
+
+        for time_string in (None, "", "bogus", "Thu, 12 Aug 2010 21:66:31 GMT"):
+            result = time_elements_object.TryCopyFromStringRFC1123(time_string)
+            self.assertFalse(result)
+
+    def testTryCopyFromStringRFC2822(self):
+        """Tests the TryCopyFromStringRFC2822 function."""
+        time_elements_object = time_elements.TimeElements()
+
+        result = time_elements_object.TryCopyFromStringRFC2822(
+            "Thu, 12 Aug 2010 21:06:31 +0100"
+        )
+        self.assertTrue(result)
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2010, 8, 12, 21, 6, 31)
+        )
+
+        for time_string in (
+            None,
+            "",
+            "bogus",
+            "Thu, 32 Aug 2010 21:06:31 +0100",
+            "Thu, 31 Feb 2010 21:06:31 +0100",
+            "Thu, 12 Aug 2010 21:06:31 (Central",
+        ):
+            result = time_elements_object.TryCopyFromStringRFC2822(time_string)
+            self.assertFalse(result)
+
 
 class TimeElementsWithFractionOfSeconds(unittest.TestCase):
     """Tests for the time elements with fractions of seconds."""
@@ -1578,18 +2119,24 @@ class TimeElementsInMillisecondsTest(unittest.TestCase):
                 "2010-08-12 21:06:31.546875+01:00"
             )
 
-        # Valid ISO 8601 notations currently not supported.
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33")
+        time_elements_object.CopyFromStringISO8601("2016-W33")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 15, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("--08-17")
+        time_elements_object.CopyFromStringISO8601("2016-230")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
+        # Valid ISO 8601 notations currently not supported.
         with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-230")
+            time_elements_object.CopyFromStringISO8601("--08-17")
 
     def testCopyFromStringTuple(self):
         """Tests the CopyFromStringTuple function."""
@@ -2011,18 +2558,24 @@ class TimeElementsInMicrosecondsTest(unittest.TestCase):
                 "2010-08-12 21:06:31.546875+01:00"
             )
 
-        # Valid ISO 8601 notations currently not supported.
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33")
+        time_elements_object.CopyFromStringISO8601("2016-W33")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 15, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("--08-17")
+        time_elements_object.CopyFromStringISO8601("2016-230")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
+        # Valid ISO 8601 notations currently not supported.
         with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-230")
+            time_elements_object.CopyFromStringISO8601("--08-17")
 
     def testCopyFromStringTuple(self):
         """Tests the CopyFromStringTuple function."""
@@ -2454,18 +3007,24 @@ class TimeElementsInNanosecondsTest(unittest.TestCase):
                 "2010-08-12 21:06:31.546875218+01:00"
             )
 
-        # Valid ISO 8601 notations currently not supported.
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33")
+        time_elements_object.CopyFromStringISO8601("2016-W33")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 15, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        time_elements_object.CopyFromStringISO8601("2016-W33-3")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
-        with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("--08-17")
+        time_elements_object.CopyFromStringISO8601("2016-230")
+        self.assertEqual(
+            time_elements_object._time_elements_tuple, (2016, 8, 17, 0, 0, 0)
+        )
 
+        # Valid ISO 8601 notations currently not supported.
         with self.assertRaises(ValueError):
-            time_elements_object.CopyFromStringISO8601("2016-230")
+            time_elements_object.CopyFromStringISO8601("--08-17")
 
     def testCopyFromStringTuple(self):
         """Tests the CopyFromStringTuple function."""
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Tests for the time zones compiled from TZif files."""
+
+import os
+import struct
+import tempfile
+import unittest
+
+from dfdatetime import definitions
+from dfdatetime import time_elements
+from dfdatetime import time_zones
+
+
+def _CreateTZifData(transitions, utc_offsets, footer=b"", format_version=b"2"):
+    """Creates TZif data.
+
+    Args:
+      transitions (list[tuple[int, int]]): POSIX timestamp in seconds and index
+          of the local time type per transition.
+      utc_offsets (list[int]): UTC offset in seconds per local time type.
+      footer (Optional[bytes]): footer, such as a POSIX TZ string between new
+          lines.
+      format_version (Optional[bytes]): format version.
+
+    Returns:
+      bytes: TZif data.
+    """
+    header_struct = struct.Struct(">4sc15x6I")
+
+    data = [
+        header_struct.pack(b"TZif", format_version, 0, 0, 0, 0, 1, 4),
+        struct.pack(">iBB", utc_offsets[0], 0, 0),
+        b"LMT\x00",
+        header_struct.pack(
+            b"TZif", format_version, 0, 0, 0, len(transitions), len(utc_offsets), 4
+        ),
+    ]
+    data.extend(struct.pack(">q", timestamp) for timestamp, _ in transitions)
+    data.append(bytes(type_index for _, type_index in transitions))
+    data.extend(struct.pack(">iBB", utc_offset, 0, 0) for utc_offset in utc_offsets)
+    data.append(b"CET\x00")
+    data.append(footer)
+
+    return b"".join(data)
+
+
+# Time zone with the transitions of 2023 of Europe/Amsterdam, after which the
+# daylight saving time rule applies.
+_TZIF_DATA = _CreateTZifData(
+    [(1679792400, 1), (1698541200, 0)],
+    [3600, 7200],
+    footer=b"\nCET-1CEST,M3.5.0,M10.5.0/3\n",
+)
+
+
+class TimeZoneTest(unittest.TestCase):
+    """Tests for the time zone."""
+
+    # pylint: disable=protected-access
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        time_zone = time_zones.TimeZone("UTC+1", [], [], 3600)
+        self.assertIsNotNone(time_zone)
+        self.assertEqual(time_zone.name, "UTC+1")
+
+    def testGetOffsetIntervalFromLocalTimestamp(self):
+        """Tests the _GetOffsetIntervalFromLocalTimestamp function."""
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA)
+
+        interval = time_zone._GetOffsetIntervalFromLocalTimestamp(
+            1690000000, definitions.TIME_ZONE_AMBIGUITY_EARLIEST
+        )
+        self.assertEqual(interval, (7200, 1679799600, 1698544800))
+
+        interval = time_zone._GetOffsetIntervalFromLocalTimestamp(
+            1698546600, definitions.TIME_ZONE_AMBIGUITY_EARLIEST
+        )
+        self.assertEqual(interval, (7200, 1698544800, 1698548400))
+
+        interval = time_zone._GetOffsetIntervalFromLocalTimestamp(
+            1698546600, definitions.TIME_ZONE_AMBIGUITY_LATEST
+        )
+        self.assertEqual(interval, (3600, 1698544800, 1698548400))
+
+        with self.assertRaises(ValueError):
+            time_zone._GetOffsetIntervalFromLocalTimestamp(
+                1698546600, definitions.TIME_ZONE_AMBIGUITY_RAISE
+            )
+
+    def testGetRuleTime(self):
+        """Tests the _GetRuleTime function."""
+        time_zone = time_zones.TimeZone("UTC+1", [], [], 3600)
+
+        rule_time = time_zone._GetRuleTime(("M", 3, 5, 0, 7200), 2024)
+        self.assertEqual(rule_time, 1711850400)
+
+        rule_time = time_zone._GetRuleTime(("J", 60, 0), 2024)
+        self.assertEqual(rule_time, 1709251200)
+
+        rule_time = time_zone._GetRuleTime(("N", 59, 0), 2024)
+        self.assertEqual(rule_time, 1709164800)
+
+    def testParseOffset(self):
+        """Tests the _ParseOffset function."""
+        offset = time_zones.TimeZone._ParseOffset("5")
+        self.assertEqual(offset, 18000)
+
+        offset = time_zones.TimeZone._ParseOffset("-3:30")
+        self.assertEqual(offset, -12600)
+
+        offset = time_zones.TimeZone._ParseOffset("+1:02:03")
+        self.assertEqual(offset, 3723)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone._ParseOffset("bogus")
+
+    def testParsePosixTimeZoneString(self):
+        """Tests the _ParsePosixTimeZoneString function."""
+        rule = time_zones.TimeZone._ParsePosixTimeZoneString(
+            "CET-1CEST,M3.5.0,M10.5.0/3"
+        )
+        self.assertEqual(
+            rule, (3600, 7200, ("M", 3, 5, 0, 7200), ("M", 10, 5, 0, 10800))
+        )
+
+        rule = time_zones.TimeZone._ParsePosixTimeZoneString("EST5EDT")
+        self.assertEqual(
+            rule, (-18000, -14400, ("M", 3, 2, 0, 7200), ("M", 11, 1, 0, 7200))
+        )
+
+        rule = time_zones.TimeZone._ParsePosixTimeZoneString("<-03>3<-02>,J60,300/4")
+        self.assertEqual(rule, (-10800, -7200, ("J", 60, 7200), ("N", 300, 14400)))
+
+        rule = time_zones.TimeZone._ParsePosixTimeZoneString("<+0330>-3:30")
+        self.assertIsNone(rule)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone._ParsePosixTimeZoneString("bogus")
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone._ParsePosixTimeZoneString("CET-1CEST,M13.5.0,M10.5.0")
+
+    def testCopyLocalToPOSIXTimestamps(self):
+        """Tests the CopyLocalToPOSIXTimestamps function."""
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA)
+
+        posix_timestamps = time_zone.CopyLocalToPOSIXTimestamps(
+            [1729992600, 1729996200, 1729999800, 0]
+        )
+        self.assertEqual(posix_timestamps, [1729985400, 1729989000, 1729996200, -3600])
+
+        posix_timestamps = time_zone.CopyLocalToPOSIXTimestamps(
+            [1729996200000],
+            ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_LATEST,
+            units_per_second=1000,
+        )
+        self.assertEqual(posix_timestamps, [1729992600000])
+
+        with self.assertRaises(ValueError):
+            time_zone.CopyLocalToPOSIXTimestamps(
+                [1729996200], ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_RAISE
+            )
+
+        with self.assertRaises(ValueError):
+            time_zone.CopyLocalToPOSIXTimestamps([0], ambiguity_policy="bogus")
+
+    def testGetOffsetFromLocalTimestamp(self):
+        """Tests the GetOffsetFromLocalTimestamp function."""
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA)
+
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(1729992600)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(1729999800)
+        self.assertEqual(utc_offset, 3600)
+
+        # Local time that occurs twice, since the clock is set back.
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(1729996200)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(
+            1729996200, ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_LATEST
+        )
+        self.assertEqual(utc_offset, 3600)
+
+        with self.assertRaises(ValueError):
+            time_zone.GetOffsetFromLocalTimestamp(
+                1729996200, ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_RAISE
+            )
+
+        # Local time that does not exist, since the clock is set forward.
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(1711852200)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromLocalTimestamp(
+            1711852200, ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_LATEST
+        )
+        self.assertEqual(utc_offset, 3600)
+
+        with self.assertRaises(ValueError):
+            time_zone.GetOffsetFromLocalTimestamp(
+                1711852200, ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_RAISE
+            )
+
+        with self.assertRaises(ValueError):
+            time_zone.GetOffsetFromLocalTimestamp(0, ambiguity_policy="bogus")
+
+    def testGetOffsetFromPOSIXTimestamp(self):
+        """Tests the GetOffsetFromPOSIXTimestamp function."""
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(0)
+        self.assertEqual(utc_offset, 3600)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1679792399)
+        self.assertEqual(utc_offset, 3600)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1679792400)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1698541200)
+        self.assertEqual(utc_offset, 3600)
+
+        # Transitions of the daylight saving time rule.
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1711846799)
+        self.assertEqual(utc_offset, 3600)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1711846800)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(4118086800)
+        self.assertEqual(utc_offset, 7200)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(4102444800)
+        self.assertEqual(utc_offset, 3600)
+
+        # Daylight saving time all year, where the start of daylight saving time
+        # coincides with the end of that of the previous year.
+        rule = time_zones.TimeZone._ParsePosixTimeZoneString("EST5EDT,0/0,J365/25")
+        time_zone = time_zones.TimeZone("Test/Zone", [], [], -18000, rule)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(17999)
+        self.assertEqual(utc_offset, -18000)
+
+        # 2031-01-01 05:00:00 and 2031-06-01 00:00:00 UTC.
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1925010000)
+        self.assertEqual(utc_offset, -14400)
+
+        utc_offset = time_zone.GetOffsetFromPOSIXTimestamp(1938038400)
+        self.assertEqual(utc_offset, -14400)
+
+    def testNewFromTZifData(self):
+        """Tests the NewFromTZifData function."""
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA)
+        self.assertIsNotNone(time_zone)
+        self.assertEqual(time_zone.name, "Test/Zone")
+
+        # TZif data without transitions and with a fixed UTC offset.
+        tzif_data = _CreateTZifData([], [-18000], footer=b"\nEST5\n")
+        time_zone = time_zones.TimeZone.NewFromTZifData("Test/Fixed", tzif_data)
+        self.assertEqual(time_zone.GetOffsetFromPOSIXTimestamp(1729996200), -18000)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone.NewFromTZifData("Test/Zone", b"TZif")
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone.NewFromTZifData("Test/Zone", b"bogus" + _TZIF_DATA)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone.NewFromTZifData("Test/Zone", _TZIF_DATA[:-40])
+
+        tzif_data = _CreateTZifData([(0, 2)], [3600, 7200])
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone.NewFromTZifData("Test/Zone", tzif_data)
+
+        tzif_data = _CreateTZifData([], [3600], footer=b"\nbogus\n")
+        with self.assertRaises(ValueError):
+            time_zones.TimeZone.NewFromTZifData("Test/Zone", tzif_data)
+
+
+class TimeZonesTest(unittest.TestCase):
+    """Tests for the time zones compiled from the TZif files of the system."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        """Makes preparations before running an individual test."""
+        self._search_paths = time_zones.TimeZones._search_paths
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        path = os.path.join(self._temporary_directory.name, "Test")
+        os.mkdir(path)
+
+        with open(os.path.join(path, "Zone"), "wb") as file_object:
+            file_object.write(_TZIF_DATA)
+
+        time_zones.TimeZones.SetSearchPaths([self._temporary_directory.name])
+
+    def tearDown(self):
+        """Cleans up after running an individual test."""
+        time_zones.TimeZones.SetSearchPaths(self._search_paths)
+        self._temporary_directory.cleanup()
+
+    def testReadTimeZone(self):
+        """Tests the _ReadTimeZone function."""
+        time_zone = time_zones.TimeZones._ReadTimeZone("Test/Zone")
+        self.assertEqual(time_zone.name, "Test/Zone")
+        self.assertEqual(time_zone.GetOffsetFromPOSIXTimestamp(1690000000), 7200)
+
+        time_zone = time_zones.TimeZones._ReadTimeZone("UTC+1")
+        self.assertEqual(time_zone.GetOffsetFromPOSIXTimestamp(1690000000), 3600)
+
+        time_zone = time_zones.TimeZones._ReadTimeZone("UTC-05:30")
+        self.assertEqual(time_zone.GetOffsetFromPOSIXTimestamp(1690000000), -19800)
+
+        for name in ("", "/etc/passwd", "../Test/Zone", "Test/Bogus", "UTC+1:99"):
+            with self.assertRaises(ValueError):
+                time_zones.TimeZones._ReadTimeZone(name)
+
+    def testApplyTimeZone(self):
+        """Tests the ApplyTimeZone function."""
+        date_time_values = time_elements.TimeElements(
+            time_elements_tuple=(2024, 10, 27, 2, 30, 0)
+        )
+        date_time_values.is_local_time = True
+        date_time_values.time_zone_hint = "Test/Zone"
+
+        time_zones.TimeZones.ApplyTimeZone(date_time_values)
+        self.assertFalse(date_time_values.is_local_time)
+        self.assertEqual(date_time_values.time_zone_offset, 120)
+        self.assertEqual(date_time_values.CopyToPosixTimestamp(), 1729989000)
+
+        # Date and time values that are no longer in local time are not changed.
+        time_zones.TimeZones.ApplyTimeZone(date_time_values, time_zone_name="UTC+1")
+        self.assertEqual(date_time_values.time_zone_offset, 120)
+
+        date_time_values = time_elements.TimeElements(
+            time_elements_tuple=(2024, 10, 27, 2, 30, 0)
+        )
+        date_time_values.is_local_time = True
+
+        time_zones.TimeZones.ApplyTimeZone(
+            date_time_values,
+            ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_LATEST,
+            time_zone_name="Test/Zone",
+        )
+        self.assertEqual(date_time_values.time_zone_offset, 60)
+        self.assertEqual(date_time_values.CopyToPosixTimestamp(), 1729992600)
+
+        date_time_values = time_elements.TimeElements(
+            time_elements_tuple=(2024, 10, 27, 2, 30, 0)
+        )
+        date_time_values.is_local_time = True
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZones.ApplyTimeZone(
+                date_time_values,
+                ambiguity_policy=definitions.TIME_ZONE_AMBIGUITY_RAISE,
+                time_zone_name="Test/Zone",
+            )
+
+        self.assertTrue(date_time_values.is_local_time)
+        self.assertIsNone(date_time_values.time_zone_offset)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZones.ApplyTimeZone(date_time_values)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZones.ApplyTimeZone(
+                date_time_values, time_zone_name="Test/Bogus"
+            )
+
+    def testGetTimeZone(self):
+        """Tests the GetTimeZone function."""
+        time_zone = time_zones.TimeZones.GetTimeZone("Test/Zone")
+        self.assertIsNotNone(time_zone)
+
+        cached_time_zone = time_zones.TimeZones.GetTimeZone("Test/Zone")
+        self.assertIs(cached_time_zone, time_zone)
+
+        time_zones.TimeZones.ClearCache()
+
+        cached_time_zone = time_zones.TimeZones.GetTimeZone("Test/Zone")
+        self.assertIsNot(cached_time_zone, time_zone)
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZones.GetTimeZone("Test/Bogus")
+
+    def testSetSearchPaths(self):
+        """Tests the SetSearchPaths function."""
+        time_zone = time_zones.TimeZones.GetTimeZone("Test/Zone")
+        self.assertIsNotNone(time_zone)
+
+        time_zones.TimeZones.SetSearchPaths([])
+
+        with self.assertRaises(ValueError):
+            time_zones.TimeZones.GetTimeZone("Test/Zone")
+
+
+if __name__ == "__main__":
+    unittest.main()
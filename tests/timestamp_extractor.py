@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Tests for the extractors of timestamps embedded in free text."""
+
+import io
+import unittest
+
+from dfdatetime import timestamp_extractor
+
+
+class TimestampExtractorTest(unittest.TestCase):
+    """Tests for the extractor of timestamps embedded in free text."""
+
+    # pylint: disable=protected-access
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+        self.assertTrue(extractor._skip_lines_without_colon)
+        self.assertEqual(extractor.format_names[:2], ["date_time", "rfc"])
+        self.assertEqual(extractor.format_names[2:], extractor.DEFAULT_STRPTIME_FORMATS)
+
+        extractor = timestamp_extractor.TimestampExtractor(
+            strptime_formats=["%d.%m.%Y"]
+        )
+        self.assertFalse(extractor._skip_lines_without_colon)
+        self.assertEqual(extractor.format_names, ["date_time", "rfc", "%d.%m.%Y"])
+
+        with self.assertRaises(ValueError):
+            timestamp_extractor.TimestampExtractor(strptime_formats=["%U"])
+
+    def testGetDateTimeTupleFromString(self):
+        """Tests the _GetDateTimeTupleFromString function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        date_time_tuple = extractor._GetDateTimeTupleFromString("2010-08-12 21:06:31")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, 0, None))
+
+        date_time_tuple = extractor._GetDateTimeTupleFromString("2010-08-12T21:06Z")
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, None, None, 0))
+
+        self.assertIsNone(extractor._GetDateTimeTupleFromString("2010-13-12 21:06:31"))
+        self.assertIsNone(extractor._GetDateTimeTupleFromString("2010-08-12T24:06:31"))
+
+    def testGetDateTimeTupleFromStringRFC(self):
+        """Tests the _GetDateTimeTupleFromStringRFC function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        date_time_tuple = extractor._GetDateTimeTupleFromStringRFC(
+            "Thu, 12 Aug 2010 21:06:31 GMT"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, None, 0))
+
+        date_time_tuple = extractor._GetDateTimeTupleFromStringRFC(
+            "12 Aug 99 21:06 +0100"
+        )
+        self.assertEqual(date_time_tuple, (1999, 8, 12, 21, 6, None, None, 60))
+
+        self.assertIsNone(
+            extractor._GetDateTimeTupleFromStringRFC("31 Sep 2010 21:06:31 GMT")
+        )
+        self.assertIsNone(
+            extractor._GetDateTimeTupleFromStringRFC("Mon, 12 Aug 2010 21:06:31 GMT")
+        )
+
+        # The weekday determines the century of a 2-digit year.
+        date_time_tuple = extractor._GetDateTimeTupleFromStringRFC(
+            "Thu, 12 Aug 10 21:06:31 GMT"
+        )
+        self.assertEqual(date_time_tuple, (2010, 8, 12, 21, 6, 31, None, 0))
+
+        date_time_tuple = extractor._GetDateTimeTupleFromStringRFC(
+            "Fri, 12 Aug 10 21:06:31 GMT"
+        )
+        self.assertEqual(date_time_tuple, (1910, 8, 12, 21, 6, 31, None, 0))
+
+    def testGetDayOfWeek(self):
+        """Tests the _GetDayOfWeek function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        self.assertEqual(extractor._GetDayOfWeek(1970, 1, 1), 3)
+        self.assertEqual(extractor._GetDayOfWeek(2000, 2, 29), 1)
+        self.assertEqual(extractor._GetDayOfWeek(2010, 8, 12), 3)
+        self.assertEqual(extractor._GetDayOfWeek(2010, 8, 16), 0)
+        self.assertEqual(extractor._GetDayOfWeek(2010, 8, 15), 6)
+
+    def testGetMatches(self):
+        """Tests the _GetMatches function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        text = "".join(
+            [
+                "no timestamp\n",
+                "at 2010-08-12 21:06:31 and 2010-08-12 21:06:32\n",
+                "2010-08-12 21:06:33\n",
+                "no timestamp\n",
+                "no timestamp\n",
+                "12 Aug 2010 21:06:34 GMT",
+            ]
+        )
+        matches = list(extractor._GetMatches(text))
+        self.assertEqual(
+            [match.group(0) for match in matches],
+            [
+                "2010-08-12 21:06:31",
+                "2010-08-12 21:06:32",
+                "2010-08-12 21:06:33",
+                "12 Aug 2010 21:06:34 GMT",
+            ],
+        )
+
+        extractor = timestamp_extractor.TimestampExtractor(
+            strptime_formats=["%d.%m.%Y"]
+        )
+        matches = list(extractor._GetMatches("on 12.08.2010\n"))
+        self.assertEqual([match.group(0) for match in matches], ["12.08.2010"])
+
+    def testParseMatches(self):
+        """Tests the _ParseMatches function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        text = "\n".join(
+            [
+                "1:2 no timestamp",
+                "at 2010-08-12 21:06:31 and 12 Aug 2010 21:06:32 GMT",
+                "bad 2010-02-30 21:06:33",
+                "Thu Aug 12 21:06:34 2010",
+            ]
+        )
+        results = list(extractor._ParseMatches(text))
+        self.assertEqual(
+            [(match.group(0), format_index) for match, format_index, _ in results],
+            [
+                ("2010-08-12 21:06:31", 0),
+                ("12 Aug 2010 21:06:32 GMT", 1),
+                ("Thu Aug 12 21:06:34 2010", 4),
+            ],
+        )
+        self.assertEqual(
+            [date_time.CopyToDateTimeString() for _, _, date_time in results],
+            [
+                "2010-08-12 21:06:31.000000000",
+                "2010-08-12 21:06:32.000000000",
+                "2010-08-12 21:06:34",
+            ],
+        )
+
+    def testExtractFromFileObject(self):
+        """Tests the ExtractFromFileObject function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        text = "".join(
+            [
+                "2010-08-12T21:06:31Z first line\n",
+                "second line without timestamp\n",
+                '127.0.0.1 - - [12/Aug/2010:21:06:32 +0100] "GET / HTTP/1.1"\n',
+                "last line 2010-08-12 21:06:33",
+            ]
+        )
+
+        for chunk_size in (7, 64, None):
+            file_object = io.StringIO(text)
+            results = list(
+                extractor.ExtractFromFileObject(file_object, chunk_size=chunk_size)
+            )
+            self.assertEqual(
+                [(start, end) for start, end, _ in results],
+                [(0, 20), (77, 103), (132, 151)],
+            )
+            for start, end, _ in results:
+                self.assertTrue(text[start:end].startswith(("2010", "12/Aug")))
+
+        with self.assertRaises(ValueError):
+            list(extractor.ExtractFromFileObject(io.StringIO(text), chunk_size=0))
+
+    def testExtractFromString(self):
+        """Tests the ExtractFromString function."""
+        extractor = timestamp_extractor.TimestampExtractor()
+
+        test_data = [
+            ("foo 2010-08-12 21:06:31.546 bar", (4, 27), "2010-08-12 21:06:31.546"),
+            ("x=2010-08-12T21:06:31+01:00,y", (2, 27), "2010-08-12 21:06:31"),
+            ("x=2010-08-12T21:06Z,y", (2, 19), "2010-08-12 21:06:00"),
+            ('[12/Aug/2010:21:06:31 +0100] "GET /"', (1, 27), "2010-08-12 21:06:31"),
+            ("Date: Thu, 12 Aug 2010 21:06:31 GMT", (6, 35), "2010-08-12 21:06:31"),
+            ("Thu Aug 12 21:06:31 2010 kernel", (0, 24), "2010-08-12 21:06:31"),
+            ("at 2010/08/12 21:06:31", (3, 22), "2010-08-12 21:06:31"),
+        ]
+        for line, expected_offsets, expected_date_time_string in test_data:
+            results = list(extractor.ExtractFromString(line))
+            self.assertEqual(len(results), 1)
+
+            start, end, date_time = results[0]
+            self.assertEqual((start, end), expected_offsets)
+            self.assertTrue(
+                date_time.CopyToDateTimeString().startswith(expected_date_time_string)
+            )
+
+        results = list(
+            extractor.ExtractFromString("bad 2010-13-45 21:06:31 id 12010-08-12 21:06")
+        )
+        self.assertEqual(results, [])
+
+        results = list(extractor.ExtractFromString("Mon, 12 Aug 2010 21:06:31 GMT"))
+        self.assertEqual(results, [])
+
+        extractor = timestamp_extractor.TimestampExtractor(
+            strptime_formats=["%d.%m.%Y"]
+        )
+        results = list(extractor.ExtractFromString("on 12.08.2010."))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][:2], (3, 13))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Tests for the ULID timestamp implementation."""
+
+import decimal
+import unittest
+
+from dfdatetime import ulid_time
+
+
+class ULIDTimeTest(unittest.TestCase):
+    """Tests for the ULID timestamp."""
+
+    # pylint: disable=protected-access
+
+    def testGetNormalizedTimestamp(self):
+        """Tests the _GetNormalizedTimestamp function."""
+        ulid_time_object = ulid_time.ULIDTime(timestamp=1469922850259)
+
+        normalized_timestamp = ulid_time_object._GetNormalizedTimestamp()
+        self.assertEqual(normalized_timestamp, decimal.Decimal("1469922850.259"))
+
+        ulid_time_object = ulid_time.ULIDTime(timestamp=1 << 48)
+
+        normalized_timestamp = ulid_time_object._GetNormalizedTimestamp()
+        self.assertIsNone(normalized_timestamp)
+
+    def testCopyFromDateTimeString(self):
+        """Tests the CopyFromDateTimeString function."""
+        ulid_time_object = ulid_time.ULIDTime()
+
+        ulid_time_object.CopyFromDateTimeString("2016-07-30 23:54:10.259")
+        self.assertEqual(ulid_time_object.timestamp, 1469922850259)
+
+    def testCopyToDateTimeString(self):
+        """Tests the CopyToDateTimeString function."""
+        ulid_time_object = ulid_time.ULIDTime(timestamp=1469922850259)
+
+        date_time_string = ulid_time_object.CopyToDateTimeString()
+        self.assertEqual(date_time_string, "2016-07-30 23:54:10.259")
+
+    def testDecodeBuffer(self):
+        """Tests the DecodeBuffer function."""
+        buffer = bytes.fromhex("01563e3ab5d3d6764c61efb99302bd5b")
+
+        timestamps, validity_mask = ulid_time.ULIDTime.DecodeBuffer(buffer)
+        self.assertEqual(list(timestamps), [1469922850259])
+        self.assertEqual(list(validity_mask), [1])
+
+        with self.assertRaises(ValueError):
+            ulid_time.ULIDTime.DecodeBuffer(bytes(17))
+
+    def testDecodeStrings(self):
+        """Tests the DecodeStrings function."""
+        timestamps, validity_mask = ulid_time.ULIDTime.DecodeStrings(
+            ["01ARZ3NDEKTSV4RRFFQ69G5FAV", "01arz3ndektsv4rrffq69g5fav"]
+        )
+        self.assertEqual(list(timestamps), [1469922850259, 1469922850259])
+        self.assertEqual(list(validity_mask), [1, 1])
+
+        timestamps, validity_mask = ulid_time.ULIDTime.DecodeStrings(
+            [
+                "01ARZ3NDEKTSV4RRFFQ69G5FAV",
+                "01ARZ3NDEKTSV4RRFFQ69G5FAI",
+                "81ARZ3NDEKTSV4RRFFQ69G5FAV",
+                "01ARZ3NDEKTSV4RRFFQ69G5FA",
+                "01ARZ3NDEK_SV4RRFFQ69G5FAV",
+            ]
+        )
+        self.assertEqual(list(timestamps), [1469922850259, 0, 0, 0, 0])
+        self.assertEqual(list(validity_mask), [1, 0, 0, 0, 0])
+
+    def testNewFromBuffer(self):
+        """Tests the NewFromBuffer function."""
+        buffer = bytes.fromhex("01563e3ab5d3d6764c61efb99302bd5b")
+
+        ulid_time_objects = ulid_time.ULIDTime.NewFromBuffer(buffer)
+        self.assertEqual(len(ulid_time_objects), 1)
+        self.assertEqual(ulid_time_objects[0].timestamp, 1469922850259)
+
+    def testNewFromStrings(self):
+        """Tests the NewFromStrings function."""
+        ulid_time_objects = ulid_time.ULIDTime.NewFromStrings(
+            ["01ARZ3NDEKTSV4RRFFQ69G5FAV", "invalid"]
+        )
+        self.assertEqual(len(ulid_time_objects), 2)
+        self.assertEqual(ulid_time_objects[0].timestamp, 1469922850259)
+        self.assertIsNone(ulid_time_objects[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
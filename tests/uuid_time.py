@@ -5,6 +5,7 @@ import decimal
 import uuid
 import unittest
 
+from dfdatetime import posix_time
 from dfdatetime import uuid_time
 
 
@@ -115,7 +116,7 @@ class UUIDTimeTest(unittest.TestCase):
         self.assertEqual(uuid_time_object._timestamp, 864000000000)
         self.assertEqual(uuid_time_object._time_zone_offset, None)
 
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, "^Year value not supported.$"):
             uuid_time_object.CopyFromDateTimeString("1570-01-02 00:00:00")
 
     def testCopyToDateTimeString(self):
@@ -152,6 +153,142 @@ class UUIDTimeTest(unittest.TestCase):
         serializable_dict = uuid_time_object.CopyToSerializableDict()
         self.assertEqual(serializable_dict, expected_serializable_dict)
 
+    def testDecodeUUIDBuffer(self):
+        """Tests the DecodeUUIDBuffer function."""
+        buffer = b"".join(
+            uuid.UUID(uuid_string).bytes
+            for uuid_string in (
+                "c232ab00-9414-11ec-b3c8-9f6bdeced846",
+                "1ec9414c-232a-6b00-b3c8-9f6bdeced846",
+                "017f22e2-79b0-7cc3-98c4-dc0c0c07398f",
+                "550e8400-e29b-41d4-a716-446655440000",
+                "c232ab00-9414-11ec-33c8-9f6bdeced846",
+            )
+        )
+
+        timestamps, versions, validity_mask = uuid_time.UUIDTime.DecodeUUIDBuffer(
+            buffer
+        )
+        self.assertEqual(
+            list(timestamps),
+            [16455577420000000, 16455577420000000, 16455577420000000, 0, 0],
+        )
+        self.assertEqual(list(versions), [1, 6, 7, 4, 0])
+        self.assertEqual(list(validity_mask), [1, 1, 1, 0, 0])
+
+        timestamps, versions, validity_mask = uuid_time.UUIDTime.DecodeUUIDBuffer(b"")
+        self.assertEqual(list(timestamps), [])
+
+        with self.assertRaises(ValueError):
+            uuid_time.UUIDTime.DecodeUUIDBuffer(bytes(17))
+
+    def testDecodeUUIDStrings(self):
+        """Tests the DecodeUUIDStrings function."""
+        uuid_strings = [
+            "c232ab00-9414-11ec-b3c8-9f6bdeced846",
+            "1EC9414C-232A-6B00-B3C8-9F6BDECED846",
+            "017f22e2-79b0-7cc3-98c4-dc0c0c07398f",
+        ]
+
+        timestamps, versions, validity_mask = uuid_time.UUIDTime.DecodeUUIDStrings(
+            uuid_strings
+        )
+        self.assertEqual(
+            list(timestamps), [16455577420000000, 16455577420000000, 16455577420000000]
+        )
+        self.assertEqual(list(versions), [1, 6, 7])
+        self.assertEqual(list(validity_mask), [1, 1, 1])
+
+        uuid_strings = [
+            "{c232ab00-9414-11ec-b3c8-9f6bdeced846}",
+            "1ec9414c232a6b00b3c89f6bdeced846",
+            "017f22e2-79b0-7cc3-98c4-dc0c0c07398x",
+            "017f22e2-79b0-7cc3-98c4-dc0c0c0739",
+            "550e8400-e29b-41d4-a716-446655440000",
+        ]
+
+        timestamps, versions, validity_mask = uuid_time.UUIDTime.DecodeUUIDStrings(
+            uuid_strings
+        )
+        self.assertEqual(
+            list(timestamps), [16455577420000000, 16455577420000000, 0, 0, 0]
+        )
+        self.assertEqual(list(versions), [1, 6, 0, 0, 4])
+        self.assertEqual(list(validity_mask), [1, 1, 0, 0, 0])
+
+        # Strings of the wrong lengths of which the total length is valid.
+        uuid_strings = [
+            "c232ab00-9414-11ec-b3c8-9f6bdeced84",
+            "6017f22e2-79b0-7cc3-98c4-dc0c0c07398f",
+        ]
+
+        timestamps, versions, validity_mask = uuid_time.UUIDTime.DecodeUUIDStrings(
+            uuid_strings
+        )
+        self.assertEqual(list(timestamps), [0, 0])
+        self.assertEqual(list(versions), [0, 0])
+        self.assertEqual(list(validity_mask), [0, 0])
+
+    def testNewFromUUID(self):
+        """Tests the NewFromUUID function."""
+        date_time_values = uuid_time.UUIDTime.NewFromUUID(
+            "1ec9414c-232a-6b00-b3c8-9f6bdeced846"
+        )
+        self.assertIsInstance(date_time_values, uuid_time.UUIDTime)
+        self.assertEqual(date_time_values.timestamp, 0x1EC9414C232AB00)
+
+        date_time_values = uuid_time.UUIDTime.NewFromUUID(
+            uuid.UUID("017f22e2-79b0-7cc3-98c4-dc0c0c07398f").bytes
+        )
+        self.assertIsInstance(date_time_values, posix_time.PosixTimeInMilliseconds)
+        self.assertEqual(date_time_values.timestamp, 1645557742000)
+
+        date_time_values = uuid_time.UUIDTime.NewFromUUID(
+            "550e8400-e29b-41d4-a716-446655440000"
+        )
+        self.assertIsNone(date_time_values)
+
+        with self.assertRaises(ValueError):
+            uuid_time.UUIDTime.NewFromUUID("017f22e2-79b0-7cc3-98c4")
+
+        with self.assertRaises(ValueError):
+            uuid_time.UUIDTime.NewFromUUID(bytes(15))
+
+    def testNewFromUUIDBuffer(self):
+        """Tests the NewFromUUIDBuffer function."""
+        buffer = b"".join(
+            uuid.UUID(uuid_string).bytes
+            for uuid_string in (
+                "c232ab00-9414-11ec-b3c8-9f6bdeced846",
+                "017f22e2-79b0-7cc3-98c4-dc0c0c07398f",
+                "550e8400-e29b-41d4-a716-446655440000",
+            )
+        )
+
+        date_time_values = uuid_time.UUIDTime.NewFromUUIDBuffer(buffer)
+        self.assertEqual(len(date_time_values), 3)
+        self.assertEqual(
+            date_time_values[0].CopyToDateTimeString(), "2022-02-22 19:22:22.0000000"
+        )
+        self.assertEqual(
+            date_time_values[1].CopyToDateTimeString(), "2022-02-22 19:22:22.000"
+        )
+        self.assertIsNone(date_time_values[2])
+
+    def testNewFromUUIDStrings(self):
+        """Tests the NewFromUUIDStrings function."""
+        uuid_strings = [
+            "1ec9414c-232a-6b00-b3c8-9f6bdeced846",
+            "017f22e2-79b0-7cc3-98c4-dc0c0c07398f",
+            "invalid",
+        ]
+
+        date_time_values = uuid_time.UUIDTime.NewFromUUIDStrings(uuid_strings)
+        self.assertEqual(len(date_time_values), 3)
+        self.assertEqual(date_time_values[0].GetPlasoTimestamp(), 1645557742000000)
+        self.assertEqual(date_time_values[1].GetPlasoTimestamp(), 1645557742000000)
+        self.assertIsNone(date_time_values[2])
+
     def testGetDate(self):
         """Tests the GetDate function."""
         uuid_object = uuid.UUID("00911b54-9ef4-11e1-be53-525400123456")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for the validators of date and time strings."""
+
+import unittest
+
+from dfdatetime import time_elements
+from dfdatetime import validators
+
+
+class RaisingTimeElements(time_elements.TimeElements):
+    """Time elements of which the raising copy methods cannot be used."""
+
+    def CopyFromDateTimeString(self, time_string):
+        """Copies time elements from a date and time string."""
+        raise AssertionError("CopyFromDateTimeString called.")
+
+    def CopyFromStringISO8601(self, time_string):
+        """Copies time elements from an ISO 8601 date and time string."""
+        raise AssertionError("CopyFromStringISO8601 called.")
+
+    def CopyFromStringRFC822(self, time_string):
+        """Copies time elements from a RFC 822 date and time string."""
+        raise AssertionError("CopyFromStringRFC822 called.")
+
+    def CopyFromStringRFC1123(self, time_string):
+        """Copies time elements from a RFC 1123 date and time string."""
+        raise AssertionError("CopyFromStringRFC1123 called.")
+
+    def CopyFromStringRFC2822(self, time_string):
+        """Copies time elements from a RFC 2822 date and time string."""
+        raise AssertionError("CopyFromStringRFC2822 called.")
+
+
+class DateTimeStringValidatorTest(unittest.TestCase):
+    """Tests for the validator of date and time strings."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        validator = validators.DateTimeStringValidator("iso8601")
+        self.assertEqual(validator.string_format, "iso8601")
+
+        with self.assertRaises(ValueError):
+            validators.DateTimeStringValidator("bogus")
+
+    def testIsValid(self):
+        """Tests the IsValid function."""
+        validator = validators.DateTimeStringValidator("date_time")
+
+        self.assertTrue(validator.IsValid("2010-08-12 21:06:31.546875"))
+        self.assertFalse(validator.IsValid("2010-08-12 21:06:61"))
+        self.assertFalse(validator.IsValid("bogus"))
+        self.assertFalse(validator.IsValid(None))
+
+    def testParse(self):
+        """Tests the Parse function."""
+        validator = validators.DateTimeStringValidator(
+            "rfc1123", time_elements_type=time_elements.TimeElements
+        )
+
+        results = validator.Parse(
+            ["Thu, 12 Aug 2010 21:06:31 GMT", "Thu, 12 Aug 2010 21:06:31", "bogus"]
+        )
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0], time_elements.TimeElements)
+        self.assertEqual(results[0].CopyToDateTimeString(), "2010-08-12 21:06:31")
+        self.assertIsNone(results[1])
+        self.assertIsNone(results[2])
+
+    def testTryParse(self):
+        """Tests the TryParse function."""
+        validator = validators.DateTimeStringValidator("iso8601")
+
+        date_time = validator.TryParse("2010-08-12T21:06:31.123456789")
+        self.assertIsInstance(date_time, time_elements.TimeElementsInNanoseconds)
+        self.assertEqual(
+            date_time.CopyToDateTimeString(), "2010-08-12 21:06:31.123456789"
+        )
+
+        self.assertIsNone(validator.TryParse("2010-08-12T21:06:61"))
+
+        # The date and time strings are parsed without the raising copy methods.
+        for string_format, time_string in (
+            ("date_time", "2010-08-12 21:06:31"),
+            ("iso8601", "2010-08-12T21:06:31"),
+            ("rfc822", "Thu, 12 Aug 10 21:06:31 GMT"),
+            ("rfc1123", "Thu, 12 Aug 2010 21:06:31 GMT"),
+            ("rfc2822", "Thu, 12 Aug 10 21:06:31 GMT"),
+        ):
+            validator = validators.DateTimeStringValidator(
+                string_format, time_elements_type=RaisingTimeElements
+            )
+            date_time = validator.TryParse(time_string)
+            self.assertIsNotNone(date_time)
+            self.assertEqual(date_time.month, 8)
+
+            self.assertIsNone(validator.TryParse("2010-02-29 21:06:61"))
+
+    def testValidate(self):
+        """Tests the Validate function."""
+        time_strings = [
+            "2010-08-12T21:06:31.546875+01:00",
+            "2010-08-12T21:06:31,546875",
+            "2010-08-12X21:06:31",
+            "",
+            "20100812",
+        ]
+
+        validator = validators.DateTimeStringValidator("iso8601")
+        self.assertEqual(
+            validator.Validate(time_strings), [True, True, False, False, True]
+        )
+
+        for string_format in validators.DateTimeStringValidator.STRING_FORMATS:
+            validator = validators.DateTimeStringValidator(string_format)
+            copy_method_name = validator._try_copy_method_name[3:]
+
+            for time_string in time_strings:
+                time_elements_object = time_elements.TimeElementsInNanoseconds()
+                copy_method = getattr(time_elements_object, copy_method_name)
+                try:
+                    copy_method(time_string)
+                    expected_result = True
+                except ValueError:
+                    expected_result = False
+
+                self.assertEqual(validator.IsValid(time_string), expected_result)
+
+
+if __name__ == "__main__":
+    unittest.main()